@@ -24,7 +24,7 @@ rename_to_cmd() {
 #
 # Nettoyage des LOG et des fichiers temporaires de TESTS
 #
-rm -f "#_LOG_*"
+rm -f "#_LOG_"*
 
 rm -f "#_TESTS_*"
 
@@ -21,37 +21,92 @@ ___debug___ = __debug__
 import os
 import sys
 
-import json
+import struct
 
 import time
 import datetime
 
 from string import whitespace
 
-import tempfile
-import subprocess
+import queue
+import threading
+import collections
 
+# RQ : LOGGING.HANDLERS doit être importé dès à présent, car nos handlers (
+# cf _LogQueueHandler, _SegmentedLogHandler, ... ) en dérivent. Il importe
+# lui-même SOCKET, STRUCT, PICKLE, ...
+#
 import logging
 import logging.handlers
 
-import socket
-import http.client
-import http.server
-import urllib.request
-import urllib.error
 
+class _LazyModule:
+    """ Un module qui ne sera réellement importé que lors de sa 1ère
+    utilisation ( ex : json.dumps ).
 
-if ___debug___:
+    Ainsi, un script qui se sert de ce module sans jamais, par exemple,
+    envoyer de requête HTTP ne paie pas l'import de toute la pile HTTP (
+    http.client, urllib.request, ... qui importent eux-mêmes ssl, email,
+    ... ). Cf le « BENCHMARK du temps d'IMPORT » de nos autotests.
 
-    import gc
-    import ctypes
-    import pprint
+    Lors de ce 1er import, la variable globale qui nous désigne est
+    remplacée par le module lui-même : les utilisations suivantes ne
+    passent donc plus par nous.
+    """
 
-    # L'utilisation de traceback.print_exc(), traceback.format_exc(), ... est
-    # généralement utile pour le débogage et le développement, mais ne devrait
-    # pas être utilisée dans du code de production pour des raisons de sécurité.
-    #
-    import traceback
+    def __init__(self, name: str, *submodules: str):
+        """ :param name: le nom du module ( ex : « http » ).
+
+        :param submodules: les sous-modules à importer avec lui ( ex :
+        « http.client », « http.server » ).
+        """
+
+        self._lazy_name = name
+        self._lazy_submodules = submodules or (name,)
+
+    def _lazy_load(self) -> object:
+        # -> module
+        """ Importe réellement notre module.
+        """
+
+        import importlib
+
+        for submodule in self._lazy_submodules:
+            importlib.import_module(submodule)
+
+        module = sys.modules[self._lazy_name]
+        globals()[self._lazy_name] = module
+
+        return module
+
+    def __getattr__(self, attribute: str):
+
+        return getattr(self._lazy_load(), attribute)
+
+    def __repr__(self) -> str:
+
+        return f'<module {self._lazy_name!r} ( pas encore importé )>'
+
+
+json = _LazyModule('json')
+tempfile = _LazyModule('tempfile')
+hashlib = _LazyModule('hashlib')
+subprocess = _LazyModule('subprocess')
+
+socket = _LazyModule('socket')
+http = _LazyModule('http', 'http.client', 'http.server')
+urllib = _LazyModule('urllib', 'urllib.request', 'urllib.error')
+
+# Modules utilisés par notre mode DEBUG.
+#
+# RQ : L'utilisation de traceback.print_exc(), traceback.format_exc(), ... est
+# généralement utile pour le débogage et le développement, mais ne devrait
+# pas être utilisée dans du code de production pour des raisons de sécurité.
+#
+gc = _LazyModule('gc')
+ctypes = _LazyModule('ctypes')
+pprint = _LazyModule('pprint')
+traceback = _LazyModule('traceback')
 
 
 __all__ = ["FileSystemTree", "ScriptSkeleton"]
@@ -68,6 +123,7 @@ url_from_bytes = None
 pathlib = None
 fnmatch = None
 glob = None
+re = None
 
 # Pour ce qui est du module PATHLIB, faudra-t-il l'importer pour l'utiliser ?
 # Si oui, devra-t-il être utilisé directement ( via des objets pathlib.PATH )
@@ -125,6 +181,9 @@ walking_via_scandir = 'os.scandir'
 #
 #   - Définition et fonctions des classes FileSystemTree + _FileSystemLeaf
 #
+#   - Classes de JOURNALISATION ( file d'attente, formats, ... ) et lecture
+#       des journaux ( iter_log_records() )
+#
 #   - Définition de la classe ScriptSkeleton ( __init__() et __del__() )
 #
 #   - Fonctions d'initialisation des EXÉCUTABLES et RÉPERTOIRES utilisés
@@ -164,6 +223,9 @@ walking_via_scandir = 'os.scandir'
 #   ( in autotests )    . def on_ouvre_le_journal
 #   ( in autotests )    . def on_se_presente
 #                       . def debug_mode
+#                       . def flush_screen
+#                       . def dump_log
+#   ( in autotests )    . def quiet_walk_mode
 #   ( in autotests )    . def on_dit_au_revoir
 #
 # ===========================================================================
@@ -193,6 +255,7 @@ walking_via_scandir = 'os.scandir'
 #
 #   ( in autotests )    . def file_system_mode
 #   ( in autotests )    . def search_files_from_a_mask
+#   ( in autotests )    . def iter_files_from_a_mask
 #   ( in autotests )    . def convert_to_pdf_init
 #   ( in autotests )    . def convert_to_pdf_run
 #   ( in autotests )    . def edit_file_txt
@@ -308,19 +371,463 @@ filetype_to_coding = {
 
 # Fonction d'affichage.
 #
-def _show_(msg, journal = None):
+def _show_(msg, journal = None, screen = None):
     """ Pour afficher un msg, tout en le journalisant en
     même temps.
+
+    RQ : Si « screen » est fourni ( cf _ScreenBuffer ), le msg
+    y est déposé, plutôt qu'affiché aussitôt via print().
     """
 
     msg_to_print = '' if msg is None else str(msg)
 
-    print(msg_to_print)
+    if screen is None:
+        print(msg_to_print)
+    else:
+        screen.write(msg_to_print + '\n')
 
     if journal is not None:
         journal.debug(msg_to_print)
 
 
+# Pour parcourir des morceaux de texte ( strings ou bytes ), qu'ils nous aient
+# été fournis 1 par 1 ou via des itérables ( listes, générateurs, ... ).
+#
+def _iter_chunks_(args):
+    """ Générateur des morceaux de texte contenus dans « args », dont chaque
+    élément est soit un morceau ( STR, BYTES, ... ), soit un itérable de
+    morceaux.
+    """
+
+    for arg in args:
+
+        if isinstance(arg, (str, bytes, bytearray, memoryview)):
+            yield arg
+        else:
+            yield from arg
+
+
+# Les types de données ( data_type ) qui désignent du JSON LINES, c-a-d un
+# enregistrement JSON par ligne.
+#
+# Cf https://jsonlines.org/
+#
+json_lines_types = ('jsonl', 'json-lines', 'json_lines', 'ndjson')
+
+
+# Pour sérialiser au fil de l'eau des données JSON.
+#
+# RQ : Le module JSON ne produit que des STRINGS ( cf json.dump ). En mode
+# BYTES, nous les encodons donc nous-même en UTF-8, seul encodage admis par
+# la RFC 8259 : « JSON text exchanged between systems that are not part of
+# a closed ecosystem MUST be encoded using UTF-8 ». Par défaut ( ensure_ascii
+# = True ), le module JSON ne produit d'ailleurs que des caractères ASCII :
+# cet encodage est alors une simple copie.
+#
+# Cf https://docs.python.org/fr/3/library/json.html#basic-usage
+#
+def _iter_json_chunks_(args, lines: bool = False, as_bytes: bool = False):
+    """ Générateur des morceaux de texte JSON correspondant à « args ».
+
+    Chaque élément de « args » peut être :
+
+        . une STRING ( ou des BYTES ) = du JSON déjà sérialisé ( la réponse
+        d'un serveur, ... ) que nous recopions tel quel,
+
+        . un itérateur ( générateur, map, ... ) = une suite d'enregistrements
+        que nous sérialisons l'un après l'autre : en JSON, ils forment un
+        tableau « [ ..., ... ] » ; en JSON LINES, une ligne chacun,
+
+        . en JSON LINES, une liste ou un tuple = de même, une suite d'
+        enregistrements ( 1 ligne chacun ) ; un tableau sur 1 seule ligne
+        n'étant presque jamais ce qui est voulu,
+
+        . tout autre objet ( dict, list, ... ) = 1 enregistrement.
+
+    :param lines: faut-il produire du JSON LINES ( 1 ligne par enregistrement )
+    plutôt que du JSON ?
+
+    :param as_bytes: faut-il produire des BYTES ( plutôt que des STRINGS ) ?
+
+    :return: les morceaux de texte JSON, à écrire les uns après les autres.
+    """
+
+    # Un seul encodeur pour tous nos enregistrements.
+    #
+    # RQ : encoder.encode() utilise l'encodeur écrit en C, quand il existe,
+    # alors que encoder.iterencode() ( qui renvoie le texte par morceaux )
+    # reste en Python. Nous ne l'utilisons donc que pour les objets isolés,
+    # possiblement énormes.
+    #
+    encoder = json.JSONEncoder()
+
+    if as_bytes:
+        convert = lambda x: x.encode('utf-8') if isinstance(x, str) else x
+    else:
+        convert = lambda x: x if isinstance(x, str) else bytes(x).decode('utf-8')
+
+    for arg in args:
+
+        if isinstance(arg, (str, bytes, bytearray, memoryview)):
+
+            yield convert(arg)
+
+        elif ( hasattr(arg, '__next__') and iter(arg) is arg ) \
+            or ( lines and isinstance(arg, (list, tuple)) ):
+
+            if lines:
+
+                for record in arg:
+                    yield convert(encoder.encode(record) + '\n')
+
+            else:
+
+                separator = '['
+
+                for record in arg:
+                    yield convert(separator + encoder.encode(record))
+                    separator = ','
+
+                yield convert('[]' if separator == '[' else ']')
+
+        elif lines:
+
+            yield convert(encoder.encode(arg) + '\n')
+
+        else:
+
+            for chunk in encoder.iterencode(arg):
+                yield convert(chunk)
+
+
+# Compressions possibles des fichiers créés par save_strings_to_file(), et
+# extensions correspondantes.
+#
+# RQ : « compression_auto » demande de choisir la compression d'après
+# l'extension du fichier cible ( aucune si elle n'est pas reconnue ).
+#
+compression_gzip = 'gz'
+compression_bz2 = 'bz2'
+compression_xz = 'xz'
+compression_zip = 'zip'
+compression_auto = 'auto'
+
+compressions = (
+    compression_gzip,
+    compression_bz2,
+    compression_xz,
+    compression_zip
+    )
+
+compression_suffixes = {c: f'.{c}' for c in compressions}
+compression_by_suffix = {s: c for c, s in compression_suffixes.items()}
+
+
+# Pour séparer un nom de fichier de son extension, en considérant qu'un
+# fichier compressé a une extension double :
+#
+#   « rapport.json.gz » = « rapport » + « .json.gz »
+#
+# ... là où pathlib ne voit que « rapport.json » + « .gz » ( cf stem et
+# suffix ).
+#
+def _split_suffixes_(name: str):
+    # -> ( STR, STR )
+
+    ( stem, ext ) = os.path.splitext(name)
+
+    if ext.lower() in compression_by_suffix:
+        ( stem, inner_ext ) = os.path.splitext(stem)
+        ext = inner_ext + ext
+
+    return ( stem, ext )
+
+
+# Pour écrire un fichier compressé au fil de l'eau, à la place d'un fichier
+# ouvert par open() ( ou par _AtomicFile ).
+#
+class _CompressedFile:
+    """ Fichier compressé, à utiliser via « with ».
+
+    :param raw_file: le fichier ( ouvert en mode 'wb' ) dans lequel écrire
+    les données compressées. Il n'est pas fermé par nos soins.
+
+    :param compression: la compression à utiliser ( cf compressions ). Si
+    elle vaut None, nous renvoyons simplement « raw_file ».
+
+    :param level: le niveau de compression ( None = celui par défaut de
+    chaque module ). Plus il est élevé, plus le fichier est petit... et
+    plus la compression est lente.
+
+    :param f_flag: le mode d'écriture voulu ( 'wt' ou 'wb' ).
+
+    :param member: le nom du fichier ( non compressé ) à inscrire dans l'
+    entête GZIP, ou dans l'archive ZIP.
+    """
+
+    def __init__(
+        self,
+        raw_file,
+        compression: str = None,
+        level: int = None,
+        f_flag: str = 'wb',
+        member: str = 'data'
+        ):
+
+        self.raw_file = raw_file
+        self.compression = compression
+        self.level = level
+        self.f_flag = f_flag
+        self.member = member
+
+        self.archive = None
+        self.file = None
+
+    def __enter__(self):
+
+        if self.compression is None:
+            return self.raw_file
+
+        # Nous n'importons que le module de compression demandé.
+        #
+        if self.compression == compression_gzip:
+
+            import gzip
+
+            stream = gzip.GzipFile(
+                filename = self.member,
+                mode = 'wb',
+                compresslevel = 9 if self.level is None else self.level,
+                fileobj = self.raw_file
+                )
+
+        elif self.compression == compression_bz2:
+
+            import bz2
+
+            stream = bz2.BZ2File(
+                self.raw_file,
+                'wb',
+                compresslevel = 9 if self.level is None else self.level
+                )
+
+        elif self.compression == compression_xz:
+
+            import lzma
+
+            stream = lzma.LZMAFile(self.raw_file, 'wb', preset = self.level)
+
+        elif self.compression == compression_zip:
+
+            import zipfile
+
+            self.archive = zipfile.ZipFile(
+                self.raw_file,
+                'w',
+                compression = zipfile.ZIP_DEFLATED,
+                compresslevel = self.level
+                )
+
+            # RQ : La taille finale de notre fichier nous est inconnue, d'
+            # où « force_zip64 » ( sinon, au-delà de 2 Go, plantage ).
+            #
+            stream = self.archive.open(self.member, 'w', force_zip64 = True)
+
+        else:
+            raise ValueError(f'Unknown compression « {self.compression} »...')
+
+        # Les modules de compression ne savent écrire que des BYTES : en
+        # mode TEXTE, nous les encodons comme l'aurait fait open().
+        #
+        if self.f_flag == 'wt':
+            import io
+            self.file = io.TextIOWrapper(stream)
+        else:
+            self.file = stream
+
+        return self.file
+
+    def __exit__(self, exc_type, exc_value, exc_tb):
+
+        if self.file is not None:
+
+            # RQ : C'est à la fermeture que sont écrits les derniers
+            # octets compressés, et la fin de l'entête ( GZIP, ZIP, ... ).
+            #
+            self.file.close()
+
+            if self.archive is not None:
+                self.archive.close()
+
+        return False
+
+
+# Pour écrire un fichier de façon « atomique » : le contenu est d'abord écrit
+# dans un fichier temporaire, situé dans le même répertoire que le fichier
+# cible, puis ce fichier temporaire remplace d'un coup ( os.replace ) la cible.
+#
+# Ainsi, un lecteur ne voit jamais de fichier à moitié écrit : soit l'ancienne
+# version, soit la nouvelle. Et si l'écriture échoue ( exception, plantage,
+# ... ), l'ancienne version reste intacte.
+#
+# RQ : os.replace() n'est atomique que sur un même système de fichiers, d'où
+# le choix d'un fichier temporaire dans le répertoire de la cible ( plutôt
+# que dans le répertoire temporaire du système ).
+#
+class _AtomicFile:
+    """ Fichier « atomique », à utiliser via « with » à la place de open().
+
+    :param file_dst: le fichier cible.
+
+    :param f_flag: le mode d'ouverture ( 'wt' ou 'wb' ).
+
+    :param buffer_size: la taille du tampon d'écriture ( cf open() ).
+
+    :param sync: faut-il forcer l'écriture sur disque ( os.fsync ) avant de
+    remplacer la cible ? C'est plus lent mais, sans cela, un plantage de la
+    machine juste après os.replace() peut laisser un fichier vide...
+    """
+
+    def __init__(
+        self,
+        file_dst: str,
+        f_flag: str = 'wb',
+        buffer_size: int = -1,
+        sync: bool = False
+        ):
+
+        self.file_dst = os.path.abspath(file_dst)
+        self.f_flag = f_flag
+        self.buffer_size = buffer_size
+        self.sync = sync
+
+        self.tmp_dst = None
+        self.file = None
+
+    def __enter__(self):
+
+        directory, name = os.path.split(self.file_dst)
+
+        # Nous créons nous-même le fichier temporaire ( O_EXCL ) plutôt que
+        # via tempfile.mkstemp() : ce dernier impose des droits 0600, alors
+        # que nous voulons ceux qu'aurait donnés open() ( 0666 & ~umask ).
+        #
+        flags = os.O_WRONLY | os.O_CREAT | os.O_EXCL | getattr(os, 'O_BINARY', 0)
+
+        while True:
+
+            self.tmp_dst = os.path.join(
+                directory,
+                f'.{name}.{os.getpid()}-{os.urandom(4).hex()}.tmp'
+                )
+
+            try:
+                fd = os.open(self.tmp_dst, flags, 0o666)
+            except FileExistsError:
+                continue
+
+            break
+
+        try:
+            self.file = os.fdopen(fd, self.f_flag, buffering = self.buffer_size)
+        except Exception:
+            os.close(fd)
+            os.remove(self.tmp_dst)
+            raise
+
+        return self.file
+
+    def __exit__(self, exc_type, exc_value, exc_tb):
+
+        try:
+            if exc_type is None:
+
+                self.file.flush()
+
+                if self.sync:
+                    os.fsync(self.file.fileno())
+
+            self.file.close()
+
+            if exc_type is None:
+
+                # Si nous remplaçons un fichier existant, nous lui
+                # conservons ses droits d'accès.
+                #
+                if os.path.exists(self.file_dst):
+                    os.chmod(self.tmp_dst, os.stat(self.file_dst).st_mode & 0o7777)
+
+                os.replace(self.tmp_dst, self.file_dst)
+                self.tmp_dst = None
+
+                # Le renommage lui-même n'est durable qu'une fois le
+                # répertoire écrit sur disque ( POSIX uniquement ).
+                #
+                if self.sync and hasattr(os, 'O_DIRECTORY'):
+
+                    dir_fd = os.open(os.path.dirname(self.file_dst), os.O_RDONLY | os.O_DIRECTORY)
+
+                    try:
+                        os.fsync(dir_fd)
+                    finally:
+                        os.close(dir_fd)
+
+        finally:
+
+            # En cas d'échec, nous ne laissons pas traîner le
+            # fichier temporaire ( la cible, elle, est intacte ).
+            #
+            if self.tmp_dst is not None:
+
+                try:
+                    os.remove(self.tmp_dst)
+                except OSError:
+                    pass
+
+        # Nous ne masquons aucune exception.
+        #
+        return False
+
+
+# Fonction d'affichage « paresseuse » : à la façon de logging.Logger.debug(),
+# le message n'est construit ( msg % args ) qu'au moment où il est affiché.
+#
+def _show_lazily_(msg, *args, **kwargs):
+    """ Pour afficher un msg avec ses arguments ( cf _show_ ).
+
+    RQ : Les paramètres nommés de logging.Logger.debug() ( « extra », ... )
+    sont acceptés, mais ignorés.
+    """
+
+    _show_(msg % args if args else msg)
+
+
+# Nos tampons d'affichage ( cf _ScreenBuffer ) : ils doivent être vidés
+# avant toute saisie, l'utilisateur devant voir la question posée... et ce
+# qui la précède !
+#
+_screen_buffers = []
+
+
+def _drain_screens_():
+    """ Affiche tout ce qui est en attente dans nos tampons d'affichage.
+    """
+
+    for screen in _screen_buffers:
+        screen.drain()
+
+
+# Toutes nos saisies passent par cette fonction ( cf _drain_screens_ ).
+#
+def _input_(prompt: str = '') -> str:
+    """ Comme input(), mais après avoir vidé nos tampons d'affichage.
+    """
+
+    _drain_screens_()
+
+    return input(prompt)
+
+
 # Pour introduire une PAUSE dans l'exécution... qui ne
 # reprendra que lorsque l'utilisateur aura appuyé sur
 # < RETURN >.
@@ -344,7 +851,7 @@ if ___debug___:
 
         for _ in range(0, before): b_line('')
 
-        input(indent + 9*car + ' ' + msg + ' ' + 9*car)
+        _input_(indent + 9*car + ' ' + msg + ' ' + 9*car)
 
         for _ in range(0, after): a_line('')
 
@@ -403,10 +910,7 @@ else:
 
 # Fonctions d'INSPECTION des VARIABLES.
 #
-try:
-    ctypes
-
-except NameError:
+if not ___debug___:
 
     def _find_var_refcounts_(*args, **kwargs) -> (int, int):
 
@@ -424,9 +928,23 @@ else:
     # ie 20230411 - GARBAGE collection + DEL keyword = Things you need to know*
     # in _Know\Info\Dvpt\Réalisation\Langages\Python\- et - Allocation de MÉMOIRE.rar
     #
-    class PyObject(ctypes.Structure):
+    # RQ : Cette structure n'est définie, et donc CTYPES importé, que lors
+    # du 1er appel à _find_var_refcounts_() ou à _load_debug_modules_().
+    #
+    PyObject = None
+
+
+    def _define_py_object_():
+        """ Définit notre structure PyObject, si ce n'est déjà fait.
+        """
 
-        _fields_ = [("refcnt", ctypes.c_long)]
+        global PyObject
+
+        if PyObject is None:
+
+            class PyObject(ctypes.Structure):
+
+                _fields_ = [("refcnt", ctypes.c_long)]
 
 
     def _find_var_refcounts_(
@@ -459,6 +977,8 @@ else:
         provoquées par l'appel à cette fonction si « purified == True ».
         """
 
+        _define_py_object_()
+
         if obj is None:
             memory_adress = address
             system_counts = -1
@@ -632,6 +1152,28 @@ else:
         return my_name, my_inside_name, my_qualified_name
 
 
+# Nos modules de DEBUG ne sont importés qu'à leur 1ère utilisation ( cf
+# _LazyModule ). Or cette 1ère utilisation peut avoir lieu dans une méthode
+# __del__(), appelée alors que Python s'arrête et ne peut plus importer de
+# module !!!
+#
+# Les objets dont la méthode __del__() s'en sert ( FileSystemTree, ... ) les
+# importent donc dès leur création.
+#
+def _load_debug_modules_():
+    """ Importe nos modules de DEBUG, s'ils ne l'ont pas encore été.
+    """
+
+    if not ___debug___:
+        return
+
+    for module in (gc, ctypes, pprint, traceback):
+        if isinstance(module, _LazyModule):
+            module._lazy_load()
+
+    _define_py_object_()
+
+
 # ---------------------------------------------------------------------------
 #
 #   PARTIE :
@@ -671,9 +1213,15 @@ _glob_only_files = 2
 # Les autres valeurs ( _search_simple, _search_complex,
 # ... ) ne sont qu'à usage interne.
 #
+# RQ : _search_recursive correspond à un masque qui porte
+# sur plusieurs niveaux de répertoires ( « sub/*.py » ) ou
+# qui contient le joker « ** » ( « **/*.py » ). Chacun des
+# niveaux est alors analysé à part ( cf _parse_mask() ).
+#
 _search_fnmatch = 0
 _search_complex = 1
 _search_simple = 2
+_search_recursive = 3
 
 _searches_lst = (
     _search_simple,
@@ -682,45 +1230,340 @@ _searches_lst = (
 )
 
 
-# Itérateur / GÉNÉRATEUR vide.
-#
-# Il s'agit du générateur qui sera renvoyé par la méthode
-# Glob() de la classe FileSystemTree._FileSystemLeaf dans
-# certains où son résultat serait vide.
-#
-def _generator_empty():
-    # -> None
-    """ Pour 1 explication sur la forme de ce générateur,
-    voir le post suivant :
+def _mask_levels(mask: str) -> list:
+    """ Découpe un masque de recherche en ses différents niveaux
+    de répertoires. Ainsi :
 
-        https://stackoverflow.com/questions/13243766/how-to-define-an-empty-generator-function/
+        « src/**/test*.py »  ->  [ 'src', '**', 'test*.py' ]
 
-    ... dont surtout :
+    Les séparateurs « / » sont toujours acceptés, ainsi que celui
+    de notre OS ( os.sep ) s'il est différent. Les niveaux vides
+    ( « a//b » ) sont ignorés et plusieurs « ** » consécutifs sont
+    réduits à un seul, puisqu'ils sont alors équivalents.
 
-        https://stackoverflow.com/a/13243870/3840170
-        -> analyse des différents « empty generator »
-        possibles.
-        
-        https://stackoverflow.com/a/61496399/577088
-        -> analyse du meilleur « empty generator » sous
-        l'angle du code CPython généré.
+    ATTENTION : Un masque ABSOLU ( « /tmp/*.py », « C:\\*.py », ... ) est
+    refusé ( ValueError ), comme chez pathlib.Path.glob() : ignorer sa
+    racine en ferait un masque relatif au répertoire parcouru.
 
-    Tous ces posts se retrouvent dans :
+    :param mask: le masque de recherche.
 
-        - GÉNÉRATEURS - How to define an EMPTY GENERATOR function *
-        in - et - ITÉRATEUR ou GÉNÉRATEUR.rar
-        in _Know\Info\Dvpt\Réalisation\Langages\Python
+    :return: la liste des niveaux du masque.
+    """
 
-    Dans ce script, nous aurions toutefois pu opter pour
-    renvoyer une liste vide, ou plutôt 1 itérateur vide :
+    if os.sep != '/':
+        mask = mask.replace(os.sep, '/')
 
-        iter(())
+    if mask.startswith('/') or os.path.splitdrive(mask)[0]:
+        raise ValueError(f'Non-relative mask « {mask} » is unsupported...')
 
-    mais ce _generator_empty() a été choisi pour raison
-    didactique...
+    levels = []
 
-    Nous aurions également pu choisir la forme suivante
-    ( peut-être plus compréhensible ) :
+    for level in mask.split('/'):
+
+        if level == '' or (level == '**' and levels[-1:] == ['**']):
+            continue
+
+        levels.append(level)
+
+    return levels
+
+
+def _mask_is_recursive(mask: str) -> bool:
+    """ Le masque de recherche porte-t-il sur plusieurs niveaux de
+    répertoires ( « sub/*.py » ) ou contient-il le joker « ** » ?
+
+    :param mask: le masque de recherche.
+
+    :return: True si une recherche RÉCURSIVE est nécessaire.
+    """
+
+    levels = _mask_levels(mask)
+
+    return len(levels) > 1 or levels == ['**']
+
+
+def _mask_has_wildcards(mask: str) -> bool:
+    """ Le masque de recherche contient-il l'un des caractères spéciaux
+    « ? » ou « [ » ( i-e « ? », « [seq] » ou « [!seq] » ) ?
+
+    :param mask: le masque de recherche ( 1 seul niveau ).
+
+    :return: True si le masque doit être traduit par _mask_to_regex().
+    """
+
+    return '?' in mask or '[' in mask
+
+
+def _mask_to_regex(mask: str) -> str:
+    """ Traduit un masque de recherche ( 1 seul niveau ) en une expression
+    régulière équivalente. La grammaire acceptée est celle de FNMATCH :
+
+        *           matches everything
+        ?           matches any single character
+        [seq]       matches any character in seq
+        [!seq]      matches any character not in seq
+
+    Comme chez FNMATCH :
+
+        - un « ] » placé juste après « [ » ou « [! » fait partie de la
+        séquence ( « []] » ou « [!]] » ) ;
+
+        - un « [ » qui n'est jamais refermé est un simple caractère ;
+
+        - « [[] » désigne le caractère « [ » lui-même.
+
+    Cf https://docs.python.org/3/library/fnmatch.html
+
+    ATTENTION : Avant que ces séquences ne soient reconnues, « [ » était
+    toujours un simple caractère, et nos répertoires sont souvent nommés
+    ainsi ( « [ skeleton ] », ... ). Pour que de tels masques continuent
+    à fonctionner, une séquence « [seq] » correspond donc SOIT à l'un des
+    caractères de « seq » ( comme chez FNMATCH ), SOIT au texte « [seq] »
+    lui-même : le masque « [ skeleton ]* » trouve ainsi « [ skeleton ] ».
+
+    RQ : Nous aurions pu utiliser directement fnmatch.translate() mais
+    nous voulons, d'une part, ne pas importer FNMATCH si ce n'est pas
+    demandé et, d'autre part, rester maîtres de la syntaxe produite
+    ( cf _FileSystemLeaf._compile_mask() qui la compile, une fois pour
+    toutes, en mode IGNORECASE ).
+
+    :param mask: le masque de recherche.
+
+    :return: l'expression régulière ( à utiliser via fullmatch() ).
+    """
+
+    global re
+    try: re.escape('test_if*already_imported')
+    except AttributeError: import re
+
+    i, n = 0, len(mask)
+    res = []
+
+    while i < n:
+
+        c = mask[i]
+        i += 1
+
+        if c == '*':
+
+            # Plusieurs « * » consécutifs sont équivalents à un seul.
+            #
+            if not res or res[-1] != '.*':
+                res.append('.*')
+
+        elif c == '?':
+            res.append('.')
+
+        elif c == '[':
+
+            # On cherche la fin de la séquence...
+            #
+            j = i
+            if j < n and mask[j] == '!':
+                j += 1
+            if j < n and mask[j] == ']':
+                j += 1
+            while j < n and mask[j] != ']':
+                j += 1
+
+            if j >= n:
+
+                # ... qui n'existe pas : « [ » est un simple caractère.
+                #
+                res.append('\\[')
+
+            else:
+
+                seq = mask[i:j]
+                i = j + 1
+
+                # Le texte « [seq] » lui-même ( cf l'ATTENTION ci-dessus ).
+                #
+                literal = re.escape('[' + seq + ']')
+
+                negate = seq.startswith('!')
+                if negate:
+                    seq = seq[1:]
+
+                # Dans une classe de caractères, seuls les tirets ( « a-z » )
+                # gardent un sens particulier : on protège tout le reste de ce
+                # qui pourrait être interprété par le module RE.
+                #
+                seq = ''.join(
+                    '\\' + x if x in '\\[]^&~|' else x
+                    for x in seq
+                    )
+
+                res.append(f"(?:{literal}|[{'^' if negate else ''}{seq}])")
+
+        else:
+            res.append(re.escape(c))
+
+    return ''.join(res)
+
+
+class _CompiledMask:
+    """ Résultat IMMUABLE de l'analyse d'un masque de recherche par
+    < _FileSystemLeaf >._parse_mask().
+
+    Un tel objet peut être directement transmis à _fake_iglob() sous
+    la forme :
+
+        _fake_iglob( .., **_parse_mask( .. ) )
+
+    ... car il se comporte, en lecture seule, comme le dictionnaire
+    que renvoyait auparavant _parse_mask() ( clés « mask », « s_type »,
+    « suffix », « mask_lst » et « test_fct » ). Cf keys() et __getitem__()
+    qui suffisent à Python pour l'opérateur « ** ».
+
+    Comme il est IMMUABLE, il peut être conservé dans notre cache
+    ( cf _masks_cache ) et partagé sans risque par tous les objets
+    FileSystemTree et _FileSystemLeaf.
+
+    Sa méthode match() permet par ailleurs de tester directement un
+    nom de fichier ou de répertoire.
+    """
+
+    __slots__ = (
+        'mask',
+        's_type',
+        'suffix',
+        'mask_lst',
+        'test_fct',
+        '_kwargs',
+        )
+
+    _keys = ('mask', 's_type', 'suffix', 'mask_lst', 'test_fct')
+
+    def __init__(
+        self,
+        mask: str,
+        s_type: int,
+        suffix: str,
+        mask_lst: list,
+        test_fct: object    # function
+        ):
+
+        # Nous interdisons toute modification via __setattr__(), donc
+        # nous devons ici passer par celui de la classe « object ».
+        #
+        init = object.__setattr__
+
+        init(self, 'mask', mask)
+        init(self, 's_type', s_type)
+        init(self, 'suffix', suffix)
+        init(self, 'mask_lst', None if mask_lst is None else tuple(mask_lst))
+        init(self, 'test_fct', test_fct)
+
+        # Paramètres transmis à test_fct() par match(), calculés une
+        # fois pour toutes ( cf aussi _fake_iglob() ).
+        #
+        init(self, '_kwargs', {
+            'mask'          :   mask,
+            'mask_lst'      :   self.mask_lst,
+            'suffix_len'    :   len(suffix) if suffix is not None else 0,
+            'suffix_lower'  :   suffix.lower() if suffix is not None else None,
+            })
+
+    def __setattr__(self, name, value):
+        raise AttributeError(f"_CompiledMask is immutable ( « {name} » )")
+
+    def __delattr__(self, name):
+        raise AttributeError(f"_CompiledMask is immutable ( « {name} » )")
+
+    def __repr__(self) -> str:
+        return f'_CompiledMask({self.mask!r}, s_type={self.s_type})'
+
+    def keys(self) -> tuple:
+        return self._keys
+
+    def __getitem__(self, key: str) -> object:
+        if key in self._keys:
+            return getattr(self, key)
+        raise KeyError(key)
+
+    def match(self, name: str) -> bool:
+        """ Le nom ( sans chemin ) correspond-il à notre masque ?
+
+        RQ : Pour un masque RÉCURSIF ( _search_recursive ), c'est le
+        rôle de _fake_rglob() de tester chacun des niveaux.
+        """
+        return self.test_fct(name, **self._kwargs)
+
+
+# Cache LRU des masques déjà analysés ( i-e des objets _CompiledMask )
+# par < _FileSystemLeaf >._parse_mask(). Ce cache est partagé par tous
+# les objets FileSystemTree, et sa clé est le couple ( masque, type de
+# recherche ).
+#
+# RQ : Depuis Python 3.7, un dictionnaire conserve l'ordre d'insertion
+# de ses clés. Il nous suffit donc de réinsérer en fin de dictionnaire
+# chaque masque réutilisé pour que la 1ère clé soit toujours celle du
+# masque le moins récemment utilisé ( celui à supprimer si le cache
+# est plein ).
+#
+# Cf https://docs.python.org/3/library/stdtypes.html#dict
+#
+_masks_cache = {}
+_masks_cache_size = 256
+
+
+# Cache des derniers index réservés par get_unused_filename( reserve = True ) :
+#
+#   ( répertoire, basename, extension, idx_start )
+#       -> ( date de modification du répertoire, dernier index réservé )
+#
+# Cela nous évite de relister un répertoire à chaque nouveau nom réservé
+# pour un même modèle ( cf ScriptSkeleton.get_unused_filename ).
+#
+# RQ : Ce cache ne fait qu'indiquer d'où partir, et seulement tant que le
+# répertoire n'a pas été modifié depuis notre dernière réservation ( sinon
+# des fichiers y ont été supprimés, ou créés, et nous le relistons ). Nous
+# vérifions de toute façon que le nom proposé est libre ( O_EXCL ).
+#
+_unused_names_cache = {}
+_unused_names_lock = threading.Lock()
+
+
+# Itérateur / GÉNÉRATEUR vide.
+#
+# Il s'agit du générateur qui sera renvoyé par la méthode
+# Glob() de la classe FileSystemTree._FileSystemLeaf dans
+# certains où son résultat serait vide.
+#
+def _generator_empty():
+    # -> None
+    """ Pour 1 explication sur la forme de ce générateur,
+    voir le post suivant :
+
+        https://stackoverflow.com/questions/13243766/how-to-define-an-empty-generator-function/
+
+    ... dont surtout :
+
+        https://stackoverflow.com/a/13243870/3840170
+        -> analyse des différents « empty generator »
+        possibles.
+        
+        https://stackoverflow.com/a/61496399/577088
+        -> analyse du meilleur « empty generator » sous
+        l'angle du code CPython généré.
+
+    Tous ces posts se retrouvent dans :
+
+        - GÉNÉRATEURS - How to define an EMPTY GENERATOR function *
+        in - et - ITÉRATEUR ou GÉNÉRATEUR.rar
+        in _Know\Info\Dvpt\Réalisation\Langages\Python
+
+    Dans ce script, nous aurions toutefois pu opter pour
+    renvoyer une liste vide, ou plutôt 1 itérateur vide :
+
+        iter(())
+
+    mais ce _generator_empty() a été choisi pour raison
+    didactique...
+
+    Nous aurions également pu choisir la forme suivante
+    ( peut-être plus compréhensible ) :
 
         def _generator_empty():
             yield from ()
@@ -1434,123 +2277,566 @@ _posix = _Posix()
 _windows = _Windows()
 
 
-class FileSystemTree:
-    """ Cette classe permet de gérer répertoires et fichiers.
-    Pour ceci, suivant sa configuration, elle s'appuie soit
-    sur la librairie OS.PATH, soit sur le module PATHLIB.
+class _IndexEntry:
+    """ Entrée d'un répertoire telle que mémorisée dans un INDEX ( cf la
+    classe _DirectoryIndex ).
 
-    Elle peut également utiliser les modules FNMATCH ou GLOB,
-    pour des fonctions annexes.
+    Cet objet se comporte, en lecture seule, comme un os.DirEntry : il
+    peut donc être transmis à un _FileSystemLeaf via son paramètre
+    « dir_entry ». Les méthodes is_dir(), is_file() et stat() de ce
+    dernier répondront alors SANS aucun appel système.
 
-    Ces différentes possibilités permettent de s'adapter aux
-    versions de Python et aux différents OS.
+    Cf https://docs.python.org/3/library/os.html#os.DirEntry
+    """
 
-    Pour des tests sur ce sujet :
+    __slots__ = ('name', 'path', '_flags', '_size', '_mtime_ns')
 
-        Cf * - TESTS --- ( import + PATHLIB + GLOB + fnmatch ) ---.py
-        in --- [ skeleton ] = 2Do & NOTES.rar\( TESTS ) dont « mplay32.exe »
-        in _Know\Info\Dvpt\Réalisation\Src\_Python\[ skeleton ]
+    # Valeurs des bits de « _flags ».
+    #
+    _is_dir = 1
+    _is_file = 2
+    _is_symlink = 4
 
-        ou
+    def __init__(
+        self,
+        directory: str,
+        name: str,
+        flags: int,
+        size: int,
+        mtime_ns: int
+        ):
 
-        Cf --- FILES and PATH --- ( mes ) NOTES = os.path, PATHLIB, fnmatch, GLOB*.py
-        in _Know\Info\Dvpt\Réalisation\Langages\Python\- et - FICHIERS.rar
+        self.name = name
+        self.path = os.path.join(directory, name)
+        self._flags = flags
+        self._size = size
+        self._mtime_ns = mtime_ns
 
-    REMARQUE : L'importation du module OS est toujours demandée
-    par skeleton.py. Pour les autres, cela dépend du bon vouloir
-    des utilisateurs de ce script.
+    def __repr__(self) -> str:
+        return f'<_IndexEntry {self.name!r}>'
 
-    REMARQUE : Par CONVENTION, les méthodes de FileSystemTree et
-    celles de sa « inner class » _FileSystemLeaf, sont IDENTIQUES
-    ( i.e ont le même nom, la même définition ) que les méthodes
-    présentes dans le module PATHLIB.
+    def __fspath__(self) -> str:
+        return self.path
 
-        Cf https://docs.python.org/3/library/pathlib.html#correspondence-to-tools-in-the-os-module
+    def is_dir(self, *, follow_symlinks: bool = True) -> bool:
+        if not follow_symlinks and self._flags & self._is_symlink:
+            return False
+        return bool(self._flags & self._is_dir)
 
-    ATTENTION : Si le module PATHLIB est importé, certaines des
-    méthodes de cet objet renverront en guise de paths ( chemin
-    de fichiers ) des valeurs type PATHLIB.PATH, sinon ces mêmes
-    valeurs seront de type STRING !!!
+    def is_file(self, *, follow_symlinks: bool = True) -> bool:
+        if not follow_symlinks and self._flags & self._is_symlink:
+            return False
+        return bool(self._flags & self._is_file)
 
-        Il faut donc être prêt à gérer ces deux types de valeurs
-        lorsque nous traitons des paths ( d'autant plus si notre
-        mode est du type « pathlib_direct_... » ), SAUF si nous
-        ne demandons jamais à ce que PATHLIB soit utilisé.
+    def is_symlink(self) -> bool:
+        return bool(self._flags & self._is_symlink)
 
-    ATTENTION : Si l'import direct de PATHLIB est demandé via les
-    modes type « pathlib_direct_... », toute fonction fournie par
-    PATHLIB sera accessible, même si non déclarées / surchargées
-    dans la classe incluse _FileSystemLeaf.
+    def stat(self, *, follow_symlinks: bool = True) -> os.stat_result:
+        """ Seuls le type ( st_mode ), la taille ( st_size ) et la date
+        de modification ( st_mtime ) du noeud sont connus de l'index.
+        """
 
-        En effet, si l'on travaille de façon directe avec le module
-        PATHLIB, alors FileSystemTree.node() renvoie directement un
-        objet PATHLIB et cela va shunter la classe _FileSystemLeaf &
-        ses méthodes. L'objet pathlib.Path sera en effet directement
-        appelé !!!
+        mode = 0o040000 if self._flags & self._is_dir else 0o100000
+        mtime = self._mtime_ns / 1e9
 
-        Toutes les méthodes de la classe pathlib.PATH sont alors ici
-        disponibles.
+        return os.stat_result(
+            (mode, 0, 0, 0, 0, 0, self._size, int(mtime), int(mtime), int(mtime)),
+            {
+                'st_mtime'      :   mtime,
+                'st_mtime_ns'   :   self._mtime_ns
+            }
+            )
 
-        Pour les classes et fonctions du module « pathlib » ( telles
-        PurePath() & autres ), elles doivent être codées au niveau de
-        notre classe FileSystemTree...
 
-        ... SAUF dans le mode « pathlib_direct_via_module_only », cas
-        où aucun objet FileSystemTree n'est créé : FileSystemTree, là,
-        n'est rien d'autre qu'un ALIAS vers le module PATHLIB !!!
+class _DirectoryIndex:
+    """ INDEX PERSISTANT du contenu de répertoires : pour chaque répertoire
+    indexé, un fichier conserve les noms, types, tailles et dates de mise
+    à jour de ses noeuds ( fichiers et sous-répertoires ).
+
+    Nos scripts « batch » interrogent à chaque exécution les mêmes gros
+    répertoires, qui changent rarement ( disques d'archives, partages
+    réseau ). Lire ces index permet alors de répondre aux recherches via
+    des masques SANS relire ces répertoires.
+
+    La validité d'un index est vérifiée à chaque utilisation, à moindre
+    coût, via la date de mise à jour du répertoire ( 1 seul os.stat ) :
+    cette date change dès qu'un noeud y est créé, supprimé ou renommé.
+    Un index périmé est alors aussitôt reconstruit.
+
+    ATTENTION : Modifier le CONTENU d'un fichier ne modifie pas la date du
+    répertoire qui le contient. Les noms et types fournis par un index sont
+    donc toujours exacts, mais les tailles et dates des fichiers peuvent
+    ne plus l'être ( cf refresh() ).
+
+    RQ : Cet index n'est utilisé que par < _FileSystemLeaf >.iterdir() hors
+    mode PATHLIB ( cf FileSystemTree.index_refresh() ).
     """
 
-    _tree_counter = 0
-    _tree_last = None
+    _version = 1
 
-    def __new__(
-        cls,
-        *args,
-        log_file: logging.Logger = None,
-        with_pathlib: str = pathlib_ignore,
-        **kwargs
+    def __init__(
+        self,
+        location: str = None,
+        write_in_log = _show_ # function
         ):
-        """ CONSTRUCTEUR de la classe FileSystemTree.
+        """ :param location: le répertoire où seront conservés nos index.
+        Par défaut, un sous-répertoire du répertoire temporaire de l'OS.
+
+        :param write_in_log: la fonction de journalisation à utiliser.
         """
 
-        write_in_log = _show_ if log_file is None else log_file.debug
-        write_in_log("Type de GESTION des FICHIERS :")
-        write_in_log("==============================")
+        if location is None:
+            location = os.path.join(
+                tempfile.gettempdir(),
+                '#_INDEX_for_skeleton_#'
+                )
 
+        self.location = location
+        self.write_in_log = write_in_log
 
-        # Nous allons dès maintenant importer le module pathlib
-        # si nécessaire. En effet, si nous ne créons pas ici d'
-        # objet FileSystemTree, nous allons renvoyer l'adresse
-        # de ce module pathlib, IL FAUT DONC QU'ELLE EXISTE !!!
+        # Index déjà lus ( ou construits ) lors de cette exécution :
         #
-        if with_pathlib in pathlib_import:
+        #   répertoire -> ( date du répertoire, liste des entrées ).
+        #
+        # ... ou None pour un répertoire SANS index : sans quoi chaque
+        # iterdir() d'un tel répertoire paierait à nouveau 1 sha1 et 1
+        # open() voué à l'échec ( cf _load ). build() et drop() mettent à
+        # jour ce cache.
+        #
+        # RQ : Un index créé par un AUTRE processus pendant notre exécution
+        # n'est donc pas vu par celle-ci.
+        #
+        # ... ainsi que les objets _IndexEntry correspondants, créés
+        # lors de leur 1ère utilisation, puis réutilisés ( ils sont en
+        # lecture seule ).
+        #
+        self._snapshots = {}
+        self._entries = {}
 
-            # Puisque nous avons défini une variable globale du
-            # nom de pathlib, écrire simplement :
-            #
-            #   try: pathlib
-            #   except NameError: import pathlib
-            #
-            # ... ne permettra pas d'importer le module pathlib
-            # puisque « try: pathlib » ne lèvera pas d'exception
-            # ( la variable pathlib existe déjà... ).
-            #
-            global pathlib
-            try: pathlib.PurePath()
-            except AttributeError: import pathlib
+    def _file_of(self, directory: str) -> str:
+        """ Nom du fichier d'index d'un répertoire ( path ABSOLU ).
+        """
 
+        digest = hashlib.sha1(
+            directory.encode('utf-8', 'surrogatepass')
+            ).hexdigest()
 
-        # Devons nous ( ou non ) créer un objet FileSystemTree ?
+        return os.path.join(self.location, digest + '.json')
+
+    def build(
+        self,
+        directory: str,
+        recursive: bool = False
+        ) -> int:
+        """ Construit ( ou reconstruit ) l'index d'un répertoire, voire
+        celui de toute son arborescence.
+
+        :param directory: le répertoire à indexer.
+
+        :param recursive: faut-il aussi indexer les sous-répertoires ?
+        ( les liens symboliques vers des répertoires ne sont pas suivis )
+
+        :return: le nombre de répertoires indexés.
+        """
+
+        log_debug = self.write_in_log
+
+        directory = os.path.abspath(directory)
+
+        # RQ : Si nos index ne peuvent être écrits, nous gardons tout de
+        # même en mémoire ce que nous avons lu ( cf ci-dessous ).
         #
-        if with_pathlib == pathlib_direct_via_module_only:
+        try:
+            os.makedirs(self.location, exist_ok = True)
 
-            # Cas du mode « pathlib_direct_via_MODULE » :
-            # ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
-            #
-            # Ici, nous n'allons pas même créer d'objet, afin
-            # de shunter complètement notre gestion des disques
-            # et fichiers, et de la confier au module PATHLIB.
-            #
+        except OSError as e:
+            log_debug(f'INDEX : création impossible de « {self.location} » ( {e} ).')
+
+        waiting = [directory]
+        nb_dirs = 0
+
+        while waiting:
+
+            current = waiting.pop()
+
+            try:
+                # La date du répertoire est lue AVANT son parcours : si
+                # celui-ci est modifié pendant que nous le lisons, notre
+                # index sera ainsi considéré comme périmé dès sa 1ère
+                # utilisation.
+                #
+                mtime_ns = os.stat(current).st_mtime_ns
+                rows = []
+
+                with os.scandir(current) as iterator:
+
+                    for entry in iterator:
+
+                        flags = 0
+
+                        try:
+                            if entry.is_dir():
+                                flags |= _IndexEntry._is_dir
+                            if entry.is_file():
+                                flags |= _IndexEntry._is_file
+                            if entry.is_symlink():
+                                flags |= _IndexEntry._is_symlink
+
+                            st = entry.stat() if flags & _IndexEntry._is_file else None
+
+                        except OSError:
+                            st = None
+
+                        rows.append([
+                            entry.name,
+                            flags,
+                            st.st_size if st is not None else 0,
+                            st.st_mtime_ns if st is not None else 0
+                            ])
+
+                        if recursive and flags == _IndexEntry._is_dir:
+                            waiting.append(entry.path)
+
+            except OSError as e:
+
+                log_debug(f'INDEX : lecture impossible de « {current} » ( {e} ).')
+                continue
+
+            # Écriture dans 1 fichier temporaire, puis remplacement : un
+            # index ne peut ainsi jamais être lu à moitié écrit.
+            #
+            # RQ : Ce fichier temporaire a un nom unique ( cf _AtomicFile ),
+            # plusieurs threads ( cf _walk_files_in_parallel ) ou processus
+            # pouvant indexer en même temps un même répertoire.
+            #
+            index_file = self._file_of(current)
+            tmp_file = f'{index_file}.{os.getpid()}-{os.urandom(4).hex()}.tmp'
+
+            try:
+                with open(tmp_file, 'w', encoding = 'utf-8') as fd:
+                    json.dump(
+                        {
+                            'version'   :   self._version,
+                            'directory' :   current,
+                            'mtime_ns'  :   mtime_ns,
+                            'entries'   :   rows
+                        },
+                        fd,
+                        ensure_ascii = False,
+                        separators = (',', ':')
+                        )
+
+                os.replace(tmp_file, index_file)
+
+            except OSError as e:
+
+                # Notre index ne sera pas conservé pour les prochaines
+                # exécutions, mais ce que nous venons de lire reste la
+                # liste « vivante » du répertoire : nous la gardons en
+                # mémoire pour celle-ci.
+                #
+                log_debug(f'INDEX : écriture impossible de « {index_file} » ( {e} ).')
+
+                try:
+                    os.remove(tmp_file)
+                except OSError:
+                    pass
+
+            self._snapshots[current] = (mtime_ns, rows)
+            self._entries.pop(current, None)
+            nb_dirs += 1
+
+            log_debug(f'INDEX : « {current} » indexé ( {len(rows)} noeuds ).')
+
+        return nb_dirs
+
+    def _load(self, directory: str) -> tuple:
+        # -> ( date du répertoire, liste des entrées ) [ ou ] None
+        """ Lit l'index d'un répertoire, s'il en existe un.
+
+        RQ : Le résultat, même négatif, est conservé ( cf _snapshots ).
+        """
+
+        try:
+            snapshot = self._snapshots[directory]
+
+        except KeyError:
+
+            try:
+                with open(self._file_of(directory), encoding = 'utf-8') as fd:
+                    content = json.load(fd)
+
+            except (OSError, ValueError):
+                content = {}
+
+            if content.get('version') != self._version \
+                or content.get('directory') != directory:
+
+                self._snapshots[directory] = None
+                return None
+
+            snapshot = (content['mtime_ns'], content['entries'])
+            self._snapshots[directory] = snapshot
+
+        return snapshot
+
+    def lookup(self, directory: str) -> list:
+        # -> list( _IndexEntry ) [ ou ] None
+        """ Contenu d'un répertoire, tel que fourni par son index.
+
+        :param directory: le répertoire ( path ABSOLU ).
+
+        :return: la liste des entrées du répertoire, ou None si celui-ci
+        n'est pas indexé. Un index périmé est reconstruit au passage.
+        """
+
+        snapshot = self._load(directory)
+
+        if snapshot is None:
+            return None
+
+        try:
+            mtime_ns = os.stat(directory).st_mtime_ns
+
+        except OSError:
+            return None
+
+        if mtime_ns != snapshot[0]:
+
+            self.write_in_log(f'INDEX : « {directory} » périmé, reconstruction.')
+
+            self.build(directory)
+            snapshot = self._snapshots.get(directory)
+
+            if snapshot is None:
+                return None
+
+        try:
+            entries = self._entries[directory]
+
+        except KeyError:
+            entries = [_IndexEntry(directory, *row) for row in snapshot[1]]
+            self._entries[directory] = entries
+
+        return entries
+
+    def indexed(self) -> list:
+        # -> list( STR )
+        """ Liste des répertoires indexés ( i-e disposant d'un fichier
+        d'index dans notre répertoire « location » ).
+        """
+
+        directories = []
+
+        try:
+            names = os.listdir(self.location)
+
+        except OSError:
+            return directories
+
+        for name in names:
+
+            if not name.endswith('.json'):
+                continue
+
+            try:
+                with open(os.path.join(self.location, name), encoding = 'utf-8') as fd:
+                    directories.append(json.load(fd)['directory'])
+
+            except (OSError, ValueError, KeyError):
+                pass
+
+        return directories
+
+    def refresh(
+        self,
+        directory: str = None,
+        force: bool = False
+        ) -> int:
+        """ Reconstruit les index périmés ou absents.
+
+        :param directory: le répertoire à ( ré )indexer ; par défaut,
+        tous les répertoires déjà indexés.
+
+        :param force: les tailles et dates des fichiers n'étant pas
+        vérifiées par lookup() ( cf ci-dessus l'ATTENTION de notre
+        classe ), force = True reconstruit tous ces index, même s'ils
+        ne sont pas périmés, afin de les remettre à jour.
+
+        :return: le nombre de répertoires ( ré )indexés.
+        """
+
+        if directory is None:
+            directories = self.indexed()
+        else:
+            directories = [os.path.abspath(directory)]
+
+        nb_dirs = 0
+
+        for current in directories:
+
+            snapshot = None if force else self._load(current)
+
+            try:
+                fresh = snapshot is not None \
+                    and os.stat(current).st_mtime_ns == snapshot[0]
+
+            except OSError:
+                fresh = False
+
+            if not fresh:
+                nb_dirs += self.build(current)
+
+        return nb_dirs
+
+    def drop(self, directory: str = None) -> int:
+        """ Supprime l'index d'un répertoire, ou tous nos index.
+
+        :param directory: le répertoire dont l'index est à supprimer ;
+        par défaut, tous.
+
+        :return: le nombre d'index supprimés.
+        """
+
+        if directory is None:
+            directories = self.indexed()
+        else:
+            directories = [os.path.abspath(directory)]
+
+        nb_dirs = 0
+
+        for current in directories:
+
+            self._snapshots.pop(current, None)
+            self._entries.pop(current, None)
+
+            try:
+                os.remove(self._file_of(current))
+                nb_dirs += 1
+
+            except FileNotFoundError:
+                pass
+
+        return nb_dirs
+
+
+class FileSystemTree:
+    """ Cette classe permet de gérer répertoires et fichiers.
+    Pour ceci, suivant sa configuration, elle s'appuie soit
+    sur la librairie OS.PATH, soit sur le module PATHLIB.
+
+    Elle peut également utiliser les modules FNMATCH ou GLOB,
+    pour des fonctions annexes.
+
+    Ces différentes possibilités permettent de s'adapter aux
+    versions de Python et aux différents OS.
+
+    Pour des tests sur ce sujet :
+
+        Cf * - TESTS --- ( import + PATHLIB + GLOB + fnmatch ) ---.py
+        in --- [ skeleton ] = 2Do & NOTES.rar\( TESTS ) dont « mplay32.exe »
+        in _Know\Info\Dvpt\Réalisation\Src\_Python\[ skeleton ]
+
+        ou
+
+        Cf --- FILES and PATH --- ( mes ) NOTES = os.path, PATHLIB, fnmatch, GLOB*.py
+        in _Know\Info\Dvpt\Réalisation\Langages\Python\- et - FICHIERS.rar
+
+    REMARQUE : L'importation du module OS est toujours demandée
+    par skeleton.py. Pour les autres, cela dépend du bon vouloir
+    des utilisateurs de ce script.
+
+    REMARQUE : Par CONVENTION, les méthodes de FileSystemTree et
+    celles de sa « inner class » _FileSystemLeaf, sont IDENTIQUES
+    ( i.e ont le même nom, la même définition ) que les méthodes
+    présentes dans le module PATHLIB.
+
+        Cf https://docs.python.org/3/library/pathlib.html#correspondence-to-tools-in-the-os-module
+
+    ATTENTION : Si le module PATHLIB est importé, certaines des
+    méthodes de cet objet renverront en guise de paths ( chemin
+    de fichiers ) des valeurs type PATHLIB.PATH, sinon ces mêmes
+    valeurs seront de type STRING !!!
+
+        Il faut donc être prêt à gérer ces deux types de valeurs
+        lorsque nous traitons des paths ( d'autant plus si notre
+        mode est du type « pathlib_direct_... » ), SAUF si nous
+        ne demandons jamais à ce que PATHLIB soit utilisé.
+
+    ATTENTION : Si l'import direct de PATHLIB est demandé via les
+    modes type « pathlib_direct_... », toute fonction fournie par
+    PATHLIB sera accessible, même si non déclarées / surchargées
+    dans la classe incluse _FileSystemLeaf.
+
+        En effet, si l'on travaille de façon directe avec le module
+        PATHLIB, alors FileSystemTree.node() renvoie directement un
+        objet PATHLIB et cela va shunter la classe _FileSystemLeaf &
+        ses méthodes. L'objet pathlib.Path sera en effet directement
+        appelé !!!
+
+        Toutes les méthodes de la classe pathlib.PATH sont alors ici
+        disponibles.
+
+        Pour les classes et fonctions du module « pathlib » ( telles
+        PurePath() & autres ), elles doivent être codées au niveau de
+        notre classe FileSystemTree...
+
+        ... SAUF dans le mode « pathlib_direct_via_module_only », cas
+        où aucun objet FileSystemTree n'est créé : FileSystemTree, là,
+        n'est rien d'autre qu'un ALIAS vers le module PATHLIB !!!
+    """
+
+    _tree_counter = 0
+    _tree_last = None
+
+    def __new__(
+        cls,
+        *args,
+        log_file: logging.Logger = None,
+        with_pathlib: str = pathlib_ignore,
+        **kwargs
+        ):
+        """ CONSTRUCTEUR de la classe FileSystemTree.
+        """
+
+        write_in_log = _show_ if log_file is None else log_file.debug
+        write_in_log("Type de GESTION des FICHIERS :")
+        write_in_log("==============================")
+
+
+        # Nous allons dès maintenant importer le module pathlib
+        # si nécessaire. En effet, si nous ne créons pas ici d'
+        # objet FileSystemTree, nous allons renvoyer l'adresse
+        # de ce module pathlib, IL FAUT DONC QU'ELLE EXISTE !!!
+        #
+        if with_pathlib in pathlib_import:
+
+            # Puisque nous avons défini une variable globale du
+            # nom de pathlib, écrire simplement :
+            #
+            #   try: pathlib
+            #   except NameError: import pathlib
+            #
+            # ... ne permettra pas d'importer le module pathlib
+            # puisque « try: pathlib » ne lèvera pas d'exception
+            # ( la variable pathlib existe déjà... ).
+            #
+            global pathlib
+            try: pathlib.PurePath()
+            except AttributeError: import pathlib
+
+
+        # Devons nous ( ou non ) créer un objet FileSystemTree ?
+        #
+        if with_pathlib == pathlib_direct_via_module_only:
+
+            # Cas du mode « pathlib_direct_via_MODULE » :
+            # ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+            #
+            # Ici, nous n'allons pas même créer d'objet, afin
+            # de shunter complètement notre gestion des disques
+            # et fichiers, et de la confier au module PATHLIB.
+            #
             # C'est pathlib qui réalisera tout !
             #
             # Dans ce cas, TOUTES les fonctionnalités du module
@@ -1813,7 +3099,10 @@ class FileSystemTree:
         with_pathlib: str = pathlib_ignore,
         with_fnmatch: bool = False,
         with_glob: bool = False,
-        log_file: logging.Logger = None
+        log_file: logging.Logger = None,
+        with_index: bool = False,
+        index_location: str = None,
+        quiet_walk: bool = False
         ):
         """ INITIALISEUR de la classe FileSystemTree.
 
@@ -1859,6 +3148,17 @@ class FileSystemTree:
 
         :param log_file: identifiant d'un fichier de journalisation
         des messages, s'il en existe un.
+
+        :param with_index: faut-il utiliser les INDEX PERSISTANTS de
+        répertoires déjà construits ( cf index_build() ) ? Sinon, ils
+        ne le seront qu'après 1er appel à l'une de nos méthodes index_..
+
+        :param index_location: le répertoire où sont conservés ces index
+        ( cf _DirectoryIndex ).
+
+        :param quiet_walk: lors d'une recherche, faut-il ne journaliser
+        qu'1 seul message de synthèse ( nombre de noeuds, durée ), plutôt
+        qu'1 ou plusieurs messages par noeud trouvé ( cf _walk_loggers ) ?
         """
 
         # Si nous n'initialisons pas self.write_in_log, Python va
@@ -1866,7 +3166,13 @@ class FileSystemTree:
         # que « self » n'a pas d'attribut « write_in_log » !!!
         #
         self.write_in_log = None
+        self.index = None
+        self.quiet_walk = quiet_walk
         self._register_log(log_file)
+
+        # Cf notre méthode __del__().
+        #
+        _load_debug_modules_()
         log_debug = self.write_in_log
 
         # On importe les modules PATHLIB, FNMATCH et GLOB si tel
@@ -1940,6 +3246,14 @@ class FileSystemTree:
             except AttributeError: import glob
 
         log_debug('\tGLOB\t\t= ' + str(glob))
+
+        # Index persistants des répertoires.
+        #
+        self._index_location = index_location
+        if with_index:
+            self.index = _DirectoryIndex(index_location, self.write_in_log)
+
+        log_debug('\tINDEX\t\t= ' + str(None if self.index is None else self.index.location))
         log_debug('')
 
 
@@ -1958,35 +3272,159 @@ class FileSystemTree:
         à l'enregistrement de nos événements.
         """
 
+        # RQ : Notre fonction de journalisation accepte, comme
+        # logging.Logger.debug(), des arguments qui ne seront
+        # insérés dans le message que s'il est écrit :
+        #
+        #   self.write_in_log('Trouvé : « %s ».', path)
+        #
         if log is None:
-            log_debug = _show_
+            log_debug = _show_lazily_
         else:
             log_debug = log.debug
 
+        self._logger = log
         self.write_in_log = log_debug
 
+        if self.index is not None:
+            self.index.write_in_log = log_debug
 
-    def _cwd(self) -> object:
-        # -> _FileSystemLeaf [ ou ] PATHLIB.PATH
-        """ Pour connaître le RÉPERTOIRE de TRAVAIL.
 
-        Au regard de notre structure de donnée ( FileSystemTree
-        représente un système de gestion de fichiers ), il semble
-        logique que cette fonctionnalité se trouve au niveau de
-        la classe FileSystemTree. Le répertoire de travail dépend
-        en effet du système lui-même, et est fixé par ce système
-        lui-même. Ce n'est donc pas un attribut d'un noeud sous-
-        jacent, d'où :
+    def debug_on(self) -> bool:
+        """ Nos messages DEBUG seront-ils réellement écrits ( dans notre
+        journal, ou à l'écran si nous n'avons pas de journal ) ?
 
-            FileSystemTree._cwd()
+        Dans nos boucles les plus sollicitées, ce test est fait 1 seule
+        fois par opération, afin de ne pas construire des messages qui
+        seraient aussitôt jetés par le module LOGGING.
+        """
 
-        Pour autant, une méthode éponyme existe au niveau de notre
-        sous-classe _FileSystemLeaf ( et c'est cette méthode qui
-        doit être utilisée ) :
+        return self._logger is None or self._logger.isEnabledFor(logging.DEBUG)
 
-            FileSystemTree._FileSystemLeaf.cwd()
 
-        En effet, la méthode cwd() que nous voulons écrire se veut
+    def _walk_loggers(self) -> tuple:
+        # -> ( fonction [ ou ] None, fonction [ ou ] None )
+        """ Les fonctions de journalisation à utiliser lors d'1 recherche
+        ( 1 appel à _fake_iglob(), ... ) :
+
+            - la 1ère pour les messages émis à chaque noeud ;
+
+            - la 2nde pour l'unique message de synthèse émis à la fin de
+            la recherche, en mode « quiet_walk ».
+
+        Chacune vaut None si ses messages sont inutiles : notre appelant
+        n'a alors qu'à écrire « if log_each: log_each(...) ».
+        """
+
+        if not self.debug_on():
+            return None, None
+
+        if self.quiet_walk:
+            return None, self.write_in_log
+
+        return self.write_in_log, None
+
+
+    def _index_get(self) -> object:
+        # -> _DirectoryIndex
+        """ Notre gestionnaire d'INDEX, créé si besoin.
+        """
+
+        if self.index is None:
+            self.index = _DirectoryIndex(self._index_location, self.write_in_log)
+
+        return self.index
+
+
+    def index_build(
+        self,
+        directory: object,  # STR, _FileSystemLeaf, PATHLIB.PATH
+        recursive: bool = False
+        ) -> int:
+        """ Construit ( ou reconstruit ) l'INDEX PERSISTANT d'un répertoire,
+        voire de toute son arborescence. Dès lors, < _FileSystemLeaf >.iterdir(),
+        et donc glob(), _fake_iglob(), search_files_from_a_mask(), etc, liront
+        cet index plutôt que le répertoire lui-même.
+
+        Cf la classe _DirectoryIndex pour plus de détails.
+
+        RQ : En modes « pathlib_deeply » et « pathlib_direct_... », c'est le
+        module PATHLIB qui parcourt les répertoires : nos index ne sont alors
+        pas utilisés.
+
+        :param directory: le répertoire à indexer.
+
+        :param recursive: faut-il aussi indexer ses sous-répertoires ?
+
+        :return: le nombre de répertoires indexés.
+        """
+
+        return self._index_get().build(str(directory), recursive)
+
+
+    def index_refresh(
+        self,
+        directory: object = None,   # STR, _FileSystemLeaf, PATHLIB.PATH
+        force: bool = False
+        ) -> int:
+        """ Construit l'index d'un répertoire s'il n'existe pas ou s'il est
+        périmé ( ou, par défaut, reconstruit tous nos index périmés ).
+
+        C'est la méthode à appeler au lancement de nos scripts « batch » :
+        si l'index est à jour, il ne coûte qu'un seul os.stat().
+
+        :param directory: le répertoire concerné ( par défaut, tous ).
+
+        :param force: cf _DirectoryIndex.refresh().
+
+        :return: le nombre de répertoires ( ré )indexés.
+        """
+
+        if directory is not None:
+            directory = str(directory)
+
+        return self._index_get().refresh(directory, force)
+
+
+    def index_drop(
+        self,
+        directory: object = None    # STR, _FileSystemLeaf, PATHLIB.PATH
+        ) -> int:
+        """ Supprime l'index d'un répertoire ( ou, par défaut, tous nos
+        index ).
+
+        :param directory: le répertoire concerné ( par défaut, tous ).
+
+        :return: le nombre d'index supprimés.
+        """
+
+        if directory is not None:
+            directory = str(directory)
+
+        return self._index_get().drop(directory)
+
+
+    def _cwd(self) -> object:
+        # -> _FileSystemLeaf [ ou ] PATHLIB.PATH
+        """ Pour connaître le RÉPERTOIRE de TRAVAIL.
+
+        Au regard de notre structure de donnée ( FileSystemTree
+        représente un système de gestion de fichiers ), il semble
+        logique que cette fonctionnalité se trouve au niveau de
+        la classe FileSystemTree. Le répertoire de travail dépend
+        en effet du système lui-même, et est fixé par ce système
+        lui-même. Ce n'est donc pas un attribut d'un noeud sous-
+        jacent, d'où :
+
+            FileSystemTree._cwd()
+
+        Pour autant, une méthode éponyme existe au niveau de notre
+        sous-classe _FileSystemLeaf ( et c'est cette méthode qui
+        doit être utilisée ) :
+
+            FileSystemTree._FileSystemLeaf.cwd()
+
+        En effet, la méthode cwd() que nous voulons écrire se veut
         le pendant de :
 
             pathlib.Path.cwd()
@@ -2627,8 +4065,45 @@ class FileSystemTree:
                 « ATTENTION = Lorsqu'un path n'est pas absolu »
 
         Il y est ainsi suggéré une évolution de _FileSystemLeaf...
+
+        REMARQUE : Lorsque nous parcourons des répertoires contenant
+        des centaines de milliers de noeuds, ce sont les instances de
+        _FileSystemLeaf qui occupent l'essentiel de la mémoire. Nous
+        utilisons donc « __slots__ » ( pas de « __dict__ » par objet )
+        et les différentes parties du path ( drive, parent, name, stem
+        et suffix ) ne sont calculées qu'une seule fois, à la demande,
+        puis conservées. Cf _split_parts().
         """
 
+        # Cf https://docs.python.org/3/reference/datamodel.html#slots
+        #
+        #   « __slots__ allow us to explicitly declare data members
+        #   (like properties) and deny the creation of __dict__ and
+        #   __weakref__ (unless explicitly declared in __slots__ or
+        #   available in a parent.) The space saved over using
+        #   __dict__ can be significant. Attribute lookup speed can
+        #   be significantly improved as well. »
+        #
+        # ATTENTION : Toute nouvelle donnée d'instance ajoutée dans
+        # __init__() doit donc aussi être déclarée ci-dessous, sinon
+        # nous aurons droit à une exception AttributeError !!!
+        #
+        # « _parts » contient, une fois calculé, le n-uplet suivant :
+        #
+        #   ( drive, parent, name, stem, suffix )
+        #
+        # ... où toutes les valeurs sont de type STRING.
+        #
+        __slots__ = (
+            'tree',
+            '_flavour',
+            'walking_mode',
+            'location_string',
+            'location_object',
+            '_parts',
+            '_dir_entry',
+            )
+
         # La définition suivante :
         #
         #   def __init__(self, tree: FileSystemTree, location):
@@ -2654,7 +4129,8 @@ class FileSystemTree:
             self,
             tree: object,
             #location: os.PathLike
-            *args       # liste(_FileSystemLeaf [ ou ] os.PathLike)
+            *args,      # liste(_FileSystemLeaf [ ou ] os.PathLike)
+            dir_entry: os.DirEntry = None
             ):
             """
             :param tree: l'objet FileSystemTree dont nous dépendons.
@@ -2676,6 +4152,11 @@ class FileSystemTree:
                 par une liste de parties d'un path ( *ARGS )...
 
                 En effet, le module pathlib autorise cette option.
+
+            :param dir_entry: l'objet os.DirEntry dont nous sommes
+            éventuellement issus ( cf iterdir() en mode « walking_via_
+            scandir » ). Nous le conservons afin de réutiliser ses infos
+            en cache ( type du noeud, stat ) sans nouvel appel système.
             """
 
             self.tree = tree
@@ -2823,6 +4304,24 @@ class FileSystemTree:
             node = os.path.normpath(os.fspath(str(location)))
             self.location_string = node
 
+            # Les parties du path ne seront calculées qu'à la 1ère
+            # demande ( cf _split_parts() ).
+            #
+            self._parts = None
+
+            # Cf https://docs.python.org/3/library/os.html#os.DirEntry
+            #
+            #   « os.DirEntry methods may perform a system call, but
+            #   is_dir() and is_file() usually only require a system
+            #   call for symbolic links; os.DirEntry.stat() always
+            #   requires a system call on Unix but only requires one
+            #   for symbolic links on Windows. »
+            #
+            # ... et ces résultats sont ensuite mis en cache au sein
+            # de l'objet os.DirEntry. Cf aussi invalidate_cache().
+            #
+            self._dir_entry = dir_entry
+
             if tree.pathlib_import:
                 # Lorsque nous nous trouvons ici, alors notre mode
                 # d'exécution est « pathlib_deeply ».
@@ -3044,10 +4543,78 @@ class FileSystemTree:
             return self.tree._home()
 
 
+        def invalidate_cache(self):
+            """ Pour OUBLIER les infos du système de fichiers ( type
+            du noeud, stat ) mises en cache lors de notre création via
+            os.scandir(). Les appels suivants à is_dir(), is_file() ou
+            stat() interrogeront donc à nouveau le système de fichiers.
+
+            À appeler si le noeud a pu être modifié ( créé, supprimé,
+            remplacé par un répertoire, ... ) depuis le parcours de son
+            répertoire parent.
+
+            RQ : Cette méthode n'existe pas dans PATHLIB, dont les objets
+            ne conservent aucune info de ce type.
+            """
+
+            self._dir_entry = None
+
+
+        def stat(self) -> os.stat_result:
+            """ Return the result of the stat() system call on this
+            path, like os.stat() does.
+
+            Si nous sommes issus d'un parcours via os.scandir(), nous
+            réutilisons le résultat mis en cache par os.DirEntry.stat().
+            """
+
+            if self.tree.pathlib_import:
+                # Lorsque nous nous trouvons ici, alors notre mode
+                # d'exécution est « pathlib_deeply ».
+                #
+                # Ainsi, nous utilisons le module PATHLIB, mais pas
+                # directement. Un objet _FileSystemLeaf est créé afin
+                # d'accéder et / ou manipuler un noeud du système de
+                # fichiers, via les méthodes du module PATHLIB.
+                #
+                return self.location_object.stat()
+
+            elif self._dir_entry is not None:
+                # Nous sommes ici dans le mode « pathlib_ignore » et
+                # nous avons été créés par os.scandir().
+                #
+                return self._dir_entry.stat()
+
+            else:
+                # Nous sommes ici dans le mode « pathlib_ignore » et
+                # nous n'utilisons que les fonctions de OS.PATH pour
+                # émuler les méthodes de PATHLIB.
+                #
+                return os.stat(self.location_string)
+
+
         def is_dir(self) -> bool:
             """ Sommes-nous un RÉPERTOIRE ?
             """
 
+            entry = self._dir_entry
+
+            if entry is not None:
+
+                # Nous sommes issus d'un parcours via os.scandir() :
+                # le type du noeud est alors déjà connu ( d_type ) et
+                # aucun appel système n'est nécessaire.
+                #
+                # RQ : Contrairement à os.path.isdir(), DirEntry.is_dir()
+                # peut lever une exception OSError ( PermissionError par
+                # exemple ). Nous gardons le comportement de os.path.
+                #
+                try:
+                    return entry.is_dir()
+
+                except OSError:
+                    return False
+
             return os.path.isdir(self.location_string)
 
 
@@ -3055,7 +4622,19 @@ class FileSystemTree:
             """ Sommes-nous un FICHIER ?
             """
 
-            if self.tree.pathlib_import:
+            entry = self._dir_entry
+
+            if entry is not None:
+
+                # Cf les remarques de notre méthode is_dir().
+                #
+                try:
+                    return entry.is_file()
+
+                except OSError:
+                    return False
+
+            elif self.tree.pathlib_import:
                 # Lorsque nous nous trouvons ici, alors notre mode
                 # d'exécution est « pathlib_deeply ».
                 #
@@ -3074,6 +4653,29 @@ class FileSystemTree:
                 return os.path.isfile(self.location_string)
 
 
+        def is_symlink(self) -> bool:
+            """ Sommes-nous un LIEN SYMBOLIQUE ?
+            """
+
+            entry = self._dir_entry
+
+            if entry is not None:
+
+                # Cf les remarques de notre méthode is_dir().
+                #
+                try:
+                    return entry.is_symlink()
+
+                except OSError:
+                    return False
+
+            elif self.tree.pathlib_import:
+                return self.location_object.is_symlink()
+
+            else:
+                return os.path.islink(self.location_string)
+
+
         def exists(self) -> bool:
             """ Existons-nous PHYSIQUEMENT ?
             """
@@ -3097,6 +4699,47 @@ class FileSystemTree:
                 return os.path.exists(self.location_string)
 
 
+        def _split_parts(self) -> tuple:
+            # -> ( drive, parent, name, stem, suffix )
+            """ Décompose ( une seule fois ) notre path en ses parties
+            puis conserve le résultat dans « _parts ».
+
+            Auparavant, chacune des propriétés drive, parent, name,
+            stem et suffix relançait à chaque appel son propre calcul
+            via os.path ( basename, splitext, ... ). Lors du parcours
+            de gros répertoires, ces appels répétés coûtaient cher en
+            temps CPU.
+
+            RQ : Cette méthode n'est utilisée qu'en mode « pathlib_
+            ignore ». En mode « pathlib_deeply », c'est l'objet de
+            type pathlib.Path qui gère lui-même ce type de cache.
+
+            :return: le n-uplet ( drive, parent, name, stem, suffix ).
+            """
+
+            parts = self._parts
+
+            if parts is None:
+
+                path = self.location_string
+
+                # RQ : os.path.split() renvoie en une seule fois ce
+                # que donneraient os.path.dirname() et basename().
+                #
+                # Par ailleurs, os.path.splitext() ne s'intéresse qu'
+                # au dernier élément du path, donc l'appliquer à name
+                # ou à path donne la même extension.
+                #
+                drive, _ = os.path.splitdrive(path)
+                parent, name = os.path.split(path)
+                stem, suffix = os.path.splitext(name)
+
+                parts = (drive, parent, name, stem, suffix)
+                self._parts = parts
+
+            return parts
+
+
         @property
         def drive(self) -> str:
             """ Quel est notre DISQUE ?
@@ -3118,8 +4761,7 @@ class FileSystemTree:
                 # nous n'utilisons que les fonctions de OS.PATH pour
                 # émuler les méthodes de PATHLIB.
                 #
-                drive, _ = os.path.splitdrive(self.location_string)
-                return drive
+                return self._split_parts()[0]
 
 
         @property
@@ -3151,7 +4793,7 @@ class FileSystemTree:
                 # nous n'utilisons que les fonctions de OS.PATH pour
                 # émuler les méthodes de PATHLIB.
                 #
-                path = os.path.dirname(self.location_string)
+                path = self._split_parts()[1]
 
             return FileSystemTree._FileSystemLeaf(self.tree, path)
 
@@ -3179,7 +4821,7 @@ class FileSystemTree:
                 # nous n'utilisons que les fonctions de OS.PATH pour
                 # émuler les méthodes de PATHLIB.
                 #
-                return os.path.basename(self.location_string)
+                return self._split_parts()[2]
 
 
         @property
@@ -3205,8 +4847,7 @@ class FileSystemTree:
                 # nous n'utilisons que les fonctions de OS.PATH pour
                 # émuler les méthodes de PATHLIB.
                 #
-                stem, _ = os.path.splitext(self.name)
-                return stem
+                return self._split_parts()[3]
 
 
         @property
@@ -3230,8 +4871,7 @@ class FileSystemTree:
                 # nous n'utilisons que les fonctions de OS.PATH pour
                 # émuler les méthodes de PATHLIB.
                 #
-                _, extension = os.path.splitext(self.location_string)
-                return extension
+                return self._split_parts()[4]
 
 
         def is_absolute(self) -> bool:
@@ -3378,7 +5018,7 @@ class FileSystemTree:
                 # nous n'utilisons que les fonctions de OS.PATH pour
                 # émuler les méthodes de PATHLIB.
                 #
-                parent = os.path.dirname(self.location_string)
+                parent = self._split_parts()[1]
                 baby = os.path.join(parent, new_name)
 
                 return FileSystemTree._FileSystemLeaf(self.tree, baby)
@@ -3541,7 +5181,7 @@ class FileSystemTree:
             # utilisons notre méthode .resolve() ailleurs, sans avoir pris
             # garde de modifier le code de _FileSystemLeaf.
             #
-            log_debug = self.tree.write_in_log
+            log_debug = self.tree.write_in_log if self.tree.debug_on() else lambda *x: None
 
             log_debug('\tATTENTION : Suite à un problème de structure de données,')
             log_debug('\t< _FileSystemLeaf >.resolve() ne sait PAS garantir un PATH')
@@ -3639,7 +5279,16 @@ class FileSystemTree:
                 ... pour s'en convaincre.
             """
 
-            log_debug = self.tree.write_in_log
+            # iterdir() étant appelée pour chacun des répertoires parcourus,
+            # son message n'est émis qu'en dehors du mode « quiet_walk ».
+            #
+            log_each, _ = self.tree._walk_loggers()
+
+            # Notre répertoire est-il indexé ( cf FileSystemTree.index_build ) ?
+            #
+            entries = None
+            if self.tree.index is not None and not self.tree.pathlib_import:
+                entries = self.tree.index.lookup(os.path.abspath(self.location_string))
 
             if self.tree.pathlib_import:
 
@@ -3651,10 +5300,31 @@ class FileSystemTree:
                 # d'accéder et / ou manipuler un noeud du système de
                 # fichiers, via les méthodes du module PATHLIB.
                 #
-                log_debug('ITÉRATEUR = pathlib.iterdir()')
+                if log_each:
+                    log_each('ITÉRATEUR = pathlib.iterdir()')
                 generator = self.location_object.iterdir()
 
 
+            elif entries is not None:
+
+                # Le contenu de notre répertoire nous est fourni par son
+                # index : nous ne le relisons pas. Chaque entrée de l'index
+                # se comporte comme un os.DirEntry, donc, comme en mode
+                # « walking_via_scandir », is_dir(), is_file() et stat()
+                # ne coûteront aucun appel système.
+                #
+                if log_each:
+                    log_each('ITÉRATEUR = INDEX du répertoire')
+
+                fct = lambda x: FileSystemTree._FileSystemLeaf(
+                        self.tree,
+                        x.path,
+                        dir_entry = x
+                        )
+
+                generator = _generator_create(entries, fct)
+
+
             # Nous sommes ici dans le mode « pathlib_ignore » et
             # nous n'utilisons que les fonctions de OS.PATH pour
             # émuler les méthodes de PATHLIB.
@@ -3683,12 +5353,19 @@ class FileSystemTree:
                 # are yielded in arbitrary order, and the special entries '.'
                 # and '..' are not included.
                 #
-                log_debug('ITÉRATEUR = os.scandir()')
+                if log_each:
+                    log_each('ITÉRATEUR = os.scandir()')
                 iterator = os.scandir(path = self.location_string)
 
                 # « x » sera de type os.DirEntry, il connaîtra donc son
                 # répertoire et le fournira à os.path.abspath().
                 #
+                # Nous transmettons aussi « x » à notre nouvel objet afin
+                # qu'il puisse réutiliser le type du noeud ( d_type ) mis
+                # en cache par os.scandir(). Ainsi, dans _fake_iglob(), le
+                # filtrage des répertoires / fichiers ne coûtera plus aucun
+                # appel système supplémentaire.
+                #
                 # Pas besoin donc d'écrire :
                 #
                 #   yield os.path.abspath(os.path.join(..))
@@ -3703,7 +5380,8 @@ class FileSystemTree:
                 #
                 fct = lambda x: FileSystemTree._FileSystemLeaf(
                         self.tree,
-                        os.path.abspath(x.path)
+                        os.path.abspath(x.path),
+                        dir_entry = x
                         )
 
                 generator = _generator_create(iterator, fct)
@@ -3723,7 +5401,8 @@ class FileSystemTree:
                 # chose que le module OS.PATH pour parcourir le système
                 # de fichiers...
                 #
-                log_debug('ITÉRATEUR = os.listdir()')
+                if log_each:
+                    log_each('ITÉRATEUR = os.listdir()')
                 our_path = self.location_string
                 iterator = os.listdir(path = our_path)
 
@@ -3782,14 +5461,76 @@ class FileSystemTree:
             self,
             mask: str = '*',
             s_type: int = None
-            ) -> dict:
+            ) -> object:
+            # -> _CompiledMask
             """ Analyse un masque de recherche destiné à _fake_iglob()
-            et renvoie un dictionnaire contenant le résultat de notre
-            analyse. Ce dictionnaire pourra ensuite être passé en tant
-            que paramètre à _fake_iglob() sous la forme :
+            et renvoie un objet ( immuable ) _CompiledMask contenant le
+            résultat de notre analyse. Cet objet pourra ensuite être
+            passé en tant que paramètre à _fake_iglob() sous la forme :
 
                 _fake_iglob( .., **_parse_mask( .. ) )
 
+            L'analyse elle-même est réalisée par _compile_mask(), mais
+            une seule fois par masque : son résultat est conservé dans
+            le cache LRU « _masks_cache », partagé par tous les objets
+            FileSystemTree. Ainsi, lorsque search_path_from_masks() ou
+            glob() relancent les mêmes recherches dans des répertoires
+            différents, l'analyse n'est pas refaite.
+
+            :param mask: cf _compile_mask().
+
+            :param s_type: cf _compile_mask().
+
+            :return: l'objet _CompiledMask résultant de notre analyse.
+            """
+
+            # Seul _search_fnmatch est pris en compte parmi les valeurs
+            # de « s_type » ( cf _compile_mask() ), d'où notre clé.
+            #
+            key = (mask, _search_fnmatch if s_type == _search_fnmatch else None)
+
+            try:
+                compiled = _masks_cache.pop(key)
+
+            except KeyError:
+
+                compiled = self._compile_mask(mask, s_type)
+
+                # Cache plein ? On supprime le masque le moins récemment
+                # utilisé ( i-e le 1er du dictionnaire ).
+                #
+                while len(_masks_cache) >= _masks_cache_size:
+                    try:
+                        del _masks_cache[next(iter(_masks_cache))]
+                    except (KeyError, StopIteration, RuntimeError):
+                        break
+
+            else:
+                log_each, _ = self.tree._walk_loggers()
+                if log_each:
+                    log_each('Masque « %s » déjà analysé ( cache ).', mask)
+
+            # Le masque devient le plus récemment utilisé, donc nous le
+            # (re)plaçons en fin de dictionnaire.
+            #
+            _masks_cache[key] = compiled
+
+            return compiled
+
+
+        def _compile_mask(
+            self,
+            mask: str = '*',
+            s_type: int = None
+            ) -> object:
+            # -> _CompiledMask
+            """ Analyse un masque de recherche destiné à _fake_iglob()
+            et renvoie un objet _CompiledMask contenant le résultat de
+            notre analyse.
+
+            RQ : Ne pas appeler directement, mais plutôt via _parse_mask()
+            qui en conserve les résultats dans un cache.
+
             :param mask: le masque de recherche & sont acceptés :
 
                 - « * » : tous les fichiers.
@@ -3798,17 +5539,28 @@ class FileSystemTree:
 
                 - « title*.m* » : masque plus complexe.
 
+                - « title_t?[0-9].m[!o]* » : masque complexe avec les
+                caractères spéciaux « ? », « [seq] » et « [!seq] », qui
+                sera traduit en expression régulière ( cf _mask_to_regex ).
+
                 - n'importe quel masque interprétable via la méthode
                 fnmatch() du module FNMATCH si la valeur de « s_type »
                 est « _search_fnmatch ».
 
+                - « sub/*.py », « **/*.py », « src/**/test*.py », ...
+                : masque sur plusieurs niveaux de répertoires, où « ** »
+                correspond à zéro, un ou plusieurs répertoires. Chaque
+                niveau ( sauf « ** » ) est alors analysé séparément par
+                un appel récursif à _parse_mask().
+
             :param s_type: ce paramètre n'a à être fourni que si nous
             désirons forcer la lecture du masque via le module FNMATCH
             ( valeur _search_fnmatch ). Sinon, il ne sera pas pris en
-            compte.
+            compte. Dans le cas d'un masque sur plusieurs niveaux, il
+            s'appliquera à chacun d'entre eux.
 
-            :return: un dictionnaire résultant de notre analyse de mask
-            et qui peut être transmis à _fake_iglob().
+            :return: l'objet _CompiledMask résultant de notre analyse
+            de mask et qui peut être transmis à _fake_iglob().
             """
 
             log_debug = self.tree.write_in_log
@@ -3818,6 +5570,30 @@ class FileSystemTree:
             test_fct = None
 
 
+            # Le masque porte-t-il sur plusieurs niveaux de répertoires
+            # ( « sub/*.py » ) ou contient-il le joker « ** » ?
+            #
+            # Si oui, nous analysons séparément chacun de ces niveaux et
+            # la liste de ces analyses sera transmise à _fake_iglob() via
+            # « mask_lst ». Le joker « ** » y sera représenté par None.
+            #
+            if _mask_is_recursive(mask):
+
+                levels = _mask_levels(mask)
+
+                log_debug('Recherche de type RÉCURSIVE !!!')
+                log_debug(f'Niveaux de répertoires du masque : {levels}.')
+
+                level_type = _search_fnmatch if s_type == _search_fnmatch else None
+
+                mask_lst = [
+                    None if level == '**' else self._parse_mask(level, level_type)
+                    for level in levels
+                    ]
+
+                return _CompiledMask(mask, _search_recursive, None, mask_lst, None)
+
+
             #
             # NOUS ALLONS IDENTIFIER QUEL EST LE TYPE DE RECHERCHE.
             #
@@ -3871,6 +5647,10 @@ class FileSystemTree:
             # Actuellement, ce code est plus à visée didactique que
             # pour une mise en production !!!
             #
+            # RQ : Un masque contenant « ? » ou « [ » ne peut jamais être
+            # SIMPLE ( « *.p? » n'est pas l'extension « .p? » ) : il sera
+            # traité comme un masque COMPLEXE.
+            #
             elif mask == '*':
 
                 # Cas d'1 chaîne de recherche très SIMPLE i-e : « * ».
@@ -3881,7 +5661,7 @@ class FileSystemTree:
                 log_debug('On accepte ici tous les noms.')
 
 
-            elif mask[0] == '*' and not '*' in mask[1:]:
+            elif mask[0] == '*' and not '*' in mask[1:] and not _mask_has_wildcards(mask):
 
                 # Cas d'1 chaîne de recherche SIMPLE i-e : « *< suffix > ».
                 #
@@ -4035,6 +5815,55 @@ class FileSystemTree:
                     test_fct = _test_simple
 
 
+            # FONCTION de TEST pour une RECHERCHE COMPLEXE avec des caractères
+            # spéciaux ( wildcards ) autres que « * », i-e « ? », « [seq] » ou
+            # « [!seq] ».
+            #
+            # Avant, seul FNMATCH savait interpréter ces caractères ( cf ci-
+            # dessus _search_fnmatch ), mais fnmatch.fnmatch() est alors appelée
+            # pour chaque nom & elle normalise à chaque fois la casse du nom et
+            # du masque ( os.path.normcase ), avant de passer par son propre
+            # cache d'expressions régulières...
+            #
+            # Nous traduisons donc ici le masque, UNE FOIS POUR TOUTES, en une
+            # expression régulière compilée en mode IGNORECASE ( nous restons
+            # ainsi insensibles à la casse, comme pour _test_simple() et pour
+            # _test_complex() ). Cf _mask_to_regex().
+            #
+            # RQ : La fonction de test est ici propre à chaque masque puisque
+            # l'expression compilée lui est liée ( via un argument par défaut ).
+            # Celle-ci n'étant jamais modifiée, il n'y a pas d'effet de bord à
+            # craindre en cas d'exécution en // ou asynchrone ( cf les remarques
+            # sur les variables « NON LOCAL » dans _fake_iglob ).
+            #
+            elif s_type == _search_complex and _mask_has_wildcards(mask):
+
+                regex = _mask_to_regex(mask)
+                log_debug(f'Masque traduit en expression régulière : « {regex} ».')
+
+                try:
+                    matcher = re.compile(regex, re.IGNORECASE | re.DOTALL)
+
+                except re.error as e:
+
+                    # Séquence invalide pour le module RE ( « [z-a] » par ex ),
+                    # nous laissons alors FNMATCH se débrouiller avec...
+                    #
+                    log_debug(f'Expression régulière invalide ( {e} ) & on utilise FNMATCH.')
+
+                    return self._compile_mask(mask, _search_fnmatch)
+
+                def _test_wildcards(
+                    name: str,
+                    _fullmatch = matcher.fullmatch,
+                    **kwargs
+                    ) -> bool:
+
+                    return _fullmatch(name) is not None
+
+                test_fct = _test_wildcards
+
+
             # FONCTION de TEST pour une RECHERCHE COMPLEXE.
             #
             # On construit notre algorithme de recherche dite « COMPLEXE » dans
@@ -4194,16 +6023,10 @@ class FileSystemTree:
                     test_fct = _test_complex
 
 
-            # On construit le dictionnaire qui va nous permettre de transmettre
-            # notre analyse à _fake_iglob().
+            # On construit l'objet ( immuable ) qui va nous permettre de
+            # transmettre notre analyse à _fake_iglob().
             #
-            return {
-                'mask'      :   mask,
-                's_type'    :   s_type,
-                'suffix'    :   suffix,
-                'mask_lst'  :   mask_lst,
-                'test_fct'  :   test_fct,
-            }
+            return _CompiledMask(mask, s_type, suffix, mask_lst, test_fct)
 
 
         def _fake_iglob(
@@ -4259,21 +6082,24 @@ class FileSystemTree:
             ci-dessous de notre paramètre mask ( « :param mask: » ).
 
             En terme de puissance d'écriture du masque, _fake_iglob
-            n'offre toutefois pas toutes les possibilités présentes
-            chez les fonctions qu'elle émule.
-
-            Par exemple, actuellement, elle ne sait interpréter les
-            caractères spéciaux ( wildcards ) suivants :
+            sait interpréter les mêmes caractères spéciaux ( wildcards )
+            que les fonctions qu'elle émule :
 
+                *           matches everything
                 ?           matches any single character
                 [seq]       matches any character in seq
                 [!seq]      matches any character not in seq
 
-            SAUF SI NOUS IMPOSONS EN AMONT L'UTILISATION DE FNMATCH
-            VIA UN APPEL DU TYPE :
+            ... et ce SANS que nous ayons à imposer en amont l'usage de
+            FNMATCH via un appel du type :
 
                  _fake_iglob( n_type, **_parse_mask( mask, _search_fnmatch ) )
 
+            Les 3 derniers sont traduits une fois pour toutes en une
+            expression régulière ( cf _mask_to_regex ). Contrairement
+            à FNMATCH sous Linux, la recherche est ALORS AUSSI insensible
+            à la casse.
+
 
             :param n_type: voulons-nous que soient retournés :
 
@@ -4293,6 +6119,12 @@ class FileSystemTree:
 
                 - « title*.m* » : masque plus complexe.
 
+                - « title_t?[0-9].m[!o]* » : masque complexe avec les
+                caractères spéciaux « ? », « [seq] » et « [!seq] ».
+
+                - « **/*.py », « sub/*.py », ... : masque RÉCURSIF ou
+                sur plusieurs niveaux de répertoires ( cf _fake_rglob ).
+
                 Si avant l'appel à _fake_iglob(), _parse_mask a été
                 invoquée, point n'est besoin de donner à nouveau la
                 valeur de « mask » puisqu'elle aura déjà été fournie
@@ -4318,31 +6150,40 @@ class FileSystemTree:
             #leaf = self.tree.node
             leaf = self.tree.Path
 
-            log_debug = self.tree.write_in_log
-            log_debug('Recherche de fichiers via « _fake_iglob »')
-            log_debug('... avec des résultats sous forme de PATHS ABSOLUS')
-            log_debug(f'... avec itération via « {self.walking_mode} ».')
+            # Le niveau de notre journal n'est testé qu'1 seule fois, ici :
+            # ensuite, dans notre boucle, aucun message n'est construit s'il
+            # ne doit pas être écrit ( cf FileSystemTree._walk_loggers ).
+            #
+            log_each, log_summary = self.tree._walk_loggers()
 
+            if log_each:
+                log_each('Recherche de fichiers via « _fake_iglob »')
+                log_each('... avec des résultats sous forme de PATHS ABSOLUS')
+                log_each('... avec itération via « %s ».', self.walking_mode)
 
-            # On indique si tous les noeuds seront recherchés, seulement les
-            # fichiers, ou seulement les répertoires.
-            #
-            if n_type == _glob_all_nodes:
-                log_debug("Fichiers ET répertoires acceptés.")
+                # On indique si tous les noeuds seront recherchés, seulement
+                # les fichiers, ou seulement les répertoires.
+                #
+                if n_type == _glob_all_nodes:
+                    log_each("Fichiers ET répertoires acceptés.")
 
-            elif n_type == _glob_only_dirs:
-                log_debug("RÉPERTOIRES seuls acceptés.")
+                elif n_type == _glob_only_dirs:
+                    log_each("RÉPERTOIRES seuls acceptés.")
 
-            else:
-                log_debug("FICHIERS seuls acceptés.")
+                else:
+                    log_each("FICHIERS seuls acceptés.")
 
 
             # Si les paramètres de notre recherche n'ont pas été initialisés,
             # nous nous en chargeons...
             #
-            if s_type is None or test_fct is None:
+            # RQ : Une recherche RÉCURSIVE n'a pas de fonction de test qui
+            # lui soit propre ( ce sont ses niveaux qui en ont une ).
+            #
+            if s_type is None or (test_fct is None and s_type != _search_recursive):
 
-                log_debug("Nous devons en premier lieu analyser le masque.")
+                if log_each:
+                    log_each("Nous devons en premier lieu analyser le masque.")
 
                 mask_dct = self._parse_mask(mask)
                 s_type = mask_dct['s_type']
@@ -4350,86 +6191,142 @@ class FileSystemTree:
                 mask_lst = mask_dct['mask_lst']
                 test_fct = mask_dct['test_fct']
 
-            else:
-                log_debug("Le masque a déjà été analysé.")
+            elif log_each:
+                log_each("Le masque a déjà été analysé.")
 
 
             # On lance notre recherche grâce à l'initialisation qui résulte
             # de l'appel en amont à _parse_mask().
             #
-            if s_type in _searches_lst:
+            if s_type == _search_recursive:
+
+                # Le masque porte sur plusieurs niveaux de répertoires :
+                # c'est _fake_rglob() qui va parcourir l'arborescence.
+                #
+                yield from self._fake_rglob(n_type, mask_lst)
+
+            elif s_type in _searches_lst:
 
-                log_debug(f"Fonction de « match » : {test_fct}")
+                if log_each:
+                    log_each("Fonction de « match » : %s", test_fct)
 
                 s_len = len(suffix) if suffix is not None else 0
                 s_lower = suffix.lower() if suffix is not None else None
 
-                for file_or_dir in self.iterdir():
+                # En mode « quiet_walk », nous comptons les noeuds lus et
+                # trouvés pour notre unique message de synthèse, émis même
+                # si notre appelant abandonne notre générateur en cours de
+                # route ( cf « finally » ).
+                #
+                nb_read = 0
+                nb_found = 0
+                t_start = time.perf_counter() if log_summary else None
 
-                    # Le noeud du système de fichier dont nous allons inspecter
-                    # le nom est-il bien du type recherché ?
-                    #
-                    # C-a-d cherchons-nous tous les noeuds ? les fichiers ou les
-                    # répertoires seulement ?
-                    #
-                    node_ok = (n_type == _glob_all_nodes) \
-                        or (n_type == _glob_only_dirs and file_or_dir.is_dir()) \
-                        or (n_type == _glob_only_files and file_or_dir.is_file())
+                # Hors mode PATHLIB, et si nous avons nous-même un path
+                # ABSOLU, les _FileSystemLeaf fournis par iterdir() ont
+                # déjà un path ABSOLU : nous le renvoyons tel quel, sans
+                # passer par resolve() ( cf ci-dessous ).
+                #
+                leaf_type = type(self)
+                as_is = not self.tree.pathlib_import and os.path.isabs(self.location_string)
 
-                    # On teste si le nom du fichier ou du répertoire correspond au
-                    # masque indiqué.
-                    #
-                    # Nous fournissons à la fonction de test toutes les infos dont
-                    # elle pourrait avoir besoin. Certaines de celles-ci auraient
-                    # pu être recalculées lors de chaque appel, au prix d'1 perte
-                    # de temps. Nous avons choisi de perdre de la mémoire plutôt.
-                    #
-                    # Nous aurions pu transmettre à la fonction « test_fct » ces
-                    # paramètres d'une façon différente ( via une fonction LAMBDA
-                    # définie ds _parse_mask avec les bons arguments par exemple,
-                    # ou via le transfert en paramètre d'1 dictionnaire ) mais ns
-                    # avons opté pour cette méthode à des fins didactiques ie pour
-                    # tester les possibilités type « KWARGS » offertes par Python.
-                    #
-                    # Par contre, nous n'aurions pu utiliser des variables d'un
-                    # type « NON LOCAL » à l'intérieur de _parse_mask() et de sa
-                    # fonction imbriquée choisie pour les tests. En effet, nous
-                    # aurions alors pu nous confronter à des effets de bord non
-                    # désirés dans le cas d'exécution en // ou asynchrone !!!
-                    #
-                    if node_ok and test_fct(
-                                        file_or_dir.name,
-                                        mask = mask,
-                                        mask_lst = mask_lst,
-                                        suffix_len = s_len,
-                                        suffix_lower = s_lower,
-                                        ):
-
-                        log_debug(f'Nouveau fichier trouvé : « {file_or_dir} ».')
-                        log_debug(f'\t\t=> DATATYPE = {type(file_or_dir)}')
-
-                        # Notre méthode .iterdir() ne fournit un PATH ABSOLU
-                        # que dans le cas où elle renvoie des _FileSystemLeaf.
-                        # Dans ce cas, nous pourrions donc n'écrire que :
+                try:
+
+                    for file_or_dir in self.iterdir():
+
+                        nb_read += 1
+
+                        # Le noeud du système de fichier dont nous allons inspecter
+                        # le nom est-il bien du type recherché ?
                         #
-                        #   yield str(file_or_dir)
-                        #                        
-                        # Mais si notre squelette est configuré pour travailler
-                        # avec le module PATHLIB, alors les objets file_or_dir
-                        # sont de type pathlib.PATH : aucune garantie qu'ils ne
-                        # soient en ce cas avec un path absolu, d'où l'appel à
-                        # la méthode .resolve() pour cela...
+                        # C-a-d cherchons-nous tous les noeuds ? les fichiers ou les
+                        # répertoires seulement ?
                         #
-                        # Pour plus d'explications, cf la partie « :return: »
-                        # dans l'entête de notre méthode .iterdir() :
+                        node_ok = (n_type == _glob_all_nodes) \
+                            or (n_type == _glob_only_dirs and file_or_dir.is_dir()) \
+                            or (n_type == _glob_only_files and file_or_dir.is_file())
+
+                        # On teste si le nom du fichier ou du répertoire correspond au
+                        # masque indiqué.
                         #
-                        #   « def iterdir(self) -> object: »
+                        # Nous fournissons à la fonction de test toutes les infos dont
+                        # elle pourrait avoir besoin. Certaines de celles-ci auraient
+                        # pu être recalculées lors de chaque appel, au prix d'1 perte
+                        # de temps. Nous avons choisi de perdre de la mémoire plutôt.
                         #
-                        yield str(file_or_dir.resolve())
+                        # Nous aurions pu transmettre à la fonction « test_fct » ces
+                        # paramètres d'une façon différente ( via une fonction LAMBDA
+                        # définie ds _parse_mask avec les bons arguments par exemple,
+                        # ou via le transfert en paramètre d'1 dictionnaire ) mais ns
+                        # avons opté pour cette méthode à des fins didactiques ie pour
+                        # tester les possibilités type « KWARGS » offertes par Python.
                         #
-                        # Cf aussi la mise en garde ds notre méthode .resolve :
+                        # Par contre, nous n'aurions pu utiliser des variables d'un
+                        # type « NON LOCAL » à l'intérieur de _parse_mask() et de sa
+                        # fonction imbriquée choisie pour les tests. En effet, nous
+                        # aurions alors pu nous confronter à des effets de bord non
+                        # désirés dans le cas d'exécution en // ou asynchrone !!!
                         #
-                        #   « ATTENTION = Lorsqu'un path n'est pas absolu »
+                        if node_ok and test_fct(
+                                            file_or_dir.name,
+                                            mask = mask,
+                                            mask_lst = mask_lst,
+                                            suffix_len = s_len,
+                                            suffix_lower = s_lower,
+                                            ):
+
+                            nb_found += 1
+
+                            if log_each:
+                                log_each('Nouveau fichier trouvé : « %s ».', file_or_dir)
+                                log_each('\t\t=> DATATYPE = %s', type(file_or_dir))
+
+                            # Notre méthode .iterdir() ne fournit un PATH ABSOLU
+                            # que dans le cas où elle renvoie des _FileSystemLeaf.
+                            # Dans ce cas, nous pourrions donc n'écrire que :
+                            #
+                            #   yield str(file_or_dir)
+                            #                        
+                            # Mais si notre squelette est configuré pour travailler
+                            # avec le module PATHLIB, alors les objets file_or_dir
+                            # sont de type pathlib.PATH : aucune garantie qu'ils ne
+                            # soient en ce cas avec un path absolu, d'où l'appel à
+                            # la méthode .resolve() pour cela...
+                            #
+                            # Pour plus d'explications, cf la partie « :return: »
+                            # dans l'entête de notre méthode .iterdir() :
+                            #
+                            #   « def iterdir(self) -> object: »
+                            #
+                            # RQ : Dans le 1er cas, nous renvoyons directement
+                            # son path ( cf « as_is » ), afin d'éviter, pour
+                            # chaque fichier trouvé, le coût de .resolve().
+                            #
+                            if as_is and type(file_or_dir) is leaf_type:
+                                yield file_or_dir.location_string
+                            else:
+                                yield str(file_or_dir.resolve())
+                            #
+                            # Cf aussi la mise en garde ds notre méthode .resolve :
+                            #
+                            #   « ATTENTION = Lorsqu'un path n'est pas absolu »
+
+                finally:
+
+                    if log_summary:
+                        elapsed = time.perf_counter() - t_start
+                        log_summary(
+                            '_fake_iglob « %s » dans « %s » : %d noeuds lus, %d retenus, en %.4f s.',
+                            mask,
+                            self,
+                            nb_read,
+                            nb_found,
+                            elapsed,
+                            extra = {
+                                'elapsed': elapsed,
+                                'counters': {'read': nb_read, 'found': nb_found}
+                                }
+                            )
 
 
             # Si le type de recherche ne nous est pas connu, nous devrions
@@ -4437,14 +6334,174 @@ class FileSystemTree:
             # aucun résultat.
             #
             else:
-                log_debug(f"Type de recherche inconnu : {s_type}.")
+                log_debug = self.tree.write_in_log
+                log_debug("Type de recherche inconnu : %s.", s_type)
                 log_debug("AUCUN RÉSULTAT NE SERA DONC FOURNI !!!")
 
                 yield from ()
 
 
+        def _fake_rglob(
+            self,
+            n_type: int = _glob_all_nodes,
+            mask_lst: list = None
+            ) -> object:
+            # ( générateur ) -> STR
+            """ Recherche RÉCURSIVE pour _fake_iglob(), i-e pour un
+            masque sur plusieurs niveaux de répertoires ( « sub/*.py »,
+            « **/*.py », ... ).
+
+            L'arborescence est parcourue UNE SEULE FOIS, via os.scandir()
+            ( quel que soit notre « walking_mode » ), d'une façon ITÉRATIVE
+            ( pas d'appels récursifs, donc pas de risque de dépasser la
+            limite de récursion de Python sur des arborescences profondes ).
+
+            Pour chaque répertoire à parcourir, nous conservons l'ensemble
+            des niveaux du masque ( « positions » ) qui peuvent encore s'y
+            appliquer. Un sous-répertoire pour lequel cet ensemble est vide
+            ne peut contenir aucun résultat : il n'est donc pas parcouru
+            ( « élagage » ).
+
+            ATTENTION : Sous « ** », les liens symboliques vers des
+            répertoires ne sont pas suivis ( afin d'éviter des boucles
+            infinies ), tout comme le fait glob.glob().
+
+            :param n_type: cf _fake_iglob().
+
+            :param mask_lst: la liste des niveaux du masque, telle que
+            construite par _parse_mask(). Chaque niveau y est représenté
+            par son objet _CompiledMask, ou par None pour le joker « ** ».
+
+            :return: un générateur des noeuds trouvés, sous forme de
+            STRING et de PATHS ABSOLUS.
+            """
+
+            log_each, log_summary = self.tree._walk_loggers()
+
+            if log_each:
+                log_each('Recherche RÉCURSIVE via « _fake_rglob » et « os.scandir ».')
+
+            t_start = time.perf_counter() if log_summary else None
+
+            last = len(mask_lst) - 1
+
+            # Pour chaque niveau, la fonction de test ( cf _CompiledMask ).
+            #
+            tests = [
+                None if level is None else level.match
+                for level in mask_lst
+                ]
+
+            # Un « ** » peut correspondre à ZÉRO répertoire : atteindre la
+            # position d'un « ** », c'est donc aussi atteindre la suivante.
+            #
+            # RQ : _mask_levels() a réduit les « ** » consécutifs à un seul.
+            #
+            def _reached(i: int) -> tuple:
+                return (i, i + 1) if tests[i] is None and i < last else (i,)
+
+            def _is_dir(entry: os.DirEntry, follow: bool) -> bool:
+                try:
+                    return entry.is_dir(follow_symlinks = follow)
+                except OSError:
+                    return False
+
+            def _node_ok(entry: os.DirEntry) -> bool:
+                try:
+                    return (n_type == _glob_all_nodes) \
+                        or (n_type == _glob_only_dirs and entry.is_dir()) \
+                        or (n_type == _glob_only_files and entry.is_file())
+                except OSError:
+                    return False
+
+            # Pile des répertoires restant à parcourir, avec pour chacun
+            # les positions du masque qui peuvent s'y appliquer.
+            #
+            pending = [
+                (os.path.abspath(self.location_string), frozenset(_reached(0)))
+                ]
+
+            nb_dirs = 0
+            nb_found = 0
+
+            while pending:
+
+                path, positions = pending.pop()
+                nb_dirs += 1
+
+                try:
+                    iterator = os.scandir(path)
+
+                except OSError as error:
+                    if log_each:
+                        log_each('Répertoire ignoré « %s » : %s', path, error)
+                    continue
+
+                with iterator:
+
+                    for entry in iterator:
+
+                        name = entry.name
+                        matched = False
+                        children = set()
+
+                        for i in positions:
+
+                            test = tests[i]
+
+                            if test is None:
+
+                                # Joker « ** » : tout nom convient, et nous
+                                # restons à cette position dans les sous-
+                                # répertoires.
+                                #
+                                if i == last:
+                                    matched = True
+
+                                if _is_dir(entry, False):
+                                    children.update(_reached(i))
+
+                            elif test(name):
+
+                                if i == last:
+                                    matched = True
+
+                                elif _is_dir(entry, True):
+                                    children.update(_reached(i + 1))
+
+                        if matched and _node_ok(entry):
+                            nb_found += 1
+                            yield entry.path
+
+                        # ÉLAGAGE : Aucun niveau du masque ne peut plus
+                        # s'appliquer à ce sous-répertoire ? Inutile de
+                        # le parcourir !
+                        #
+                        if children:
+                            pending.append((entry.path, frozenset(children)))
+
+            if log_each:
+                log_each('Répertoires parcourus = %d', nb_dirs)
+                log_each('Noeuds trouvés = %d', nb_found)
+
+            if log_summary:
+                elapsed = time.perf_counter() - t_start
+                log_summary(
+                    '_fake_rglob « %s » : %d répertoires parcourus, %d noeuds retenus, en %.4f s.',
+                    self,
+                    nb_dirs,
+                    nb_found,
+                    elapsed,
+                    extra = {
+                        'elapsed': elapsed,
+                        'counters': {'dirs': nb_dirs, 'found': nb_found}
+                        }
+                    )
+
+
         def glob(self, mask: str = '*') -> os.PathLike:
             # -> ( itérateur / générateur ) STR [ ou ] PATHLIB.PATH
+            # -> dict( STR : list ) si « mask » est une liste de masques
             """ Glob the given relative pattern in the directory
             represented by this path, yielding all matching files
             (of any kind).
@@ -4487,11 +6544,20 @@ class FileSystemTree:
             si nous avons ou pas importé les modules PATHLIB ou GLOB,
             voire FNMATCH.
 
+                Ce paramètre peut aussi être une LISTE ( ou un t-uple )
+                de masques : notre répertoire n'est alors parcouru qu'1
+                seule fois pour l'ensemble de ces masques ( cf la méthode
+                _multi_glob() ).
+
             :return: un itérateur sur la liste des répertoires ou des
             fichiers trouvés, et cette suite de valeurs sera de type
             STRING ou PATHLIB.PATH. Nous essayerons par ailleurs au
             maximum que ces valeurs soient des paths ABSOLUS.
 
+                ATTENTION : Si « mask » est une liste de masques, nous
+                renvoyons un DICTIONNAIRE « masque -> liste des noeuds
+                trouvés » et non un itérateur.
+
                 Lorsqu'il s'agit de STRINGS, nous nous assurons que
                 la valeur retournée soit un PATH ABSOLU.
 
@@ -4521,6 +6587,12 @@ class FileSystemTree:
 
             log_debug = self.tree.write_in_log
 
+            if not isinstance(mask, str):
+
+                # Plusieurs masques à rechercher en 1 seul parcours.
+                #
+                return self._multi_glob(mask)
+
             if not self.is_dir():
 
                 log_debug("Configuration d'une recherche - Répertoire non valide :")
@@ -4562,13 +6634,31 @@ class FileSystemTree:
                 # Nous encapsulons donc l'itérateur fourni par
                 # glob.iglob() dans notre propre générateur.
                 #
+                # RQ : Sans « recursive = True », glob.iglob() traite
+                # le joker « ** » comme un simple « * ».
+                #
                 dir = self.location_string
-                iterator = glob.iglob(mask, root_dir = dir)
+                iterator = glob.iglob(mask, root_dir = dir, recursive = True)
                 fct = lambda x: os.path.abspath(os.path.join(dir, x))
 
                 generator = _generator_create(iterator, fct)
 
 
+            elif self.tree.with_fnmatch and _mask_is_recursive(mask):
+
+                # Nous avons l'autorisation de nous servir de la
+                # librairie FNMATCH de Python, mais fnmatch.filter()
+                # ne sait travailler que sur 1 seul niveau.
+                #
+                # Nous confions donc le parcours de l'arborescence à
+                # _fake_iglob(), chaque niveau du masque étant testé
+                # via FNMATCH.
+                #
+                log_debug("Configuration d'une recherche - via « _fake_iglob » + « fnmatch »")
+
+                generator = self._fake_iglob(**self._parse_mask(mask, _search_fnmatch))
+
+
             elif self.tree.with_fnmatch:
 
                 # Nous avons l'autorisation de nous servir de la
@@ -4776,6 +6866,111 @@ class FileSystemTree:
             return generator
 
 
+        def _multi_glob(
+            self,
+            masks,          # iterable( STR )
+            n_type: int = _glob_all_nodes
+            ) -> dict:
+            # -> dict( STR : list( STR [ ou ] PATHLIB.PATH ) )
+            """ Cherche dans notre répertoire les noeuds correspondant
+            à PLUSIEURS masques de recherche, en ne le parcourant qu'une
+            seule fois.
+
+            AVANT, rechercher N masques dans un même répertoire ( par ex
+            « Libre*Office* » et « Just*Great*Software* » dans « Program
+            Files » ) impliquait N appels à glob(), donc N parcours de ce
+            répertoire. Ici, chaque noeud n'est lu qu'1 seule fois, puis
+            son nom est testé avec chacun des masques ( déjà analysés via
+            _parse_mask() ), et son type n'est testé qu'1 fois lui aussi.
+            Le temps de parcours ne dépend donc plus du nombre de masques.
+
+            ATTENTION : Ce parcours unique n'est réalisé que lorsque nos
+            propres fonctions de test sont utilisées ( cas « pathlib_ignore »,
+            avec ou sans FNMATCH ) et pour des masques sur 1 seul niveau
+            de répertoire. Dans les autres cas ( GLOB, « pathlib_deeply »,
+            masques RÉCURSIFS ), nous appelons glob() pour chaque masque,
+            afin que les résultats restent identiques à ceux de glob().
+
+            :param masks: la liste des masques de recherche ( cf glob() ).
+
+            :param n_type: cf _fake_iglob().
+
+            :return: un dictionnaire dont les clés sont les masques, et les
+            valeurs les listes des noeuds trouvés pour chacun d'eux ( au
+            format STRING ou PATHLIB.PATH, comme pour glob() ). Un même
+            noeud peut donc apparaître pour plusieurs masques.
+            """
+
+            log_debug = self.tree.write_in_log
+            log_debug(f'Recherche MULTI-MASQUES dans « {self} » :')
+
+            # dict.fromkeys() pour écarter les doublons tout en conservant
+            # l'ordre des masques.
+            #
+            found = {mask: [] for mask in dict.fromkeys(masks)}
+            compiled = []
+
+            if not self.is_dir():
+
+                log_debug("Configuration d'une recherche - Répertoire non valide.")
+                return found
+
+            one_pass = not (self.tree.with_glob or self.tree.pathlib_import)
+            s_type = _search_fnmatch if self.tree.with_fnmatch else None
+
+            for mask in found:
+
+                if one_pass and not _mask_is_recursive(mask):
+                    compiled.append((mask, self._parse_mask(mask, s_type)))
+
+                else:
+
+                    log_debug(f'Masque « {mask} » recherché via glob().')
+
+                    found[mask] = [
+                        n for n in self.glob(mask)
+                        if (n_type == _glob_all_nodes)
+                            or (n_type == _glob_only_dirs and self.tree.Path(n).is_dir())
+                            or (n_type == _glob_only_files and self.tree.Path(n).is_file())
+                        ]
+
+            if not compiled:
+                return found
+
+            log_debug(f'Masques testés en 1 seul parcours : {[m for m, _ in compiled]}.')
+
+            leaf_type = type(self)
+            as_is = not self.tree.pathlib_import and os.path.isabs(self.location_string)
+
+            for file_or_dir in self.iterdir():
+
+                name = file_or_dir.name
+                matching = [mask for mask, c in compiled if c.match(name)]
+
+                # Le type du noeud n'est testé qu'une fois le nom retenu,
+                # et une seule fois quel que soit le nombre de masques.
+                #
+                if not matching or not (
+                    (n_type == _glob_all_nodes)
+                    or (n_type == _glob_only_dirs and file_or_dir.is_dir())
+                    or (n_type == _glob_only_files and file_or_dir.is_file())
+                    ):
+                    continue
+
+                # Cf _fake_iglob() pour l'usage de .resolve() ( et pour
+                # celui de « as_is » ).
+                #
+                if as_is and type(file_or_dir) is leaf_type:
+                    path = file_or_dir.location_string
+                else:
+                    path = str(file_or_dir.resolve())
+
+                for mask in matching:
+                    found[mask].append(path)
+
+            return found
+
+
         def touch(self):
             """ Pour CRÉER un fichier.
 
@@ -4923,4461 +7118,8328 @@ class FileSystemTree:
 #
 #   PARTIE :
 #   ~~~~~~~~
-#   Définition de la classe ScriptSkeleton ( __init__() et __del__() ).
+#   Classes de JOURNALISATION ( file d'attente, ... ).
 #
 # ---------------------------------------------------------------------------
 
 
-# Notre classe principale ScriptSkeleton.
+# Que faire lorsque la file d'attente de notre journal est pleine ?
+# ( cf _LogQueueHandler )
 #
-class ScriptSkeleton:
-    """ Squelette d'un script Python, avec différentes
-    propriétés et méthodes pour faciliter les traitements
-    de base.
+#   . log_overflow_block : l'appelant attend qu'1 place se libère ( aucun
+#   message n'est perdu ).
+#
+#   . log_overflow_drop_debug : les messages DEBUG sont abandonnés, les
+#   autres attendent qu'1 place se libère.
+#
+#   . log_overflow_drop_oldest : le message le plus ancien de la file est
+#   abandonné au profit du nouveau ( l'appelant n'attend jamais ).
+#
+log_overflow_block = 'block'
+log_overflow_drop_debug = 'drop_debug'
+log_overflow_drop_oldest = 'drop_oldest'
+
+log_overflows = (
+    log_overflow_block,
+    log_overflow_drop_debug,
+    log_overflow_drop_oldest
+    )
+
+
+class _LogQueueListener(logging.handlers.QueueListener):
+    """ Le thread qui, en tâche de fond, vide la file d'attente de notre
+    journal vers ses véritables handlers ( fichier LOG, ... ).
+    """
+
+    def enqueue_sentinel(self):
+        """ QueueListener.stop() dépose dans la file une « sentinelle » via
+        put_nowait(), ce qui échoue ( queue.Full ) si notre file BORNÉE est
+        pleine : nous attendons donc que notre thread lui fasse de la place.
+        """
+
+        self.queue.put(self._sentinel)
+
+
+class _LogQueueHandler(logging.handlers.QueueHandler):
+    """ Handler qui ne fait que déposer les messages du journal dans une
+    file d'attente BORNÉE, un thread en tâche de fond se chargeant de les
+    formater puis de les écrire ( cf _LogQueueListener ).
+
+    Ainsi, un log.debug() ne coûte plus à l'appelant ni formatage, ni écriture
+    dans le fichier LOG ( cf prepare() ), ce qui compte dans nos boucles les
+    plus sollicitées ( cf _fake_iglob() qui journalise plusieurs lignes par
+    fichier trouvé ).
+
+    Lorsque la file est pleine, le comportement suit la politique choisie
+    ( cf log_overflow_... ). Les messages abandonnés sont comptés dans
+    l'attribut « dropped ».
+
+    RQ : Une fois notre thread arrêté ( cf stop() ), les messages sont de
+    nouveau écrits directement par l'appelant : aucun n'est perdu, même
+    lorsque notre journal est encore utilisé en toute fin de script.
     """
 
     def __init__(
         self,
-        module_name: str = None,
-        module_file: str = __file__,
-        arguments: list = None,
-        debug_mode: bool = ___debug___,
-        walking_mode: str = walking_via_listdir,
-        with_pathlib: str = ___dflt_pathlib___,
-        with_fnmatch: bool = False,
-        with_glob: bool = False
+        queue_size: int = 10000,
+        overflow: str = log_overflow_block
         ):
+        """ :param queue_size: le nombre max de messages en attente.
+
+        :param overflow: la politique en cas de file pleine.
         """
-        :param module_name: nom du module.
 
-        :param module_file: nom du fichier appelant ( sa valeur
-        de __file__ en général ).
+        if overflow not in log_overflows:
+            raise ValueError(
+                f"Politique « {overflow} » inconnue ( cf {log_overflows} )."
+                )
 
-        :param arguments: les arguments avec lesquels le module
-        principal qui nous appelle a lui-même été appelé ( i-e
-        sys.argv en général ).
+        super().__init__(queue.Queue(queue_size))
 
-        :param debug_mode: ce « squelette » va-t-il s'exécuter
-        en mode DEBUG ( True or False ) ? Par défaut, il prend
-        le mode de ce script ( défini par ___debug___ )...
-        Un autre nom pour ce paramètre pourrait être :
+        self.overflow = overflow
+        self.dropped = 0
 
-                VERBOSE = True / False...
+        self.listener = None
+        self.targets = ()
 
-        :param walking_mode: si ce « squelette » n'utilise que le
-        module OS.PATH, pour parcourir 1 répertoire utilisera-t-il
-        la fct os.listdir() ou os.scandir() ?
+    def start(self, *handlers):
+        """ Lance le thread qui écrira nos messages dans « handlers ».
+        """
 
-            * walking_via_listdir : os.listdir() utilisée.
+        self.targets = handlers
 
-            * walking_via_scandir : os.scandir() utilisée.
+        self.listener = _LogQueueListener(
+            self.queue,
+            *handlers,
+            respect_handler_level = True
+            )
+        self.listener.start()
 
-            * walking_ignore : peu importe ( cas où module PATHLIB
-            est utilisé pour gérer les fichiers... ) et, si nous
-            arrivons tout de même dans 1 partie de code utilisant
-            cette informat°, la méthode par défaut ( ie os.listdir()
-            sera utilisée ).
+    def stop(self):
+        """ Arrête notre thread, APRÈS qu'il a écrit tous les messages encore
+        présents dans notre file d'attente.
 
-            RQ = Si les modules GLOB ou FNMATCH sont importés, cela
-            n'impose pas le walking_mode et il faut le spécifier !
+        RQ : Cette méthode peut être appelée plusieurs fois ( fin de script
+        via on_dit_au_revoir(), puis atexit, ... ).
+        """
 
-            RQ = Cf FileSystemTree._FileSystemLeaf.iterdir()
+        listener, self.listener = self.listener, None
 
-        :param with_pathlib: ce « squelette » va-t-il s'appuyer sur
-        le module PATHLIB, ou simplement se servir de la librairie
-        OS.PATH ? Valeurs possibles :
+        if listener is not None:
+            listener.stop()
 
-            * pathlib_ignore ( None ) : pas de module PATHLIB.
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        """ Renvoie le message TEL QUEL, sans le formater.
 
-            * pathlib_direct_... : module PATHLIB sans filtre.
+        RQ : QueueHandler.prepare() formate le message dans le thread de
+        l'appelant, puis vide exc_info / exc_text en collant la trace de
+        l'exception dans « msg ». C'était donc l'appelant qui payait encore
+        le formatage, et nos formats structurés ( cf log_format_jsonl et
+        log_format_binary ) ne voyaient plus l'exception ( « exc » vide ).
 
-            * pathlib_deeply : module PATHLIB incorporé.
+        Ici, c'est le formatter du handler cible, dans notre thread, qui
+        fait tout le travail. Aucune copie n'est nécessaire puisque nous ne
+        modifions pas le message.
 
-        :param with_fnmatch: ce « squelette » va-t-il s'appuyer sur
-        le module FNMATCH ?
+        ATTENTION : Les arguments du message ( record.args ) sont donc
+        convertis en texte plus tard, dans notre thread. Un objet MUTABLE
+        passé en argument, et modifié juste après l'appel, peut y être
+        journalisé dans son nouvel état.
+        """
 
-        :param with_glob: ce « squelette » va-t-il s'appuyer sur le
-        module GLOB ?
+        return record
+
+    def enqueue(self, record: logging.LogRecord):
+        """ Dépose un message dans notre file, en respectant la politique
+        choisie si celle-ci est pleine.
         """
 
-        # On personnalise notre mode de déboggage.
-        #
-        self._debug_ = debug_mode
+        if self.listener is None:
 
-        # Sommes-nous dans notre méthode __del__ ?
-        #
-        # Non, bien sûr... !!!
-        #
-        self._we_are_inside_del_method = False
-        self._we_already_said_bye = False
+            # Notre thread est arrêté : nous écrivons nous-mêmes.
+            #
+            for handler in self.targets:
+                if record.levelno >= handler.level:
+                    handler.handle(record)
 
-        # Variables internes pour stockage du journal des opérations :
-        #
-        #       _logHandler pointe sur le fichier TXT temporaire de log ;
-        #
-        #       _logFile contient le nom du fichier log créé ;
-        #
-        #       logItem contient l'objet journal ;
-        #
-        # Ce module ne gère en effet qu'un journal, et ceci afin de ne pas avoir
-        # plusieurs journaux créés ( par erreur par exemple ) en //, ce qui causerait
-        # la création de plusieurs fichiers log temporaires, et donc rendrait le
-        # déroulé des opérations plus difficile à suivre !!!
-        #
-        self._logHandler = None
-        self._logFile = None
+            return
 
-        # On créé l'objet qui va nous permettre d'accéder à la gestion des répertoires
-        # et des fichiers.
-        #
-        self.files = FileSystemTree(
-            walking_mode = walking_mode,
-            with_pathlib = with_pathlib,
-            with_fnmatch = with_fnmatch,
-            with_glob = with_glob
-            )
+        if self.overflow == log_overflow_block:
+            self.queue.put(record)
+            return
 
-        # Nous sommes obligés d'initialiser logItem à None, et ce afin que Python sache
-        # que ScriptSkeleton possède un attribut de ce nom.
-        #
-        # En effet, dans la fonction on_ouvre_le_journal(), on nomme cet attribut !!!
-        # Alors s'il n'a pas été déclaré dans la fonction __init__, avant l'appel, le
-        # script va planter car Python ne saura pas que cet attribut existe...
-        #
-        if module_name is None:
+        try:
+            self.queue.put_nowait(record)
+            return
 
-            # On donne comme nom de module, le nom de base ( sans extension ) de notre
-            # nom de fichier ( module_file ).
+        except queue.Full:
+            pass
+
+        if self.overflow == log_overflow_drop_debug:
+
+            if record.levelno <= logging.DEBUG:
+                self.dropped += 1
+            else:
+                self.queue.put(record)
+
+        else:
+
+            # log_overflow_drop_oldest : nous retirons le plus ancien des
+            # messages en attente, jusqu'à pouvoir déposer le nôtre.
             #
-            #module_name = self.files.node(module_file).stem
-            module_name = self.files.Path(module_file).stem
+            while True:
 
-        self.logItem = None
-        self.logItem = self.on_ouvre_le_journal(module_name)
+                try:
+                    self.queue.put_nowait(record)
+                    break
 
-        # Si la gestion du système de fichiers est assurée par un objet FileSystemTree,
-        # nous lui communiquons l'adresse de notre fichier LOG.
-        #
-        if isinstance(self.files, FileSystemTree):
-            self.files._register_log(self.logItem)
+                except queue.Full:
 
-        # ATTENTION : Lorsque nous serons dans notre méthode __del__() et donc dans le
-        # ramasse-miettes de Python = POTENTIELLEMENT, les objets LOG seront aussi en
-        # train d'être détruits, voire l'auront déjà été... !!!
-        #
-        # Donc nous nous prémunissons contre cela via des fonctions LAMBDA qui feront
-        # ou pas référence à notre log, suivant le cas.
-        #
-        # D'expérience, appeler dans notre __del__() le module LOG ne pose en fait pas
-        # de pb sous Python 3.10 et Windows 10.
-        #
-        # Par contre, sous Python 3.9 ( a-Shell ) et iOS, cela provoque des bugs d'appels
-        # dans le module LOG qui ne retrouve plus ses petits...
-        #
-        # Pour l'instant, notre LOG vient d'être créé, donc pas de souci !!!
-        #
-        self.shw = lambda x: _show_(x, self.logItem)
-        self.shw_info = lambda x: self.logItem.info(x)
-        self.shw_debug = lambda x: self.logItem.debug(x)
-        #
-        # Dans notre méthode __del__(), nous attribuerons d'autres valeurs à self.shw_info
-        # et à self.shw_debug.
-        #
-        # Par ailleurs, ces 2 fonctions sont ( actuellement ) utilisées seulement dans nos
-        # méthodes invoquées directement ou indirectement depuis notre méthode __del__()
-        # i.e :
-        #
-        #       - on_dit_au_revoir()
-        #       - on_sonne_le_reveil()
-        #       - edit_file_txt()
-        #       - get_paths_and_miscellaneous()
-
-        if self._debug_:
+                    try:
+                        self.queue.get_nowait()
+                        self.queue.task_done()
+                        self.dropped += 1
 
-            # On affiche notre mode de déboggage quand il est actif.
-            #
-            self.debug_mode(True)
+                    except queue.Empty:
+                        pass
 
-        self.nb_parameters_in = self.on_se_presente(module_file, arguments)
 
-        # Le dictionnaire « paths_and_miscellaneous » contiendra la liste des fichiers
-        # & répertoires utiles, i-e il contiendra à minima les entrées suivantes :
-        #
-        #       - working_SYSTEM,
-        #       - working_RELEASE,
-        #       - working_VERSION,
-        #       - working_MACHINE_NAME,
-        #       - working_MACHINE_TYPE,
-        #       - working_PATH_FULL,
-        #       - working_PATH_DSK_ONLY,
-        #       - EXE_txt_editor,
-        #       - EXE_(..),
-        #       - DIR_(..),
-        #       - DLL_(..),
-        #       - ARG_(..),
-        #       - NOD_(..).
-        #
-        # Il est aussi possible de se servir de ce dictionnaire pour conserver des
-        # paramètres généraux du programme, tels que ceux par exemple lus dans une
-        # section 'GENERAL SETTINGS' d'un fichiers de configuration. Les entrées
-        # suivantes sont ainsi aussi possibles :
-        #       - shutdown_TYPE.
-        #
-        # ( ! ) ATTENTION ( ! ) : Choix a été fait de stocker dans ce dictionnaire
-        # des variables telles que renvoyées par :
-        #
-        #       ScriptSkeleton.files.node()
-        #       [ ou plutôt ScriptSkeleton.files.Path() dorénavant ]
-        #
-        # ... i.e :
-        #
-        #       des variables de type _FileSystemLeaf ou pathlib.Path
-        #
-        # ... par convention, ces variables ont pour clés :
-        #
-        #       NOD_(..)
-        #
-        # ... or un appel subséquent à :
-        #
-        #       ScriptSkeleton.file_system_mode()
-        #
-        # ... pourrait changer le type de ces variables, et donc occasionnerait
-        # des BUGS ( !!! )
-        #
-        # Nous convertissons pour autant le dictionnaire « paths_and_miscellaneous » 
-        # afin d'éviter cela. Cette conversion est réalisée directement dans notre
-        # méthode file_system_mode().
-        #
-        # Pour autant, le script qui nous utilise pourrait avoir lui-même conservé
-        # de telles variables par ailleurs, et ne pourrait-il alors planter par la
-        # suite, dans des cas à la marge ( ??? ) :
-        #
-        #       - exemple : tentative de comparaison de 2 de ces objets alors que
-        # leur type serait différent.
-        #
-        #       - exemple : tentative de concaténation de 2 paths alors que leur
-        # type serait différent.
-        #
-        # ( !!! ) PRUDENCE DONC LORSQUE L'ON CONSERVE UNE VALEUR DU TYPE :
-        #
-        #        ScriptSkeleton.file_system_mode()
-        #
-        # Cependant, à part ces cas à la marge :
-        #
-        #       _FileSystemLeaf & pathlib.Path PEUVENT COHABITER DANS 1 MÊME SCRIPT
-        #
-        # ... en effet, ces objets sont plutôt utilisés pour accéder aux noeuds
-        # du système de gestion de fichiers eux-mêmes, via leurs méthodes, et ce
-        # afin d'en obtenir des informations.
-        #
-        self.shutdown_dflt = shutdown_none
+# Formats possibles pour notre fichier LOG ( cf on_ouvre_le_journal ).
+#
+#   . log_format_text : le format libre historique, 1 ligne par message
+#   ( date - niveau - message ), destiné à être lu par un humain.
+#
+#   . log_format_jsonl : 1 objet JSON par ligne, avec des champs STABLES
+#   ( cf _log_record_fields ), destiné à nos outils d'analyse.
+#
+#   . log_format_binary : les mêmes champs, sous une forme binaire compacte,
+#   chaque message étant précédé de sa longueur ( cf _BinaryLogFormatter ).
+#
+# Les 2 derniers formats sont relus au fil de l'eau par iter_log_records().
+#
+log_format_text = 'text'
+log_format_jsonl = 'jsonl'
+log_format_binary = 'binary'
+
+log_formats = (
+    log_format_text,
+    log_format_jsonl,
+    log_format_binary
+    )
+
+
+def _log_record_fields(
+    record: logging.LogRecord,
+    formatter: logging.Formatter
+    ) -> dict:
+    """ Les champs STABLES d'un message de notre journal structuré :
+
+        . time      : date du message ( secondes depuis EPOCH ) ;
+        . level     : son niveau ( DEBUG, INFO, ... ) ;
+        . logger    : le nom de notre journal ;
+        . module    : le module Python émetteur ;
+        . method    : la fonction / méthode émettrice ;
+        . line      : la ligne émettrice ;
+        . uptime    : secondes écoulées depuis le chargement de LOGGING ;
+        . elapsed   : durée ( secondes ) fournie par l'émetteur, sinon None ;
+        . counters  : compteurs ( dict ) fournis par l'émetteur, sinon None ;
+        . msg       : le message lui-même ;
+        . exc       : la trace d'une exception, sinon None.
+
+    RQ : « elapsed » et « counters » sont fournis via le paramètre « extra »
+    de logging.Logger.debug(), ... Ainsi :
+
+        log.debug('Recherche terminée.', extra = {
+            'elapsed' : 0.25,
+            'counters' : {'found': 12}
+            })
+    """
 
-        self.paths_and_miscellaneous = {}
+    if record.exc_info and not record.exc_text:
+        record.exc_text = formatter.formatException(record.exc_info)
+
+    return {
+        'time'      :   record.created,
+        'level'     :   record.levelname,
+        'logger'    :   record.name,
+        'module'    :   record.module,
+        'method'    :   record.funcName,
+        'line'      :   record.lineno,
+        'uptime'    :   record.relativeCreated / 1000,
+        'elapsed'   :   getattr(record, 'elapsed', None),
+        'counters'  :   getattr(record, 'counters', None),
+        'msg'       :   record.getMessage(),
+        'exc'       :   record.exc_text or None
+        }
 
-        self.set_paths_and_miscellaneous()
 
+class _JsonLinesFormatter(logging.Formatter):
+    """ Formate chaque message de notre journal en 1 ligne JSON ( cf
+    _log_record_fields ).
+    """
 
-    def __del__(self):
-        """
-        """
+    def format(self, record: logging.LogRecord) -> str:
 
-        self._we_are_inside_del_method = True
+        return json.dumps(
+            _log_record_fields(record, self),
+            ensure_ascii = False,
+            separators = (',', ':'),
+            default = str
+            )
 
-        # ATTENTION : Dans notre méthode __del__() et donc dans le ramasse-miettes
-        # de Python = POTENTIELLEMENT, les objets LOG sont aussi en train d'être
-        # détruits, voire l'ont déjà été... !!!
-        #
-        # Donc nous choisissons d'autres façons d'afficher le LOG en cette toute
-        # fin de script !!!
-        #
-        self.shw_info = lambda x: print(x)
-        self.shw_debug = lambda x: print(x) if self._debug_ else None
 
-        # On quitte l'application...
-        #
-        self.on_dit_au_revoir()
+class _BinaryLogFormatter(logging.Formatter):
+    """ Formate chaque message de notre journal sous une forme BINAIRE
+    compacte :
 
+        . longueur du message ( 4 octets ), qui permet à un lecteur de
+        passer d'un message au suivant sans analyser son contenu ;
 
-# ---------------------------------------------------------------------------
-#
-#   PARTIE :
-#   ~~~~~~~~
-#   Fonctions d'initialisation des EXÉCUTABLES et RÉPERTOIRES utilisés.
-#
-# ---------------------------------------------------------------------------
+        . version du format ( cf _version ), date, « uptime », « elapsed »
+        ( NaN si absent ), niveau et n° de ligne ( cf _header ) ;
 
+        . puis les champs texte ( logger, module, method, msg, exc,
+        counters au format JSON ), chacun précédé de sa longueur.
 
-    def search_path_from_masks(
-        self,
-        root,           # _FileSystemLeaf, pathlib.Path
-        masks,          # iterable, iterator, generator
-        ) -> (
-            object,     # _FileSystemLeaf, pathlib.Path
-            os.PathLike # chemin du fichier recherché
-        ):
-        """ Cette fonction permet de rechercher un fichier ( une DLL ou
-        un exécutable par exemple ) à partir d'une certaine localisation
-        et en cheminant le long d'un chemin indiqué par des masques.
+    RQ : Le niveau est codé sur 4 octets, afin d'accepter les niveaux créés
+    par logging.addLevelName(), même au-delà de 255.
 
-        Par exemple, pour trouver EditPadPro?.exe, à partir du répertoire
-        « Program Files », nous aurons comme paramètres :
+    RQ : Toute évolution de ce format doit incrémenter _version : decode()
+    refuse les messages d'une version qu'il ne connaît pas.
+    """
 
-            root = r"C:\Program Files"
-            masks = ( 'Just*Great*Software', 'EditPad*Pro*', 'EditPadPro*.exe' )
+    _version = 1
 
-        Puisque plusieurs versions de EditPad Pro peuvent être présentes
-        sur une même machine, cette façon de faire trouvera :
+    _size = struct.Struct('>I')
+    _header = struct.Struct('>BdddiI')
+    _texts = ('logger', 'module', 'method', 'msg', 'exc', 'counters')
 
-            C:\Program Files\Just Great Software\EditPad Pro 8\EditPadPro8.exe
-            C:\Program Files\Just-Great-Software\EditPadPro 7\EditPadPro7.exe
-            C:\Program Files\Just_Great_Software\EditPadPro6\EditPadPro6.exe
-            ...
+    def format(self, record: logging.LogRecord) -> bytes:
 
-        Puisque nous parcourons l'arborescence en ordre décroissant, et
-        car nous stoppons au 1er fichier trouvé, search_path_from_masks()
-        répondra alors :
+        fields = _log_record_fields(record, self)
 
-            C:\Program Files\Just Great Software\EditPad Pro 8\EditPadPro8.exe
+        if fields['counters'] is not None:
+            fields['counters'] = json.dumps(fields['counters'], default = str)
 
-        :param root: la racine à partir de laquelle nous devons débuter
-        nos recherches.
+        elapsed = fields['elapsed']
 
-        :param masks: une suite de valeurs (toutes au format STRING )
-        décrivant le cheminement dont nous pensons qu'il peut nous mener
-        depuis « root » au fichier recherché. La dernière de ces valeurs
-        doit expliciter le nom du fichier cherché. Ainsi :
+        chunks = [self._header.pack(
+            self._version,
+            fields['time'],
+            fields['uptime'],
+            float('nan') if elapsed is None else elapsed,
+            record.levelno,
+            fields['line']
+            )]
 
-            ( 'Libre*Office*', '*program*', 's*office.exe' )
+        for key in self._texts:
+            text = (fields[key] or '').encode('utf-8', 'backslashreplace')
+            chunks.append(self._size.pack(len(text)))
+            chunks.append(text)
 
-        :return: un t-uple contenant 2 valeurs =
+        payload = b''.join(chunks)
 
-                - l'objet répertoire contenant le fichier trouvé ( objet
-                de type _FileSystemLeaf ou pathlib.Path ).
+        return self._size.pack(len(payload)) + payload
 
-                - le chemin complet du fichier recherché.
+    @classmethod
+    def decode(cls, payload: bytes) -> dict:
+        """ L'inverse de format() ( hors longueur du message ).
         """
 
-        #leaf = self.files.node
-        leaf = self.files.Path
-        log = self.logItem
+        ( version, created, uptime, elapsed, levelno, line ) = cls._header.unpack_from(payload)
+        offset = cls._header.size
 
-        last_level = ( len(masks) == 1 )
+        if version != cls._version:
+            raise ValueError(
+                f'Version « {version} » de message binaire inconnue '
+                f'( version attendue : {cls._version} ).'
+                )
 
-        # On recherche le premier masque dans la racine, car il faut bien
-        # commencer nos recherches qq part !!!
-        #
-        # Pour chacun des noeuds dont le nom correspond à ce masque, nous
-        # allons en explorer l'arborescence.
-        #
-        for n in sorted(root.glob(masks[0]), reverse = True):
+        fields = {
+            'time'      :   created,
+            'level'     :   logging.getLevelName(levelno),
+            'line'      :   line,
+            'uptime'    :   uptime,
+            'elapsed'   :   None if elapsed != elapsed else elapsed  # NaN
+            }
 
-            # « n » est de type STRING ou PATHLIB.PATH.
-            #
-            log.debug('')
-            log.debug('NOEUD TESTÉ = %s', n)
-            log.debug('')
+        for key in cls._texts:
+            ( size, ) = cls._size.unpack_from(payload, offset)
+            offset += cls._size.size
+            fields[key] = payload[offset:offset + size].decode('utf-8') or None
+            offset += size
 
-            # S'il n'y a qu'un seul masque dans la liste, nous comprenons
-            # qu'il s'agit d'un masque de fichier... Nous cherchons alors
-            # s'il existe dans « root » un fichier correspondant au masque
-            # recherché.
-            #
-            if last_level:
+        if fields['counters'] is not None:
+            fields['counters'] = json.loads(fields['counters'])
 
-                if leaf(n).is_file():
-                    # Nous avons trouvé le 1er fichier qui correspond à
-                    # notre recherche : comme nous avons trié en ordre
-                    # décroissant, on peut espérer qu'il s'agit de la
-                    # version la plus récente...
-                    #
-                    log.debug('Répertoire retenu = %s', root)
-                    log.debug('Fichier retenu = %s', n)
+        return fields
 
-                    return root, n
 
-            # Sinon, on parcourt les répertoires dont le nom commence par
-            # le masque voulu...
-            #
-            # On descend ainsi dans l'arborescence, on met donc le premier
-            # masque de côté, et on examine les suivants.
-            #
-            else:
+# Compressions possibles des anciens segments de notre fichier LOG ( cf
+# _SegmentedLogHandler ).
+#
+log_compression_gzip = 'gz'
+log_compression_xz = 'xz'
 
-                dir, exe = self.search_path_from_masks(root / n, masks[1:])
+log_compressions = (
+    log_compression_gzip,
+    log_compression_xz
+    )
 
-                if exe is not None:
-                    # Si la recherche dans l'arborescence a trouvé une
-                    # valeur, nous la retournons.
-                    #
-                    return dir, exe
 
-        return None, None
+class _SegmentedLogHandler(logging.handlers.RotatingFileHandler):
+    """ RotatingFileHandler pour nos traitements de longue durée ( batchs
+    de nuit, ... ). Notre fichier LOG y est découpé en SEGMENTS :
 
+        . lorsqu'il dépasse « max_bytes » octets, et / ou lorsqu'il a été
+        ouvert depuis plus de « max_age » secondes ;
 
-    def show_paths_and_miscellaneous(
+        . chaque segment terminé est renommé en y ajoutant sa date, soit
+        « #_LOG_for_<name>_#_xxx.AAAAMMJJ-HHMMSS.log », puis il est, si
+        c'est demandé, compressé ( « .gz » ou « .xz » ) ;
+
+        . seuls les « backup_count » derniers segments, et ceux de moins
+        de « retention » secondes, sont conservés.
+
+    Compressions et destructions sont réalisées par un thread en tâche de
+    fond : le thread qui journalise ne fait que renommer le segment.
+
+    RQ : Le préfixe « #_LOG_for_ » étant conservé, nos segments sont
+    détruits avec le LOG ( cf on_dit_au_revoir() et segments() ), ou
+    par admin.sh.
+    """
+
+    def __init__(
         self,
-        printer = print, # function
-        jumper = print, # function
-        intro: str = None
+        filename: str,
+        max_bytes: int = 1000000,
+        backup_count: int = 1,
+        max_age: float = None,
+        compression: str = None,
+        retention: float = None,
+        mode: str = 'a',
+        encoding: str = None
         ):
-        """ Pour "imprimer" ou sauvegarder le contenu de
-        notre dictionnaire.
+        """ :param filename: le fichier LOG.
 
-        :param printer: la fonction qui doit permettre de
-        sauvegarder ou imprimer ce résumé là où l'on veut
-        ( un fichier log, un widget, ...).
+        :param max_bytes: la taille max d'un segment ( 0 = illimitée ).
 
-        :param jumper: la fonction qui permet de "sauter
-        une ligne" afin d'améliorer la présentation.
+        :param backup_count: le nombre max de segments conservés.
 
-        :param sous_titre: un message que l'on souhaite
-        éventuellement afficher en introduction.
+        :param max_age: la durée max d'un segment, en secondes ( None =
+        illimitée ).
 
-        :return: None
+        :param compression: la compression des segments terminés ( None,
+        ou cf log_compression_... ).
+
+        :param retention: la durée max, en secondes, pendant laquelle un
+        segment est conservé ( None = illimitée ).
         """
 
-        printer('Configuration des exécutables & répertoires :')
-        printer('=============================================')
-        jumper()
+        if compression is not None and compression not in log_compressions:
+            raise ValueError(f"Compression « {compression} » inconnue ( cf {log_compressions} ).")
 
-        if intro is not None:
-            printer(intro)
-            jumper()
+        # ATTENTION : RotatingFileHandler impose le mode 'a' ( texte ) dès
+        # que max_bytes > 0, d'où l'ouverture différée ( delay ) puis le
+        # retour au mode demandé.
+        #
+        super().__init__(filename, mode, max_bytes, backup_count, encoding, delay = True)
 
-        for key, value in self.paths_and_miscellaneous.items():
-            printer(f'{key} = {value}')
-            printer(f'\t{type(value)}')
-            jumper()
+        self.mode = mode
 
+        if 'b' in mode:
+            self.encoding = None
 
-    def check_paths_and_miscellaneous(
-        self,
-        printer = print, # function
-        jumper = print, # function
-        alert = print # function
-        ) -> bool:
-        """ Pour vérifier que notre dictionnaire est correct.
+        self.maxAge = max_age
+        self.compression = compression
+        self.retention = retention
 
-        On va tester le contenu des clefs commençant par :
+        self._rollover_at = None
+        self._last_stamp = None
+        self._last_n = 0
+        self._worker = None
+        self._pending = queue.Queue()
 
-            . 'DIR_',
-            . 'EXE_',
-            . 'DLL_'.
+        ( self._segment_stem, self._segment_suffix ) = os.path.splitext(self.baseFilename)
 
-        On teste l'existence des répertoires & fichiers définis,
-        autres que ceux relatifs au répertoire de travail ( car
-        on est sûr que ces derniers existent puisqu'ils ont été
-        construits à partir de la fonction os.getcwd() ou que l'
-        on a déjà vérifié leur existence.
+    def _open(self):
 
-        :param printer: la fonction qui doit permettre de sauver
-        ou imprimer les messages relatifs à nos traitements là où
-        l'on veut ( un fichier log, un widget, ...).
+        stream = super()._open()
 
-        :param jumper: la fonction qui permet de "sauter 1 ligne"
-        afin d'améliorer la présentation.
+        if self.maxAge:
+            self._rollover_at = time.time() + self.maxAge
 
-        :param alert: la fonction qui nous permet d'alerter si ns
-        trouvons un pb.
+        return stream
 
-        :return: True si les tests ok ; False si on a rencontré
-        une erreur .
+    def _needs_rollover(self, size: int) -> bool:
+        """ Le segment courant doit-il être terminé avant d'y écrire
+        « size » octets de plus ?
         """
 
-        #leaf = self.files.node
-        leaf = self.files.Path
-        no_error = True
-
-        for key, value in self.paths_and_miscellaneous.items():
+        if self._rollover_at is not None and time.time() >= self._rollover_at:
+            return True
 
-            if value is None:
-                pass
+        return self.maxBytes > 0 and self.stream.tell() + size >= self.maxBytes
 
-            else:
-                name = None
-                key_short = key[0:4]
+    def shouldRollover(self, record: logging.LogRecord) -> bool:
 
-                if key_short in ('DIR_', 'EXE_', 'DLL_'):
+        if self.stream is None:
+            self.stream = self._open()
 
-                    printer(f"Test de l'existence de {key}...")
-                    node = leaf(value)
+        if self.maxBytes <= 0 and self._rollover_at is None:
+            return False
 
-                    # Nous testons différemment chaque type de noeuds du
-                    # système de fichiers afin de pouvoir adapter le msg
-                    # d'erreur potentiel.
-                    #
-                    # En effet, nous pourrions écrire plus simplement :
-                    #
-                    #   if not node.exists():
-                    #       name = 'noeud'
-                    #
-                    if key_short == 'DIR_' and not node.is_dir():
-                        name = 'répertoire'
+        return self._needs_rollover(len(self.format(record)) + len(self.terminator))
 
-                    elif key_short == 'EXE_' and not node.is_file():
-                        name = 'fichier'
+    def doRollover(self):
 
-                    elif key_short == 'DLL_' and not node.is_file():
-                        name = 'module DLL'
+        if self.stream:
+            self.stream.close()
+            self.stream = None
 
-                if name is not None:
+        self._rollover_at = None
 
-                    no_error = False
+        if os.path.exists(self.baseFilename):
 
-                    alert(f"Le {name} suivant n'existe pas :")
-                    #
-                    # On impose une tabulation de 6 espaces car, suivant
-                    # les systèmes, \t ne représente pas toujours le même
-                    # nombre de ceux-ci...
-                    #
-                    alert(f"{'':>6}{value}")
+            # Le segment terminé prend le nom du LOG, daté.
+            #
+            # RQ : Plusieurs segments terminés dans la même seconde sont
+            # numérotés « -2 », « -3 », ... sans jamais réutiliser le n°
+            # d'un segment entre-temps détruit ( cf _purge ), afin que
+            # leur ordre reste celui de leur création.
+            #
+            stamp = time.strftime('%Y%m%d-%H%M%S')
+            n = self._last_n + 1 if stamp == self._last_stamp else 1
 
-                    jumper()
+            while True:
 
-        return no_error
+                if n == 1:
+                    segment = f'{self._segment_stem}.{stamp}{self._segment_suffix}'
+                else:
+                    segment = f'{self._segment_stem}.{stamp}-{n}{self._segment_suffix}'
 
+                if not any(
+                    os.path.exists(segment + extension)
+                    for extension in ('', '.gz', '.xz')
+                    ):
+                    break
 
-    def set_paths_and_miscellaneous(
-        self,
-        directory: str = None,
-        print_configuration: bool = None
-        ) -> str:
-        """ Définitions des différents exécutables dont se sert ce script.
-    
-        :param directory: répertoire où il faut lire & écrire les fichiers. Si ce
-        paramètre est omis, ou que le répertoire désigné n'existe pas, on fixera
-        le répertoire de lecture / création au répertoire courant...
-    
-        :param print_configuration: faut-il ou non afficher la configuration construite ?
-    
-        :return: le répertoire de travail, ce qui est utile s'il n'a pas été passé en
-        paramètre d'entrée...
-        """
+                n += 1
 
-        #leaf = self.files.node
-        leaf = self.files.Path
-        log = self.logItem
+            ( self._last_stamp, self._last_n ) = ( stamp, n )
 
-        os_dir = None
-        os_node = None
-        l_office_exe = None
-        l_writer_exe = None
-        exe_txt_editor = None
+            os.replace(self.baseFilename, segment)
 
-        # ATTENTION : PERSONNALISATION de notre mode DEBUG
-        # -----------
-        # Si aucune valeur ne nous est précisée pour l'affichage
-        # ou pas de la configuration, nous faisons en fonction de
-        # notre propre mode de déboggage...
-        #
-        # Nous sommes obligé de faire ainsi car la déclaration de
-        # set_paths_and_miscellaneous() ne peut prendre la forme :
-        #
-        #   def set_paths_and_miscellaneous(
-        #       self,
-        #       directory: str = '',
-        #       print_configuration: bool = self.debug
-        #       ) -> str:
-        #
-        # ... c'est une syntaxe que Python n'autorise pas d'indiquer
-        # comme valeur par défaut, une valeur ( self.debug ) extraite
-        # de l'un même des autres paramètres ( self ).
-        #
-        # Si nous n'avions qu'un seul mode DEBUG pour l'entièreté de
-        # notre script, et non un mode DEBUG pour chacun des objets
-        # ScriptSkeleton, nous aurions pu écrire plus simplement :
-        #
-        #   def set_paths_and_miscellaneous(
-        #       self,
-        #       directory: str = '',
-        #       print_configuration: bool = ___debug___
-        #       ) -> str:
-        #
-        # ... mais chacun de ces objets à son propre mode !!!
-        #
-        # Donc nous sommes obligés de donner la valeur « None » dans
-        # la définition de fonction au booléen en question, puis de
-        # tester ici si cette valeur est à None ou pas.
-        #
-        if print_configuration is None:
-            print_configuration = self._debug_
+            # Sa compression, et les destructions qui s'ensuivent, sont
+            # confiées à notre thread en tâche de fond.
+            #
+            if self._worker is None:
+                self._worker = threading.Thread(
+                    target = self._compress_and_purge,
+                    name = 'log_segments',
+                    daemon = True
+                    )
+                self._worker.start()
 
-        # Les modules optionnels sont-ils chargés ?
-        #
-        if isinstance(self.files, FileSystemTree):
-            self.paths_and_miscellaneous[
-                'walking_MODE'
-                ] = str(self.files.walking_mode)
+            self._pending.put(segment)
 
-        self.paths_and_miscellaneous['module_PATHLIB'] = str(pathlib)
-        self.paths_and_miscellaneous['module_FNMATCH'] = str(fnmatch)
-        self.paths_and_miscellaneous['module_GLOB'] = str(glob)
+        self.stream = self._open()
 
-        # Où sommes-nous ?
-        #
-        try:
-            module = 'OS'
-            where_are_we = os.uname()
+    def _compress_and_purge(self):
+        """ Le thread en tâche de fond qui compresse nos segments terminés,
+        puis ne conserve que les segments demandés.
+        """
 
-            our_system = where_are_we.sysname
-            our_release = where_are_we.release
-            our_version = where_are_we.version
-            our_machine = where_are_we.machine
-            our_nodename = where_are_we.nodename
+        while True:
 
-        except AttributeError:
+            segment = self._pending.get()
 
-            from platform import uname
-            log.debug('« os.uname() » inconnu.')
-            log.debug('')
+            if segment is None:
+                return
 
-            module = 'PLATFORM'
-            where_are_we = uname()
+            try:
+                if self.compression:
+                    self._compress(segment)
 
-            our_system = where_are_we.system
-            our_release = where_are_we.release
-            our_version = where_are_we.version
-            our_machine = where_are_we.machine
-            our_nodename = where_are_we.node
+                self._purge()
 
-        log.debug('Dixit « %s » : %s', module, where_are_we)
-        log.debug('Système « %s » « %s » version « %s ».',
-            our_system,
-            our_release,
-            our_version
-            )
-        log.debug("Notre machine est de type « %s » et s'appelle :",
-            our_machine
-            )
-        log.debug('\t« %s »', our_nodename)
-        log.debug('')
+            except OSError:
+                pass
 
-        self.paths_and_miscellaneous['working_SYSTEM'] = our_system
-        self.paths_and_miscellaneous['working_RELEASE'] = our_release
-        self.paths_and_miscellaneous['working_VERSION'] = our_version
-        self.paths_and_miscellaneous['working_MACHINE_TYPE'] = our_machine
-        self.paths_and_miscellaneous['working_MACHINE_NAME'] = our_nodename
+    def _compress(self, segment: str):
+        """ Compresse un segment. Le segment compressé est d'abord écrit
+        sous un nom temporaire, afin de ne jamais laisser de fichier
+        compressé incomplet.
+        """
 
-        # Sommes-nous 32 ou 64 bits ?
-        #
-        is_64bits = sys.maxsize > 2 ** 32
-        size = '64' if is_64bits else '32'
-        msg_architecture = f'ARCHITECTURE {size} bits sur OS « {our_system} ».'
+        import shutil
 
-        # On initialise le répertoire de travail de ce programme.
-        #
-        if directory is None or not leaf(directory).is_dir():
-            working_node = leaf().cwd()
+        if self.compression == log_compression_xz:
+            import lzma
+            opener = lzma.open
         else:
-            working_node = leaf(directory)
+            import gzip
+            opener = gzip.open
 
-        working_path = str(working_node)
+        target = f'{segment}.{self.compression}'
 
-        self.paths_and_miscellaneous['NOD_working'] = working_node
-        self.paths_and_miscellaneous['working_PATH_FULL'] = working_path
+        with open(segment, 'rb') as source, opener(target + '.tmp', 'wb') as compressed:
+            shutil.copyfileobj(source, compressed, 1024 * 1024)
 
-        # Avant étaient utilisées les 2 instructions ci-dessous :
-        #
-        #   directories_and_files['working_PATH_DSK_ONLY'] = working_path[0:2]
-        #   directories_and_files['working_PATH_DIRS_ONLY'] = working_path[3:]
-        #
-        # Ensuite, on est passé à os.path.splitdrive, pour être plus PORTABLE :
-        #
-        #   (path_drive, path_tail) = os.path.splitdrive(working_path)
-        #   self.paths_and_miscellaneous['working_PATH_DSK_ONLY'] = path_drive
-        #   self.paths_and_miscellaneous['working_PATH_DIRS_ONLY'] = path_tail
-        #
-        # Puis l'on est passé à l'utilisation de notre classe FileSystemTree,
-        # et l'on a alors supprimé l'affectation relative au « path_tail » car
-        # « working_PATH_DIRS_ONLY » n'était utilisé nulle part et car cette
-        # donnée / attribut n'est pas présente dans le module PATHLIB !!!
-        #
-        self.paths_and_miscellaneous[
-            'working_PATH_DSK_ONLY'
-            ] = working_node.drive
+        os.replace(target + '.tmp', target)
+        os.unlink(segment)
 
-        # On initialise les comportements généraux de ce programme.
-        #
-        self.paths_and_miscellaneous[shutdown_TYPE] = self.shutdown_dflt
+    def segments(self) -> list:
+        # -> list( STR )
+        """ Les segments terminés de notre LOG, du plus ancien au plus
+        récent.
+        """
 
+        directory = os.path.dirname(self.baseFilename)
+        prefix = os.path.basename(self._segment_stem) + '.'
+        found = []
 
-        #
-        ###########################################################
-        ########## INITIALISATION dans le cas de WINDOWS ##########
-        ###########################################################
-        #
+        for name in os.listdir(directory):
 
+            if not name.startswith(prefix) or name.endswith('.tmp'):
+                continue
 
-        # On définit les autres répertoires & fichiers utilisés.
+            # Reste « AAAAMMJJ-HHMMSS[-n].log[.gz|.xz] ».
+            #
+            stamp = name[len(prefix):].split('.', 1)[0]
+
+            if (
+                len(stamp) >= 15
+                and stamp[:8].isdigit()
+                and stamp[8] == '-'
+                and stamp[9:15].isdigit()
+                and self._segment_suffix in name[len(prefix) + len(stamp):]
+                ):
+                found.append((
+                    stamp[:15],
+                    int(stamp[16:] or 1) if stamp[16:].isdigit() or not stamp[16:] else 0,
+                    os.path.join(directory, name)
+                    ))
+
+        # RQ : Nos dates se trient par ordre alphabétique, mais pas nos
+        # suffixes « -n » ( doublons d'1 même seconde ), d'où ce tri.
         #
-        if os.name.upper() == 'NT':
+        return [segment for ( _, _, segment ) in sorted(found)]
 
-            os_dir = os.environ['SYSTEMROOT']
-            os_node = leaf(os_dir)
-            programs = leaf(r"C:\Program Files")
+    def _purge(self):
+        """ Détruit les segments en trop, ou trop anciens.
+        """
 
-            # On recherche le répertoire de LibreOffice.
-            #
-            log.debug("Recherche de LIBRE OFFICE :")
-            log.debug("~~~~~~~~~~~~~~~~~~~~~~~~~~~")
+        segments = self.segments()
 
-            # Description du cheminement dont nous pensons qu'il peut nous
-            # mener depuis « Program Files » à l'exécutable de LibreOffice.
-            #
-            masks = ( "Libre*Office*", "program", "soffice.exe" )
+        if self.backupCount >= 0:
+            doomed = segments[:max(0, len(segments) - self.backupCount)]
+        else:
+            doomed = []
 
-            dir, exe = self.search_path_from_masks(programs, masks)
+        if self.retention is not None:
+            limit = time.time() - self.retention
+            doomed.extend(
+                segment for segment in segments[len(doomed):]
+                if os.path.getmtime(segment) < limit
+                )
 
-            if exe is not None:
-                l_office_exe = str(exe)
-                l_writer_exe = str(dir / "swriter.exe")
+        for segment in doomed:
+            try:
+                os.unlink(segment)
+            except OSError:
+                pass
 
-            log.debug('')
+    def close(self):
+        """ On attend que nos segments aient été compressés, avant de
+        fermer le LOG.
+        """
 
-            # « Edit Pad Pro » peut être "rangé" / installé dans plusieurs
-            # répertoires différents suivant les machines, suivant que j'ai
-            # utilisé le répertoire par défaut lors de l'installation, ou
-            # que j'ai pensé à modifier ce répertoire ( pour coller à mon
-            # ancienne habitude... ).
-            #
-            # Le mieux serait ici de lire dans le registre Windows l'endroit
-            # où se trouve Edit Pad Pro !!!
-            #
-            # Cela dit, il peut y avoir plusieurs version d'EditPad Pro
-            # hébergées sur une même machine...
-            #
-            # AVANT nous utilisions 2 listes pour retrouver « Edit Pad Pro »
-            # ( une infâme verrue en fait... ), 2 listes que nous parcourions
-            # l'une après l'autre, via 2 boucles « for » :
-            #
-            #   editpad_dir_list = [
-            #       # On liste ici les différents répertoires possibles, par ordre
-            #       # de la version la plus récente ( préférée ) à la plus ancienne.
-            #       #
-            #       r"C:\Program Files\Just Great Software\EditPad Pro",
-            #       r"C:\Program Files\EditPad Pro",
-            #       r"C:\Program Files\EditPadPro",
-            #       r"C:\Program Files\Just Great Software\EditPad Pro 8",
-            #       r"C:\Program Files\EditPad Pro 8",
-            #       r"C:\Program Files\EditPadPro8",
-            #       r"C:\Program Files\Just Great Software\EditPad Pro 7",
-            #       (..)
-            #   ]
-            #
-            #   editpad_exe_list = [
-            #       # On liste ici les différents exécutables possibles, par ordre
-            #       # de la version la plus récente ( préférée ) à la plus ancienne.
-            #       #
-            #       'EditPadPro8.exe',
-            #       'EditPadPro7.exe',
-            #       (..)
-            #   ]
-            #
-            # PUIS la méthode search_path_from_masks() a été écrite et cela
-            # a simplifié la recherche...
-            #
-            log.debug("Recherche de EDIT PAD PRO : dans « Just*Great*Software* »")
-            log.debug("~~~~~~~~~~~~~~~~~~~~~~~~~~~")
-
-            # Description du cheminement dont nous pensons qu'il peut nous
-            # mener depuis « Program Files » à l'exécutable de Edit Pad Pro.
-            #
-            masks = ( "Just*Great*Software*", "Edit*Pad*Pro*", "Edit*Pad*Pro*.exe" )
-
-            _, exe = self.search_path_from_masks(programs, masks)
-
-            if exe is None:
-                # En cas d'échec, nous testons un chemin alternatif : il se peut
-                # que le sous-répertoire soit directement dans « Program Files ».
-                #
-                log.debug('')
-                log.debug("Recherche de EDIT PAD PRO : dans « Program Files »")
-                log.debug("~~~~~~~~~~~~~~~~~~~~~~~~~~~")
+        if self._worker is not None:
+            self._pending.put(None)
+            self._worker.join()
+            self._worker = None
 
-                _, exe = self.search_path_from_masks(programs, masks[1:])
+        super().close()
 
-            if exe is None:
-                # Si l'on n'a pas trouvé EditPadPro, on se rabat sur Notepad.
-                #
-                log.debug('')
-                log.debug("Recherche de EDIT PAD PRO : ÉCHEC")
-                log.debug("~~~~~~~~~~~~~~~~~~~~~~~~~~~")
-                log.debug('Fichier retenu = %s', exe)
 
-                exe = str(os_node / 'notepad.exe')
+class _BinaryRotatingFileHandler(_SegmentedLogHandler):
+    """ _SegmentedLogHandler pour notre format BINAIRE : le fichier est
+    ouvert en mode binaire, et chaque message y est écrit tel que fourni
+    par _BinaryLogFormatter ( sans fin de ligne ).
+    """
 
-            log.debug('')
-            exe_txt_editor = exe
+    def __init__(
+        self,
+        filename: str,
+        max_bytes: int = 0,
+        backup_count: int = 0,
+        **kwargs
+        ):
 
-            # Seulement dans le cas de Windows XP, et ceci afin de jouer
-            # un son, on a besoin d'un player et d'un fichier multimédia.
-            # ( cf la fonction "on_sonne_le_reveil" ).
-            #
-            if our_system == 'Windows' and our_release == 'XP':
+        super().__init__(filename, max_bytes, backup_count, mode = 'ab', **kwargs)
 
-                # Sous Windows XP, on joue un son d'une autre façon que
-                # sur les autres plateformes car le son généré par un
-                # "\a" y est peu audible...
-                #
-                # Je n'ai testé le "mplay32.exe" que sous Windows XP,
-                # c'est pour cela que je ne me sers de ce logiciel que
-                # dans ce cas, mais il doit fonctionner sous beaucoup
-                # de versions de Windows avant XP voire qq unes après
-                # (ou au moins son ancêtre i.e mplay.exe)... Par contre,
-                # à partir de Windows 7, il faut utiliser le lecteur
-                # Windows Media ou une autre solution...
-                #
-                # Donc ici, pour réveiller l'utilisateur, on joue une
-                # mélodie sous Windows via le Media Player l'avantage
-                # de cette méthode est que le son est réglable et que
-                # cela marche sur un PC de bureau comme sur un portable...
-                #
-                player_exe = str(os_node / 'System32' / 'mplay32.exe')
-                player_arg = ['/play', '/close']
-                played = str(os_node / 'Media' / 'Windows XP Battery Low.wav')
+    def emit(self, record: logging.LogRecord):
 
-            else:
-                player_exe = None
-                player_arg = None
-                played = None
+        try:
+            data = self.format(record)
 
+            if self.stream is None:
+                self.stream = self._open()
 
-        #
-        ###########################################################
-        ########## INITIALISATION pour un OS INCONNU  #############
-        ###########################################################
-        #
+            if self._needs_rollover(len(data)):
+                self.doRollover()
 
+            self.stream.write(data)
+            self.flush()
 
-        else:
-            log.critical('UNSUPPORTED SYSTEM :')
-            log.critical('')
-            log.critical(
-                "Les programmes nécessaires à ce module sont à définir pour l'OS « %s ».",
-                os.name.upper()
-                )
-            log.critical('')
+        except Exception:
+            self.handleError(record)
 
-            # On ne lève dorénavant plus une exception :
-            #
-            #   raise AssertionError
-            #
-            # ... car :
-            #
-            #   - Cela faisait planter le script dans ce cas, i-e en fin
-            # de script, lorsque l'on passait dans notre méthode __del__,
-            # celle-ci apelait « self.on_dit_au_revoir() », qui elle-même
-            # lançait « self.edit_file_txt() », qui elle-même invoquait :
-            #
-            #   self.paths_and_miscellaneous['EXE_txt_editor']
-            #
-            # ... qui n'avait pas été défini !!!
-            #
-            # On ne peut donc lever une exception qu'après avoir défini tous
-            # les « paths and miscellaneous » !!!
-            #
-            # Sinon, on va droit au PLANTAGE !!!
-            #
-            player_exe = None
-            player_arg = None
-            played = None
 
+class _LogRingHandler(logging.handlers.MemoryHandler):
+    """ Handler qui ne garde en MÉMOIRE que les « capacity » derniers
+    messages de notre journal ( les plus anciens étant oubliés ), et ne
+    les transmet à son handler cible ( le fichier LOG ) que :
 
-        #
-        ###########################################################
-        ########## CLÔTURE de notre INITIALISATION ################
-        ###########################################################
-        #
+        . lorsqu'un message de niveau « flush_level » ( WARNING par défaut )
+        ou plus est émis : ce message et ceux qui l'ont précédé sont alors
+        écrits, afin d'en connaître le contexte ;
 
+        . sur demande explicite ( cf dump() ).
 
-        self.paths_and_miscellaneous['DIR_os'] = os_dir
-        self.paths_and_miscellaneous['NOD_os'] = os_node
+    Ainsi, un script qui se déroule sans encombre n'écrit rien sur disque,
+    alors que son LOG, n'ayant rien appris d'utile, sera détruit à la fin (
+    cf on_dit_au_revoir() ).
 
-        self.paths_and_miscellaneous['EXE_txt_editor'] = exe_txt_editor
+    À l'inverse, dès que des messages ont été écrits ( cf l'attribut
+    « dumped » ), le LOG est CONSERVÉ par défaut à la fin du script : c'est
+    justement lui qui décrit le problème rencontré.
 
-        self.paths_and_miscellaneous['EXE_libre_office'] = l_office_exe
-        self.paths_and_miscellaneous['EXE_libre_writer'] = l_writer_exe
+    RQ : À la différence de MemoryHandler, flush() ne fait rien : sinon,
+    logging.shutdown(), appelé en fin de script, écrirait tout de même nos
+    messages. Seul dump() les écrit.
+    """
 
-        self.paths_and_miscellaneous['EXE_player'] = player_exe
-        self.paths_and_miscellaneous['ARG_player'] = player_arg
-        self.paths_and_miscellaneous['EXE_played'] = played
+    def __init__(
+        self,
+        capacity: int = 1000,
+        target: logging.Handler = None,
+        flush_level: int = logging.WARNING
+        ):
+        """ :param capacity: le nombre max de messages gardés en mémoire.
 
-        # Si c'est demandé, on imprime le dictionnaire.
-        #
-        printing_function = lambda x: log.debug(x)
-        jumping_function = lambda: log.debug('')
-        alert_function = lambda x: log.critical(x)
+        :param target: le handler vers lequel ces messages seront écrits.
 
-        if print_configuration:
+        :param flush_level: le niveau des messages qui déclenchent cette
+        écriture.
+        """
 
-            jumping_function()
+        super().__init__(capacity, flush_level, target, flushOnClose = False)
 
-            self.show_paths_and_miscellaneous(
-                printing_function,
-                jumping_function,
-                msg_architecture
-                )
+        self.buffer = collections.deque(maxlen = capacity)
+        self.dumped = 0
 
-        # On vérifie que notre dictionnaire soit correct.
-        #
-        all_ok = self.check_paths_and_miscellaneous(
-            printing_function,
-            jumping_function,
-            alert_function
-            )
+    def emit(self, record: logging.LogRecord):
 
-        if all_ok:
-            log.debug('-> Ok, présence de tous les fichiers & répertoires.')
-            jumping_function()
+        self.buffer.append(record)
 
-        else:
-            log.critical('-> Certains FICHIERS requis sont MANQUANTS.')
-            log.critical('')
+        if record.levelno >= self.flushLevel:
+            self.dump()
 
-        return working_path
+    def flush(self):
+        pass
 
+    def dump(self):
+        """ Écrit, vers notre handler cible, les messages encore en mémoire.
+        """
 
-    def get_paths_and_miscellaneous(
-        self,
-        index: str
-        ) -> str:
-        """ Pour retrouver de façon « protégée » une valeur de notre
-        dictionnaire : on va ainsi, par exemple, tester si l'index
-        est bien présent dans le dictionnaire...
-        
-        :param index: l'index de la valeur souhaitée.
+        with self.lock:
 
-        :return: la valeur souhaitée.
-        """
+            if self.target is None:
+                return
 
-        value = None
+            while self.buffer:
+                self.target.handle(self.buffer.popleft())
+                self.dumped += 1
 
-        if self.paths_and_miscellaneous is None \
-            or len(self.paths_and_miscellaneous) == 0:
+            self.target.flush()
 
-            self.shw_debug(f'« {index} » est inconnu.')
-            self.shw_debug("« paths_and_miscellaneous » est vide.")
-            self.shw_debug('')
 
-        else:
+class _LazyLogHandler(logging.Handler):
+    """ Handler qui tient la place de notre fichier LOG tant qu'aucun message
+    n'a été émis : ce n'est qu'à réception du 1er message que ce fichier est
+    réellement créé ( cf « opener » ), que son handler prend notre place dans
+    le journal, et que le message lui est transmis.
 
-            keys = self.paths_and_miscellaneous.keys()
+    Ainsi, un script qui ne journalise rien ne crée aucun fichier LOG.
+    """
 
-            if index in keys:
+    def __init__(
+        self,
+        journal: logging.Logger,
+        opener: object,
+        announce: object = None
+        ):
+        """ :param journal: le journal dont nous tenons la place.
 
-                value = self.paths_and_miscellaneous[index]
+        :param opener: fonction() -> logging.Handler qui crée le fichier LOG,
+        et renvoie le handler qui doit nous remplacer.
 
-            if value is None:
+        :param announce: fonction() appelée juste après ce remplacement ( afin,
+        par exemple, de journaliser le nom du fichier créé ).
+        """
 
-                # Si l'index n'a pas été trouvé, ou que la valeur dans
-                # le dictionnaire est None, alors on informe.
-                #
-                msg = f'« {index} » est inconnu'
+        super().__init__(logging.DEBUG)
 
-                if 'working_SYSTEM' in keys and 'working_MACHINE_TYPE' in keys:
+        self.journal = journal
+        self.opener = opener
+        self.announce = announce
+        self.target = None
+        self.discarding = False
 
-                    msg = '{} sur {} et {}.'.format(
-                        msg,
-                        self.paths_and_miscellaneous['working_SYSTEM'],
-                        self.paths_and_miscellaneous['working_MACHINE_TYPE']
-                        )
+    def discard(self):
+        """ Les messages à venir seront ignorés, sans créer de fichier LOG (
+        cf on_dit_au_revoir() ).
+        """
 
-                else:
-                    msg = f'{msg} sur {os.name.upper()}.'
+        self.discarding = True
 
-                self.shw_debug(msg)
-                self.shw_debug('')
-            
-        return value
+    def emit(self, record: logging.LogRecord):
 
+        # RQ : Handler.handle() nous appelle en détenant notre verrou :
+        # un seul thread peut donc créer le fichier LOG.
+        #
+        if self.target is None:
 
-# ---------------------------------------------------------------------------
-#
-#   PARTIE :
-#   ~~~~~~~~
-#   Fonctions pour manipulation de MODULES ( installation, ... )
-#
-# ---------------------------------------------------------------------------
+            if self.discarding:
+                return
 
+            self.target = self.opener()
 
-    def install_module_via_pip(
-        self,
-        module_name: str = None
-        ) -> bool:
-        """ Pour installer un module qui ne l'aurait pas encore été et dont
-            nous aurions pour autant besoin...
+            # ATTENTION : Le journal est peut-être en train de parcourir sa
+            # liste de handlers ( cf Logger.callHandlers ) : nous y prenons
+            # donc la place de notre remplaçant, sans décaler les autres.
+            #
+            handlers = self.journal.handlers
 
-        :param module_name: le nom du module à installer
+            if self in handlers:
+                handlers[handlers.index(self)] = self.target
 
-        :return: True si l'installation a réussi ( ou si le module existait
-        déjà ), False sinon.
-        """
+            if self.announce is not None:
+                self.announce()
 
-        log = self.logItem
+        if record.levelno >= self.target.level:
+            self.target.handle(record)
 
-        installed = False
 
-        try:
-            # On essaye d'importer le module pour savoir s'il n'existerait
-            # pas déjà.
-            #
-            # Pour ceci, la syntaxe :
-            #
-            #   import module_name
-            #
-            # ... ne convient pas car, alors, Python va recherche un module
-            # nommé « module_name » !!!
-            #
-            # Dans ce cas, on peut utiliser le module « importlib » :
-            #
-            #   cf https://docs.python.org/3/library/importlib.html#importlib.import_module
-            #
-            # C'est la syntaxe la plus correcte et l'on écrit donc :
-            #
-            #   import importlib
-            #   importlib.import_module(module_name)
-            #
-            # On peut sinon utiliser la fonction « __import__() », interne
-            # à Python  :
-            #
-            #   cf https://docs.python.org/3/library/functions.html#import__
-            #
-            # ... mais cela est déconseillé :
-            #
-            #   « Direct use of __import__() is also discouraged in favor of
-            #     importlib.import_module(). »
-            #
-            # TOUTEFOIS, dans notre cas, comme il ne s'agit que de tester
-            # l'existence du module, c'est pourtant cette dernière syntaxe
-            # ( la plus simple et efficace ) que nous avons choisie !!!
-            #
-            __import__(module_name)
+def iter_log_records(
+    log_file: str,
+    log_format: str = None
+    ) -> object:
+    # ( générateur ) -> dict
+    """ Relit, au fil de l'eau, les messages d'un fichier LOG créé par
+    ScriptSkeleton.on_ouvre_le_journal() : le fichier n'est jamais chargé
+    en entier, ce qui permet d'analyser les journaux de longs traitements.
 
-        except ModuleNotFoundError:
+    :param log_file: le fichier à relire.
 
-            # Le module n'est pas installé...
-            #
-            # ... alors on l'installe en attendant la fin de cette opération
-            # ( via subprocess.run ).
-            #
-            command_line = [sys.executable, '-m', 'pip', 'install', module_name]
-            log.debug("Commande exécutée = %s", command_line)
-            log.debug('')
+    :param log_format: son format ( cf log_format_... ). Par défaut, il est
+    déduit de son 1er octet : « { » pour du JSON, 0 pour du binaire ( une
+    longueur de message < 16 Mo ), sinon du texte.
 
-            process = subprocess.run(command_line)
-            log.debug('Code Retour de la commande : « %s ».', process.returncode)
-            log.debug('')
+    :return: un générateur de dictionnaires ( cf _log_record_fields ). Pour
+    le format texte, seul le champ « msg » ( la ligne lue ) est fourni.
 
-            if process.returncode == 0:
+    RQ : Un dernier message incomplet ( journal en cours d'écriture ) est
+    ignoré.
 
-                log.debug("Installation du module « %s » réussie.", module_name)
-                log.debug('')
+    RQ : Les segments compressés ( « .gz » ou « .xz », cf
+    _SegmentedLogHandler ) sont relus de la même façon.
+    """
 
-                installed = True
+    if log_file.endswith('.' + log_compression_gzip):
+        import gzip
+        opener = gzip.open
 
-            else:
-                log.critical('Module « %s » INTROUVABLE !!!', module_name)
-                log.critical('')
+    elif log_file.endswith('.' + log_compression_xz):
+        import lzma
+        opener = lzma.open
 
-        else:
-            log.debug("Module « %s » déjà présent sur cette machine.", module_name)
-            log.debug('')
+    else:
+        opener = open
 
-            installed = True
+    with opener(log_file, 'rb') as fd:
 
-        return installed
+        if log_format is None:
 
+            first = fd.read(1)
+            fd.seek(0)
 
-# ---------------------------------------------------------------------------
-#
-#   PARTIE :
-#   ~~~~~~~~
-#   Fonctions pour journalisation des WARNINGS et ERREURS ( DÉBOGAGE ).
-#
-# ---------------------------------------------------------------------------
+            if first == b'{':
+                log_format = log_format_jsonl
+            elif first == b'\x00':
+                log_format = log_format_binary
+            else:
+                log_format = log_format_text
 
+        if log_format == log_format_binary:
 
-    def on_ouvre_le_journal(
-        self,
-        log_name,
-        directory: str = None,
-        also_on_screen: bool = None,
-        warning_on_reopen: bool = None
-        ) -> logging.Logger:
-        """ Pour initialiser la journalisation des messages dans un fichier,
-            voire également à l'écran.
+            size_of = _BinaryLogFormatter._size
 
-        Cette fonction est initialement basée sur un exemple trouvé sur le web :
+            while True:
 
-            http://sametmax.com/ecrire-des-logs-en-python/
-            (..)\Src\_Python\( help ) Functions of Python.rar\LOG - Écrire des logs en Python*.pdf
+                head = fd.read(size_of.size)
+                if len(head) < size_of.size:
+                    return
 
-        On ne gère par contre qu'un unique journal, et ceci afin de ne pas avoir
-        plusieurs journaux créés ( par erreur par exemple ) en //, ce qui causerait
-        la création de plusieurs fichiers log temporaires, et donc rendrait le
-        déroulé des opérations plus difficile à suivre !!!
+                ( size, ) = size_of.unpack(head)
+                payload = fd.read(size)
+                if len(payload) < size:
+                    return
 
-        :param log_name: nom qui sera donné au logger et qui permettra de le retrouver,
-        si nécessaire, via la fonction logging.getLogger(name).
+                yield _BinaryLogFormatter.decode(payload)
 
-        :param directory: répertoire où il faut créé le journal. Si ce paramètre est
-        vide, ou que le répertoire n'existe pas, on fixera le répertoire de création
-        au répertoire courant...
+        elif log_format == log_format_jsonl:
 
-        :param also_on_screen: les messages de log doivent-ils également apparaître
-        à l'écran ( ou ne seront-ils stockés sinon que dans un fichier ).
+            for line in fd:
 
-        :param warning_on_reopen: si ce booléen est à vrai, un WARNING s'affichera
-        en gros si le journal avait déjà été ouvert. Sinon, il y aura seulement
-        un message de deboggage qui sera émis.
+                line = line.strip()
+                if not line:
+                    continue
 
-        :return: l'objet logger en lui-même, qu'il ait été créé à cette occasion
-        ou que, ayant déjà été créé, on renvoie à nouveau le même.
-        """
+                try:
+                    yield json.loads(line)
 
-        leaf = self.files.Path
+                except ValueError:
+                    continue
 
-        # On définit nos paramètres en fonction de notre mode de DEBUG personnel.
-        # ( cf ci-dessus « ATTENTION : PERSONNALISATION de notre mode DEBUG » )
-        #
-        if also_on_screen is None:
-            also_on_screen = self._debug_
+        else:
 
-        if warning_on_reopen is None:
-            warning_on_reopen = self._debug_
+            for line in fd:
+                yield {'msg': line.decode('utf-8', 'replace').rstrip('\r\n')}
 
-        # On crée l'objet JOURNAL si besoin.
-        #
-        if self.logItem is None:
 
-            # Création de l'objet logger qui va nous servir à écrire dans les logs.
-            #
-            journal = logging.getLogger(log_name)
-            self.logItem = journal
+class _MethodStats:
+    """ Statistiques d'appels de nos méthodes ( cf _instrument_methods ) :
+    pour chacune d'elles, le nombre d'appels, leurs durées totale, moyenne
+    et au 95e centile ( « p95 » ), le nombre d'octets traités ( lorsque
+    cela a un sens, cf _timing_bytes ), ainsi que le nombre d'appels ayant
+    échoué ( exception levée ), dont la durée est tout de même comptée.
 
-            # On met le niveau du logger à DEBUG, comme ça il écrit tout.
-            #
-            journal.setLevel(logging.DEBUG)
+    Elles sont consultables via :
 
-            # Création d'un formateur qui va ajouter le temps, le niveau
-            # de chaque message quand on écrira un message dans le log.
-            #
-            file_format = logging.Formatter(
-                fmt = '%(asctime)s - %(levelname)-9s %(message)s',
-                datefmt = '%d-%m %H:%M:%S'
-                )
+        stats.get('ScriptSkeleton.search_files_from_a_mask')
+        stats.as_dict()
+        stats.summary()         # -> les lignes d'un tableau récapitulatif
 
-            # Création d'un fichier temporaire qui va nous servir d
-            # journal d'exécution.
-            #
-            #if directory is None or not self.files.node(directory).is_dir():
-            if directory is None or not leaf(directory).is_dir():
-                directory = str(leaf().cwd())
+    RQ : Seules les « max_samples » dernières durées de chaque méthode sont
+    conservées pour calculer son p95.
+    """
 
-            file_prefix = f'#_LOG_for_{log_name}_#_'
-            file_object = tempfile.NamedTemporaryFile(
-                mode = 'w+t',
-                encoding = 'utf-8',
-                prefix = file_prefix,
-                suffix = '.log',
-                dir = directory,
-                delete = False
-                )
+    def __init__(self, max_samples: int = 10000):
 
-            # Création d'un handler qui va rediriger une écriture du log vers
-            # un fichier en mode 'append', avec 1 backup et une taille max de 1Mo.
-            #
-            file_handler = logging.handlers.RotatingFileHandler(
-                file_object.name,
-                'a',
-                1000000,
-                1
-                )
+        self.max_samples = max_samples
+        self._methods = {}
+        self._lock = threading.Lock()
 
-            # On met le niveau du handler fichier sur DEBUG, on lui dit qu'il doit
-            # utiliser le formateur créé précédement et on ajoute ce handler au
-            # logger
-            file_handler.setLevel(logging.DEBUG)
-            file_handler.setFormatter(file_format)
-            journal.addHandler(file_handler)
-            self._logHandler = file_handler
+    def record(
+        self,
+        name: str,
+        elapsed: float,
+        nb_bytes: int = 0,
+        failed: bool = False
+        ):
+        """ Comptabilise un appel de la méthode « name ».
 
-            # Création d'un second handler qui va rediriger chaque écriture de log
-            # sur la console.
-            #
-            # On ne crée toutefois ce second handler que si l'appelant veut également
-            # que les messages apparaissent à l'écran...
-            #
-            if also_on_screen:
-        
-                stream_handler = logging.StreamHandler()
-                stream_handler.setLevel(logging.INFO)
-                journal.addHandler(stream_handler)
+        :param failed: l'appel a-t-il levé une exception ?
+        """
 
-            journal.info('')
+        with self._lock:
 
-            journal.debug('')
-            journal.debug('OUVERTURE du journal « %s »...', log_name)
-            journal.debug('')
-            journal.debug('... tenu via PYTHON version %s.', sys.version)
-            journal.debug('')
+            stats = self._methods.get(name)
 
-            self._logFile = file_object.name
-            journal.info(
-                'Les messages seront stockés dans le fichier : %s.',
-                file_object.name
-                )
-            journal.info('')
+            if stats is None:
+                stats = [0, 0.0, 0, collections.deque(maxlen = self.max_samples), 0]
+                self._methods[name] = stats
 
-        else:
+            stats[0] += 1
+            stats[1] += elapsed
+            stats[2] += nb_bytes
+            stats[3].append(elapsed)
 
-            # Un journal existe déjà donc c'est celui-ci que l'on retourne.
-            # Par ailleurs, on affiche un warning...
-            #
-            journal = self.logItem
+            if failed:
+                stats[4] += 1
 
-            if warning_on_reopen:
-        
-                journal.warning("TENTATIVE d'OUVERTURE d'1 NOUVEAU JOURNAL...")
-                journal.warning('ATTENTION : Un journal a déjà été ouvert !!!')
-                journal.warning('')
-                journal.warning('Nous allons donc nous servir du journal nommé « %s ».',
-                                journal.name)
-                journal.warning("Par contre, on IGNORE la demande de création d'un journal « %s ».",
-                                log_name)
-                journal.warning('')
+    def get(self, name: str) -> dict:
+        # -> dict [ ou ] None
+        """ Les statistiques de la méthode « name », si elle a été appelée.
+        """
 
-        return journal
+        with self._lock:
 
+            stats = self._methods.get(name)
 
-    def on_se_presente(
-        self,
-        module_file: str,
-        arguments: list
-        ) -> int:
-        """ Fonction permettant d'afficher des informations d'ordre général ( nom du module,
-        ses arguments, ... ) lorsqu'un module est appelé en tant que __main__.
-    
-        :param module_file: le nom du fichier appelant ( la valeur de __file__ en général ).
-    
-        :param arguments: les arguments avec lesquels le module principal qui nous appelle
-        a lui-même été appelé ( sys.argv en général ).
-    
-        :return: le nombre d'éléments contenu dans la liste d'arguments « arguments » qui
-        nous a été passée en paramètre. Il s'agit d'un simple len(arguments), mais que
-        l'appelant n'aura ainsi pas à refaire...
+            if stats is None:
+                return None
+
+            ( calls, total, nb_bytes, samples, errors ) = stats
+            samples = sorted(samples)
+
+        return {
+            'calls'     :   calls,
+            'total'     :   total,
+            'mean'      :   total / calls,
+            'p95'       :   samples[max(0, -(-95 * len(samples) // 100) - 1)],
+            'bytes'     :   nb_bytes,
+            'errors'    :   errors
+            }
+
+    def as_dict(self) -> dict:
+        # -> dict( STR : dict )
+        """ Les statistiques de toutes nos méthodes appelées.
         """
 
-        log = self.logItem
+        return {name: self.get(name) for name in sorted(self._methods)}
 
-        # On affiche le nom du module en lettres capitales, i.e le nom du fichier, mais sans
-        # son extension.
-        #
-        #short_name = self.files.node(module_file).stem
-        short_name = self.files.Path(module_file).stem
+    def reset(self):
 
-        log.debug('')
-        log.debug('Je me présente :')
-        log.debug('================')
-        log.debug('')
-        log.debug("!!! Hello world, I'm « %s » in Python !!!", short_name.upper())
-        log.debug('')
+        with self._lock:
+            self._methods.clear()
 
-        log.debug('')
-        log.debug('Exécution de : %s', module_file)
-        log.debug('==============')
-        log.debug('')
-        log.debug('Ce module est exécuté en tant que MODULE PRINCIPAL.')
-        log.debug('')
+    def summary(self) -> list:
+        # -> list( STR )
+        """ Les lignes d'un tableau récapitulatif, trié par durée totale
+        décroissante.
+        """
 
-        # On affiche la liste des paramètres reçus.
-        #
-        log.debug('')
-        log.debug('Paramètres reçus :')
-        log.debug('==================')
-        log.debug('')
+        rows = sorted(
+            self.as_dict().items(),
+            key = lambda item: item[1]['total'],
+            reverse = True
+            )
 
-        nb_parameters_in = 0 if arguments is None else len(arguments)
+        width = max([len(name) for name, _ in rows] + [len('Méthode')])
 
-        log.debug('Nombre de paramètres = %s', nb_parameters_in)
-        log.debug('Liste des paramètres = %s', arguments)
-        log.debug('')
+        lines = [
+            f'{"Méthode":<{width}} {"Appels":>8} {"Total (s)":>10}'
+            f' {"Moyenne (s)":>12} {"p95 (s)":>10} {"Octets":>12} {"Erreurs":>8}',
+            '-' * (width + 67)
+            ]
 
-        if arguments is not None:
+        for name, stats in rows:
+            lines.append(
+                f'{name:<{width}} {stats["calls"]:>8} {stats["total"]:>10.4f}'
+                f' {stats["mean"]:>12.6f} {stats["p95"]:>10.6f} {stats["bytes"]:>12}'
+                f' {stats["errors"]:>8}'
+                )
 
-            for counter, parameter in enumerate(arguments, start=0):
+        return lines
 
-                log.debug(
-                    'Paramètre n° %s ie sys.argv[ %s ] = %s',
-                    counter,
-                    counter,
-                    parameter
-                    )
 
-        log.debug('')
+# Nombre d'octets traités par certaines de nos méthodes, déduits de leurs
+# arguments et / ou de leur résultat ( cf _instrument_methods ).
+#
+def _bytes_of_saved_file(args, kwargs, result) -> int:
 
-        return nb_parameters_in
+    return os.path.getsize(result) if isinstance(result, str) and os.path.isfile(result) else 0
 
 
-    def debug_mode(
-        self,
-        state: bool = True
-        ):
-        """ Pour lancer / arrêter notre mode DEBUG depuis le script
-        appelant.
+def _bytes_of_url_answer(args, kwargs, result) -> int:
 
-        Cela permet au script appelant de moduler les informations
-        que nous émettons, au regard des parties de son corps, plus
-        ou moins sensibles / nouvelles, qu'il veut observer.
+    answer = result[0] if isinstance(result, tuple) and result else None
 
-        :param state: True pour (re)démarrer le mode, False pour
-        le stopper.
-        """
+    return len(answer) if isinstance(answer, (str, bytes)) else 0
 
-        self._debug_ = state
 
-        action = 'start' if state else 'stop'
-        deco = 22 * '#'
-        msg = f'{deco} Mode DEBUG ( {action} ) {deco}'
+_timing_bytes = {
+    'save_strings_to_file': _bytes_of_saved_file,
+    'send_request_url': _bytes_of_url_answer
+    }
 
-        self.shw('#' * len(msg))
-        self.shw(msg)
-        self.shw('#' * len(msg))
-        self.shw('')
 
+def _instrument_methods(
+    obj: object,
+    stats: _MethodStats,
+    bytes_of: dict = None
+    ):
+    """ Mesure les appels de chaque méthode PUBLIQUE de la classe de « obj »
+    ( cf _MethodStats ).
 
-    def on_dit_au_revoir(
-        self,
-        log_to_open: bool = None,
-        log_to_remove: bool = None,
-        pause_to_make: bool = None
-        ):
-        """ Fonction a appeler avant de quitter ce module. Elle permet
-        essentiellement de lancer l'affichage du fichier de LOG... et
-        de rendre la main à l'environnement appelant.
+    L'objet « obj », et lui seul, devient pour cela une instance d'1 sous-
+    classe de sa classe, dont les méthodes chronomètrent chaque appel à
+    celles de leur classe mère : la classe elle-même n'est pas modifiée, et
+    donc nos objets non instrumentés ne paient aucun surcoût.
 
-        :param log_to_open: faut-il afficher ou non le fichier LOG dans
-        un éditeur de TXT.
+    RQ : Lorsqu'une méthode renvoie un générateur, c'est le temps passé à le
+    parcourir qui est mesuré, à la fin de son parcours.
 
-        :param log_to_remove: faut-il détruire ou non le fichier LOG.
+    RQ : Un appel qui lève une exception est lui aussi comptabilisé, comme
+    un échec ( cf _MethodStats.record ) : sinon, nos appels en erreur (
+    send_request_url() sans réponse, ... ) disparaîtraient de nos mesures.
 
-        :param pause_to_make: faut-il marquer une pause en demandant
-        à l'utilisateur de frapper sur la touche ENTRÉE, et ce à la
-        toute fin des traitements.
+    RQ : Contrairement à des fonctions stockées dans l'objet lui-même, cette
+    sous-classe ne crée aucune référence de l'objet vers lui-même, ce qui
+    ne retarde pas sa destruction ( cf __del__ ).
 
-        :return:
-        """
+    :param obj: l'objet à instrumenter.
 
-        # On définit nos paramètres en fonction de notre mode de DEBUG personnel.
-        # ( cf ci-dessus « ATTENTION : PERSONNALISATION de notre mode DEBUG » )
-        #
-        if log_to_open is None:
-            log_to_open = self._debug_
+    :param stats: là où stocker les mesures.
 
-        if log_to_remove is None:
-            log_to_remove = not self._debug_
+    :param bytes_of: dict( nom de méthode : fonction( args, kwargs, résultat )
+    -> nombre d'octets traités ).
+    """
 
-        if pause_to_make is None:
-            pause_to_make = self._debug_
+    import inspect
+    import functools
 
-        # Pour ne pas dire 2 fois au revoir, ni détruire 2 fois
-        # le fichier LOG...
-        #
-        # Normalement, l'utilisateur de ce module doit appeler
-        # on_dit_au_revoir() lorsqu'il a fini... mais, au cas où
-        # il ne le ferait pas, nous appelons aussi cette fonction
-        # dans notre méthode __del__(). Nous réalisons alors ce
-        # que nous pouvons encore faire...
-        #
-        if self._we_already_said_bye:
+    if bytes_of is None:
+        bytes_of = _timing_bytes
 
-            # La fonction on_dit_aurevoir() a déjà été appelée
-            # par l'utilisateur de ce module. Nous revenons ici
-            # probablement depuis notre méthode __del__ qui nous
-            # appelle aussi, et ce afin que nous puissions faire
-            # ce que nous pouvons encore faire si l'utilisateur
-            # du module n'a pas appeler on_dit_aurevoir(), comme
-            # il le devrait...
-            #
-            self.shw_debug('Nous avons déjà dit au revoir...')
-            self.shw_debug('')
+    klass = type(obj)
 
-        else:
+    # Notre objet est déjà instrumenté.
+    #
+    if '_timing_stats' in vars(klass):
+        return
 
-            # Nous sommes ici sûrs que c'est la première
-            # fois que nous parcourons cette fonction.
-            #
-            self._we_already_said_bye = True
+    def timed_generator(name, generator):
 
-            self.shw_info('BYE')
-            self.shw_info('')
+        elapsed = 0.0
+        failed = False
 
-            # S'il est demandé d'afficher le journal en
-            # fin de traitements, on le fait.
-            #
-            # ... sauf si nous sommes déjà dans notre
-            # méthode __del__(), sinon cela va planter car
-            # beaucoup d'objets sont déjà potentiellement
-            # en cours de destruction !!!
-            #
-            # CHANGEMENT : Dorénavant, grâce aux fonctions
-            # self.shw_info() et self.shw_debug(), on peut
-            # appeler edit_file_txt() même depuis __del__().
-            #
-            if log_to_open:
+        try:
+            while True:
 
-                # On lance l'éditeur de texte afin que l'
-                # utilisateur puisse voir le fichier log.
-                #
-                self.edit_file_txt(
-                    self._logFile,
-                    wait = False
-                    )
+                t_start = time.perf_counter()
 
-            # On signale à notre objet FileSystemTree de
-            # ne plus écrire dans le LOG, car nous allons
-            # détruire ce fichier...
-            #
-            if isinstance(self.files, FileSystemTree):
-                self.files._register_log(None)
+                try:
+                    item = next(generator)
+                finally:
+                    elapsed += time.perf_counter() - t_start
 
-            # On libère le fichier LOG de sa fonction de
-            # handler.
-            #
-            # Ce qui permettra que ce fichier soit détruit
-            # s'il est devenu inutile...
-            #
-            # ... sauf si nous sommes déjà dans notre
-            # méthode __del(), sinon cela va planter car
-            # bcp d'objets sont déjà potentiellement en
-            # cours de destruction !!!
-            #
-            if self._we_are_inside_del_method:
+                yield item
 
-                pass
+        except StopIteration:
+            pass
 
-            else:
+        except Exception:
+            failed = True
+            raise
 
-                self.logItem.removeHandler(
-                    self._logHandler
-                    )
+        finally:
+            generator.close()
+            stats.record(name, elapsed, failed = failed)
 
-            self._logHandler.close()
+    def instrument(name, function):
 
-            #
-            ################################################
-            ########## ATTENTION : Cette limite dépassée, il
-            ########## ne faut plus écrire dans le LOG car
-            ########## Python peut avoir détruit toutes les
-            ########## classes qui le gère !!!
-            ##########
-            ########## En effet, nous avons libéré ci-dessus
-            ########## la dernière dépendance à celui-ci, si
-            ########## nous n'avions pas demandé à ce que le
-            ########## LOG apparaisse aussi à l'écran...
-            ################################################
-            #
+        full_name = f'{klass.__name__}.{name}'
+        count_bytes = bytes_of.get(name)
 
-            # On va adopter un comportement final différent
-            # suivant que ce script est lancé au travers de
-            # Python IDLE ou pas.
-            #
-            #myLogFile = self.files.node(self._logFile)
-            myLogFile = self.files.Path(self._logFile)
-            idle_windows = 'pythonw.exe'
+        @functools.wraps(function)
+        def timed(self, *args, **kwargs):
 
-            if idle_windows in sys.executable:
+            t_start = time.perf_counter()
+            failed = True
 
-                # Lorsque nous sommes sous IDLE, nous en
-                # tenons pas compte du paramètre demandant
-                # de détruire ou pas le fichier LOG...
-                #
-                # Dans ce cas, il s'agit en effet, souvent,
-                # d'une phase de mise au point d'un script,
-                # donc nous laissons quoi qu'il arrive le
-                # LOG, afin qu'il puisse être examiné.
-                #
-                # ATTENTION : Finalement, même sous IDLE, on
-                # détruit le fichier LOG si telle est le choix
-                # de l'utilisateur. En effet, même s'il s'agit
-                # de phases de mises au point, on peut avoir
-                # envie de détruire le LOG car il ne va rien
-                # nous apporter et que l'on devra le détruire
-                # à chaque nouvelle exécution...
-                #
-                #   self.shw_debug('PS: Je ne détruis pas le LOG')
-                #   self.shw_debug('')
-                #
-                if log_to_remove and myLogFile.is_file():
+            try:
+                result = function(self, *args, **kwargs)
+                failed = False
 
-                    self.shw_debug('Destruction du LOG même sous IDLE.')
-                    self.shw_debug('')
+            finally:
+                elapsed = time.perf_counter() - t_start
 
-                    myLogFile.unlink()
+                if failed:
+                    stats.record(full_name, elapsed, failed = True)
 
-                # Nous sommes sous IDLE donc nous affichons
-                # seulement un message avant de rendre la
-                # main à cette console.
-                #
-                #   self.shw_debug('... et je rends la main à IDLE.')
-                #
-                self.shw_debug('Puis je rends la main à IDLE.')
-                self.shw_debug('')
+            if inspect.isgenerator(result):
+                return timed_generator(full_name, result)
 
-                # Sous IDLE, l'instruction « exit() » ci-
-                # dessous aurait aussi tué IDLE... !!!
-                #
-                # exit()
+            stats.record(
+                full_name,
+                elapsed,
+                count_bytes(args, kwargs, result) if count_bytes else 0
+                )
 
-            else:
-    
-                # Tout s'est bien passé donc on détruit le
-                # fichier LOG, pour ne pas encombrer...
-                #
-                # On ne va toutefois pas détruire ce fichier
-                # tant que l'utilisateur n'a pas frappé la
-                # touche entrée.
-                #
-                if log_to_remove and myLogFile.is_file():
+            return result
 
-                    self.shw_debug('Destruction du LOG.')
-                    self.shw_debug('')
+        return timed
 
-                # Nous ne sommes pas sous IDLE, donc nous
-                # marquons une pause afin que la fenêtre
-                # d'exécution ne disparaisse pas subitement.
-                #
-                if pause_to_make:
+    timed_methods = {
+        name: instrument(name, function)
+        for name, function in vars(klass).items()
+        if not name.startswith('_') and inspect.isfunction(function)
+        }
 
-                    _pause_("PRESS ENTER TO CONTINUE...",
-                            before=1, after=2)
+    timed_methods['_timing_stats'] = stats
+    timed_methods['__qualname__'] = klass.__qualname__
+    timed_methods['__module__'] = klass.__module__
 
-                # On a laissé le temps à l'utilisateur de
-                # consulter le fichier LOG. On peut donc
-                # le détruire.
-                #
-                if log_to_remove and myLogFile.is_file():
+    obj.__class__ = type(klass.__name__, (klass,), timed_methods)
 
-                    myLogFile.unlink()
 
-                self.shw_debug('FIN DU SCRIPT')
-                self.shw_debug('')
+# Profilages possibles de nos scripts ( cf _ScriptProfiler ), éventuellement
+# combinés ( ex : « cprofile+tracemalloc » ).
+#
+# RQ : Ils peuvent aussi être demandés, sans toucher au script lui-même, via
+# la variable d'environnement profile_mode_env ( ex : sous Windows, « set
+# SKELETON_PROFILE=cprofile » avant de lancer le script ).
+#
+profile_via_cprofile = 'cprofile'
+profile_via_tracemalloc = 'tracemalloc'
 
-                if self._we_are_inside_del_method:
+profile_modes = (
+    profile_via_cprofile,
+    profile_via_tracemalloc
+    )
 
-                    self.shw_debug(
-                        'Nous nous AUTO-DÉTRUISONS ( __del__ ).'
-                        )
-                    self.shw_debug(
-                        'Pas de « exit() » lancé : sinon cela bug !'
-                        )
-                    self.shw_debug('')
+profile_mode_env = 'SKELETON_PROFILE'
 
-                    # Nous sommes dans la méthode __del__, nous
-                    # ne pouvons lancer le « exit() » de fin.
-                    #
-                    # En effet, si on l'exécute dans __del__,
-                    # Python affiche les msgs suivants :
-                    #
-                    #       FIN DU SCRIPT
-                    #
-                    #       Exception ignored in: <function ScriptSkeleton.__del__ at 0x0000021D99CC1510>
-                    #       Traceback (most recent call last):
-                    #         File "C:\Program Files\make_movie\skeleton.py", line 167, in __del__
-                    #         File "C:\Program Files\make_movie\skeleton.py", line 729, in on_dit_au_revoir
-                    #       NameError: name 'exit' is not defined
-                    #
-                    # ... ou ( dans je ne sais plus quelle autre
-                    # configuration ) :
-                    #
-                    #       FIN DU SCRIPT
-                    #
-                    #       Exception ignored in: <function ScriptSkeleton.__del__ at 0x0000026AC1D11750>
-                    #       Traceback (most recent call last):
-                    #         File "K:\_Know\Info\Dvpt\RALISA~1\Src\_Python\my Crew History\skeleton.py", line 168, in __del__
-                    #         File "K:\_Know\Info\Dvpt\RALISA~1\Src\_Python\my Crew History\skeleton.py", line 722, in on_dit_au_revoir
-                    #         File "C:\Program Files\Python310\lib\_sitebuiltins.py", line 26, in __call__
-                    #       SystemExit: None
-                    #
-                    # exit()
 
-                else:
+class _ScriptProfiler:
+    """ Profile l'exécution d'un script, de start() à stop(), via :
 
-                    self.shw_debug("Ciel ! On m'a tué...")
-                    self.shw_debug('')
+        . cProfile : le temps passé dans chaque fonction, sauvegardé dans
+        un fichier « .prof » ( à relire via pstats, snakeviz, ... ) et
+        résumé dans un fichier « .prof.txt » ;
 
-                    # Finalement, ici aussi nous n'exécutons plus
-                    # l'instruction « exit() » ci-dessous...
-                    #
-                    # exit()
+        . tracemalloc : les lignes qui ont alloué le plus de mémoire, et
+        le pic d'allocation, dans un fichier « .alloc.txt ».
+    """
 
-                    # Le mieux est probablement de ne pas lancer
-                    # du tout « exit() » !!!
-                    #
-                    # En effet, cf :
-                    #
-                    #   https://stackoverflow.com/questions/19747371/python-exit-commands-why-so-many-and-when-should-each-be-used/
-                    #   in _Know\Info\Dvpt\Réalisation\Langages\Python\- et - exit(), system.exit(), raise SystemExit, etc.rar
-                    #
-                    #   « Nevertheless, quit should not be used in production code.
-                    #   This is because it only works if the site module is loaded.
-                    #   Instead, this function should only be used in the interpreter.
-                    #   [..]
-                    #   However, like quit, exit is considered bad to use in production
-                    #   code and should be reserved for use in the interpreter. This is
-                    #   because it too relies on the site module. »
-                    #
-                    # Par ailleurs, si on utilise l'une ou l'
-                    # autre des syntaxes suivantes :
-                    #
-                    #   . raise SystemExit
-                    #
-                    #   . sys.exit()
-                    #
-                    # Python communiquera les msgs suivants :
-                    #
-                    #       FIN DU SCRIPT
-                    #
-                    #       Exception ignored in: <function ScriptSkeleton.__del__ at 0x000002DBEEB616C0>
-                    #       Traceback (most recent call last):
-                    #         File "K:\_Know\Info\Dvpt\RALISA~1\Src\_Python\my Crew History\skeleton.py", line 176, in __del__
-                    #         File "K:\_Know\Info\Dvpt\RALISA~1\Src\_Python\my Crew History\skeleton.py", line 730, in on_dit_au_revoir
-                    #       SystemExit:
-                    #
-                    # DONC, FINALEMENT, DANS CETTE BRANCHE, ON
-                    # NE FAIT PLUS RIEN ( à part des msgs ) !!!
-                    #
-                    # On pourrait même virer tout le code de
-                    # cette fonction à partir du dernier :
-                    #
-                    #       if self._we_are_inside_del_method:
-                    #
-                    # J'ai toutefois gardé tout ce code et ces
-                    # infos ( commentaires ) pour me souvenir
-                    # de tout cela.
-                    #
+    def __init__(
+        self,
+        mode: str,
+        top_n: int = 25
+        ):
+        """ :param mode: le(s) profilage(s) demandé(s), séparés par des
+        « + » ou des « , » ( cf profile_via_... ).
 
+        :param top_n: le nombre de lignes de nos rapports.
+        """
 
-# ---------------------------------------------------------------------------
-#
-#   PARTIE :
-#   ~~~~~~~~
-#   Fonctions spécifiques à l'OPERATING SYSTEM ( bip, shutdown, ... ).
-#
-# ---------------------------------------------------------------------------
+        self.modes = {
+            item.strip().lower()
+            for item in mode.replace(',', '+').split('+')
+            if item.strip()
+            }
 
+        unknown = self.modes.difference(profile_modes)
 
-    def on_sonne_le_reveil(self):
-        """ Pour émettre un "beep" afin de prévenir l'utilisateur qu'une action
-        lui est demandée...
+        if unknown:
+            raise ValueError(f"Profilage(s) {sorted(unknown)} inconnu(s) ( cf {profile_modes} ).")
 
-        :return:
+        self.top_n = top_n
+        self.base_name = os.path.join(os.getcwd(), '#_LOG_profile')
+        self._profiler = None
+        self._running = False
+
+    def start(self):
+
+        if self._running:
+            return
+
+        self._running = True
+
+        if profile_via_tracemalloc in self.modes:
+            import tracemalloc
+            tracemalloc.start()
+
+        if profile_via_cprofile in self.modes:
+            import cProfile
+            self._profiler = cProfile.Profile()
+            self._profiler.enable()
+
+    def stop(self, base_name: str = None) -> list:
+        # -> list( STR )
+        """ Arrête le profilage, et sauvegarde ses résultats.
+
+        :param base_name: le nom, sans extension, des fichiers à créer ( par
+        défaut, self.base_name ).
+
+        :return: les fichiers créés.
         """
 
-        log = self.logItem
+        if not self._running:
+            return []
 
-        player = self.get_paths_and_miscellaneous('EXE_player')
+        if base_name is None:
+            base_name = self.base_name
 
-        if player is None:
+        self._running = False
+        files = []
 
-            # Sur la plupart des OS, on utilise une commande
-            # très générique, ie envoyer le caractère ASCII
-            # \a sur le port de sortie...
-            #
-            sys.stdout.write('\a')
-            sys.stdout.flush()
+        if self._profiler is not None:
 
-        else:
+            self._profiler.disable()
 
-            # Sur certains OS, on utilise un logiciel audio,
-            # qui va jouer un fichier bien précis.
-            #
-            # Ainsi, sous Windows XP, on joue un son d'une autre
-            # façon que "\a" ci-dessous, car le son généré par 1
-            # "\a" y est peu audible...
-            #
-            # Jouer une mélodie via un player a pour avantage que
-            # le son est réglable et que cela marche sur un PC de
-            # bureau comme sur un portable...
-            #
-            cmd_line = [player]
+            import pstats
+            import io
 
-            args = self.get_paths_and_miscellaneous('ARG_player')
+            self._profiler.dump_stats(base_name + '.prof')
+            files.append(base_name + '.prof')
 
-            if args is None:
-                pass
+            report = io.StringIO()
+            stats = pstats.Stats(self._profiler, stream = report)
+            stats.sort_stats(pstats.SortKey.CUMULATIVE).print_stats(self.top_n)
 
-            elif type(args) in (list, tuple):
+            with open(base_name + '.prof.txt', 'w', encoding = 'utf-8') as fd:
+                fd.write(report.getvalue())
 
-                cmd_line += args
-                #cmd_line += list(args)
-                #
-                # Si "args" est un tuple :
-                #
-                #   cmd_line += args
-                #
-                # ... est compris par Python.
-                #
-                # Par contre, dans ce même cas :
-                #
-                #   cmd_line = cmd_line + args
-                #
-                # ... provoquera une exception !!!
-                #
-                #   >>> args=('-f', 456,'param', 56)
-                #   >>> cmd = ['player']
-                #   >>> cmd = cmd + args
-                #   Traceback (most recent call last):
-                #     File "<pyshell#2>", line 1, in <module>
-                #       cmd = cmd + args
-                #   TypeError: can only concatenate list (not "tuple") to list
-                #   >>> cmd += args
-                #   >>> cmd
-                #   ['player', '-f', 456, 'param', 56]
-                #
+            files.append(base_name + '.prof.txt')
+            self._profiler = None
 
-            else:
-                cmd_line.append(args)
+        if profile_via_tracemalloc in self.modes:
 
-            played = self.get_paths_and_miscellaneous('EXE_played')
+            import tracemalloc
 
-            if played is None:
-                pass
+            snapshot = tracemalloc.take_snapshot()
+            ( current, peak ) = tracemalloc.get_traced_memory()
+            tracemalloc.stop()
 
-            else:
-                cmd_line.append(played)
+            snapshot = snapshot.filter_traces((
+                tracemalloc.Filter(False, tracemalloc.__file__),
+                tracemalloc.Filter(False, '<frozen importlib._bootstrap>'),
+                ))
 
-            self.shw_debug(f'Player\t= {player}')
-            self.shw_debug(f'Played\t= {played}')
-            self.shw_debug(f'Args  \t= {args}')
-            self.shw_debug(f'liste?\t= {isinstance(args, list)}')
-            self.shw_debug('')
+            with open(base_name + '.alloc.txt', 'w', encoding = 'utf-8') as fd:
 
-            log.debug("Commande exécutée = %s", cmd_line)
+                fd.write(f'Mémoire allouée = {current} octets ( pic = {peak} octets )\n')
+                fd.write('\n')
+                fd.write(f'Top {self.top_n} des allocations encore en cours :\n')
+                fd.write('\n')
 
-            process = subprocess.Popen(cmd_line)
-            log.debug('Code Retour : « %s ».', process.returncode)
-            log.debug('')
+                for stat in snapshot.statistics('lineno')[:self.top_n]:
+                    fd.write(f'{stat}\n')
 
+            files.append(base_name + '.alloc.txt')
 
-    def shutdown_please(
+        return files
+
+
+class _ScreenBuffer:
+    """ Tampon d'affichage à l'ÉCRAN : les lignes qui y sont déposées
+    ( via _show_, ou par le logging.StreamHandler de notre journal ) sont
+    regroupées, puis écrites en 1 seul bloc sur « stream ».
+
+    Un terminal lent, ou une sortie redirigée vers un « pipe », coûte en
+    effet 1 écriture ( voire 1 vidage ) par ligne affichée, ce qui pèse
+    lorsque nos autotests ou show_paths_and_miscellaneous() en affichent
+    des milliers.
+
+    Le bloc est écrit dès que :
+
+        . le nombre de lignes en attente atteint « max_lines » ;
+
+        . la 1ère ligne en attente l'est depuis « max_delay » secondes
+        ( RQ : un minuteur, cf threading.Timer, est armé à chaque 1ère
+        ligne en attente : une ligne affichée juste avant un long calcul
+        apparaît donc quand même ) ;
+
+        . une ligne est déposée dans notre tampon « frère » ( cf sibling ) :
+        STDOUT et STDERR ont chacun leur tampon, mais leurs lignes doivent
+        apparaître dans l'ordre où elles ont été écrites ;
+
+        . drain() est appelée : avant toute saisie ( cf _input_ ) et en fin
+        de script.
+    """
+
+    def __init__(
         self,
-        how: str = None
+        stream = None,  # objet fichier ( sys.stdout par défaut )
+        max_lines: int = 200,
+        max_delay: float = 0.25,
+        sibling: object = None  # _ScreenBuffer
         ):
-        """ Pour éteindre la machine hôte lorsque l'on est sous Windows.
-    
-        Cette fonction ne marche pas dans tous les cas, il faut les privilèges
-        "root" pour cela...
-    
-        Sinon, sous Windows, il faut écrire une fonction plus compliquée qui
-        utilise les modules win32security & win32api.
-    
-        Sous Unix, Linux ou Mac OS, c'est encore autre chose...
-    
-        :param how: précisions sur la façon de réaliser l'arrêt i-e =
-            . 'complete'    : on arrête complètement la machine hôte.
-            . 'hibernate'   : on met la machine en veille prolongée.
-            . 'none'        : on ne fait rien en fait...
-    
-        :return:
-        """
-
-        log = self.logItem
-
-        if how is None:
-            log.debug('SHUTDOWN « par défaut » demandé.')
-            how = self.shutdown_dflt
-
-        log.debug('TYPE de SHUTDOWN réalisé : « %s ».', how)
-        log.debug('')
-
-        # On attendra 9 mn 33 secondes avant l'arrêt.
-        #
-        delai_9mn33_en_secondes = 573
-        delay_performed_by_system = False
-
-        if os.name.upper() == 'NT':
-
-            # On analyse la façon dont l'arrêt doit être
-            # configuré.
-            #
-            how_lower = how.lower()
-
-            if how_lower == shutdown_complete:
-
-                # On demande l'arrêt total de la machine dans 9 mn.
-                #
-                command_line = [
-                    'shutdown',
-                    '-s',
-                    '-f',
-                    '-t', str(delai_9mn33_en_secondes)
-                    ]
-
-                # La temporisation est incluse dans la commande
-                # ci-dessus, donc pas besoin que nous la prenions
-                # en charge.
-                #
-                delay_performed_by_system = True
+        """ :param stream: où écrire nos blocs de lignes.
 
-            elif how_lower == shutdown_hibernate:
+        :param max_lines: nombre max de lignes en attente.
 
-                # On demande l'hibernation de la machine après une
-                # temporisation.
-                #
-                # RQ : Sous Windows, la demande d'hibernation n'est
-                # pas compatible avec le paramètre de temporisation
-                # ( '-t' ). Donc on temporisera nous-mêmes avant la
-                # demande d'hibernation immédiate...
-                #
-                command_line = ['shutdown', '-h', '-f']
-                delay_performed_by_system = False
+        :param max_delay: durée max ( en secondes ) d'attente d'une ligne
+        ( None = pas de limite ).
 
-            elif how_lower == shutdown_none:
-                command_line = None
+        :param sibling: le tampon « frère » ( celui de STDERR pour celui de
+        STDOUT, ... ), vidé avant que nous ne recevions une ligne. Ce lien
+        est réciproque.
+        """
 
-            else:
-                log.warning('UNSUPPORTED PARAMETER :')
-                log.warning('')
-                log.warning("Le type d'arrêt « %s » est inconnu...", how)
-                log.warning('... alors on ne fait rien !!!')
-                log.warning('')
-                command_line = None
+        self.stream = stream
+        self.max_lines = max_lines
+        self.max_delay = max_delay
 
-            if command_line is not None:
+        self.sibling = sibling
 
-                self.on_sonne_le_reveil()
+        if sibling is not None:
+            sibling.sibling = self
 
-                log.info('----------- ARRET EN COURS ------------')
-                log.info('')
+        self._chunks = []
+        self._nb_lines = 0
+        self._since = None
+        self._timer = None
 
-                if delay_performed_by_system:
+        # Notre journal peut être alimenté par plusieurs threads ( cf
+        # _walk_files_in_parallel ).
+        #
+        self._lock = threading.Lock()
 
-                    log.info("Taper une touche pour annuler l'arrêt")
-                    log.info('')
+    def write(self, text: str) -> int:
+        """ Dépose du texte dans notre tampon ( interface « fichier »,
+        utilisée aussi par logging.StreamHandler ).
+        """
 
-                else:
+        now = time.monotonic()
 
-                    log.info("Taper < CTRL + C > pour annuler l'arrêt")
-                    log.info('')
+        # Ce que notre « frère » a reçu avant nous doit apparaître avant.
+        #
+        if self.sibling is not None and self.sibling._chunks:
+            self.sibling.drain()
 
-                    log.debug("Cause restrictions de Windows...")
-                    log.debug("... on va dormir AVANT la demande d'hibernation.")
-                    log.debug('')
+        with self._lock:
 
-                    self.shw("J'attends...")
-                    self.shw('')
+            if not self._chunks:
 
-                    try:
-                        time.sleep(delai_9mn33_en_secondes)
+                self._since = now
 
-                    except KeyboardInterrupt:
-                        # Si l'utilisateur à frapper < CTRL + C >, on intercepte
-                        # cette interruption et on rend la main au programme, sans
-                        # mettre la machine en hibernation...
-                        #
-                        log.debug("HIBERNATION INTERROMPUE")
-                        log.debug('')
-                        command_line = None
+                if self.max_delay is not None and self._timer is None:
+                    self._timer = threading.Timer(self.max_delay, self.drain)
+                    self._timer.daemon = True
+                    self._timer.start()
 
-            # Si l'arrêt du système n'a pas été interrompu lors de la temporisation
-            # ci-dessus ( qui n'a elle-même eu lieu que si la command_line d'arrêt
-            # ne prend pas en charge cette temporisation ), on en vient enfin à cet
-            # arrêt.
-            #
-            if command_line is not None:
+            self._chunks.append(text)
+            self._nb_lines += text.count('\n')
 
-                log.debug("Commande exécutée = %s", command_line)
-                log.debug('')
+            full = self._nb_lines >= self.max_lines \
+                or ( self.max_delay is not None and now - self._since >= self.max_delay )
 
-                process = subprocess.Popen(command_line)
+        if full:
+            self.drain()
 
-                log.debug('Code Retour de la commande : « %s ».',
-                          process.returncode)
-                log.debug('')
+        return len(text)
 
-                # Si la temporisation a été faite par ce programme, pas besoin d'
-                # attendre une nouvelle temporisation.
-                #
-                # Par contre, si la temporisation est réalisée par le système ( et
-                # donc par la dernière commande lancée ), on va ici attendre la fin
-                # de cette temporisation...
-                #
-                if delay_performed_by_system:
+    def flush(self):
+        """ logging.StreamHandler nous appelle après chacun de ses messages :
+        nous ne vidons PAS notre tampon pour autant ( c'est tout l'intérêt
+        de celui-ci ), write() ayant déjà appliqué notre politique.
+        """
 
-                    _pause_("J'attends...")
+        pass
 
-                    # On annule l'arrêt si l'utilisateur l'a demandé.
-                    #
-                    command_line = ['shutdown', '-a']
+    def drain(self):
+        """ Écrit ( en 1 bloc ) tout ce qui est en attente.
+        """
 
-                    log.debug("Commande exécutée = %s", command_line)
-                    log.debug('')
+        # RQ : Nous gardons notre verrou pendant l'écriture elle-même, pour
+        # que 2 vidages simultanés ( celui de notre minuteur et un autre )
+        # ne puissent pas inverser l'ordre de nos blocs.
+        #
+        with self._lock:
 
-                    process = subprocess.Popen(command_line)
+            chunks = self._chunks
+            self._chunks = []
+            self._nb_lines = 0
 
-                    log.debug('Code Retour de la commande : « %s ».',
-                              process.returncode)
-                    log.debug('')
+            timer = self._timer
+            self._timer = None
 
-        else:
-            log.critical('UNSUPPORTED SYSTEM :')
-            log.critical('')
-            log.critical(
-                "La procédure d'arrêt machine pour l'OS « %s » n'est pas définie.",
-                os.name.upper()
-                )
-            log.critical('')
+            if timer is not None and timer is not threading.current_thread():
+                timer.cancel()
 
-            # On ne lève plus d'exception dans ce cas.
-            #
-            # raise AssertionError
+            if chunks:
+                stream = sys.stdout if self.stream is None else self.stream
+                stream.write(''.join(chunks))
+                stream.flush()
 
 
 # ---------------------------------------------------------------------------
 #
 #   PARTIE :
 #   ~~~~~~~~
-#   - Fonctions spécifiques au TEMPS.
+#   Définition de la classe ScriptSkeleton ( __init__() et __del__() ).
 #
 # ---------------------------------------------------------------------------
 
 
-    def build_now_string(
-        self,
-        desired_form: str = "%Y%m%d - %Hh%Mmn%Ss%fms"
-        ) -> str:
-        """ Fonction produisant une chaîne de caractère contenant la
-        date et l'heure au format désiré.
-        
-        :param desired_form: format voulu tel que défini dans la doc
-        Python pour la fonction « strftime() ».
+# Le dictionnaire « paths_and_miscellaneous » d'un ScriptSkeleton en mode
+# « lazy_init » : ses entrées ne sont calculées qu'à leur 1ère lecture, par
+# groupe ( cf ScriptSkeleton._set_working_paths() puis _set_executables() ).
+#
+class _LazyPaths(dict):
+    """ Dictionnaire qui se remplit à la demande : lire l'une des clés
+    ci-dessous, alors qu'elle est absente, lance le calcul de son groupe.
+
+    RQ : Seule la lecture via « [] » ( cf __missing__ ), fill() ou fill_all()
+    déclenche ces calculs : « in », get(), keys(), items(), ... ne voient que
+    les entrées déjà calculées. Qui veut parcourir TOUT le dictionnaire doit
+    donc d'abord appeler fill_all() ( cf check_paths_and_miscellaneous() ).
+    """
 
-        :return: la chaîne désirée.
+    working_keys = frozenset((
+        'walking_MODE',
+        'module_PATHLIB',
+        'module_FNMATCH',
+        'module_GLOB',
+        'working_SYSTEM',
+        'working_RELEASE',
+        'working_VERSION',
+        'working_MACHINE_TYPE',
+        'working_MACHINE_NAME',
+        'NOD_working',
+        'working_PATH_FULL',
+        'working_PATH_DSK_ONLY',
+        shutdown_TYPE
+        ))
+
+    executable_keys = frozenset((
+        'DIR_os',
+        'NOD_os',
+        'EXE_txt_editor',
+        'EXE_libre_office',
+        'EXE_libre_writer',
+        'EXE_player',
+        'ARG_player',
+        'EXE_played'
+        ))
+
+    def __init__(self, skeleton: object):
+        # skeleton : ScriptSkeleton
+
+        super().__init__()
+
+        self.skeleton = skeleton
+        self.working_done = False
+        self.executables_done = False
+
+    def fill(self, key: str):
+        """ Calcule, si ce n'est déjà fait, le groupe de la clé « key ».
         """
 
-        now = datetime.datetime.now()
-
-        return now.strftime(desired_form)
+        if not self.working_done and (
+            key in self.working_keys or key in self.executable_keys
+            ):
 
+            # RQ : Nos exécutables dépendent de notre système.
+            #
+            self.working_done = True
+            self.skeleton._set_working_paths()
 
-# ---------------------------------------------------------------------------
-#
-#   PARTIE :
-#   ~~~~~~~~
-#   Fonctions de SAISIE de DONNÉES.
-#
-# ---------------------------------------------------------------------------
+        if not self.executables_done and key in self.executable_keys:
 
+            self.executables_done = True
+            self.skeleton._set_executables()
 
-    def ask_yes_or_no(
-        self,
-        prompt: str,
-        #
-        default = None, # Type = BOOL ou STR
-        #default: str = None,
-        #
-        # Permettre que default soit une string OU un booléen ?
-        # Afin que la fonction puisse tout simplement retourner
-        # « default », sans avoir à chercher sa correspondance
-        # dans le dictionnaire de LOCALISATION ( yes_or_no ).
-        #
-        # « default » ne serait pas typé :
-        #
-        #   default = None
-        #
-        # et son type serait testé en entrée de fonction :
-        #
-        #   if type(default) == bool:
-        #       [..]
-        #   elif type(default) == str:
-        #       [..]
-        #
-        # ... afin d'adapter notre comportement.
-        #
-        # => C'est finalement cette dernière solution qui a été
-        # retenue.
-        #
-        langage: str = 'fre',
-        retries: int = 3,
-        reminder: str = 'Please try again !',
-        play_sound: bool = None,
-        raise_on_retry_error: bool = False
-        ) -> bool:
+    def fill_all(self):
+        """ Calcule, si ce n'est déjà fait, TOUS nos groupes de clés.
         """
 
-        // TODO : Cette fonction ask_yes_or_no est à RETRAVAILLER & FINALISER !!!
+        # RQ : Le groupe des exécutables entraîne celui de notre système.
+        #
+        self.fill(next(iter(self.executable_keys)))
 
-        :param prompt: le texte de la question.
+    def __missing__(self, key: str):
 
-        :param default: la réponse par défaut.
-        Si la valeur spécifiée est de type BOOL, on l'interprète
-        telle quelle.
-        Si la valeur spécifiée est de type STR, elle doit être une
-        des clés présentes dans notre dictionnaire de LOCALISATION
-        ( skeleton.yes_or_no ) sinon, en mode DEBUG, on lèvera une
-        exception AssertionError via l'instruction « assert ».
-        HORS du mode DEBUG, on laissera le script se poursuivre.
+        self.fill(key)
 
-        :param langage: le langage qui sera utilisé pour la saisie
-        ( en, fr, etc... ) afin d'interroger notre dictionnaire de
-        LOCALISATION ( skeleton.yes_or_no ) en conséquence.
+        if key in self:
+            return dict.__getitem__(self, key)
 
-        :param retries: le nombre d'essais autorisés.
+        raise KeyError(key)
 
-        :param reminder: le texte à afficher si un essai échoue.
 
-        :param play_sound: faut-il « réveiller » l'utilisateur via
-        une sonnerie avant de poser la question la 1ère fois ?
+# Notre classe principale ScriptSkeleton.
+#
+class ScriptSkeleton:
+    """ Squelette d'un script Python, avec différentes
+    propriétés et méthodes pour faciliter les traitements
+    de base.
+    """
 
-        :param raise_on_retry_error: faut-il lever une exception de
-        type ValueError si l'utilisateur dépasse le nombre d'essais
-        autorisés ?
-        Si FALSE, on renverra la valeur définie par défaut dès que
-        ce nombre sera dépassé.
-        Si toutefois la valeur par défaut est elle-même incorrecte,
-        alors on lèvera l'exception AssertionError via l'instruction
-        « assert » : donc en mode DEBUG seul !!!
-        HORS du mode DEBUG, toujours pour une valeur par défaut non
-        valide, le script plantera sur une exception KeyError à :
+    def __init__(
+        self,
+        module_name: str = None,
+        module_file: str = __file__,
+        arguments: list = None,
+        debug_mode: bool = ___debug___,
+        walking_mode: str = walking_via_listdir,
+        with_pathlib: str = ___dflt_pathlib___,
+        with_fnmatch: bool = False,
+        with_glob: bool = False,
+        log_in_background: bool = False,
+        log_queue_size: int = 10000,
+        log_overflow: str = log_overflow_block,
+        quiet_walk: bool = False,
+        screen_buffered: bool = False,
+        screen_max_lines: int = 200,
+        screen_max_delay: float = 0.25,
+        log_format: str = log_format_text,
+        log_max_bytes: int = 1000000,
+        log_max_age: float = None,
+        log_backup_count: int = 1,
+        log_compression: str = None,
+        log_retention: float = None,
+        log_in_memory: bool = False,
+        log_memory_size: int = 1000,
+        with_timing: bool = False,
+        profile_mode: str = None,
+        lazy_init: bool = False
+        ):
+        """
+        :param module_name: nom du module.
 
-            return our_yes_or_no[default]
+        :param module_file: nom du fichier appelant ( sa valeur
+        de __file__ en général ).
 
-        Nous aurions pu choisir la solution d'1 fonction ask_yes_or_no
-        retournant 3 valeurs possibles : True, False, Invalid. Mais
-        cela aurait complexifié le test en retour de cette fonction,
-        qui pour l'intant peut simplement être :
+        :param arguments: les arguments avec lesquels le module
+        principal qui nous appelle a lui-même été appelé ( i-e
+        sys.argv en général ).
 
-            if ask_yes_or_no(...):
+        :param debug_mode: ce « squelette » va-t-il s'exécuter
+        en mode DEBUG ( True or False ) ? Par défaut, il prend
+        le mode de ce script ( défini par ___debug___ )...
+        Un autre nom pour ce paramètre pourrait être :
 
-        Cette complexification ne semble pas souhaitable pour juste
-        parer à une éventualité très rare et, qui plus est, aisément
-        détectable et reproductible en mode DEBUG...
+                VERBOSE = True / False...
 
-        AUTRE SOLUTION POSSIBLE = Renvoyer tout simplement « default »
-        si « default » n'est pas 1 clé présente dans yes_or_no[langage].
-        Toutefois, nous sommes sûr que « default » n'est pas un booléen
-        [ retour attendu de ask_yes_or_no() ] mais plutôt de type STR.
-        Il faudrait donc avoir une valeur par défaut qui serait soit un
-        booléen, soit un STR : donc un objet dont on testerait le type
-        lors des tests sur la validité du paramètre « default ».
+        :param walking_mode: si ce « squelette » n'utilise que le
+        module OS.PATH, pour parcourir 1 répertoire utilisera-t-il
+        la fct os.listdir() ou os.scandir() ?
 
-        ==> C'est ce qui a finalement été choisi, « default » peut être
-        BOOL ou STR, mais le PB reste le MÊME s'il n'est ni l'un ni l'
-        autre, ou s'il est STR sans être une clef de yes_or_no[langage],
-        c-a-d il y aura plantage du script sur une EXCEPTION KeyError.       
+            * walking_via_listdir : os.listdir() utilisée.
 
-        :return: True ( YES ) or False ( NO ).
-        """
+            * walking_via_scandir : os.scandir() utilisée.
 
-        # On définit nos paramètres en fonction de notre mode de DEBUG personnel.
-        # ( cf ci-dessus « ATTENTION : PERSONNALISATION de notre mode DEBUG » )
-        #
-        if play_sound is None:
-            play_sound = self._debug_
+            * walking_ignore : peu importe ( cas où module PATHLIB
+            est utilisé pour gérer les fichiers... ) et, si nous
+            arrivons tout de même dans 1 partie de code utilisant
+            cette informat°, la méthode par défaut ( ie os.listdir()
+            sera utilisée ).
 
-        # On sonne le réveil si désiré.
-        #
-        if play_sound:
-            self.on_sonne_le_reveil()
+            RQ = Si les modules GLOB ou FNMATCH sont importés, cela
+            n'impose pas le walking_mode et il faut le spécifier !
 
-        # On vérifie si nous connaissons la liste des façons de dire OUI ou NON
-        # dans le langage désiré de la réponse.
-        #
-        # Si le langage n'est pas référencé, nous présupposons l'anglais.
-        #
-        if langage not in yes_or_no.keys():
+            RQ = Cf FileSystemTree._FileSystemLeaf.iterdir()
 
-            self.shw(f'Unknown language « {langage} »... Using english...')
-            self.shw('')
-            langage = 'eng'
+        :param with_pathlib: ce « squelette » va-t-il s'appuyer sur
+        le module PATHLIB, ou simplement se servir de la librairie
+        OS.PATH ? Valeurs possibles :
 
-        our_yes_or_no = yes_or_no[langage]
+            * pathlib_ignore ( None ) : pas de module PATHLIB.
 
-        # On vérifie la validité de la réponse par défaut.
-        #
-        # On affiche cette valeur par défaut en conséquence.
-        #
-        if default is None:
+            * pathlib_direct_... : module PATHLIB sans filtre.
 
-            dflt_type = None
-            dflt_valid = False
+            * pathlib_deeply : module PATHLIB incorporé.
 
-        else:
+        :param with_fnmatch: ce « squelette » va-t-il s'appuyer sur
+        le module FNMATCH ?
 
-            dflt_type = type(default)
+        :param with_glob: ce « squelette » va-t-il s'appuyer sur le
+        module GLOB ?
 
-            assert dflt_type in (bool, str), (
-                "\n\t Invalid default value = Must be None, bool, or str."
-                f"\n\t Here type is = « {dflt_type} »."
-                )
+        :param log_in_background: le fichier LOG doit-il être écrit
+        par un thread en tâche de fond ( cf _LogQueueHandler ) ?
 
-            if dflt_type == bool:
+        :param log_queue_size: dans ce cas, le nombre max de messages
+        en attente d'écriture.
 
-                dflt_valid = True
+        :param log_overflow: et que faire lorsque ce nombre est atteint
+        ( cf log_overflow_... ).
 
-            elif dflt_type == str:
+        :param quiet_walk: nos recherches de fichiers ne doivent-elles
+        journaliser qu'1 message de synthèse chacune ( cf quiet_walk_mode ) ?
 
-                default = default.strip(whitespace)
-                dflt_valid = default != ''
+        :param screen_buffered: nos affichages à l'écran ( shw, shw_info,
+        shw_debug ) doivent-ils être regroupés en blocs ( cf _ScreenBuffer ) ?
 
-                if dflt_valid:
+        :param screen_max_lines: dans ce cas, le nombre max de lignes en
+        attente d'affichage.
 
-                    assert default in our_yes_or_no.keys(), (
-                        f"\n\t Invalid default value = « {default} »"
-                        f" not in « {langage} » dictionary !"
-                        )
+        :param screen_max_delay: et la durée max ( en secondes ) pendant
+        laquelle une ligne peut attendre d'être affichée.
 
-        if dflt_valid:
+        :param log_format: le format du fichier LOG ( cf log_format_... ).
 
-            prompt = f'{prompt} [« {default} » par défaut] '
+        :param log_max_bytes: la taille max du fichier LOG, en octets, avant
+        son découpage en segments ( cf _SegmentedLogHandler ).
 
-        # On initialise la liste des OUI & NON acceptés.
-        # ( en fonction du langage qui a été fixé ).
+        :param log_max_age: la durée max d'un segment, en secondes.
+
+        :param log_backup_count: le nombre max de segments conservés.
+
+        :param log_compression: la compression de ces segments ( cf
+        log_compression_... ).
+
+        :param log_retention: la durée max de conservation d'un segment, en
+        secondes.
+
+        :param log_in_memory: faut-il ne garder nos derniers messages qu'en
+        mémoire, et ne les écrire dans le fichier LOG qu'en cas de WARNING (
+        ou plus ), sur demande ( cf dump_log ) ou, en mode DEBUG, lorsque
+        nous disons au revoir ( cf _LogRingHandler ) ?
+
+        :param log_memory_size: dans ce cas, le nombre max de messages gardés
+        en mémoire.
+
+        :param with_timing: faut-il mesurer les appels de nos méthodes
+        publiques et de celles de self.files ( cf _MethodStats ) ? Ces mesures
+        sont alors consultables via self.timing, et leur synthèse affichée
+        lorsque nous disons au revoir.
+
+        :param profile_mode: faut-il profiler notre script via cProfile et / ou
+        tracemalloc ( cf profile_via_... ) ? Les rapports sont sauvegardés à
+        côté du fichier LOG lorsque nous disons au revoir. Par défaut, c'est
+        la variable d'environnement profile_mode_env qui en décide.
+
+        :param lazy_init: faut-il différer nos initialisations jusqu'à leur 1ère
+        utilisation ? Le fichier LOG n'est alors créé qu'à son 1er message,
+        notre présentation ( cf on_se_presente ) n'est pas journalisée, et
+        chaque entrée de self.paths_and_miscellaneous n'est calculée qu'à sa
+        1ère lecture ( cf _LazyPaths ). Notre construction ne coûte alors
+        presque plus rien, ce qui est utile aux scripts qui ne se servent que
+        de save_strings_to_file(), send_request_url(), ...
+        """
+
+        # On personnalise notre mode de déboggage.
         #
-        # Cette initialisation pourrait se réaliser via deux compréhensions de
-        # liste :
+        self._debug_ = debug_mode
+
+        # Sommes-nous dans notre méthode __del__ ?
         #
-        #   our_yes = [ key for key, value in our_yes_or_no.items() if value ]
-        #   our_no = [ key for key, value in our_yes_or_no.items() if not value ]
+        # Non, bien sûr... !!!
         #
-        # ... mais on parcourt alors 2 fois la liste !
+        self._we_are_inside_del_method = False
+
+        # Cf notre méthode __del__().
         #
-        # Avec la solution ci-dessous ( boucle FOR ), la liste n'est parcourue
-        # qu'une seule fois.
+        # RQ : En mode DEBUG, cette dernière peut aussi ouvrir notre LOG dans
+        # un éditeur ( cf on_dit_au_revoir() ), via SUBPROCESS.
         #
-        # // TODO : Tester laquelle des 2 solutions est la plus rapide ???
+        _load_debug_modules_()
+
+        if self._debug_ and isinstance(subprocess, _LazyModule):
+            subprocess._lazy_load()
+
+        self._we_already_said_bye = False
+
+        # Variables internes pour stockage du journal des opérations :
         #
-        # Cela dit, nous allons ensuite attendre une saisie humaine, donc la
-        # rapidité n'est pas ici un facteur discriminant !!!
+        #       _logHandler pointe sur le fichier TXT temporaire de log ;
         #
-        # La solution avec une boucle FOR semble aussi la plus lisible.
+        #       _logFile contient le nom du fichier log créé ;
         #
-        our_yes = []
-        our_no = []
-
-        for key, value in our_yes_or_no.items():
+        #       logItem contient l'objet journal ;
+        #
+        # Ce module ne gère en effet qu'un journal, et ceci afin de ne pas avoir
+        # plusieurs journaux créés ( par erreur par exemple ) en //, ce qui causerait
+        # la création de plusieurs fichiers log temporaires, et donc rendrait le
+        # déroulé des opérations plus difficile à suivre !!!
+        #
+        self._logHandler = None
+        self._logFile = None
 
-            if value:
-                our_yes.append(key)
+        # Lorsque le fichier LOG est écrit en tâche de fond, _logQueue
+        # pointe sur le handler qui dépose les messages dans la file
+        # d'attente du thread écrivain ( cf _LogQueueHandler ).
+        #
+        self._logQueue = None
 
-            else:
-                our_no.append(key)
+        # Lorsque le fichier LOG n'est écrit qu'en cas de problème, _logRing
+        # pointe sur le handler qui garde les derniers messages en mémoire
+        # ( cf _LogRingHandler ).
+        #
+        self._logRing = None
 
-        # On attend & on traite la réponse de l'utilisateur.
+        # En mode « lazy_init », _logLazy tient la place de notre fichier LOG
+        # jusqu'à son 1er message ( cf _LazyLogHandler ).
         #
-        while True:
+        self._logLazy = None
 
-            answer = input(prompt).lower()
-            print()
+        # Tampon de nos affichages à l'écran, s'il est demandé. Il doit
+        # exister avant l'ouverture de notre journal, qui s'en servira
+        # pour ses propres affichages ( cf on_ouvre_le_journal ).
+        #
+        # RQ : Ce qui y est encore en attente sera affiché même si notre
+        # script se termine sans nous avoir dit au revoir.
+        #
+        # RQ : Les messages de notre journal vont, eux, sur STDERR ( cf
+        # on_ouvre_le_journal ), dans un tampon distinct mais lié au 1er
+        # ( cf _ScreenBuffer.sibling ), afin que « 2> » fonctionne encore.
+        #
+        self._screen = None
+        self._screen_err = None
 
-            if answer.strip(whitespace) == '':
-                answer = default
+        if screen_buffered:
 
-            if answer in (True, False):
-                return answer
+            self._screen = _ScreenBuffer(
+                max_lines = screen_max_lines,
+                max_delay = screen_max_delay
+                )
 
-            elif answer in our_yes_or_no.keys():
-                return our_yes_or_no[answer]
+            self._screen_err = _ScreenBuffer(
+                sys.stderr,
+                max_lines = screen_max_lines,
+                max_delay = screen_max_delay,
+                sibling = self._screen
+                )
 
-            retries = retries - 1
+            _screen_buffers.extend(( self._screen, self._screen_err ))
 
-            if retries <= 0:
+            import atexit
+            atexit.register(_drain_screens_)
 
-                if raise_on_retry_error:
+        # Si c'est demandé, par l'appelant ou par la variable d'environnement
+        # profile_mode_env, notre script est profilé dès à présent, et ce
+        # jusqu'à ce que nous disions au revoir ( cf _ScriptProfiler ).
+        #
+        # RQ : Cette variable d'environnement sert à profiler des scripts en
+        # production, qu'elle ne doit pas faire planter : une valeur inconnue
+        # y est donc ignorée ( et signalée dans notre LOG, cf plus bas ).
+        #
+        self._profiler = None
+        profile_error = None
 
-                    raise ValueError('Too much retry...')
+        if profile_mode is None:
 
-                else:
-                    assert dflt_valid, (
-                        'Too much retry and no correct default value !'
-                        )
+            profile_mode = os.environ.get(profile_mode_env) or None
 
-                    self.shw('Too much retry... Using default !')
-                    self.shw('')
+            try:
+                self._profiler = _ScriptProfiler(profile_mode) if profile_mode else None
+            except ValueError as e:
+                profile_error = e
 
-                    return (
-                        default
-                        if dflt_type == bool 
-                        else our_yes_or_no[default]
-                        )
+        elif profile_mode:
+            self._profiler = _ScriptProfiler(profile_mode)
 
-            self.shw(reminder)
-            self.shw(f'OK = {our_yes}')
-            self.shw(f'NO = {our_no}')
-            self.shw('')
+        if self._profiler is not None:
+            self._profiler.start()
 
+        # On créé l'objet qui va nous permettre d'accéder à la gestion des répertoires
+        # et des fichiers.
+        #
+        self.quiet_walk = quiet_walk
+        self.files = FileSystemTree(
+            walking_mode = walking_mode,
+            with_pathlib = with_pathlib,
+            with_fnmatch = with_fnmatch,
+            with_glob = with_glob,
+            quiet_walk = quiet_walk
+            )
 
-    def choose_in_a_list(
-        self,
-        choices: list, 
-        default_choice: int = -1
-        ) -> int:
-        """ Prend en charge le choix par l'utilisateur d'une valeur dans une liste.
-    
-        Cette fonction va afficher la liste d'une manière qui permette à l'utilisateur
-        d'exprimer son choix.
-    
-        REMARQUE : Si la liste n'est constituée que d'un seul élément, alors le choix
-        est automatique & cette fonction renvoie aussitôt l'index de cet élément ( ie
-        0 donc ).
-    
-        :param choices: la liste dans laquelle une valeur doit être choisie.
-    
-        :param default_choice: index du choix par défaut. Cette valeur doit être fixée
-        à -1 si aucun choix par défaut n'est défini.
-    
-        :return: l'index dans la liste correspondant au choix ou, sinon, -1 si aucun
-        choix possible ( liste vide par exemple ).
-        """
+        # Si c'est demandé, nos méthodes publiques, et celles de self.files,
+        # sont chronométrées dès à présent ( cf _instrument_methods ). Sinon,
+        # self.timing vaut None et nos méthodes ne sont pas touchées.
+        #
+        self.timing = None
 
-        log = self.logItem
+        if with_timing:
 
-        list_length = len(choices)
+            self.timing = _MethodStats()
+            _instrument_methods(self, self.timing)
+            _instrument_methods(self.files, self.timing)
 
-        # Si la liste est vide, le retour vaudra -1 car pas de choix possible.
-        # Si la liste n'a qu'1 élément, le retour vaudra 0 car 1 seul choix possible.
-        #
-        # Cela se résume en peu de mots... :
-        #
-        #       if list_length < 2:
-        #           the_choice_is = list_length - 1
+        # Nous sommes obligés d'initialiser logItem à None, et ce afin que Python sache
+        # que ScriptSkeleton possède un attribut de ce nom.
         #
-        # ... mais en fait le code s'est compliqué afin de pouvoir afficher à
-        # chaque fois la raison du choix ou du non choix.
+        # En effet, dans la fonction on_ouvre_le_journal(), on nomme cet attribut !!!
+        # Alors s'il n'a pas été déclaré dans la fonction __init__, avant l'appel, le
+        # script va planter car Python ne saura pas que cet attribut existe...
         #
-        if list_length == 0:
-            the_choice_is = - 1
-            log.info('Aucun choix disponible...')
-            log.info('')
+        if module_name is None:
 
-        elif list_length == 1:
-            the_choice_is = 0
-            log.info('Un seul choix disponible...')
-            log.info('')
+            # On donne comme nom de module, le nom de base ( sans extension ) de notre
+            # nom de fichier ( module_file ).
+            #
+            #module_name = self.files.node(module_file).stem
+            module_name = self.files.Path(module_file).stem
 
-        # Plusieurs valeurs sont présents dans la liste donc on doit choisir.
-        #
-        # On présente pour ceci la liste à l'utilisateur afin qu'il fasse son
-        # choix.
+        self.logItem = None
+        self.logItem = self.on_ouvre_le_journal(
+            module_name,
+            in_background = log_in_background,
+            queue_size = log_queue_size,
+            overflow = log_overflow,
+            log_format = log_format,
+            max_bytes = log_max_bytes,
+            max_age = log_max_age,
+            backup_count = log_backup_count,
+            compression = log_compression,
+            retention = log_retention,
+            in_memory = log_in_memory,
+            memory_size = log_memory_size,
+            lazy = lazy_init
+            )
+
+        # Les rapports de profilage seront sauvegardés à côté de notre LOG (
+        # et avec le même préfixe « #_LOG_for_ », cf _open_log_file() ). Même
+        # si notre script se termine sans nous avoir dit au revoir.
         #
-        else:
-            self.shw('Veuillez choisir parmi les réponses suivantes :')
-            self.shw('')
+        if self._profiler is not None:
 
-            # // TODO : Il serait bon ici de limiter le nombre de réponses affichées
-            # et ceci au cas où la LISTE SERAIT TROP LONGUE. Reste à trouver comment...
-            #
-            for index, an_answer in enumerate(choices, start=0):
-                self.shw(f'{index:>3} - {an_answer}')
-            self.shw('')
+            import atexit
+            atexit.register(self._profiler.stop)
 
-            # On demande son choix à l'utilisateur, i-e le n° de la réponse dans la
-            # liste affichée.
-            #
-            # Via les exceptions et des tests, on va vérifier que l'utilisateur
-            # fourni bien une réponse sous forme d'entier, et que cet entier soit
-            # compris dans les bornes des index de la liste...
-            #
-            msg = 'Veuillez indiquer le n° de la réponse choisie '
+        if profile_error is not None:
+            self.logItem.warning('%s = « %s » ignorée : %s', profile_mode_env, profile_mode, profile_error)
 
-            if 0 <= default_choice < list_length:
-                msg += f'( « {choices[default_choice]} » par défaut ) '
+        # Si la gestion du système de fichiers est assurée par un objet FileSystemTree,
+        # nous lui communiquons l'adresse de notre fichier LOG.
+        #
+        if isinstance(self.files, FileSystemTree):
+            self.files._register_log(self.logItem)
 
-            while True:
+        # ATTENTION : Lorsque nous serons dans notre méthode __del__() et donc dans le
+        # ramasse-miettes de Python = POTENTIELLEMENT, les objets LOG seront aussi en
+        # train d'être détruits, voire l'auront déjà été... !!!
+        #
+        # Donc nous nous prémunissons contre cela via des fonctions LAMBDA qui feront
+        # ou pas référence à notre log, suivant le cas.
+        #
+        # D'expérience, appeler dans notre __del__() le module LOG ne pose en fait pas
+        # de pb sous Python 3.10 et Windows 10.
+        #
+        # Par contre, sous Python 3.9 ( a-Shell ) et iOS, cela provoque des bugs d'appels
+        # dans le module LOG qui ne retrouve plus ses petits...
+        #
+        # Pour l'instant, notre LOG vient d'être créé, donc pas de souci !!!
+        #
+        self.shw = lambda x: _show_(x, self.logItem, self._screen)
+        self.shw_info = lambda x: self.logItem.info(x)
+        self.shw_debug = lambda x: self.logItem.debug(x)
+        #
+        # Dans notre méthode __del__(), nous attribuerons d'autres valeurs à self.shw_info
+        # et à self.shw_debug.
+        #
+        # Par ailleurs, ces 2 fonctions sont ( actuellement ) utilisées seulement dans nos
+        # méthodes invoquées directement ou indirectement depuis notre méthode __del__()
+        # i.e :
+        #
+        #       - on_dit_au_revoir()
+        #       - on_sonne_le_reveil()
+        #       - edit_file_txt()
+        #       - get_paths_and_miscellaneous()
 
-                index_given = input(msg + ': ')
-                print()
+        if self._debug_:
 
-                if index_given == '' and 0 <= default_choice < list_length:
-                    the_choice_is = default_choice
-                    break
+            # On affiche notre mode de déboggage quand il est actif.
+            #
+            self.debug_mode(True)
 
-                else:
-                    try:
-                        index = int(index_given)
+        if lazy_init:
+            self.nb_parameters_in = 0 if arguments is None else len(arguments)
+        else:
+            self.nb_parameters_in = self.on_se_presente(module_file, arguments)
 
-                    except ValueError:
-                        log.warning(
-                            "La donnée saisie n'est pas un entier : « %s » !!!",
-                            index_given
-                            )
-                        log.warning('')
+        # Le dictionnaire « paths_and_miscellaneous » contiendra la liste des fichiers
+        # & répertoires utiles, i-e il contiendra à minima les entrées suivantes :
+        #
+        #       - working_SYSTEM,
+        #       - working_RELEASE,
+        #       - working_VERSION,
+        #       - working_MACHINE_NAME,
+        #       - working_MACHINE_TYPE,
+        #       - working_PATH_FULL,
+        #       - working_PATH_DSK_ONLY,
+        #       - EXE_txt_editor,
+        #       - EXE_(..),
+        #       - DIR_(..),
+        #       - DLL_(..),
+        #       - ARG_(..),
+        #       - NOD_(..).
+        #
+        # Il est aussi possible de se servir de ce dictionnaire pour conserver des
+        # paramètres généraux du programme, tels que ceux par exemple lus dans une
+        # section 'GENERAL SETTINGS' d'un fichiers de configuration. Les entrées
+        # suivantes sont ainsi aussi possibles :
+        #       - shutdown_TYPE.
+        #
+        # ( ! ) ATTENTION ( ! ) : Choix a été fait de stocker dans ce dictionnaire
+        # des variables telles que renvoyées par :
+        #
+        #       ScriptSkeleton.files.node()
+        #       [ ou plutôt ScriptSkeleton.files.Path() dorénavant ]
+        #
+        # ... i.e :
+        #
+        #       des variables de type _FileSystemLeaf ou pathlib.Path
+        #
+        # ... par convention, ces variables ont pour clés :
+        #
+        #       NOD_(..)
+        #
+        # ... or un appel subséquent à :
+        #
+        #       ScriptSkeleton.file_system_mode()
+        #
+        # ... pourrait changer le type de ces variables, et donc occasionnerait
+        # des BUGS ( !!! )
+        #
+        # Nous convertissons pour autant le dictionnaire « paths_and_miscellaneous » 
+        # afin d'éviter cela. Cette conversion est réalisée directement dans notre
+        # méthode file_system_mode().
+        #
+        # Pour autant, le script qui nous utilise pourrait avoir lui-même conservé
+        # de telles variables par ailleurs, et ne pourrait-il alors planter par la
+        # suite, dans des cas à la marge ( ??? ) :
+        #
+        #       - exemple : tentative de comparaison de 2 de ces objets alors que
+        # leur type serait différent.
+        #
+        #       - exemple : tentative de concaténation de 2 paths alors que leur
+        # type serait différent.
+        #
+        # ( !!! ) PRUDENCE DONC LORSQUE L'ON CONSERVE UNE VALEUR DU TYPE :
+        #
+        #        ScriptSkeleton.file_system_mode()
+        #
+        # Cependant, à part ces cas à la marge :
+        #
+        #       _FileSystemLeaf & pathlib.Path PEUVENT COHABITER DANS 1 MÊME SCRIPT
+        #
+        # ... en effet, ces objets sont plutôt utilisés pour accéder aux noeuds
+        # du système de gestion de fichiers eux-mêmes, via leurs méthodes, et ce
+        # afin d'en obtenir des informations.
+        #
+        self.shutdown_dflt = shutdown_none
 
-                    else:
-                        if 0 <= index < list_length:
-                            the_choice_is = index
-                            break
+        if lazy_init:
+            self.paths_and_miscellaneous = _LazyPaths(self)
+        else:
+            self.paths_and_miscellaneous = {}
+            self.set_paths_and_miscellaneous()
 
-                        else:
-                            log.warning(
-                                "Veuillez indiquer un nombre compris entre 0 et %s.",
-                                #str(list_length - 1)
-                                list_length - 1
-                                )
-                            log.warning('')
 
-            log.debug('Index choisi     : %s', the_choice_is)
-            log.debug('Valeur associée  : %s', choices[the_choice_is])
-            log.debug('')
+    def __del__(self):
+        """
+        """
 
-        return the_choice_is
+        self._we_are_inside_del_method = True
 
+        # Notre construction a échoué avant l'ouverture de notre journal (
+        # paramètre invalide, ... ) : nous n'avons alors rien à clore.
+        #
+        if getattr(self, 'logItem', None) is None:
+            return
 
-    def choose_in_a_dict(
-        self,
-        dict_of_choices: dict,
-        default_key: object = None,
-        restricted: bool = True
-        ) -> object:
-        """ Prend en charge le choix par l'utilisateur d'une valeur dans un dictionnaire.
+        # ATTENTION : Dans notre méthode __del__() et donc dans le ramasse-miettes
+        # de Python = POTENTIELLEMENT, les objets LOG sont aussi en train d'être
+        # détruits, voire l'ont déjà été... !!!
+        #
+        # Donc nous choisissons d'autres façons d'afficher le LOG en cette toute
+        # fin de script !!!
+        #
+        # Ce qui est encore dans notre tampon d'affichage doit donc apparaître
+        # avant ces affichages directs.
+        #
+        self.flush_screen()
 
-        Cette fonction va afficher le dictionnaire d'une manière qui permette à
-        l'utilisateur d'exprimer son choix.
+        self.shw_info = lambda x: print(x)
+        self.shw_debug = lambda x: print(x) if self._debug_ else None
 
-        REMARQUE : Si le dictionnaire n'est constitué que d'un seul élément, alors le
-        choix est automatique & cette fonction renvoie aussitôt la clé de cet élément.
+        # On quitte l'application...
+        #
+        self.on_dit_au_revoir()
 
-        :param dict_of_choices: le dictionnaire dans lequel une valeur doit être choisie.
 
-        :param default_key: clé du choix par défaut. Cette valeur doit être fixée à
-        None si aucun choix par défaut n'est défini.
+# ---------------------------------------------------------------------------
+#
+#   PARTIE :
+#   ~~~~~~~~
+#   Fonctions d'initialisation des EXÉCUTABLES et RÉPERTOIRES utilisés.
+#
+# ---------------------------------------------------------------------------
 
-        :param restricted: faut-il restreindre le choix aux seules valeurs présentes
-        dans le dictionnaire, ou l'utilisateur peut-il saisir une clé inconnue ?
-        Si "restricted" vaut True, seules les valeurs du dictionnaire sont acceptées.
 
-        :return: la clé choisie ou, sinon, None si aucun choix possible ( dictionnaire
-        vide par exemple ).
+    def _glob_from_masks(
+        self,
+        root,           # _FileSystemLeaf, pathlib.Path
+        masks,          # iterable( STR )
+        ) -> dict:
+        # -> dict( STR : list( STR [ ou ] PATHLIB.PATH ) )
+        """ Recherche dans « root » les noeuds correspondant à chacun
+        des masques indiqués, en ne parcourant qu'1 seule fois ce répertoire
+        si cela nous est possible ( cf _FileSystemLeaf._multi_glob() ).
+
+        :param root: le répertoire à explorer.
+
+        :param masks: les masques de recherche ( 1 seul niveau ).
+
+        :return: un dictionnaire « masque -> liste des noeuds trouvés ».
         """
 
-        log = self.logItem
+        if isinstance(root, FileSystemTree._FileSystemLeaf):
+            return root.glob(tuple(masks))
 
-        dict_length = len(dict_of_choices)
-    
-        # Si le dictionnaire est vide, le retour vaudra None car pas de choix possible.
-        # Si la liste n'a qu'1 élément, le retour vaudra sa clé car 1 seul choix possible.
+        # Modes « pathlib_direct_... » : root est un pathlib.Path qui ne
+        # sait chercher qu'1 seul masque à la fois.
         #
-        if dict_length == 0:
-            the_choice_is = None
-            log.info('Aucun choix disponible...')
-            log.info('')
+        return {m: list(root.glob(m)) for m in dict.fromkeys(masks)}
 
-        elif dict_length == 1:
-            the_choice_is = list(dict_of_choices.keys())[0]
-            log.info('Un seul choix disponible...')
-            log.info('')
 
-        # Plusieurs valeurs sont présents dans le dictionnaire donc on doit choisir.
-        #
-        # On présente pour ceci le dictionnaire à l'utilisateur afin qu'il fasse son
-        # choix.
-        #
-        else:
-            self.shw('Veuillez choisir parmi les réponses suivantes :')
-            self.shw('')
-            self.shw('  N° -   CLEF   =   VALEUR')
-            self.shw(' ' + 33 * '-')
+    def search_path_from_masks(
+        self,
+        root,           # _FileSystemLeaf, pathlib.Path
+        masks,          # iterable, iterator, generator
+        found: dict = None
+        ) -> (
+            object,     # _FileSystemLeaf, pathlib.Path
+            os.PathLike # chemin du fichier recherché
+        ):
+        """ Cette fonction permet de rechercher un fichier ( une DLL ou
+        un exécutable par exemple ) à partir d'une certaine localisation
+        et en cheminant le long d'un chemin indiqué par des masques.
 
-            # // TODO : Il serait bon ici de limiter le nombre de réponses affichées
-            # et ceci au cas où la LISTE SERAIT TROP LONGUE. Reste à trouver comment...
-            #
-            for idx, item in enumerate(sorted(dict_of_choices.items()), start=0):
-                self.shw(f' {idx:>3} - {item[0]:>8} = {item[1]}')
-            self.shw('')
+        Par exemple, pour trouver EditPadPro?.exe, à partir du répertoire
+        « Program Files », nous aurons comme paramètres :
 
-            # On demande son choix à l'utilisateur, i-e le n° de la réponse dans la
-            # liste affichée.
-            #
-            # L'utilisateur peut aussi saisir directement l'une des clés ( on va
-            # considérer qu'il a saisi une clé si sa réponse n'est pas un entier
-            # compris dans la liste des index affichés ).
-            #
-            msg = 'Veuillez indiquer un n° de réponse ou une clef '
+            root = r"C:\Program Files"
+            masks = ( 'Just*Great*Software', 'EditPad*Pro*', 'EditPadPro*.exe' )
 
-            if not restricted or default_key in dict_of_choices:
-                msg += f'( « {default_key} » par défaut ) '
- 
-            while True:
+        Puisque plusieurs versions de EditPad Pro peuvent être présentes
+        sur une même machine, cette façon de faire trouvera :
 
-                answer = input(msg + ': ')
-                print()
+            C:\Program Files\Just Great Software\EditPad Pro 8\EditPadPro8.exe
+            C:\Program Files\Just-Great-Software\EditPadPro 7\EditPadPro7.exe
+            C:\Program Files\Just_Great_Software\EditPadPro6\EditPadPro6.exe
+            ...
 
-                log.debug("La donnée saisie est : « %s ».", answer)
-                log.debug('')
+        Puisque nous parcourons l'arborescence en ordre décroissant, et
+        car nous stoppons au 1er fichier trouvé, search_path_from_masks()
+        répondra alors :
 
-                if answer == '':
-                    # Si la réponse est vide et qu'il existe une
-                    # réponse par défaut digne de ce nom, on peut
-                    # enregistrer cette réponse.
-                    #
-                    if not restricted or default_key in dict_of_choices:
-                        the_choice_is = default_key
-                        break
+            C:\Program Files\Just Great Software\EditPad Pro 8\EditPadPro8.exe
 
-                else:
-                    # Par défaut, on considère que la réponse est une
-                    # clé & non un des index leur faisant face, mais
-                    # l'on va vérifier cela en analysant la réponse...
-                    #
-                    the_choice_is = answer
+        :param root: la racine à partir de laquelle nous devons débuter
+        nos recherches.
 
-                    try:
-                        index = int(the_choice_is)
+        :param masks: une suite de valeurs (toutes au format STRING )
+        décrivant le cheminement dont nous pensons qu'il peut nous mener
+        depuis « root » au fichier recherché. La dernière de ces valeurs
+        doit expliciter le nom du fichier cherché. Ainsi :
 
-                    except ValueError:
-                        # La réponse n'est pas un entier, l'utilisateur a donc bien
-                        # voulu signifier une clé , qu'elle existe déjà ou qu'elle
-                        # soit nouvelle. On en prend bonne note...
-                        #
-                        log.debug("La réponse n'est pas un entier donc c'est une clef.")
-                        log.debug('')
+            ( 'Libre*Office*', '*program*', 's*office.exe' )
 
-                    else:
-                        if 0 <= index < dict_length:
-                            # La réponse est un entier qui correspond aux index
-                            # affichés en face des clés, on retrouve donc la clé
-                            # associées.
-                            #
-                            # On pourrait pour ceci écrire :
-                            #
-                            #       list(sorted(dict_of_choices.keys()))[index]
-                            #
-                            # ... toutefois, comme c'est une autre formule qui a
-                            # été utilisée pour l'affichage, et comme on veut être
-                            # sûr que l'on retrouvera exactement la clé en face de
-                            # l'index donné, on réutilise exactement la formule qui
-                            # a servie à l'affichage pour retrouver cette clé.
-                            #
-                            the_choice_is = list(sorted(dict_of_choices.items()))[index][0]
-                            log.debug("La réponse est un index.")
-                            log.debug('')
+        :param found: le résultat, s'il est déjà connu, de la recherche
+        du 1er masque dans « root », sous la forme d'1 dictionnaire tel
+        que renvoyé par _glob_from_masks(). Ceci permet à notre appelant
+        de parcourir une seule fois « root » pour plusieurs recherches.
 
-                        else:
-                            # La réponse est bien un entier, mais qui ne peut
-                            # représenter l'un des index affichés en face d'une
-                            # clé, nous allons donc supposer que l'utilisateur
-                            # a voulu signifier une clé, qu'elle existe ou qu'
-                            # elle soit nouvelle. On la retient donc.
-                            #
-                            log.debug("La réponse est un entier hors index donc une clef.")
-                            log.debug('')
+        :return: un t-uple contenant 2 valeurs =
 
-                    finally:
-                        # On a traduit la réponse sous forme de clé. Si cette
-                        # clé existe déjà, tout va bien ; sinon on demande
-                        # confirmation qu'il s'agit bien d'une nouvelle clé et
-                        # non d'une erreur de frappe.
-                        #
-                        # Si c'est une erreur, on reboucle...
-                        #
-                        # Si les réponses sont en fait restreintes au dictionnaire,
-                        # on reboucle aussi...
-                        #
-                        if the_choice_is in dict_of_choices:
-                            break
+                - l'objet répertoire contenant le fichier trouvé ( objet
+                de type _FileSystemLeaf ou pathlib.Path ).
 
-                        else:
-                            log.warning(
-                                "« %s » n'est pas une clef connue...",
-                                #str(the_choice_is)
-                                the_choice_is
-                                )
+                - le chemin complet du fichier recherché.
+        """
 
-                            if restricted:
-                                # Si les clés inconnues ne sont pas autorisées, alors
-                                # on reboucle.
-                                #
-                                log.warning("... or les clefs inconnues sont interdites !")
-                                log.warning('')
+        #leaf = self.files.node
+        leaf = self.files.Path
+        log = self.logItem
 
-                            else:
-                                # Si cette nouvelle clé est confirmée par l'utilisateur,
-                                # on pourra quitter. Sinon on redemande une nouvelle
-                                # réponse...
-                                #
-                                log.warning('')
-                                prompt = 'Confirmez-vous cette réponse ?'
+        last_level = ( len(masks) == 1 )
 
-                                if ask_yes_or_no(prompt, 'o'):
-                                    break
+        # On recherche le premier masque dans la racine, car il faut bien
+        # commencer nos recherches qq part !!!
+        #
+        # Pour chacun des noeuds dont le nom correspond à ce masque, nous
+        # allons en explorer l'arborescence.
+        #
+        # RQ : Si cette recherche a déjà été faite ( cf « found » ), nous
+        # ne parcourons pas à nouveau « root ».
+        #
+        if found is not None and masks[0] in found:
+            candidates = found[masks[0]]
+        else:
+            candidates = root.glob(masks[0])
 
-            log.debug('Clef choisie    : %s', the_choice_is)
-            if the_choice_is in dict_of_choices:
-                log.debug(
-                    'Valeur associée : %s',
-                    dict_of_choices[the_choice_is]
-                    )
+        for n in sorted(candidates, reverse = True):
+
+            # « n » est de type STRING ou PATHLIB.PATH.
+            #
+            log.debug('')
+            log.debug('NOEUD TESTÉ = %s', n)
             log.debug('')
 
-        return the_choice_is
+            # S'il n'y a qu'un seul masque dans la liste, nous comprenons
+            # qu'il s'agit d'un masque de fichier... Nous cherchons alors
+            # s'il existe dans « root » un fichier correspondant au masque
+            # recherché.
+            #
+            if last_level:
 
+                if leaf(n).is_file():
+                    # Nous avons trouvé le 1er fichier qui correspond à
+                    # notre recherche : comme nous avons trié en ordre
+                    # décroissant, on peut espérer qu'il s'agit de la
+                    # version la plus récente...
+                    #
+                    log.debug('Répertoire retenu = %s', root)
+                    log.debug('Fichier retenu = %s', n)
 
-# ---------------------------------------------------------------------------
-#
-#   PARTIE :
-#   ~~~~~~~~
-#   Fonctions de GESTION de FICHIERS.
-#
-# ---------------------------------------------------------------------------
+                    return root, n
+
+            # Sinon, on parcourt les répertoires dont le nom commence par
+            # le masque voulu...
+            #
+            # On descend ainsi dans l'arborescence, on met donc le premier
+            # masque de côté, et on examine les suivants.
+            #
+            else:
 
+                dir, exe = self.search_path_from_masks(root / n, masks[1:])
 
-    def file_system_mode(
+                if exe is not None:
+                    # Si la recherche dans l'arborescence a trouvé une
+                    # valeur, nous la retournons.
+                    #
+                    return dir, exe
+
+        return None, None
+
+
+    def show_paths_and_miscellaneous(
         self,
-        walking_mode: str = walking_via_listdir,
-        with_pathlib: str = pathlib_ignore,
-        with_fnmatch: bool = False,
-        with_glob: bool = False
+        printer = print, # function
+        jumper = print, # function
+        intro: str = None
         ):
-        """
-        Cette méthode permet de modifier le fonctionnement interne
-        de ScriptSkeleton i-e notre gestion de fichiers va-t-elle
-        s'appuyer sur la librairie OS.PATH seule, ou plutôt sur les
-        modules PATHLIB, FNMATCH et GLOB ?
+        """ Pour "imprimer" ou sauvegarder le contenu de
+        notre dictionnaire.
 
-        :param walking_mode: si ce « squelette » n'utilise que le
-        module OS.PATH, pour parcourir 1 répertoire utilisera-t-il
-        la fct os.listdir() ou os.scandir() ?
+        :param printer: la fonction qui doit permettre de
+        sauvegarder ou imprimer ce résumé là où l'on veut
+        ( un fichier log, un widget, ...).
 
-            * walking_via_listdir : os.listdir() utilisée.
+        :param jumper: la fonction qui permet de "sauter
+        une ligne" afin d'améliorer la présentation.
 
-            * walking_via_scandir : os.scandir() utilisée.
+        :param sous_titre: un message que l'on souhaite
+        éventuellement afficher en introduction.
 
-            * walking_ignore : peu importe ( cas où un autre module
-            que OS.PATH est utilisé pour gérer les fichiers... ) et
-            si nous arrivons tout de même dans une partie de code
-            utilisant cette information, la méthode par défaut ( ie
-            os.listdir() sera utilisée ).
+        :return: None
+        """
 
-            RQ = Si les modules GLOB ou FNMATCH sont importés, cela
-            n'impose pas le walking_mode et il faut le spécifier !
+        printer('Configuration des exécutables & répertoires :')
+        printer('=============================================')
+        jumper()
 
-            RQ = Cf FileSystemTree._FileSystemLeaf.iterdir()
+        if intro is not None:
+            printer(intro)
+            jumper()
 
-        :param with_pathlib: ce « squelette » va-t-il s'appuyer sur
-        le module PATHLIB, ou simplement se servir de la librairie
-        OS.PATH ? Valeurs possibles :
+        # En mode « lazy_init », items() ne verrait que les entrées déjà
+        # calculées ( cf _LazyPaths ).
+        #
+        if isinstance(self.paths_and_miscellaneous, _LazyPaths):
+            self.paths_and_miscellaneous.fill_all()
 
-            * pathlib_ignore ( None ) : pas de module PATHLIB.
+        for key, value in self.paths_and_miscellaneous.items():
+            printer(f'{key} = {value}')
+            printer(f'\t{type(value)}')
+            jumper()
 
-            * pathlib_direct_... : module PATHLIB sans filtre.
 
-            * pathlib_deeply : module PATHLIB incorporé.
+    def check_paths_and_miscellaneous(
+        self,
+        printer = print, # function
+        jumper = print, # function
+        alert = print # function
+        ) -> bool:
+        """ Pour vérifier que notre dictionnaire est correct.
 
-        :param with_fnmatch: ce « squelette » va-t-il s'appuyer sur
-        le module FNMATCH ?
+        On va tester le contenu des clefs commençant par :
 
-        :param with_glob: ce « squelette » va-t-il s'appuyer sur le
-        module GLOB ?
-        """
+            . 'DIR_',
+            . 'EXE_',
+            . 'DLL_'.
 
-        log = self.logItem
-        tree_old = self.files
-
-        # Si l'un des paramètres a changé, on recréé l'objet qui nous
-        # permet d'accéder à la gestion des répertoires et fichiers.
-        #
-        if (tree_old.walking_mode == walking_mode) \
-            and (tree_old.with_pathlib == with_pathlib) \
-            and (tree_old.with_fnmatch == with_fnmatch) \
-            and (tree_old.with_glob == with_glob):
-            #
-            # Rien n'a changé donc rien à faire !!!
-            #
-            log.debug("Configuration de la GESTION des FICHIERS :")
-            log.debug('==========================================')
-            log.debug("\tAUCUN des paramètres n'a été modifié.")
-            log.debug('\tDonc pas de changement dans la gestion')
-            log.debug('\t...... des répertoires et fichiers !!!')
-            log.debug('')
-
-        else:
-            # On créé un nouvel objet de gestion des noeuds de notre
-            # système de fichiers.
-            #
-            #node_type_old = type(tree_old.node())
-            node_type_old = type(tree_old.Path())
+        On teste l'existence des répertoires & fichiers définis,
+        autres que ceux relatifs au répertoire de travail ( car
+        on est sûr que ces derniers existent puisqu'ils ont été
+        construits à partir de la fonction os.getcwd() ou que l'
+        on a déjà vérifié leur existence.
 
-            self.files = FileSystemTree(
-                walking_mode = walking_mode,
-                with_pathlib = with_pathlib,
-                with_fnmatch = with_fnmatch,
-                with_glob = with_glob,
-                log_file = log
-                )
+        :param printer: la fonction qui doit permettre de sauver
+        ou imprimer les messages relatifs à nos traitements là où
+        l'on veut ( un fichier log, un widget, ...).
 
-            tree_new = self.files
+        :param jumper: la fonction qui permet de "sauter 1 ligne"
+        afin d'améliorer la présentation.
 
-            # On inspecte les références à l'espace mémoire occupé par
-            # la variable « tree_old » ( ie l'ancien FileSystemTree ).
-            #
-            # Et ceci :
-            #
-            #   AVANT libération des _FileSystemLeaf dont nous avons
-            #   la trace.
-            #
-            # RQ : FileSystemTree pourrait garder la liste des objets
-            # _FileSystemLeaf créé, mais cela créerait vers chacun d'
-            # eux une référence qui bloquerait toute action du ramasse
-            # -miettes de Python !!!
-            #
-            if ___debug___:
+        :param alert: la fonction qui nous permet d'alerter si ns
+        trouvons un pb.
 
-                # On lance le Garbage Collector pour se débarrasser
-                # des parasites type l'instruction ci-dessus :
-                #
-                #   node_type_old = type(tree_old.Path())
-                #
-                # ... qui a créé un objet _FileSystemLeaf non nommé
-                # et inatteignable.
-                #
-                # ( sinon ce Garbage Collector ne sera probablement
-                #   pas lancé avant la fin de la méthode... )
-                #
-                gc_level = gc.get_debug()
-                gc.set_debug(gc.DEBUG_LEAK)
-                gc.collect()
+        :return: True si les tests ok ; False si on a rencontré
+        une erreur .
+        """
 
-                #msg = pprint.pformat(gc.garbage, indent=33)
-                #log.debug(f"GC uncollectables objects : {msg}")
-                #log.debug('')
+        #leaf = self.files.node
+        leaf = self.files.Path
+        no_error = True
 
-                # Le décompte ci-dessous contient la référence faite
-                # par « tree_old » lui-même !!! Donc on soustrait 1
-                # au décompte trouvé afin que cette référence ne soit
-                # pas prise en compte...
-                #
-                memory_refs = _find_var_refcounts_(tree_old)[0] - 1
+        # En mode « lazy_init », items() ne verrait que les entrées déjà
+        # calculées ( cf _LazyPaths ) : nous n'aurions alors rien vérifié.
+        #
+        if isinstance(self.paths_and_miscellaneous, _LazyPaths):
+            self.paths_and_miscellaneous.fill_all()
 
-                log.debug(f"Brand new FileSystemTree  : « tree_new » species   = {type(tree_new)}")
-                log.debug(f"Brand new FileSystemTree  : « tree_new » address   = {id(tree_new)}")
-		        #log.debug(f"Brand new FileSystemTree  : « tree_new » __repr__ = {repr(tree_new)}")
-                log.debug(f"Brand new FileSystemTree  : « tree_new » __str__   = {str(tree_new)}")
-                log.debug('')
+        for key, value in self.paths_and_miscellaneous.items():
 
-                log.debug(f"Deprecated FileSystemTree : « tree_old » species   = {type(tree_old)}")
-                log.debug(f"Deprecated FileSystemTree : « tree_old » address   = {id(tree_old)}")
-                #log.debug(f"Deprecated FileSystemTree : « tree_old » __repr__ = {repr(tree_old)}")
-                log.debug(f"Deprecated FileSystemTree : « tree_old » __str__   = {str(tree_old)}")
-                log.debug(f"Deprecated FileSystemTree : _find_var_refcounts_() = {memory_refs}")
+            if value is None:
+                pass
 
-                # On retrouve ces références, s'il y en a, puis nous
-                # les affichons.
-                #
-                if memory_refs:
+            else:
+                name = None
+                key_short = key[0:4]
 
-                    referrers = gc.get_referrers(tree_old)
+                if key_short in ('DIR_', 'EXE_', 'DLL_'):
 
-                    #msg = pprint.pformat(referrers, indent=33)
-                    #log.debug(f"Deprecated FileSystemTree : gc.get_referrers       =\n{msg}")
-                    #log.debug('')
+                    printer(f"Test de l'existence de {key}...")
+                    node = leaf(value)
 
-                    # Nous souhaitons exclure « tree_old » lui-même de
-                    # cette liste avant un affichage plus précis.
-                    #
-                    # Comme nous n'arrivions pas à exclure « tree_old »
-                    # via les 2 compréhensions de liste ci-dessous :
-                    #
-                    #restricted = [r for r in referrers if not r is tree_old]
-                    #restricted = [r for r in referrers if id(r) != id(tree_old)]
-                    #
-                    # ... nous sommes passés à la suivante, plus large
-                    # dans son sens :
-                    #
-                    #restricted = [r for r in referrers if type(r) != FileSystemTree]
-                    #
-                    # ... et, alors, dans la liste de ces « referrers »,
-                    # l'étrange et non localisable item du type :
-                    #
-                    #   <cell at 0x00000249579B20B0: FileSystemTree object at 0x00000249579E4690>
-                    #
-                    # ... qui y apparaissait, a disparu de la liste :
-                    #
-                    #   « restricted »
-                    #
-                    # ... tout comme de la liste :
-                    #
-                    #   « referrers » !!!
-                    #
-                    # Nous avons alors remplacé la compréhension de
-                    # liste par:
-                    #
-                    #restricted = referrers
-                    #
-                    # ... et cette ligne perturbante <cell at xxx>
-                    # n'a toujours pas réapparu !!!
-                    #
-                    # Visiblement, en prévision d'1 des 2 premières
-                    # compréhensions de liste utilisant « tree_old »,
-                    # Python créait et conservait une variable locale
-                    # fantôme que gc.get_referrers() affichait !!!
-                    #
-                    # OU, PLUTÔT, comme indiqué dans la documentation
-                    # de « gc.get_referrers() » :
+                    # Nous testons différemment chaque type de noeuds du
+                    # système de fichiers afin de pouvoir adapter le msg
+                    # d'erreur potentiel.
                     #
-                    #   Warning
-                    #   Care must be taken when using objects returned by get_referrers()
-                    #   because some of them could still be under construction and hence
-                    #   in a temporarily invalid state. Avoid using get_referrers() for
-                    #   any purpose other than debugging. 
+                    # En effet, nous pourrions écrire plus simplement :
                     #
-                    #   Cf https://docs.python.org/3/library/gc.html#gc.get_referrers
+                    #   if not node.exists():
+                    #       name = 'noeud'
                     #
-                    # Nous avons donc supprimé tout code visant à
-                    # enlever « tree_old » de la liste car, en fait :
+                    if key_short == 'DIR_' and not node.is_dir():
+                        name = 'répertoire'
+
+                    elif key_short == 'EXE_' and not node.is_file():
+                        name = 'fichier'
+
+                    elif key_short == 'DLL_' and not node.is_file():
+                        name = 'module DLL'
+
+                if name is not None:
+
+                    no_error = False
+
+                    alert(f"Le {name} suivant n'existe pas :")
                     #
-                    #   « tree_old » EST PAR CONSTRUCTION ABSENT DE
-                    #   LA LISTE gc.get_referrers( « tree_old » ) !!!
+                    # On impose une tabulation de 6 espaces car, suivant
+                    # les systèmes, \t ne représente pas toujours le même
+                    # nombre de ceux-ci...
                     #
-                    #msg = pprint.pformat(restricted, indent=33)
-                    #log.debug(f"Restricted :\n{msg}")
-                    #log.debug('')
+                    alert(f"{'':>6}{value}")
 
-                    log.debug(f"Deprecated FileSystemTree : get_referrers (detail) =")
+                    jumper()
 
-                    #for r in restricted:
-                    for r in referrers:
+        return no_error
 
-                        # ICI aussi « gc.get_referrers » donne de
-                        # CURIEUSES INFORMATIONS suivant la ligne
-                        # ci-dessous décommentée...
-                        #
-                        # Ainsi, si locals() est envoyé à notre fct
-                        # _find_var_names_(), le prochain appel à
-                        # « gc.get_referrers », celui situé APRÈS la
-                        # libération des _FileSystemLeaf, donnera une
-                        # référence étrange pointant vers « tree_old »
-                        # i-e qq ch comme :
-                        #
-                        #   Var TYPE     = <class 'dict'>
-                        #   [..]
-                        #   Var __repr__ = {'self': <__main__.ScriptSkeleton object at 0x000001E1AE3847D0>,
-                        #
-                        # ... alors que ScriptSkeleton est loin d'être
-                        # un dictionnaire !!!
-                        #
-                        # En fait, cette étranganté n'en est PAS DU
-                        # TOUT !!!
-                        #
-                        # Il ne s'agit pas d'un objet ScriptSkeleton
-                        # mais de son dictionnaire qui est ici désigné.
-                        #
-                        # < instance ScriptSkeleton >.__dict__ possède
-                        # en effet les couples clef-valeur suivant :
-                        #
-                        #   - 'self': <__main__.ScriptSkeleton object at 0x000001E1AE3847D0>,
-                        #   - ...
-                        #   - 'files' : <__main__.FileSystemTree object at 0x000001859F9148D0>,
-                        #   - ...
-                        #
-                        # ... et cette valeur de la clef 'files' qui
-                        # peut pointer vers un objet FileSystemTree !!!
-                        #
-                        # Ce qui est étrange, c'est que skeleton.files
-                        # pointe encore vers l'ancien FileSystemTree
-                        # alors que qq lignes plus haut, le nouveau
-                        # FileSystemTree a été réaffecté à self.files !!!
-                        #
-                        # Il s'agit probablement des « invalid state »
-                        # indiqué dans le WARNING de gc.get_referrers.
-                        #
-                        # Cf ci-dessus :
-                        #
-                        #   « OU PLUTÔT, comme indiqué dans la documentation »
-                        #
-                        #
-                        # =================
-                        # !!! ATTENTION !!!
-                        # =================
-                        #
-                        # POUR AUTANT, même quand cette référence étrange
-                        # est indiquée, AU SORTIR DE file_system_mode(),
-                        # que soit lancé ou non « gc.collect() », on voit
-                        # apparaître des messages provenant de la méthode
-                        # __del__ de FileSystemTree !!!
-                        #
-                        # DONC, en sortie de file_system_mode(), après mise
-                        # à jour des _FileSystemLeaf, aucune référence vers
-                        # l'ancien FileSystemTree n'existe, et celui-ci est
-                        # éliminé par le Garbage Collector...
-                        #
-                        # Au final, nous avons supprimé la source de cette
-                        # référence étrange, en n'utilisant plus locals(),
-                        # même si cette étrangeté n'empêchait en rien la
-                        # disparition de l'ancien FileSystemTree...
-                        #
-                        #r_names = _find_var_names_(r, locals())
-                        r_names = _find_var_names_(r)
 
-                        log.debug('')
-                        log.debug(f"{margin}Var TYPE     = {type(r)}")
-                        log.debug(f"{margin}Var _NAMES_  = {r_names}")
-                        log.debug(f"{margin}Var address  = {id(r)}")
-                        #log.debug(f"{margin}Var __repr__ = {repr(r)}")
-                        log.debug(f"{margin}Var __str__  = {str(r)[0:222]}")
+    def _discovery_cache_file(self) -> str:
+        """ Nom du fichier où sont conservés, d'une exécution à l'autre,
+        les EXE_(..) & DLL_(..) trouvés par set_paths_and_miscellaneous().
 
-                #_pause_()
-                log.debug('')
+        RQ : Ce fichier est placé dans le répertoire temporaire de l'OS,
+        et il peut donc être partagé par plusieurs machines ( profils
+        itinérants, partages réseau ) : ses entrées sont donc indexées par
+        nom de machine et version d'OS ( cf _discovery_cache_key() ).
+        """
 
-            #node_type_new = type(tree_new.node())
-            node_type_new = type(tree_new.Path())
-            my_dict = self.paths_and_miscellaneous
+        return os.path.join(
+            tempfile.gettempdir(),
+            '#_CACHE_for_skeleton_#.json'
+            )
 
-            if node_type_new != node_type_old:
 
-                # Si l'on a changé le type de stockage de la description
-                # des noeuds de notre système de fichier ( pathlib.Path
-                # vs _FileSystemLeaf ) alors nous convertissons dans le
-                # dictionnaire « paths_and_miscellaneous » les valeurs
-                # qui en auraient besoin !!!
-                #
-                #   Cf « ( ! ) ATTENTION ( ! ) : Choix a été fait de stocker »
-                #
-                #
-                # =================
-                # !!! ATTENTION !!!
-                # =================
-                #
-                # PAR AILLEURS, si nous sommes dans le cas d'1 conversion
-                # de _FileSystemLeaf en pathlib.Path, cette conversion va
-                # libérer les _FileSystemLeaf existantes, et ces dernières
-                # références vers l'ancien FileSystemTree disparaîtront...
-                #
-                # DONC cet ancien FileSystemTree sera libéré, dès la fin
-                # de « def file_system_mode », lorsque « tree_old » sera
-                # détruite ( puisqu'elle sera la dernière référence à ce
-                # vieux FileSystemTree ).
-                #
-                log.critical('')
-                log.critical("\t~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~")
-                log.critical("\tMODIFICATION DU TYPE DES NOEUDS !!!")
-                log.critical("\t~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~")
-                log.critical("\t... = ATTENTION AUX EFFETS DE BORDS")
-                log.critical('')
+    def _discovery_cache_key(self) -> str:
+        """ Clé, dans notre cache, des EXE_(..) & DLL_(..) de la machine
+        sur laquelle nous sommes exécutés.
+        """
 
-                # Faudra-t-il annuler les références des _FileSystemLeaf vers leur
-                # FileSystemTree parent, afin de faciliter la Gaarbage Collection ?
-                #
-                #kill_references = ( node_type_old == FileSystemTree._FileSystemLeaf )
+        return '{}|{}'.format(
+            self.paths_and_miscellaneous['working_MACHINE_NAME'],
+            self.paths_and_miscellaneous['working_RELEASE']
+            )
 
-                for key, value in my_dict.items():
 
-                    if type(value) == node_type_old:
+    # Durée ( en secondes ) au-delà de laquelle un échec mémorisé dans notre
+    # cache ( programme non trouvé, ou programme de repli ) n'est plus cru,
+    # même si le répertoire surveillé n'a pas changé ( cf _load_discovered_paths ).
+    #
+    discovery_failure_ttl = 7 * 24 * 3600
 
-                        log.critical("\tConversion de « %s »...", key)
 
-                        # On stocke la zone mémoire éventuellement du type _FileSystemLeaf,
-                        # afin de pouvoir, sî elle est bien de ce type, annuler ensuite la
-                        # référence qu'elle fait pointer vers son FileSystemTree parent...,
-                        # facilitant ainsi le travail du Garbage Collector.
-                        #
-                        # Nous n'annulerons cette référence qu'après l'appel str(value), qui
-                        # exécute _FileSystemLeaf.__str__, qui a besoin de cette référence.
-                        #
-                        #leaf_old = my_dict[key]
+    def _load_discovered_paths(
+        self,
+        keys,       # iterable( STR )
+        watched: str = None
+        ) -> dict:
+        # -> dict( STR : STR ) [ ou ] None
+        """ Relit dans notre cache les EXE_(..) & DLL_(..) trouvés lors
+        d'une exécution précédente sur cette même machine.
+
+        Chacun des fichiers mémorisés est validé à moindre coût, via un
+        simple is_file() : s'il a été désinstallé ou déplacé, le cache est
+        ignoré, et notre appelant doit alors refaire ses recherches.
+
+        Une recherche qui avait échoué ( entrée à None, ou programme de
+        repli tel Notepad au lieu de EditPad Pro, cf _save_discovered_paths(
+        failures ) ) est, elle, validée par la date de modification du
+        répertoire « watched » ( « Program Files », ... ) : si elle a changé
+        ( un programme y a été installé ? ), ou si cet échec date de plus de
+        « discovery_failure_ttl » secondes, le cache est ignoré.
+
+        :param keys: les clés attendues ( 'EXE_txt_editor', ... ).
+
+        :param watched: le répertoire dont la date de modification valide
+        les échecs mémorisés.
+
+        :return: le dictionnaire « clé -> chemin », ou None si le cache est
+        absent, incomplet ou périmé.
+        """
 
-                        #my_dict[key] = tree_new.node(str(value))
-                        my_dict[key] = tree_new.Path(str(value))
+        leaf = self.files.Path
+        log = self.logItem
 
-                        # Si applicable, on fait pointer la feuille dans le vide, afin de 
-                        # libérer une des références vers l'ancien FileSystemTree, et donc
-                        # de permettre le travail du GARBAGE COLLECTOR.
-                        #
-                        #
-                        # ATTENTION :
-                        # ===========
-                        #
-                        # Il n'est plus besoin d'annuler ces références : dorénavant, dans
-                        # FileSystemTree.__new__, nous annulons la référence de _tree_last
-                        # vers l'ancien FileSystemTree même lorsqu'est sélectionné le mode
-                        # « pathlib_direct_via_module_only ». Dans tous les cas, donc, il
-                        # n'y aura plus de références vers l'ancien FileSystemTree, autres
-                        # que les feuilles dont il est le parent. Or ces feuilles, via la
-                        # conversion ci-dessus ne seront plus utilisées, elles vont alors
-                        # disparaître grâce au Garbage Collector. Une fois disparues, elles
-                        # ne pointeront plus vers l'ancien FileSystemTree, et celui-ci sera
-                        # détruit.
-                        #
-                        #if kill_references:
-                        #    leaf_old.tree = None
+        try:
+            with open(self._discovery_cache_file(), encoding = 'utf-8') as fd:
+                cached = json.load(fd)[self._discovery_cache_key()]
 
-                        # Pour vérifier la conversion, on journalise le type de l'objet créé
-                        #
-                        #log.debug("\t\t... en un objet %s.", type(my_dict[key]))
+        except (OSError, ValueError, KeyError, TypeError):
+            log.debug('CACHE : aucune entrée pour cette machine.')
+            return None
 
-                log.critical("\t~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~")
-                log.critical('')
-                log.critical('')
+        for key in keys:
 
-            elif node_type_new == FileSystemTree._FileSystemLeaf:
+            try:
+                value = cached[key]
 
-                # Si le type de stockage est tjrs le même, et que ce sont
-                # des objets _FileSystemLeaf, alors nous mettons à jour
-                # leur pointeur vers le nouveau FileSystemTree dont elles
-                # dépendent.
-                #
-                #
-                # =================
-                # !!! ATTENTION !!!
-                # =================
-                #
-                # Cela aura pour effet de libérer toutes les références
-                # vers l'ancien FileSystemLeaf, et le Garbage Collector
-                # l'éliminera alors en sortie de cette méthode.
-                #
-                log.debug('')
-                log.debug("\t~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~")
-                log.debug("\tMODIFICATION DU PÈRE DES NOEUDS !!!")
-                log.debug("\t~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~")
-                log.debug("\t... = ATTENTION AUX EFFETS DE BORDS")
-                log.debug('')
+            except KeyError:
+                log.debug('CACHE : entrée « %s » absente.', key)
+                return None
 
-                for key, value in my_dict.items():
+            if value is not None and not leaf(value).is_file():
+                log.debug('CACHE : « %s » périmé ( %s ).', key, value)
+                return None
 
-                    if type(value) == node_type_new:
+        if cached.get('_failures'):
 
-                        log.debug("\tMise à jour de « %s »...", key)
+            try:
+                watched_mtime = None if watched is None else os.stat(watched).st_mtime
+            except OSError:
+                watched_mtime = None
 
-                        my_dict[key].tree = tree_new
+            if watched_mtime != cached.get('_watched_mtime'):
+                log.debug('CACHE : « %s » modifié depuis nos échecs %s.', watched, cached['_failures'])
+                return None
 
-                log.debug("\t~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~")
-                log.debug('')
-                log.debug('')
+            if time.time() - cached.get('_saved_at', 0) > self.discovery_failure_ttl:
+                log.debug('CACHE : échecs %s trop anciens.', cached['_failures'])
+                return None
 
-            # On inspecte les références à l'espace mémoire visé par
-            # la variable « tree_old » ( ie l'ancien FileSystemTree ).
-            #
-            # Et ceci :
-            #
-            #   APRÈS libération des _FileSystemLeaf dont nous avions
-            #   la trace.
-            #
-            if ___debug___:
+        log.debug('CACHE : entrées relues dans « %s ».', self._discovery_cache_file())
+        return {key: cached[key] for key in keys}
 
-                # On lance le Garbage Collector pour se débarrasser
-                # des parasites qui auraient été créés ci-dessus.
-                #
-                # ( sinon ce Garbage Collector ne sera probablement
-                #   pas lancé avant la fin de la méthode... )
-                #
-                gc.collect()
-                gc.set_debug(gc_level)
 
-                memory_refs = _find_var_refcounts_(tree_old)[0] - 1
+    def _save_discovered_paths(
+        self,
+        discovered: dict,
+        failures = (),      # iterable( STR )
+        watched: str = None
+        ):
+        """ Mémorise dans notre cache les EXE_(..) & DLL_(..) trouvés sur
+        cette machine, sans toucher aux entrées des autres machines.
 
-                log.debug(f"Deprecated FileSystemTree : « tree_old » is {repr(tree_old)}")
-                log.debug(f"Deprecated FileSystemTree : « tree_old » address   = {id(tree_old)}")
-                log.debug(f"Deprecated FileSystemTree : _find_var_refcounts_() = {memory_refs}")
+        :param discovered: le dictionnaire « clé -> chemin » à conserver.
 
-                # On retrouve ces références, s'il y en a.
-                #
-                if memory_refs:
+        :param failures: les clés dont la recherche a échoué ( programme
+        non trouvé, ou remplacé par 1 programme de repli ).
 
-                    referrers = gc.get_referrers(tree_old)
+        :param watched: le répertoire dont la date de modification valide
+        ces échecs ( cf _load_discovered_paths ).
+        """
 
-                    #msg = pprint.pformat(referrers, indent=33)
-                    #log.debug(f"Deprecated FileSystemTree : gc.get_referrers       =\n{msg}")
-                    #log.debug('')
+        log = self.logItem
+        cache_file = self._discovery_cache_file()
 
-                    log.debug(f"Deprecated FileSystemTree : get_referrers (detail) =")
+        try:
+            with open(cache_file, encoding = 'utf-8') as fd:
+                cached = json.load(fd)
 
-                    for r in referrers:
+            if not isinstance(cached, dict):
+                cached = {}
 
-                        r_names = _find_var_names_(r)
+        except (OSError, ValueError):
+            cached = {}
 
-                        log.debug('')
-                        log.debug(f"{margin}Var TYPE     = {type(r)}")
-                        log.debug(f"{margin}Var _NAMES_  = {r_names}")
-                        log.debug(f"{margin}Var address  = {id(r)}")
-                        log.debug(f"{margin}Var __repr__ = {repr(r)}")
-                        log.debug(f"{margin}Var __str__  = {r}")
+        entry = {
+            key: None if value is None else str(value)
+            for key, value in discovered.items()
+            }
 
-                #_pause_()
-                log.debug('')
+        entry['_failures'] = sorted(failures)
 
-            # On libère notre ancien FileSystemTree qui est devenu
-            # inutile. Cela nous permettra, par ailleurs, que le bon
-            # décompte du nombre de FileSystemTree « en vie » soit
-            # tenu.
-            #
-            # Cf ci-dessus dans notre « FileSystemTree.__new__ », les
-            # rmqs à :
-            #
-            #   "Création d'un objet FileSystemTree dans les autres cas :"
-            #
-            #
-            # =================
-            # !!! ATTENTION !!!
-            # =================
-            #
-            # Le code ci-dessous est INUTILE i-e :
-            #
-            #   del tree_old
-            #
-            # ... sauf peut-être en mode DEBUG, au cas où l'on veuille
-            # faire des tests supplémentaires.
-            #
-            # En effet, « tree_old » est une variable locale, qui va
-            # disparaître en même temps que cette méthode va se clore.
-            #
-            # « tree_old » étant la dernière référence vers l'ancien
-            # FileSystemTree, le Garbage Collector va l'effacer de la
-            # mémoire sans autre action de notre part...
-            #
-            # Et ceci puisque, d'après les tests, le Garbage Collector
-            # se lance en sortie de cette fonction, quoi qu'il en soit.
-            #
-            # Ce qui est LOGIQUE, puisqu'il doit nettoyer la mémoire de
-            # toutes les variables locales à cette méthode.
-            #
-            #
-            # =================
-            # !!! ATTENTION !!!
-            # =================
-            #
-            # FINALEMENT, pour l'instant, nous avons choisi de ne pas 
-            # exécuter la portion de code ci-dessous ( cf « if False » )
-            # ni donc le Garbage Collector, afin de nous retrouver en des
-            # conditions les plus normales d'exécution.
-            #
-            if False:
-            #if ___debug___:
-                
-                log.debug("Running « del tree_old » + GARBAGE COLLECTION...")
-                log.debug('')
+        if failures:
 
-                del tree_old
-                gc.collect()
+            try:
+                entry['_watched_mtime'] = None if watched is None else os.stat(watched).st_mtime
+            except OSError:
+                entry['_watched_mtime'] = None
 
-            else:
+            entry['_saved_at'] = time.time()
 
-                log.debug("Neither « del tree_old » nor GARBAGE COLLECTION !")
-                log.debug('')
+        cached[self._discovery_cache_key()] = entry
 
+        # Écriture dans 1 fichier temporaire, puis remplacement : notre
+        # cache ne peut ainsi jamais être lu à moitié écrit ( par un autre
+        # de nos scripts lancé en même temps, par exemple ).
+        #
+        # RQ : Ce fichier temporaire a un nom unique ( cf _AtomicFile ), 2
+        # scripts lancés en même temps ne pouvant ainsi pas écrire dans le
+        # même. Le dernier à remplacer notre cache l'emporte.
+        #
+        tmp_file = f'{cache_file}.{os.getpid()}-{os.urandom(4).hex()}.tmp'
 
-    def search_files_from_a_mask(
-        self,
-        #directory: os.PathLike = None,
-        directory: object = None,
-        mask: str = '*'
-        ) -> list:
-    	# -> list( STR ) [ ou ] list( PATHLIB.PATH )
-        """ Cherche dans un répertoire tous les FICHIERS qui
-        correspondent à un certain masque.
+        try:
+            with open(tmp_file, 'w', encoding = 'utf-8') as fd:
+                json.dump(cached, fd, ensure_ascii = False, indent = 1)
 
-        :param directory: le répertoire à explorer, au format
-        STRING, PATHLIB.PATH, voire _FileSystemLeaf....
+            os.replace(tmp_file, cache_file)
 
-        :param mask: le masque de recherche, qui peut contenir
-        des « wildcards ». Ces wildcards sont soit ceux compris
-        par pathlib.glob(), glob.glob() ou fnmatch.filter(), soit
-        ceux compris par la méthode _FileSystemLeaf._fake_iglob().
-        Dans ce dernier cas, les masques de recherche interprétés
-        sont :
+        except OSError as e:
+            log.debug('CACHE : écriture impossible dans « %s » ( %s ).', cache_file, e)
 
-            - « * » : tous les fichiers.
+            try:
+                os.remove(tmp_file)
+            except OSError:
+                pass
 
-            - « *.xxx » : les fichiers d'un certain type.
 
-            - « title*.m* » : masque plus complexe.
+    def set_paths_and_miscellaneous(
+        self,
+        directory: str = None,
+        print_configuration: bool = None,
+        use_cache: bool = True
+        ) -> str:
+        """ Définitions des différents exécutables dont se sert ce script.
+    
+        :param directory: répertoire où il faut lire & écrire les fichiers. Si ce
+        paramètre est omis, ou que le répertoire désigné n'existe pas, on fixera
+        le répertoire de lecture / création au répertoire courant...
+    
+        :param print_configuration: faut-il ou non afficher la configuration construite ?
 
-        Dans les autres cas ( i-e lorsque nous avons importé les
-        modules GLOB ou FNMATCH ou PATHLIB ), cf :
+        :param use_cache: faut-il relire les exécutables trouvés lors d'une exécution
+        précédente ( cf _load_discovered_paths() ) ? À False, toutes les recherches
+        sont refaites, et le cache est mis à jour.
 
-            Cf https://docs.python.org/3/library/glob.html#glob.glob
-            Cf https://docs.python.org/3/library/fnmatch.html#fnmatch.filter
-            Cf https://docs.python.org/3/library/pathlib.html#pathlib.Path.glob
-        
-        :return: la liste des chemins des fichiers trouvés, au
-        format STRING ou PATHLIB.PATH, et ces fichiers seront
-        exprimés via un PATH ABSOLU.
+        :return: le répertoire de travail, ce qui est utile s'il n'a pas été passé en
+        paramètre d'entrée...
+        """
 
-        ATTENTION : search_files_from_a_mask() ne renvoie QUE
-        des fichiers, tout répertoire est écarté du résultat !
+        log = self.logItem
 
-        ATTENTION : Si notre objet ScriptSkeleton est configuré
-        afin d'utiliser le module PATHLIB ( cf notre propriété
-        « with_pathlib » ) alors la liste en retour contiendra
-        des valeurs de type PATHLIB.PATH, sinon les valeurs de
-        la liste seront de type STRING !!!
+        # ATTENTION : PERSONNALISATION de notre mode DEBUG
+        # -----------
+        # Si aucune valeur ne nous est précisée pour l'affichage
+        # ou pas de la configuration, nous faisons en fonction de
+        # notre propre mode de déboggage...
+        #
+        # Nous sommes obligé de faire ainsi car la déclaration de
+        # set_paths_and_miscellaneous() ne peut prendre la forme :
+        #
+        #   def set_paths_and_miscellaneous(
+        #       self,
+        #       directory: str = '',
+        #       print_configuration: bool = self.debug
+        #       ) -> str:
+        #
+        # ... c'est une syntaxe que Python n'autorise pas d'indiquer
+        # comme valeur par défaut, une valeur ( self.debug ) extraite
+        # de l'un même des autres paramètres ( self ).
+        #
+        # Si nous n'avions qu'un seul mode DEBUG pour l'entièreté de
+        # notre script, et non un mode DEBUG pour chacun des objets
+        # ScriptSkeleton, nous aurions pu écrire plus simplement :
+        #
+        #   def set_paths_and_miscellaneous(
+        #       self,
+        #       directory: str = '',
+        #       print_configuration: bool = ___debug___
+        #       ) -> str:
+        #
+        # ... mais chacun de ces objets à son propre mode !!!
+        #
+        # Donc nous sommes obligés de donner la valeur « None » dans
+        # la définition de fonction au booléen en question, puis de
+        # tester ici si cette valeur est à None ou pas.
+        #
+        if print_configuration is None:
+            print_configuration = self._debug_
 
-            Lorsqu'il s'agit de STRINGS, nous nous assurons que
-            les valeurs retournées soient des PATHS ABSOLUS.
+        # Où sommes-nous ? Puis quels exécutables pouvons-nous utiliser ?
+        #
+        working_path, msg_architecture = self._set_working_paths(directory)
+        self._set_executables(use_cache)
 
-            Si les données retournées sont de type PATHLIB.PATH,
-            les valeurs retournées seront également de type PATH
-            ABSOLU ( obtenues via leur méthode « resolve » ).
+        # Si c'est demandé, on imprime le dictionnaire.
+        #
+        printing_function = lambda x: log.debug(x)
+        jumping_function = lambda: log.debug('')
+        alert_function = lambda x: log.critical(x)
+
+        if print_configuration:
+
+            jumping_function()
+
+            self.show_paths_and_miscellaneous(
+                printing_function,
+                jumping_function,
+                msg_architecture
+                )
+
+        # On vérifie que notre dictionnaire soit correct.
+        #
+        all_ok = self.check_paths_and_miscellaneous(
+            printing_function,
+            jumping_function,
+            alert_function
+            )
+
+        if all_ok:
+            log.debug('-> Ok, présence de tous les fichiers & répertoires.')
+            jumping_function()
+
+        else:
+            log.critical('-> Certains FICHIERS requis sont MANQUANTS.')
+            log.critical('')
+
+        return working_path
+
+
+    def _set_working_paths(
+        self,
+        directory: str = None
+        ) -> (str, str):
+        """ 1ère partie de set_paths_and_miscellaneous() : où sommes-nous (
+        système, machine, répertoire de travail, ... ) ?
+
+        :param directory: cf set_paths_and_miscellaneous().
+
+        :return: le répertoire de travail, et la description de notre
+        architecture.
         """
 
         #leaf = self.files.node
         leaf = self.files.Path
         log = self.logItem
 
-        if directory is None:
+        # Les modules optionnels sont-ils chargés ?
+        #
+        if isinstance(self.files, FileSystemTree):
+            self.paths_and_miscellaneous[
+                'walking_MODE'
+                ] = str(self.files.walking_mode)
 
-            log.debug('Pas de répertoire de recherche indiqué.')
-            log.debug('Donc ce sera le répertoire de travail.')
+        self.paths_and_miscellaneous['module_PATHLIB'] = str(pathlib)
+        self.paths_and_miscellaneous['module_FNMATCH'] = str(fnmatch)
+        self.paths_and_miscellaneous['module_GLOB'] = str(glob)
 
-            # On n'appelle pas ici get_paths_and_miscellaneous()
-            # car on sait que 'working_PATH_FULL' est toujours
-            # défini à ce stade...
-            #
-            dir_n = self.paths_and_miscellaneous['NOD_working']
+        # Où sommes-nous ?
+        #
+        try:
+            module = 'OS'
+            where_are_we = os.uname()
 
-        else:
-            dir_n = leaf(directory)
+            our_system = where_are_we.sysname
+            our_release = where_are_we.release
+            our_version = where_are_we.version
+            our_machine = where_are_we.machine
+            our_nodename = where_are_we.nodename
 
-        log.debug('Recherche de fichiers dans : %s.', dir_n)
+        except AttributeError:
 
-        # Nous imposons que le retour de notre fonction soit
-        # une liste.
+            from platform import uname
+            log.debug('« os.uname() » inconnu.')
+            log.debug('')
+
+            module = 'PLATFORM'
+            where_are_we = uname()
+
+            our_system = where_are_we.system
+            our_release = where_are_we.release
+            our_version = where_are_we.version
+            our_machine = where_are_we.machine
+            our_nodename = where_are_we.node
+
+        log.debug('Dixit « %s » : %s', module, where_are_we)
+        log.debug('Système « %s » « %s » version « %s ».',
+            our_system,
+            our_release,
+            our_version
+            )
+        log.debug("Notre machine est de type « %s » et s'appelle :",
+            our_machine
+            )
+        log.debug('\t« %s »', our_nodename)
+        log.debug('')
+
+        self.paths_and_miscellaneous['working_SYSTEM'] = our_system
+        self.paths_and_miscellaneous['working_RELEASE'] = our_release
+        self.paths_and_miscellaneous['working_VERSION'] = our_version
+        self.paths_and_miscellaneous['working_MACHINE_TYPE'] = our_machine
+        self.paths_and_miscellaneous['working_MACHINE_NAME'] = our_nodename
+
+        # Sommes-nous 32 ou 64 bits ?
         #
-        # En effet, par exemple, si :
+        is_64bits = sys.maxsize > 2 ** 32
+        size = '64' if is_64bits else '32'
+        msg_architecture = f'ARCHITECTURE {size} bits sur OS « {our_system} ».'
+
+        # On initialise le répertoire de travail de ce programme.
         #
-        #   self.with_pathlib == pathlib_direct_via_path_method
+        if directory is None or not leaf(directory).is_dir():
+            working_node = leaf().cwd()
+        else:
+            working_node = leaf(directory)
+
+        working_path = str(working_node)
+
+        self.paths_and_miscellaneous['NOD_working'] = working_node
+        self.paths_and_miscellaneous['working_PATH_FULL'] = working_path
+
+        # Avant étaient utilisées les 2 instructions ci-dessous :
         #
-        # ... alors :
+        #   directories_and_files['working_PATH_DSK_ONLY'] = working_path[0:2]
+        #   directories_and_files['working_PATH_DIRS_ONLY'] = working_path[3:]
         #
-        #   self.files.node(directory).glob(mask)
-        #   [ ou plutôt self.files.Path(directory).glob(mask) ]
-        #   = < pathlib.Path >.glob(mask)
-        #   = un itérateur !!!
+        # Ensuite, on est passé à os.path.splitdrive, pour être plus PORTABLE :
         #
-        # En effet, sous Python IDLE :
+        #   (path_drive, path_tail) = os.path.splitdrive(working_path)
+        #   self.paths_and_miscellaneous['working_PATH_DSK_ONLY'] = path_drive
+        #   self.paths_and_miscellaneous['working_PATH_DIRS_ONLY'] = path_tail
         #
-        #   import pathlib
-        #   lst = pathlib.Path('.').glob('*')
-        #   type(lst)
+        # Puis l'on est passé à l'utilisation de notre classe FileSystemTree,
+        # et l'on a alors supprimé l'affectation relative au « path_tail » car
+        # « working_PATH_DIRS_ONLY » n'était utilisé nulle part et car cette
+        # donnée / attribut n'est pas présente dans le module PATHLIB !!!
         #
-        # -> result = <class 'generator'>
+        self.paths_and_miscellaneous[
+            'working_PATH_DSK_ONLY'
+            ] = working_node.drive
+
+        # On initialise les comportements généraux de ce programme.
         #
-        # ... Donc, si notre appelant s'attend à avoir 1 liste
-        # qu'il puisse réutiliser, alors il sera très surpris
-        # puisqu'une fois parcourue, cette liste deviendra vide
-        # ( propriété des itérateurs qui ne conservent pas leurs
-        # valeurs et ne peuvent donc les afficher qu'une fois et
-        # une seule ) !!! 
-        #
-        # Ainsi, sous IDLE :
-        #
-        #   for i in lst: print(i)
-    	#
-        # -> result =
-    	#	skeleton { SRC }.py
-    	#	skeleton.py
-    	#
-    	# ... puis :
-    	#
-        #	list(lst)
-    	#
-        # -> result = []
-    	#
-    	# Donc lorsque nous parcourons la liste, cela la vide !!!
-    	# Ce qui est bien le principe des itérateurs / générateurs.
-	    #
-        # D'où la syntaxe :
-        #
-        #   return list(self.files.node(directory).glob(mask))
-        #   [ ou plutôt list( self.files.Path(..).glob(..) ) ]
-        #
-        # RQ : Depuis qu'1 compréhension de liste est utilisée,
-        # la syntaxe ci-dessus a disparu puisqu'1 compréhension
-        # fournit 1 liste en retour ( que sa syntaxe soit basée
-        # sur une liste ou sur un itérateur !!! ).
-        #
-        # RQ : Depuis, < _FileSystemLeaf >.glob s'est mise aussi
-        # à renvoyer un itérateur ou générateur en retour ( et
-        # seulement cela ) et dans aucun cas une liste, ce qui
-        # justifie d'autant plus que nous transformions ceci
-        # en liste au regard de ce qu'attend notre appelant...
-        #
-        #
-        #   ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
-        #   !!! EXEMPLE D'UTILISATION D'UNE COMPRÉHENSION DE LISTE !!!
-        #   ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+        self.paths_and_miscellaneous[shutdown_TYPE] = self.shutdown_dflt
+
+        return working_path, msg_architecture
+
+
+    def _set_executables(
+        self,
+        use_cache: bool = True
+        ):
+        """ 2nde partie de set_paths_and_miscellaneous() : quels exécutables
+        pouvons-nous utiliser ( éditeur de texte, LibreOffice, ... ) ?
+
+        RQ : Les informations de _set_working_paths() sont supposées déjà
+        connues.
+
+        :param use_cache: cf set_paths_and_miscellaneous().
+        """
+
+        #leaf = self.files.node
+        leaf = self.files.Path
+        log = self.logItem
+
+        our_system = self.paths_and_miscellaneous['working_SYSTEM']
+        our_release = self.paths_and_miscellaneous['working_RELEASE']
+
+        os_dir = None
+        os_node = None
+        l_office_exe = None
+        l_writer_exe = None
+        exe_txt_editor = None
+
         #
+        ###########################################################
+        ########## INITIALISATION dans le cas de WINDOWS ##########
+        ###########################################################
         #
-        only_files = [
-            #
-            # Nous utilisons une « compréhension de liste » pour
-            # écarter tout répertoire du résultat. En effet, nous
-            # ne souhaitons conserver que les fichiers.
-            #
-            # node(directory).glob(mask) renvoie en effet autant
-            # des fichiers que des répertoires, puisque c'est le
-            # cas de :
-            # [ ou plutôt Path(directory).glob(mask) dorénavant ]
-            #
-            #   . pathlib.glob()
-            #   . fnmatch.filter()
-            #   . glob.iglob()
-            #   . glob.glob()
-            #
-            # ... qui ne font pas le distingo entre les fichiers
-            # et les répertoires !!!
-            #
-            # Cf :
-            #
-            #   . https://docs.python.org/3/library/pathlib.html#pathlib.Path.glob
-            #   . https://docs.python.org/3/library/fnmatch.html#fnmatch.filter
-            #   . https://docs.python.org/3/library/glob.html#glob.iglob
-            #   . https://docs.python.org/3/library/glob.html#glob.glob
-            #
-            # Seule la fonction < _FileSystemLeaf >._fake_iglob()
-            # permet d'indiquer si l'on veut récupérer tous les
-            # noeuds, les répertoires seuls, ou seulement les
-            # fichiers.
-            #
-            # Par ailleurs, nous voulons être sûrs de ne fournir
-            # que des paths ABSOLUS, d'où l'utilisation de la fct
-            # os.path.abspath() qui accepte en entrée autant des
-            # STRING que des pathlib.PATH. Ainsi, sous IDLE :
-            #
-            #   os.path.abspath('.')
-            # > 'K:\\_Know\\Info\\Dvpt\\Réalisation\\Src\\_Python\\[ skeleton ]'
-            #
-            #   pathlib.Path('.')
-            # > WindowsPath('.')
-            #
-            #   os.path.abspath(pathlib.Path('.'))
-            # > 'K:\\_Know\\Info\\Dvpt\\Réalisation\\Src\\_Python\\[ skeleton ]'
-            #
-            # La formule est donc devenue :
-            #
-            #   [ os.path.abspath(n)
-            #       for n in node(directory).glob(mask) \
-            #       if node(n).is_file() ]
-            #
-            # RQ : < FileSystemTree >.node() fournit des STRINGS
-            # ou des objets de type PATHLIB.PATH.
-            #
-            # Par la suite, pour une formulation respectueuse
-            # des différents types possibles, nous avons choisi
-            # d'écrire :
-            #
-            #   [ os.path.abspath(n) if type(n) == str else n.resolve() \
-            #     for n in node(directory).glob(mask) if node(n).is_file() ]
-            #
-            # On peut en effet tester les expresions suivantes
-            # sous IDLE :
-            #
-            #   [ os.path.abspath(n) if type(n) == str else n.resolve() \
-            #     for n in pathlib.Path().glob('*') if n.is_file() ]
-            #
-            #   [ os.path.abspath(n) if type(n) == str else n.resolve() \
-            #     for n in glob.glob('*') if os.path.isfile(n) ]
-            #
-            # Cela a considérablement alourdi la syntaxe, mais
-            # c'est à visée didactique.
-            #
-            os.path.abspath(n) if type(n) == str else n.resolve()
-                for n in dir_n.glob(mask) \
-                if leaf(n).is_file()
-            ]
-        return only_files
 
 
-    def convert_to_pdf_init(
-        self
-        ) -> bool:
-        """ Conversion de fichier(s) DOCX ( ou ODT, TXT, etc )
-        en fichier(s) PDF :
+        # On définit les autres répertoires & fichiers utilisés.
+        #
+        if os.name.upper() == 'NT':
 
-                PHASE D'INITIALISATION
+            os_dir = os.environ['SYSTEMROOT']
+            os_node = leaf(os_dir)
+            programs = leaf(r"C:\Program Files")
 
-        :return: opération réussie ou non.
-        """
+            # Parcourir « Program Files » est ce qu'il y a de plus long lors
+            # de notre démarrage, alors que les exécutables trouvés changent
+            # rarement d'une exécution à l'autre : nous relisons donc ceux
+            # trouvés la fois précédente ( cf _load_discovered_paths() ), et
+            # ne refaisons nos recherches que s'ils ne sont plus valides ( ou
+            # si elles avaient échoué, et que « Program Files » a changé ).
+            #
+            discovered_keys = (
+                'EXE_libre_office', 'EXE_libre_writer', 'EXE_txt_editor',
+                'EXE_player', 'EXE_played'
+                )
+            discovered = None
 
-        log = self.logItem
-        no_error = True
+            if use_cache:
+                log.debug("Recherche des EXÉCUTABLES : dans notre CACHE")
+                log.debug("~~~~~~~~~~~~~~~~~~~~~~~~~~~")
 
-        # Pour convertir en PDF, on va faire appel à LibreOffice.
-        # En effet, le format PDF est complexe à gérer !!!
-        # Créer un PDF avec beaucoup de lignes TXT me semble
-        # compliqué !!!
-        #
-        # Cf :
-        #
-        #   _Know\Info\Dvpt\Réalisation\Langages\Python\- et - PDF.rar
-        #
-        # On lance donc dès que possible LibreOffice. Comme cela,
-        # lorsque nos traitements seront finis, ce logiciel aura
-        # certainement achevé son initialisation...
-        #
-        # Il nous suffira de communiquer avec lui pour lui demander
-        # la conversion.
-        #
-        log.debug('Initialisation de LibreOffice :')
-        log.debug('')
+                discovered = self._load_discovered_paths(discovered_keys, str(programs))
+                log.debug('')
 
-        libre_office_exec = self.get_paths_and_miscellaneous(
-            'EXE_libre_office'
-            )
+            if discovered is not None:
 
-        if libre_office_exec is None:
-            no_error = False
+                l_office_exe = discovered['EXE_libre_office']
+                l_writer_exe = discovered['EXE_libre_writer']
+                exe_txt_editor = discovered['EXE_txt_editor']
+                player_exe = discovered['EXE_player']
+                played = discovered['EXE_played']
 
-        else:
+            else:
 
-            log.debug('... i-e lancement de : « %s »', libre_office_exec)
-            log.debug('')
+                # Les recherches ci-dessous ( LibreOffice, puis EditPad Pro ) ont
+                # toutes pour point de départ « Program Files » : nous cherchons
+                # donc leurs 1ers masques en 1 seul parcours de ce répertoire.
+                #
+                in_programs = self._glob_from_masks(
+                    programs,
+                    ( "Libre*Office*", "Just*Great*Software*", "Edit*Pad*Pro*" )
+                    )
 
-            command_line = [
-                libre_office_exec,
+                # On recherche le répertoire de LibreOffice.
                 #
-                # --headless permet de lancer LibreOffice sans son
-                # interface utilisateur. ( Starts in "headless mode"
-                # which allows using the application without user
-                # interface. This special mode can be used when the
-                # application is controlled by external clients via
-                # the API https://api.libreoffice.org/ )
+                log.debug("Recherche de LIBRE OFFICE :")
+                log.debug("~~~~~~~~~~~~~~~~~~~~~~~~~~~")
+
+                # Description du cheminement dont nous pensons qu'il peut nous
+                # mener depuis « Program Files » à l'exécutable de LibreOffice.
                 #
-                '--headless',
-                '--nocrashreport',
-                '--nodefault',
-                '--nofirststartwizard',
-                '--nolockcheck',
-                '--nologo',
-                '--norestore'
-                ]
+                masks = ( "Libre*Office*", "program", "soffice.exe" )
 
-            log.debug("Commande exécutée = %s", command_line)
-            log.debug('')
+                dir, exe = self.search_path_from_masks(programs, masks, in_programs)
 
-            # On utilise Popen() car run() attend lui que Libre
-            # Office nous rende la main, ce qu'il ne fait que si
-            # on le ferme... puisqu'on ne lui demande rien de
-            # spécifique à faire et que donc Libre Office garde
-            # la main !!!
-            #
-            #   process = subprocess.run(command_line)
-            #
-            # Cela dit, il doit y avoir un paramètre de run() qui
-            # permet cela.
-            #
-            process = subprocess.Popen(command_line)
+                if exe is not None:
+                    l_office_exe = str(exe)
+                    l_writer_exe = str(dir / "swriter.exe")
 
-            log.debug('Code Retour : « %s ».', process.returncode)
-            log.debug('')
+                log.debug('')
 
-        return no_error
+                # « Edit Pad Pro » peut être "rangé" / installé dans plusieurs
+                # répertoires différents suivant les machines, suivant que j'ai
+                # utilisé le répertoire par défaut lors de l'installation, ou
+                # que j'ai pensé à modifier ce répertoire ( pour coller à mon
+                # ancienne habitude... ).
+                #
+                # Le mieux serait ici de lire dans le registre Windows l'endroit
+                # où se trouve Edit Pad Pro !!!
+                #
+                # Cela dit, il peut y avoir plusieurs version d'EditPad Pro
+                # hébergées sur une même machine...
+                #
+                # AVANT nous utilisions 2 listes pour retrouver « Edit Pad Pro »
+                # ( une infâme verrue en fait... ), 2 listes que nous parcourions
+                # l'une après l'autre, via 2 boucles « for » :
+                #
+                #   editpad_dir_list = [
+                #       # On liste ici les différents répertoires possibles, par ordre
+                #       # de la version la plus récente ( préférée ) à la plus ancienne.
+                #       #
+                #       r"C:\Program Files\Just Great Software\EditPad Pro",
+                #       r"C:\Program Files\EditPad Pro",
+                #       r"C:\Program Files\EditPadPro",
+                #       r"C:\Program Files\Just Great Software\EditPad Pro 8",
+                #       r"C:\Program Files\EditPad Pro 8",
+                #       r"C:\Program Files\EditPadPro8",
+                #       r"C:\Program Files\Just Great Software\EditPad Pro 7",
+                #       (..)
+                #   ]
+                #
+                #   editpad_exe_list = [
+                #       # On liste ici les différents exécutables possibles, par ordre
+                #       # de la version la plus récente ( préférée ) à la plus ancienne.
+                #       #
+                #       'EditPadPro8.exe',
+                #       'EditPadPro7.exe',
+                #       (..)
+                #   ]
+                #
+                # PUIS la méthode search_path_from_masks() a été écrite et cela
+                # a simplifié la recherche...
+                #
+                log.debug("Recherche de EDIT PAD PRO : dans « Just*Great*Software* »")
+                log.debug("~~~~~~~~~~~~~~~~~~~~~~~~~~~")
 
+                # Description du cheminement dont nous pensons qu'il peut nous
+                # mener depuis « Program Files » à l'exécutable de Edit Pad Pro.
+                #
+                masks = ( "Just*Great*Software*", "Edit*Pad*Pro*", "Edit*Pad*Pro*.exe" )
 
-    def convert_to_pdf_run(
-        self,
-        *args,
-        wait: bool = True
-        ) -> bool:
-        """ Conversion de fichier(s) DOCX ( ou ODT, TXT, etc )
-        en fichier(s) PDF :
+                _, exe = self.search_path_from_masks(programs, masks, in_programs)
 
-                PHASE DE CONVERSION
+                if exe is None:
+                    # En cas d'échec, nous testons un chemin alternatif : il se peut
+                    # que le sous-répertoire soit directement dans « Program Files ».
+                    #
+                    log.debug('')
+                    log.debug("Recherche de EDIT PAD PRO : dans « Program Files »")
+                    log.debug("~~~~~~~~~~~~~~~~~~~~~~~~~~~")
 
-        :param *args: tuple des fichiers à convertir, dont les
-        path seront du type STRING ou PATHLIB.PATH....
+                    _, exe = self.search_path_from_masks(programs, masks[1:], in_programs)
 
-        :param wait: attend-t-on la fin de la conversion pour
-        rendre la main à la fonction appelante ? ou pas...
+                # Nos échecs ne sont mémorisés que tant que « Program Files »
+                # n'a pas changé ( cf _load_discovered_paths ).
+                #
+                failures = [] if l_office_exe is not None else [ 'EXE_libre_office', 'EXE_libre_writer' ]
 
-        :return: opération réussie ou non.
-        """
+                if exe is None:
+                    # Si l'on n'a pas trouvé EditPadPro, on se rabat sur Notepad.
+                    #
+                    log.debug('')
+                    log.debug("Recherche de EDIT PAD PRO : ÉCHEC")
+                    log.debug("~~~~~~~~~~~~~~~~~~~~~~~~~~~")
+                    log.debug('Fichier retenu = %s', exe)
 
-        log = self.logItem
-        no_error = True
+                    exe = str(os_node / 'notepad.exe')
+                    failures.append('EXE_txt_editor')
 
-        # On demande à LibreOffice de convertir nos fichiers
-        # en PDF.
-        #
-        # Pour ceci, j'ai choisi de simplement relancer Libre
-        # Office avec les paramètres adéquats. Comme il est
-        # déjà en tâche de fond ( grâce à l'initialisation via
-        # convert_to_pdf_init ), Libre Office va alors attraper
-        # cet appel et le réaliser...
-        #
-        # RQ : Si convert_to_pdf_init() n'a pas été déjà lancée,
-        # pas de souci... Ça marchera, quand même, mais ce sera
-        # certainement bien plus long car il faudra attendre le
-        # lancement de LibreOffice.
-        #
-        log.debug("Conversion de fichier(s) en PDF via LibreOffice :")
-        log.debug('')
+                log.debug('')
+                exe_txt_editor = exe
 
-        libre_office_exec = self.get_paths_and_miscellaneous(
-            'EXE_libre_office'
-            )
+                # Seulement dans le cas de Windows XP, et ceci afin de jouer
+                # un son, on a besoin d'un player et d'un fichier multimédia.
+                # ( cf la fonction "on_sonne_le_reveil" ).
+                #
+                if our_system == 'Windows' and our_release == 'XP':
 
-        if libre_office_exec is None:
-            no_error = False
+                    # Sous Windows XP, on joue un son d'une autre façon que
+                    # sur les autres plateformes car le son généré par un
+                    # "\a" y est peu audible...
+                    #
+                    # Je n'ai testé le "mplay32.exe" que sous Windows XP,
+                    # c'est pour cela que je ne me sers de ce logiciel que
+                    # dans ce cas, mais il doit fonctionner sous beaucoup
+                    # de versions de Windows avant XP voire qq unes après
+                    # (ou au moins son ancêtre i.e mplay.exe)... Par contre,
+                    # à partir de Windows 7, il faut utiliser le lecteur
+                    # Windows Media ou une autre solution...
+                    #
+                    # Donc ici, pour réveiller l'utilisateur, on joue une
+                    # mélodie sous Windows via le Media Player l'avantage
+                    # de cette méthode est que le son est réglable et que
+                    # cela marche sur un PC de bureau comme sur un portable...
+                    #
+                    player_exe = str(os_node / 'System32' / 'mplay32.exe')
+                    played = str(os_node / 'Media' / 'Windows XP Battery Low.wav')
 
-        else:
+                else:
+                    player_exe = None
+                    played = None
+
+                self._save_discovered_paths(
+                    {
+                        'EXE_libre_office'  :   l_office_exe,
+                        'EXE_libre_writer'  :   l_writer_exe,
+                        'EXE_txt_editor'    :   exe_txt_editor,
+                        'EXE_player'        :   player_exe,
+                        'EXE_played'        :   played
+                    },
+                    failures,
+                    str(programs)
+                    )
 
-            # Cf https://wiki.openoffice.org/wiki/API/Tutorials/PDF_export
-            # Cf https://www.libreofficehelp.com/batch-convert-writer-documents-pdf-libreoffice/
-            # Cf https://stackoverflow.com/questions/30349542/command-libreoffice-headless-convert-to-pdf-test-docx-outdir-pdf-is-not
+            player_arg = None if player_exe is None else ['/play', '/close']
+
+
+        #
+        ###########################################################
+        ########## INITIALISATION pour un OS INCONNU  #############
+        ###########################################################
+        #
+
+
+        else:
+            log.critical('UNSUPPORTED SYSTEM :')
+            log.critical('')
+            log.critical(
+                "Les programmes nécessaires à ce module sont à définir pour l'OS « %s ».",
+                os.name.upper()
+                )
+            log.critical('')
+
+            # On ne lève dorénavant plus une exception :
             #
-            #   --convert-to pdf:writer_pdf_Export:{"Magnification":{"type":"long","value":"2"}}
-            #   --convert-to pdf:writer_pdf_Export:{"Zoom":{"type":"long","value":"75"}}
+            #   raise AssertionError
             #
-            format_cible = 'pdf:writer_pdf_Export'
-            #format_cible += ':{'
-            #format_cible += '"Magnification":{"type":"long","value":"4"}'
-            #format_cible += ','
-            #format_cible += '"Zoom":{"type":"long","value":"75"}'
-            #format_cible += '}'
+            # ... car :
             #
-            # Je n'ai pas réussi à faire fonctionner les configurations PDF
-            # ci-dessus... Il faut probablement utiliser les UNO tools pour
-            # finement choisir nos paramètres.
+            #   - Cela faisait planter le script dans ce cas, i-e en fin
+            # de script, lorsque l'on passait dans notre méthode __del__,
+            # celle-ci apelait « self.on_dit_au_revoir() », qui elle-même
+            # lançait « self.edit_file_txt() », qui elle-même invoquait :
             #
-            # Cf - et - Communications ( pipe, socket ).rar\UNO tools = unotools-0.3.3\
-            # in _Know\Info\Dvpt\Réalisation\Langages\Python\
+            #   self.paths_and_miscellaneous['EXE_txt_editor']
             #
-            # L'utilisation des UNO tools PERMETTRAIT PAR EXEMPLE DE CHOISIR
-            # LA FONT POUR CONVERSION D'UN FICHIER .TXT vers PDF, ODT, ...
+            # ... qui n'avait pas été défini !!!
             #
+            # On ne peut donc lever une exception qu'après avoir défini tous
+            # les « paths and miscellaneous » !!!
+            #
+            # Sinon, on va droit au PLANTAGE !!!
+            #
+            player_exe = None
+            player_arg = None
+            played = None
 
-            for file_in in args:
-
-                command_line = [
-                    libre_office_exec,
-                    #
-                    # --invisible :
-                    #
-                    #   Drapeau que j'utilisais dans mon ancien batch DOS
-                    #   "INVENTAIRE - #NotSynchronized.bat" ie je lançais :
-                    #
-                    #   SET LiO_DEFAULT="C:\Program Files\LibreOffice 5\program\soffice.exe"
-                    #   [..]
-                    #   SET LibreOffice=%LiO_DEFAULT%
-                    #   SET NOM_LENOVO_S340=BONZZZ-7
-                    #   SET LiO_LENOVO_S340="C:\Program Files\LibreOffice\program\soffice.exe"
-                    #   [..]
-                    #   IF '%PC_NAME%' == '%NOM_LENOVO_S340%' SET LibreOffice=%LiO_LENOVO_S340%
-                    #   [..]
-                    #   %LibreOffice% --invisible macro:///Standard.Convert.ConvertTXTtoPDF(%RESULT_FILE_TXT%)
-                    #
-                    # ... mais que j'ai finalement retiré car, après, si
-                    # je souhaitais lancer LibreOffice en interactif, je
-                    # n'y avais plus accès, à moins de tuer chaque process
-                    # LibreOffice avant de le lancer !
-                    #
-                    #'--invisible',
-                    '--convert-to', format_cible,
-                    '--outdir', '.',
-                    str(file_in)
-                    ]
-
-                log.debug("Fichier à traiter = %s", file_in)
-                log.debug("Commande exécutée = %s", command_line)
 
-                if wait:
+        #
+        ###########################################################
+        ########## CLÔTURE de notre INITIALISATION ################
+        ###########################################################
+        #
 
-                    # Il est ici demandé que convert_to_pdf_run()
-                    # garde la main tant que la conversion n'est
-                    # achevée.
-                    #
-                    # J'utilise donc run() et non Popen(), car c'
-                    # est ainsi ce que LibreOffice va faire.
-                    #
-                    # C'est parfait puisque lorsque l'on va enfin
-                    # retrouver la main, on saura que la conversion
-                    # sera achevée ( et donc on sera sûr que le PDF
-                    # est bien présent... ).
-                    #
-                    log.debug('... exécution SYNCHRONE.')
-                    process = subprocess.run(command_line)
 
-                else:
+        self.paths_and_miscellaneous['DIR_os'] = os_dir
+        self.paths_and_miscellaneous['NOD_os'] = os_node
 
-                    # On rend la main à l'appelant dès que l'on
-                    # a lancé la conversion, sans se soucier de
-                    # si elle est achevée ni comment...
-                    #
-                    log.debug('... exécution ASYNCHRONE.')
-                    process = subprocess.Popen(command_line)
+        self.paths_and_miscellaneous['EXE_txt_editor'] = exe_txt_editor
 
-                log.debug('')
-                log.debug('Code Retour : « %s ».', process.returncode)
-                log.debug('')
+        self.paths_and_miscellaneous['EXE_libre_office'] = l_office_exe
+        self.paths_and_miscellaneous['EXE_libre_writer'] = l_writer_exe
 
-        return no_error
+        self.paths_and_miscellaneous['EXE_player'] = player_exe
+        self.paths_and_miscellaneous['ARG_player'] = player_arg
+        self.paths_and_miscellaneous['EXE_played'] = played
 
 
-    def edit_file_txt(
+    def get_paths_and_miscellaneous(
         self,
-        *args,
-        wait: bool = True
-        ):
-        """ Édition d'un ou plusieurs fichiers au format TXT.
-
-        :param *args: tuple des fichiers à éditer, dont les
-        path seront du type STRING, PATHLIB.PATH, voire même
-        _FileSystemLeaf....
+        index: str
+        ) -> str:
+        """ Pour retrouver de façon « protégée » une valeur de notre
+        dictionnaire : on va ainsi, par exemple, tester si l'index
+        est bien présent dans le dictionnaire...
+        
+        :param index: l'index de la valeur souhaitée.
 
-        :param wait: attend-t-on la fin de l'édition pour
-        rendre la main à la fonction appelante ? ou pas...
+        :return: la valeur souhaitée.
         """
 
-        self.shw_debug('Édition de fichier(s) TXT :')
-        self.shw_debug('')
+        value = None
 
-        # On retrouve l'éditeur de texte.
+        # En mode « lazy_init », l'entrée demandée est calculée si besoin.
         #
-        exe_txt_editor = self.get_paths_and_miscellaneous(
-            'EXE_txt_editor'
-            )
+        if isinstance(self.paths_and_miscellaneous, _LazyPaths):
+            self.paths_and_miscellaneous.fill(index)
+
+        if self.paths_and_miscellaneous is None \
+            or len(self.paths_and_miscellaneous) == 0:
+
+            self.shw_debug(f'« {index} » est inconnu.')
+            self.shw_debug("« paths_and_miscellaneous » est vide.")
+            self.shw_debug('')
 
-        if exe_txt_editor is None:
-            pass
         else:
 
-            for file_to_edit in args:
+            keys = self.paths_and_miscellaneous.keys()
 
-                # On lance l'éditeur de texte avec notre fichier
-                # comme paramètre.
+            if index in keys:
+
+                value = self.paths_and_miscellaneous[index]
+
+            if value is None:
+
+                # Si l'index n'a pas été trouvé, ou que la valeur dans
+                # le dictionnaire est None, alors on informe.
                 #
-                command_line = [exe_txt_editor, str(file_to_edit)]
+                msg = f'« {index} » est inconnu'
 
-                self.shw_debug(
-                    f'Fichier à traiter = {file_to_edit}'
-                    )
-                self.shw_debug(
-                    f'Commande exécutée = {command_line}'
+                if 'working_SYSTEM' in keys and 'working_MACHINE_TYPE' in keys:
+
+                    msg = '{} sur {} et {}.'.format(
+                        msg,
+                        self.paths_and_miscellaneous['working_SYSTEM'],
+                        self.paths_and_miscellaneous['working_MACHINE_TYPE']
+                        )
+
+                else:
+                    msg = f'{msg} sur {os.name.upper()}.'
+
+                self.shw_debug(msg)
+                self.shw_debug('')
+            
+        return value
+
+
+# ---------------------------------------------------------------------------
+#
+#   PARTIE :
+#   ~~~~~~~~
+#   Fonctions pour manipulation de MODULES ( installation, ... )
+#
+# ---------------------------------------------------------------------------
+
+
+    def install_module_via_pip(
+        self,
+        module_name: str = None
+        ) -> bool:
+        """ Pour installer un module qui ne l'aurait pas encore été et dont
+            nous aurions pour autant besoin...
+
+        :param module_name: le nom du module à installer
+
+        :return: True si l'installation a réussi ( ou si le module existait
+        déjà ), False sinon.
+        """
+
+        log = self.logItem
+
+        installed = False
+
+        try:
+            # On essaye d'importer le module pour savoir s'il n'existerait
+            # pas déjà.
+            #
+            # Pour ceci, la syntaxe :
+            #
+            #   import module_name
+            #
+            # ... ne convient pas car, alors, Python va recherche un module
+            # nommé « module_name » !!!
+            #
+            # Dans ce cas, on peut utiliser le module « importlib » :
+            #
+            #   cf https://docs.python.org/3/library/importlib.html#importlib.import_module
+            #
+            # C'est la syntaxe la plus correcte et l'on écrit donc :
+            #
+            #   import importlib
+            #   importlib.import_module(module_name)
+            #
+            # On peut sinon utiliser la fonction « __import__() », interne
+            # à Python  :
+            #
+            #   cf https://docs.python.org/3/library/functions.html#import__
+            #
+            # ... mais cela est déconseillé :
+            #
+            #   « Direct use of __import__() is also discouraged in favor of
+            #     importlib.import_module(). »
+            #
+            # TOUTEFOIS, dans notre cas, comme il ne s'agit que de tester
+            # l'existence du module, c'est pourtant cette dernière syntaxe
+            # ( la plus simple et efficace ) que nous avons choisie !!!
+            #
+            __import__(module_name)
+
+        except ModuleNotFoundError:
+
+            # Le module n'est pas installé...
+            #
+            # ... alors on l'installe en attendant la fin de cette opération
+            # ( via subprocess.run ).
+            #
+            command_line = [sys.executable, '-m', 'pip', 'install', module_name]
+            log.debug("Commande exécutée = %s", command_line)
+            log.debug('')
+
+            process = subprocess.run(command_line)
+            log.debug('Code Retour de la commande : « %s ».', process.returncode)
+            log.debug('')
+
+            if process.returncode == 0:
+
+                log.debug("Installation du module « %s » réussie.", module_name)
+                log.debug('')
+
+                installed = True
+
+            else:
+                log.critical('Module « %s » INTROUVABLE !!!', module_name)
+                log.critical('')
+
+        else:
+            log.debug("Module « %s » déjà présent sur cette machine.", module_name)
+            log.debug('')
+
+            installed = True
+
+        return installed
+
+
+# ---------------------------------------------------------------------------
+#
+#   PARTIE :
+#   ~~~~~~~~
+#   Fonctions pour journalisation des WARNINGS et ERREURS ( DÉBOGAGE ).
+#
+# ---------------------------------------------------------------------------
+
+
+    def on_ouvre_le_journal(
+        self,
+        log_name,
+        directory: str = None,
+        also_on_screen: bool = None,
+        warning_on_reopen: bool = None,
+        in_background: bool = False,
+        queue_size: int = 10000,
+        overflow: str = log_overflow_block,
+        log_format: str = log_format_text,
+        max_bytes: int = 1000000,
+        max_age: float = None,
+        backup_count: int = 1,
+        compression: str = None,
+        retention: float = None,
+        in_memory: bool = False,
+        memory_size: int = 1000,
+        lazy: bool = False
+        ) -> logging.Logger:
+        """ Pour initialiser la journalisation des messages dans un fichier,
+            voire également à l'écran.
+
+        Cette fonction est initialement basée sur un exemple trouvé sur le web :
+
+            http://sametmax.com/ecrire-des-logs-en-python/
+            (..)\Src\_Python\( help ) Functions of Python.rar\LOG - Écrire des logs en Python*.pdf
+
+        On ne gère par contre qu'un unique journal, et ceci afin de ne pas avoir
+        plusieurs journaux créés ( par erreur par exemple ) en //, ce qui causerait
+        la création de plusieurs fichiers log temporaires, et donc rendrait le
+        déroulé des opérations plus difficile à suivre !!!
+
+        :param log_name: nom qui sera donné au logger et qui permettra de le retrouver,
+        si nécessaire, via la fonction logging.getLogger(name).
+
+        :param directory: répertoire où il faut créé le journal. Si ce paramètre est
+        vide, ou que le répertoire n'existe pas, on fixera le répertoire de création
+        au répertoire courant...
+
+        :param also_on_screen: les messages de log doivent-ils également apparaître
+        à l'écran ( ou ne seront-ils stockés sinon que dans un fichier ).
+
+        :param warning_on_reopen: si ce booléen est à vrai, un WARNING s'affichera
+        en gros si le journal avait déjà été ouvert. Sinon, il y aura seulement
+        un message de deboggage qui sera émis.
+
+        :param in_background: faut-il écrire le fichier LOG via un thread en
+        tâche de fond ? L'appelant ne fait alors que déposer ses messages dans
+        une file d'attente ( cf _LogQueueHandler ).
+
+        :param queue_size: le nombre max de messages dans cette file d'attente.
+
+        :param overflow: que faire lorsque cette file est pleine ( attendre, ne
+        plus garder les messages DEBUG, oublier les plus anciens messages, cf
+        log_overflow_... ).
+
+        :param log_format: le format du fichier LOG : texte libre, 1 objet JSON
+        par ligne, ou binaire compact ( cf log_format_... et iter_log_records ).
+
+        :param max_bytes: la taille max, en octets, du fichier LOG, au-delà de
+        laquelle il est découpé en segments ( cf _SegmentedLogHandler ).
+
+        :param max_age: la durée max, en secondes, d'un segment ( None = pas de
+        découpage dans le temps ).
+
+        :param backup_count: le nombre max de segments terminés conservés.
+
+        :param compression: la compression, en tâche de fond, des segments
+        terminés ( None, ou cf log_compression_... ).
+
+        :param retention: la durée max, en secondes, de conservation d'un
+        segment terminé ( None = illimitée ).
+
+        :param in_memory: faut-il ne garder que les « memory_size » derniers
+        messages en mémoire, et ne les écrire dans le fichier LOG qu'en cas
+        de besoin ( cf _LogRingHandler ) ?
+
+        :param memory_size: le nombre max de messages gardés en mémoire.
+
+        :param lazy: faut-il attendre le 1er message pour créer le fichier LOG
+        ( cf _LazyLogHandler ) ?
+
+        :return: l'objet logger en lui-même, qu'il ait été créé à cette occasion
+        ou que, ayant déjà été créé, on renvoie à nouveau le même.
+        """
+
+        leaf = self.files.Path
+
+        # On définit nos paramètres en fonction de notre mode de DEBUG personnel.
+        # ( cf ci-dessus « ATTENTION : PERSONNALISATION de notre mode DEBUG » )
+        #
+        if also_on_screen is None:
+            also_on_screen = self._debug_
+
+        if warning_on_reopen is None:
+            warning_on_reopen = self._debug_
+
+        # On crée l'objet JOURNAL si besoin.
+        #
+        if self.logItem is None:
+
+            # Création de l'objet logger qui va nous servir à écrire dans les logs.
+            #
+            journal = logging.getLogger(log_name)
+            self.logItem = journal
+
+            # On met le niveau du logger à DEBUG, comme ça il écrit tout.
+            #
+            journal.setLevel(logging.DEBUG)
+
+            # Création d'un formateur qui va ajouter le temps, le niveau
+            # de chaque message quand on écrira un message dans le log.
+            #
+            # RQ : Pour nos formats structurés, JSON ou binaire, ce sont
+            # les champs de _log_record_fields() qui sont écrits.
+            #
+            if log_format not in log_formats:
+                raise ValueError(f"Format « {log_format} » inconnu ( cf {log_formats} ).")
+
+            if log_format == log_format_jsonl:
+                file_format = _JsonLinesFormatter()
+
+            elif log_format == log_format_binary:
+                file_format = _BinaryLogFormatter()
+
+            else:
+                file_format = logging.Formatter(
+                    fmt = '%(asctime)s - %(levelname)-9s %(message)s',
+                    datefmt = '%d-%m %H:%M:%S'
+                    )
+
+            # Création d'un fichier temporaire qui va nous servir d
+            # journal d'exécution.
+            #
+            #if directory is None or not self.files.node(directory).is_dir():
+            if directory is None or not leaf(directory).is_dir():
+                directory = str(leaf().cwd())
+
+            # RQ : Ce fichier, et ses handlers, sont créés par la fonction
+            # ci-dessous : soit dès à présent, soit, en mode « lazy », lors
+            # de l'émission du 1er message ( cf _LazyLogHandler ).
+            #
+            def open_log_file() -> logging.Handler:
+                return self._open_log_file(
+                    log_name,
+                    directory,
+                    file_format,
+                    max_bytes,
+                    backup_count,
+                    max_age,
+                    compression,
+                    retention,
+                    in_memory,
+                    memory_size,
+                    in_background,
+                    queue_size,
+                    overflow,
+                    log_format
+                    )
+
+            def announce_log_file():
+                journal.info('')
+
+                journal.debug('')
+                journal.debug('OUVERTURE du journal « %s »...', log_name)
+                journal.debug('')
+                journal.debug('... tenu via PYTHON version %s.', sys.version)
+                journal.debug('')
+
+                journal.info(
+                    'Les messages seront stockés dans le fichier : %s.',
+                    self._logFile
+                    )
+                journal.info('')
+
+            if lazy:
+                self._logLazy = _LazyLogHandler(journal, open_log_file, announce_log_file)
+                journal.addHandler(self._logLazy)
+            else:
+                journal.addHandler(open_log_file())
+
+            # Création d'un second handler qui va rediriger chaque écriture de log
+            # sur la console.
+            #
+            # On ne crée toutefois ce second handler que si l'appelant veut également
+            # que les messages apparaissent à l'écran...
+            #
+            if also_on_screen:
+
+                # RQ : Si nos affichages sont regroupés en blocs, ceux
+                # de notre journal le sont aussi ( et dans le même ordre ),
+                # toujours sur STDERR. Sinon, self._screen_err vaut None,
+                # ce qui désigne sys.stderr.
+                #
+                stream_handler = logging.StreamHandler(self._screen_err)
+                stream_handler.setLevel(logging.INFO)
+                journal.addHandler(stream_handler)
+
+            if not lazy:
+                announce_log_file()
+
+        else:
+
+            # Un journal existe déjà donc c'est celui-ci que l'on retourne.
+            # Par ailleurs, on affiche un warning...
+            #
+            journal = self.logItem
+
+            if warning_on_reopen:
+        
+                journal.warning("TENTATIVE d'OUVERTURE d'1 NOUVEAU JOURNAL...")
+                journal.warning('ATTENTION : Un journal a déjà été ouvert !!!')
+                journal.warning('')
+                journal.warning('Nous allons donc nous servir du journal nommé « %s ».',
+                                journal.name)
+                journal.warning("Par contre, on IGNORE la demande de création d'un journal « %s ».",
+                                log_name)
+                journal.warning('')
+
+        return journal
+
+
+    def _open_log_file(
+        self,
+        log_name: str,
+        directory: str,
+        file_format: logging.Formatter,
+        max_bytes: int,
+        backup_count: int,
+        max_age: float,
+        compression: str,
+        retention: float,
+        in_memory: bool,
+        memory_size: int,
+        in_background: bool,
+        queue_size: int,
+        overflow: str,
+        log_format: str
+        ) -> logging.Handler:
+        """ Crée notre fichier LOG, et les handlers qui y écrivent ( cf
+        on_ouvre_le_journal() pour le détail des paramètres ).
+
+        :return: le handler à ajouter à notre journal ( file d'attente, mémoire
+        ou fichier, suivant ce qui est demandé ).
+        """
+
+        file_prefix = f'#_LOG_for_{log_name}_#_'
+        file_object = tempfile.NamedTemporaryFile(
+            mode = 'w+t',
+            encoding = 'utf-8',
+            prefix = file_prefix,
+            suffix = '.log',
+            dir = directory,
+            delete = False
+            )
+
+        # RQ : Seul son nom nous intéresse, le handler ci-dessous
+        # ouvrant lui-même ce fichier. Nous le fermons donc, afin
+        # que Windows nous laisse le renommer ( cf doRollover ).
+        #
+        file_object.close()
+
+        # Création d'un handler qui va rediriger une écriture du log vers
+        # un fichier en mode 'append', par défaut avec 1 backup et une
+        # taille max de 1Mo ( cf _SegmentedLogHandler ).
+        #
+        rotation = {
+            'max_age': max_age,
+            'compression': compression,
+            'retention': retention
+            }
+
+        if log_format == log_format_binary:
+
+            file_handler = _BinaryRotatingFileHandler(
+                file_object.name,
+                max_bytes,
+                backup_count,
+                **rotation
+                )
+
+        else:
+
+            file_handler = _SegmentedLogHandler(
+                file_object.name,
+                max_bytes,
+                backup_count,
+                **rotation
+                )
+
+        # On met le niveau du handler fichier sur DEBUG, on lui dit qu'il doit
+        # utiliser le formateur créé précédement et on ajoute ce handler au
+        # logger
+        file_handler.setLevel(logging.DEBUG)
+        file_handler.setFormatter(file_format)
+        self._logHandler = file_handler
+
+        # Si c'est demandé, nos messages ne sont d'abord que gardés
+        # en mémoire, et ne sont transmis au handler fichier qu'en
+        # cas de besoin ( WARNING, ... cf _LogRingHandler ).
+        #
+        if in_memory:
+
+            ring_handler = _LogRingHandler(memory_size, file_handler)
+            ring_handler.setLevel(logging.DEBUG)
+            self._logRing = ring_handler
+            file_handler = ring_handler
+
+        # Si c'est demandé, ce handler n'est plus appelé directement
+        # par le logger, mais par un thread en tâche de fond qui vide
+        # la file d'attente dans laquelle le logger dépose ses messages.
+        #
+        # RQ : Seul le fichier LOG est ainsi différé, l'affichage à
+        # l'écran ( cf ci-dessous ) restant immédiat.
+        #
+        if in_background:
+
+            queue_handler = _LogQueueHandler(queue_size, overflow)
+            queue_handler.setLevel(logging.DEBUG)
+            queue_handler.start(file_handler)
+            self._logQueue = queue_handler
+            file_handler = queue_handler
+
+            # Si notre script se termine sans que nous ayons pu dire
+            # au revoir ( cf on_dit_au_revoir() ), les messages encore
+            # en attente seront tout de même écrits.
+            #
+            import atexit
+            atexit.register(queue_handler.stop)
+
+        # Tout est prêt !
+        #
+        self._logFile = file_object.name
+
+        if self._profiler is not None:
+            self._profiler.base_name = os.path.splitext(self._logFile)[0]
+
+        return file_handler
+
+
+    def on_se_presente(
+        self,
+        module_file: str,
+        arguments: list
+        ) -> int:
+        """ Fonction permettant d'afficher des informations d'ordre général ( nom du module,
+        ses arguments, ... ) lorsqu'un module est appelé en tant que __main__.
+    
+        :param module_file: le nom du fichier appelant ( la valeur de __file__ en général ).
+    
+        :param arguments: les arguments avec lesquels le module principal qui nous appelle
+        a lui-même été appelé ( sys.argv en général ).
+    
+        :return: le nombre d'éléments contenu dans la liste d'arguments « arguments » qui
+        nous a été passée en paramètre. Il s'agit d'un simple len(arguments), mais que
+        l'appelant n'aura ainsi pas à refaire...
+        """
+
+        log = self.logItem
+
+        # On affiche le nom du module en lettres capitales, i.e le nom du fichier, mais sans
+        # son extension.
+        #
+        #short_name = self.files.node(module_file).stem
+        short_name = self.files.Path(module_file).stem
+
+        log.debug('')
+        log.debug('Je me présente :')
+        log.debug('================')
+        log.debug('')
+        log.debug("!!! Hello world, I'm « %s » in Python !!!", short_name.upper())
+        log.debug('')
+
+        log.debug('')
+        log.debug('Exécution de : %s', module_file)
+        log.debug('==============')
+        log.debug('')
+        log.debug('Ce module est exécuté en tant que MODULE PRINCIPAL.')
+        log.debug('')
+
+        # On affiche la liste des paramètres reçus.
+        #
+        log.debug('')
+        log.debug('Paramètres reçus :')
+        log.debug('==================')
+        log.debug('')
+
+        nb_parameters_in = 0 if arguments is None else len(arguments)
+
+        log.debug('Nombre de paramètres = %s', nb_parameters_in)
+        log.debug('Liste des paramètres = %s', arguments)
+        log.debug('')
+
+        if arguments is not None:
+
+            for counter, parameter in enumerate(arguments, start=0):
+
+                log.debug(
+                    'Paramètre n° %s ie sys.argv[ %s ] = %s',
+                    counter,
+                    counter,
+                    parameter
+                    )
+
+        log.debug('')
+
+        return nb_parameters_in
+
+
+    def debug_mode(
+        self,
+        state: bool = True
+        ):
+        """ Pour lancer / arrêter notre mode DEBUG depuis le script
+        appelant.
+
+        Cela permet au script appelant de moduler les informations
+        que nous émettons, au regard des parties de son corps, plus
+        ou moins sensibles / nouvelles, qu'il veut observer.
+
+        :param state: True pour (re)démarrer le mode, False pour
+        le stopper.
+        """
+
+        self._debug_ = state
+
+        action = 'start' if state else 'stop'
+        deco = 22 * '#'
+        msg = f'{deco} Mode DEBUG ( {action} ) {deco}'
+
+        self.shw('#' * len(msg))
+        self.shw(msg)
+        self.shw('#' * len(msg))
+        self.shw('')
+
+
+    def quiet_walk_mode(
+        self,
+        state: bool = True
+        ):
+        """ Pour lancer / arrêter notre mode « quiet walk » : chacune de
+        nos recherches de fichiers ( _fake_iglob(), _walk_files_in_parallel(),
+        ... ) ne journalise alors plus qu'1 seul message de synthèse ( nombre
+        de noeuds, durée ), au lieu de plusieurs messages par noeud trouvé.
+
+        :param state: True pour (re)démarrer le mode, False pour
+        le stopper.
+        """
+
+        self.quiet_walk = state
+
+        if isinstance(self.files, FileSystemTree):
+            self.files.quiet_walk = state
+
+
+    def flush_screen(self):
+        """ Affiche tout ce qui est encore en attente dans notre tampon
+        d'affichage ( cf _ScreenBuffer ), s'il y en a un.
+
+        Nous l'appelons en fin de script ( nos saisies, elles, vident tous
+        nos tampons, cf _input_ ).
+        """
+
+        for screen in ( self._screen_err, self._screen ):
+
+            if screen is not None:
+                screen.drain()
+
+
+    def dump_log(self):
+        """ Écrit dans le fichier LOG les messages qui ne sont encore
+        gardés qu'en mémoire ( cf _LogRingHandler ), s'il y en a.
+
+        Utile, par exemple, avant une opération risquée, ou pour garder
+        une trace d'une étape importante même si tout se passe bien.
+        """
+
+        if self._logRing is None:
+            return
+
+        # Les messages encore dans notre file d'attente ( cf
+        # _LogQueueHandler ) n'ont pas encore atteint notre
+        # mémoire : ils seront écrits au fil de l'eau.
+        #
+        self._logRing.dump()
+
+
+    def _walk_loggers(self) -> tuple:
+        # -> ( fonction [ ou ] None, fonction [ ou ] None )
+        """ Les fonctions de journalisation à utiliser lors d'1 recherche :
+        cf FileSystemTree._walk_loggers().
+
+        RQ : Le niveau de notre journal est testé ici, 1 seule fois par
+        recherche, et non à chaque message.
+        """
+
+        log = self.logItem
+
+        if log is None or not log.isEnabledFor(logging.DEBUG):
+            return None, None
+
+        if self.quiet_walk:
+            return None, log.debug
+
+        return log.debug, None
+
+
+    def on_dit_au_revoir(
+        self,
+        log_to_open: bool = None,
+        log_to_remove: bool = None,
+        pause_to_make: bool = None
+        ):
+        """ Fonction a appeler avant de quitter ce module. Elle permet
+        essentiellement de lancer l'affichage du fichier de LOG... et
+        de rendre la main à l'environnement appelant.
+
+        :param log_to_open: faut-il afficher ou non le fichier LOG dans
+        un éditeur de TXT.
+
+        :param log_to_remove: faut-il détruire ou non le fichier LOG.
+
+        :param pause_to_make: faut-il marquer une pause en demandant
+        à l'utilisateur de frapper sur la touche ENTRÉE, et ce à la
+        toute fin des traitements.
+
+        :return:
+        """
+
+        # On définit nos paramètres en fonction de notre mode de DEBUG personnel.
+        # ( cf ci-dessus « ATTENTION : PERSONNALISATION de notre mode DEBUG » )
+        #
+        if log_to_open is None:
+            log_to_open = self._debug_
+
+        if log_to_remove is None:
+
+            # RQ : Si notre journal en mémoire a dû écrire son contenu dans
+            # le fichier LOG ( WARNING, ERROR, ... ), ce LOG est précisément
+            # celui qu'il faut garder, même hors mode DEBUG.
+            #
+            log_was_dumped = (
+                self._logRing is not None
+                and self._logRing.dumped > 0
+                )
+
+            log_to_remove = not ( self._debug_ or log_was_dumped )
+
+        if pause_to_make is None:
+            pause_to_make = self._debug_
+
+        # Pour ne pas dire 2 fois au revoir, ni détruire 2 fois
+        # le fichier LOG...
+        #
+        # Normalement, l'utilisateur de ce module doit appeler
+        # on_dit_au_revoir() lorsqu'il a fini... mais, au cas où
+        # il ne le ferait pas, nous appelons aussi cette fonction
+        # dans notre méthode __del__(). Nous réalisons alors ce
+        # que nous pouvons encore faire...
+        #
+        if self._we_already_said_bye:
+
+            # La fonction on_dit_aurevoir() a déjà été appelée
+            # par l'utilisateur de ce module. Nous revenons ici
+            # probablement depuis notre méthode __del__ qui nous
+            # appelle aussi, et ce afin que nous puissions faire
+            # ce que nous pouvons encore faire si l'utilisateur
+            # du module n'a pas appeler on_dit_aurevoir(), comme
+            # il le devrait...
+            #
+            self.shw_debug('Nous avons déjà dit au revoir...')
+            self.shw_debug('')
+
+        else:
+
+            # Nous sommes ici sûrs que c'est la première
+            # fois que nous parcourons cette fonction.
+            #
+            self._we_already_said_bye = True
+
+            # En mode « lazy_init », si aucun message n'a
+            # encore été journalisé, aucun fichier LOG n'a
+            # été créé : ce n'est pas pour nous dire au
+            # revoir que nous allons en créer un.
+            #
+            log_never_opened = (
+                self._logLazy is not None
+                and self._logLazy.target is None
+                )
+
+            if log_never_opened:
+
+                self._logLazy.discard()
+
+                log_to_open = False
+                log_to_remove = False
+
+            self.shw_info('BYE')
+            self.shw_info('')
+
+            # Si nos méthodes ont été chronométrées, nous
+            # en affichons la synthèse.
+            #
+            # RQ : Depuis notre méthode __del__(), seul
+            # self.shw_info() est encore sûr.
+            #
+            if self.timing is not None:
+
+                show = self.shw_info if self._we_are_inside_del_method else self.shw
+
+                for line in self.timing.summary():
+                    show(line)
+
+                show('')
+
+            # Si notre script a été profilé, nous en
+            # sauvegardons les rapports.
+            #
+            if self._profiler is not None:
+
+                for profile_file in self._profiler.stop():
+                    self.shw_info(f'Profilage sauvegardé dans : {profile_file}')
+
+                self.shw_info('')
+
+            # Si nos messages ne sont gardés qu'en mémoire,
+            # ils ne sont écrits dans le LOG qu'en mode DEBUG
+            # ( sinon, ce LOG serait détruit ci-dessous ).
+            #
+            # RQ : Les messages encore dans notre file d'
+            # attente doivent d'abord y être parvenus.
+            #
+            if self._logRing is not None and self._debug_:
+
+                if self._logQueue is not None:
+                    self._logQueue.stop()
+
+                self._logRing.dump()
+
+            # S'il est demandé d'afficher le journal en
+            # fin de traitements, on le fait.
+            #
+            # ... sauf si nous sommes déjà dans notre
+            # méthode __del__(), sinon cela va planter car
+            # beaucoup d'objets sont déjà potentiellement
+            # en cours de destruction !!!
+            #
+            # CHANGEMENT : Dorénavant, grâce aux fonctions
+            # self.shw_info() et self.shw_debug(), on peut
+            # appeler edit_file_txt() même depuis __del__().
+            #
+            if log_to_open:
+
+                # On lance l'éditeur de texte afin que l'
+                # utilisateur puisse voir le fichier log.
+                #
+                self.edit_file_txt(
+                    self._logFile,
+                    wait = False
+                    )
+
+            # On signale à notre objet FileSystemTree de
+            # ne plus écrire dans le LOG, car nous allons
+            # détruire ce fichier...
+            #
+            if isinstance(self.files, FileSystemTree):
+                self.files._register_log(None)
+
+            # Si le fichier LOG est écrit en tâche de fond,
+            # nous attendons que tous les messages encore
+            # en attente y aient été écrits.
+            #
+            # C'est alors notre handler de file d'attente
+            # que nous détachons du journal ci-dessous.
+            #
+            log_handler = self._logRing or self._logHandler
+
+            if log_never_opened:
+                log_handler = self._logLazy
+
+            if self._logQueue is not None:
+
+                self._logQueue.stop()
+                log_handler = self._logQueue
+
+                if self._logQueue.dropped:
+                    self.shw_debug(
+                        f'{self._logQueue.dropped} messages du LOG abandonnés ( file pleine ).'
+                        )
+                    self.shw_debug('')
+
+            # On libère le fichier LOG de sa fonction de
+            # handler.
+            #
+            # Ce qui permettra que ce fichier soit détruit
+            # s'il est devenu inutile...
+            #
+            # ... sauf si nous sommes déjà dans notre
+            # méthode __del(), sinon cela va planter car
+            # bcp d'objets sont déjà potentiellement en
+            # cours de destruction !!!
+            #
+            if self._we_are_inside_del_method:
+
+                pass
+
+            else:
+
+                self.logItem.removeHandler(
+                    log_handler
+                    )
+
+            if self._logRing is not None:
+                self._logRing.close()
+
+            if self._logHandler is not None:
+                self._logHandler.close()
+
+            # Les anciens segments de notre LOG ( cf
+            # _SegmentedLogHandler ) suivent son sort.
+            #
+            if isinstance(self._logHandler, _SegmentedLogHandler):
+                log_segments = self._logHandler.segments()
+            else:
+                log_segments = []
+
+            #
+            ################################################
+            ########## ATTENTION : Cette limite dépassée, il
+            ########## ne faut plus écrire dans le LOG car
+            ########## Python peut avoir détruit toutes les
+            ########## classes qui le gère !!!
+            ##########
+            ########## En effet, nous avons libéré ci-dessus
+            ########## la dernière dépendance à celui-ci, si
+            ########## nous n'avions pas demandé à ce que le
+            ########## LOG apparaisse aussi à l'écran...
+            ################################################
+            #
+
+            # On va adopter un comportement final différent
+            # suivant que ce script est lancé au travers de
+            # Python IDLE ou pas.
+            #
+            #myLogFile = self.files.node(self._logFile)
+            if log_never_opened:
+                myLogFile = None
+            else:
+                myLogFile = self.files.Path(self._logFile)
+            idle_windows = 'pythonw.exe'
+
+            if idle_windows in sys.executable:
+
+                # Lorsque nous sommes sous IDLE, nous en
+                # tenons pas compte du paramètre demandant
+                # de détruire ou pas le fichier LOG...
+                #
+                # Dans ce cas, il s'agit en effet, souvent,
+                # d'une phase de mise au point d'un script,
+                # donc nous laissons quoi qu'il arrive le
+                # LOG, afin qu'il puisse être examiné.
+                #
+                # ATTENTION : Finalement, même sous IDLE, on
+                # détruit le fichier LOG si telle est le choix
+                # de l'utilisateur. En effet, même s'il s'agit
+                # de phases de mises au point, on peut avoir
+                # envie de détruire le LOG car il ne va rien
+                # nous apporter et que l'on devra le détruire
+                # à chaque nouvelle exécution...
+                #
+                #   self.shw_debug('PS: Je ne détruis pas le LOG')
+                #   self.shw_debug('')
+                #
+                if log_to_remove and myLogFile.is_file():
+
+                    self.shw_debug('Destruction du LOG même sous IDLE.')
+                    self.shw_debug('')
+
+                    myLogFile.unlink()
+
+                    for segment in log_segments:
+                        self.files.Path(segment).unlink()
+
+                # Nous sommes sous IDLE donc nous affichons
+                # seulement un message avant de rendre la
+                # main à cette console.
+                #
+                #   self.shw_debug('... et je rends la main à IDLE.')
+                #
+                self.shw_debug('Puis je rends la main à IDLE.')
+                self.shw_debug('')
+
+                # Sous IDLE, l'instruction « exit() » ci-
+                # dessous aurait aussi tué IDLE... !!!
+                #
+                # exit()
+
+            else:
+    
+                # Tout s'est bien passé donc on détruit le
+                # fichier LOG, pour ne pas encombrer...
+                #
+                # On ne va toutefois pas détruire ce fichier
+                # tant que l'utilisateur n'a pas frappé la
+                # touche entrée.
+                #
+                if log_to_remove and myLogFile.is_file():
+
+                    self.shw_debug('Destruction du LOG.')
+                    self.shw_debug('')
+
+                # Nous ne sommes pas sous IDLE, donc nous
+                # marquons une pause afin que la fenêtre
+                # d'exécution ne disparaisse pas subitement.
+                #
+                if pause_to_make:
+
+                    _pause_("PRESS ENTER TO CONTINUE...",
+                            before=1, after=2)
+
+                # On a laissé le temps à l'utilisateur de
+                # consulter le fichier LOG. On peut donc
+                # le détruire.
+                #
+                if log_to_remove and myLogFile.is_file():
+
+                    myLogFile.unlink()
+
+                    for segment in log_segments:
+                        self.files.Path(segment).unlink()
+
+                self.shw_debug('FIN DU SCRIPT')
+                self.shw_debug('')
+
+                if self._we_are_inside_del_method:
+
+                    self.shw_debug(
+                        'Nous nous AUTO-DÉTRUISONS ( __del__ ).'
+                        )
+                    self.shw_debug(
+                        'Pas de « exit() » lancé : sinon cela bug !'
+                        )
+                    self.shw_debug('')
+
+                    # Nous sommes dans la méthode __del__, nous
+                    # ne pouvons lancer le « exit() » de fin.
+                    #
+                    # En effet, si on l'exécute dans __del__,
+                    # Python affiche les msgs suivants :
+                    #
+                    #       FIN DU SCRIPT
+                    #
+                    #       Exception ignored in: <function ScriptSkeleton.__del__ at 0x0000021D99CC1510>
+                    #       Traceback (most recent call last):
+                    #         File "C:\Program Files\make_movie\skeleton.py", line 167, in __del__
+                    #         File "C:\Program Files\make_movie\skeleton.py", line 729, in on_dit_au_revoir
+                    #       NameError: name 'exit' is not defined
+                    #
+                    # ... ou ( dans je ne sais plus quelle autre
+                    # configuration ) :
+                    #
+                    #       FIN DU SCRIPT
+                    #
+                    #       Exception ignored in: <function ScriptSkeleton.__del__ at 0x0000026AC1D11750>
+                    #       Traceback (most recent call last):
+                    #         File "K:\_Know\Info\Dvpt\RALISA~1\Src\_Python\my Crew History\skeleton.py", line 168, in __del__
+                    #         File "K:\_Know\Info\Dvpt\RALISA~1\Src\_Python\my Crew History\skeleton.py", line 722, in on_dit_au_revoir
+                    #         File "C:\Program Files\Python310\lib\_sitebuiltins.py", line 26, in __call__
+                    #       SystemExit: None
+                    #
+                    # exit()
+
+                else:
+
+                    self.shw_debug("Ciel ! On m'a tué...")
+                    self.shw_debug('')
+
+                    # Finalement, ici aussi nous n'exécutons plus
+                    # l'instruction « exit() » ci-dessous...
+                    #
+                    # exit()
+
+                    # Le mieux est probablement de ne pas lancer
+                    # du tout « exit() » !!!
+                    #
+                    # En effet, cf :
+                    #
+                    #   https://stackoverflow.com/questions/19747371/python-exit-commands-why-so-many-and-when-should-each-be-used/
+                    #   in _Know\Info\Dvpt\Réalisation\Langages\Python\- et - exit(), system.exit(), raise SystemExit, etc.rar
+                    #
+                    #   « Nevertheless, quit should not be used in production code.
+                    #   This is because it only works if the site module is loaded.
+                    #   Instead, this function should only be used in the interpreter.
+                    #   [..]
+                    #   However, like quit, exit is considered bad to use in production
+                    #   code and should be reserved for use in the interpreter. This is
+                    #   because it too relies on the site module. »
+                    #
+                    # Par ailleurs, si on utilise l'une ou l'
+                    # autre des syntaxes suivantes :
+                    #
+                    #   . raise SystemExit
+                    #
+                    #   . sys.exit()
+                    #
+                    # Python communiquera les msgs suivants :
+                    #
+                    #       FIN DU SCRIPT
+                    #
+                    #       Exception ignored in: <function ScriptSkeleton.__del__ at 0x000002DBEEB616C0>
+                    #       Traceback (most recent call last):
+                    #         File "K:\_Know\Info\Dvpt\RALISA~1\Src\_Python\my Crew History\skeleton.py", line 176, in __del__
+                    #         File "K:\_Know\Info\Dvpt\RALISA~1\Src\_Python\my Crew History\skeleton.py", line 730, in on_dit_au_revoir
+                    #       SystemExit:
+                    #
+                    # DONC, FINALEMENT, DANS CETTE BRANCHE, ON
+                    # NE FAIT PLUS RIEN ( à part des msgs ) !!!
+                    #
+                    # On pourrait même virer tout le code de
+                    # cette fonction à partir du dernier :
+                    #
+                    #       if self._we_are_inside_del_method:
+                    #
+                    # J'ai toutefois gardé tout ce code et ces
+                    # infos ( commentaires ) pour me souvenir
+                    # de tout cela.
+                    #
+
+        # Tout ce qui attend encore dans notre tampon d'affichage doit
+        # apparaître avant que nous ne rendions la main.
+        #
+        self.flush_screen()
+
+
+# ---------------------------------------------------------------------------
+#
+#   PARTIE :
+#   ~~~~~~~~
+#   Fonctions spécifiques à l'OPERATING SYSTEM ( bip, shutdown, ... ).
+#
+# ---------------------------------------------------------------------------
+
+
+    def on_sonne_le_reveil(self):
+        """ Pour émettre un "beep" afin de prévenir l'utilisateur qu'une action
+        lui est demandée...
+
+        :return:
+        """
+
+        log = self.logItem
+
+        player = self.get_paths_and_miscellaneous('EXE_player')
+
+        if player is None:
+
+            # Sur la plupart des OS, on utilise une commande
+            # très générique, ie envoyer le caractère ASCII
+            # \a sur le port de sortie...
+            #
+            sys.stdout.write('\a')
+            sys.stdout.flush()
+
+        else:
+
+            # Sur certains OS, on utilise un logiciel audio,
+            # qui va jouer un fichier bien précis.
+            #
+            # Ainsi, sous Windows XP, on joue un son d'une autre
+            # façon que "\a" ci-dessous, car le son généré par 1
+            # "\a" y est peu audible...
+            #
+            # Jouer une mélodie via un player a pour avantage que
+            # le son est réglable et que cela marche sur un PC de
+            # bureau comme sur un portable...
+            #
+            cmd_line = [player]
+
+            args = self.get_paths_and_miscellaneous('ARG_player')
+
+            if args is None:
+                pass
+
+            elif type(args) in (list, tuple):
+
+                cmd_line += args
+                #cmd_line += list(args)
+                #
+                # Si "args" est un tuple :
+                #
+                #   cmd_line += args
+                #
+                # ... est compris par Python.
+                #
+                # Par contre, dans ce même cas :
+                #
+                #   cmd_line = cmd_line + args
+                #
+                # ... provoquera une exception !!!
+                #
+                #   >>> args=('-f', 456,'param', 56)
+                #   >>> cmd = ['player']
+                #   >>> cmd = cmd + args
+                #   Traceback (most recent call last):
+                #     File "<pyshell#2>", line 1, in <module>
+                #       cmd = cmd + args
+                #   TypeError: can only concatenate list (not "tuple") to list
+                #   >>> cmd += args
+                #   >>> cmd
+                #   ['player', '-f', 456, 'param', 56]
+                #
+
+            else:
+                cmd_line.append(args)
+
+            played = self.get_paths_and_miscellaneous('EXE_played')
+
+            if played is None:
+                pass
+
+            else:
+                cmd_line.append(played)
+
+            self.shw_debug(f'Player\t= {player}')
+            self.shw_debug(f'Played\t= {played}')
+            self.shw_debug(f'Args  \t= {args}')
+            self.shw_debug(f'liste?\t= {isinstance(args, list)}')
+            self.shw_debug('')
+
+            log.debug("Commande exécutée = %s", cmd_line)
+
+            process = subprocess.Popen(cmd_line)
+            log.debug('Code Retour : « %s ».', process.returncode)
+            log.debug('')
+
+
+    def shutdown_please(
+        self,
+        how: str = None
+        ):
+        """ Pour éteindre la machine hôte lorsque l'on est sous Windows.
+    
+        Cette fonction ne marche pas dans tous les cas, il faut les privilèges
+        "root" pour cela...
+    
+        Sinon, sous Windows, il faut écrire une fonction plus compliquée qui
+        utilise les modules win32security & win32api.
+    
+        Sous Unix, Linux ou Mac OS, c'est encore autre chose...
+    
+        :param how: précisions sur la façon de réaliser l'arrêt i-e =
+            . 'complete'    : on arrête complètement la machine hôte.
+            . 'hibernate'   : on met la machine en veille prolongée.
+            . 'none'        : on ne fait rien en fait...
+    
+        :return:
+        """
+
+        log = self.logItem
+
+        if how is None:
+            log.debug('SHUTDOWN « par défaut » demandé.')
+            how = self.shutdown_dflt
+
+        log.debug('TYPE de SHUTDOWN réalisé : « %s ».', how)
+        log.debug('')
+
+        # On attendra 9 mn 33 secondes avant l'arrêt.
+        #
+        delai_9mn33_en_secondes = 573
+        delay_performed_by_system = False
+
+        if os.name.upper() == 'NT':
+
+            # On analyse la façon dont l'arrêt doit être
+            # configuré.
+            #
+            how_lower = how.lower()
+
+            if how_lower == shutdown_complete:
+
+                # On demande l'arrêt total de la machine dans 9 mn.
+                #
+                command_line = [
+                    'shutdown',
+                    '-s',
+                    '-f',
+                    '-t', str(delai_9mn33_en_secondes)
+                    ]
+
+                # La temporisation est incluse dans la commande
+                # ci-dessus, donc pas besoin que nous la prenions
+                # en charge.
+                #
+                delay_performed_by_system = True
+
+            elif how_lower == shutdown_hibernate:
+
+                # On demande l'hibernation de la machine après une
+                # temporisation.
+                #
+                # RQ : Sous Windows, la demande d'hibernation n'est
+                # pas compatible avec le paramètre de temporisation
+                # ( '-t' ). Donc on temporisera nous-mêmes avant la
+                # demande d'hibernation immédiate...
+                #
+                command_line = ['shutdown', '-h', '-f']
+                delay_performed_by_system = False
+
+            elif how_lower == shutdown_none:
+                command_line = None
+
+            else:
+                log.warning('UNSUPPORTED PARAMETER :')
+                log.warning('')
+                log.warning("Le type d'arrêt « %s » est inconnu...", how)
+                log.warning('... alors on ne fait rien !!!')
+                log.warning('')
+                command_line = None
+
+            if command_line is not None:
+
+                self.on_sonne_le_reveil()
+
+                log.info('----------- ARRET EN COURS ------------')
+                log.info('')
+
+                if delay_performed_by_system:
+
+                    log.info("Taper une touche pour annuler l'arrêt")
+                    log.info('')
+
+                else:
+
+                    log.info("Taper < CTRL + C > pour annuler l'arrêt")
+                    log.info('')
+
+                    log.debug("Cause restrictions de Windows...")
+                    log.debug("... on va dormir AVANT la demande d'hibernation.")
+                    log.debug('')
+
+                    self.shw("J'attends...")
+                    self.shw('')
+
+                    try:
+                        time.sleep(delai_9mn33_en_secondes)
+
+                    except KeyboardInterrupt:
+                        # Si l'utilisateur à frapper < CTRL + C >, on intercepte
+                        # cette interruption et on rend la main au programme, sans
+                        # mettre la machine en hibernation...
+                        #
+                        log.debug("HIBERNATION INTERROMPUE")
+                        log.debug('')
+                        command_line = None
+
+            # Si l'arrêt du système n'a pas été interrompu lors de la temporisation
+            # ci-dessus ( qui n'a elle-même eu lieu que si la command_line d'arrêt
+            # ne prend pas en charge cette temporisation ), on en vient enfin à cet
+            # arrêt.
+            #
+            if command_line is not None:
+
+                log.debug("Commande exécutée = %s", command_line)
+                log.debug('')
+
+                process = subprocess.Popen(command_line)
+
+                log.debug('Code Retour de la commande : « %s ».',
+                          process.returncode)
+                log.debug('')
+
+                # Si la temporisation a été faite par ce programme, pas besoin d'
+                # attendre une nouvelle temporisation.
+                #
+                # Par contre, si la temporisation est réalisée par le système ( et
+                # donc par la dernière commande lancée ), on va ici attendre la fin
+                # de cette temporisation...
+                #
+                if delay_performed_by_system:
+
+                    _pause_("J'attends...")
+
+                    # On annule l'arrêt si l'utilisateur l'a demandé.
+                    #
+                    command_line = ['shutdown', '-a']
+
+                    log.debug("Commande exécutée = %s", command_line)
+                    log.debug('')
+
+                    process = subprocess.Popen(command_line)
+
+                    log.debug('Code Retour de la commande : « %s ».',
+                              process.returncode)
+                    log.debug('')
+
+        else:
+            log.critical('UNSUPPORTED SYSTEM :')
+            log.critical('')
+            log.critical(
+                "La procédure d'arrêt machine pour l'OS « %s » n'est pas définie.",
+                os.name.upper()
+                )
+            log.critical('')
+
+            # On ne lève plus d'exception dans ce cas.
+            #
+            # raise AssertionError
+
+
+# ---------------------------------------------------------------------------
+#
+#   PARTIE :
+#   ~~~~~~~~
+#   - Fonctions spécifiques au TEMPS.
+#
+# ---------------------------------------------------------------------------
+
+
+    def build_now_string(
+        self,
+        desired_form: str = "%Y%m%d - %Hh%Mmn%Ss%fms"
+        ) -> str:
+        """ Fonction produisant une chaîne de caractère contenant la
+        date et l'heure au format désiré.
+        
+        :param desired_form: format voulu tel que défini dans la doc
+        Python pour la fonction « strftime() ».
+
+        :return: la chaîne désirée.
+        """
+
+        now = datetime.datetime.now()
+
+        return now.strftime(desired_form)
+
+
+# ---------------------------------------------------------------------------
+#
+#   PARTIE :
+#   ~~~~~~~~
+#   Fonctions de SAISIE de DONNÉES.
+#
+# ---------------------------------------------------------------------------
+
+
+    def ask_yes_or_no(
+        self,
+        prompt: str,
+        #
+        default = None, # Type = BOOL ou STR
+        #default: str = None,
+        #
+        # Permettre que default soit une string OU un booléen ?
+        # Afin que la fonction puisse tout simplement retourner
+        # « default », sans avoir à chercher sa correspondance
+        # dans le dictionnaire de LOCALISATION ( yes_or_no ).
+        #
+        # « default » ne serait pas typé :
+        #
+        #   default = None
+        #
+        # et son type serait testé en entrée de fonction :
+        #
+        #   if type(default) == bool:
+        #       [..]
+        #   elif type(default) == str:
+        #       [..]
+        #
+        # ... afin d'adapter notre comportement.
+        #
+        # => C'est finalement cette dernière solution qui a été
+        # retenue.
+        #
+        langage: str = 'fre',
+        retries: int = 3,
+        reminder: str = 'Please try again !',
+        play_sound: bool = None,
+        raise_on_retry_error: bool = False
+        ) -> bool:
+        """
+
+        // TODO : Cette fonction ask_yes_or_no est à RETRAVAILLER & FINALISER !!!
+
+        :param prompt: le texte de la question.
+
+        :param default: la réponse par défaut.
+        Si la valeur spécifiée est de type BOOL, on l'interprète
+        telle quelle.
+        Si la valeur spécifiée est de type STR, elle doit être une
+        des clés présentes dans notre dictionnaire de LOCALISATION
+        ( skeleton.yes_or_no ) sinon, en mode DEBUG, on lèvera une
+        exception AssertionError via l'instruction « assert ».
+        HORS du mode DEBUG, on laissera le script se poursuivre.
+
+        :param langage: le langage qui sera utilisé pour la saisie
+        ( en, fr, etc... ) afin d'interroger notre dictionnaire de
+        LOCALISATION ( skeleton.yes_or_no ) en conséquence.
+
+        :param retries: le nombre d'essais autorisés.
+
+        :param reminder: le texte à afficher si un essai échoue.
+
+        :param play_sound: faut-il « réveiller » l'utilisateur via
+        une sonnerie avant de poser la question la 1ère fois ?
+
+        :param raise_on_retry_error: faut-il lever une exception de
+        type ValueError si l'utilisateur dépasse le nombre d'essais
+        autorisés ?
+        Si FALSE, on renverra la valeur définie par défaut dès que
+        ce nombre sera dépassé.
+        Si toutefois la valeur par défaut est elle-même incorrecte,
+        alors on lèvera l'exception AssertionError via l'instruction
+        « assert » : donc en mode DEBUG seul !!!
+        HORS du mode DEBUG, toujours pour une valeur par défaut non
+        valide, le script plantera sur une exception KeyError à :
+
+            return our_yes_or_no[default]
+
+        Nous aurions pu choisir la solution d'1 fonction ask_yes_or_no
+        retournant 3 valeurs possibles : True, False, Invalid. Mais
+        cela aurait complexifié le test en retour de cette fonction,
+        qui pour l'intant peut simplement être :
+
+            if ask_yes_or_no(...):
+
+        Cette complexification ne semble pas souhaitable pour juste
+        parer à une éventualité très rare et, qui plus est, aisément
+        détectable et reproductible en mode DEBUG...
+
+        AUTRE SOLUTION POSSIBLE = Renvoyer tout simplement « default »
+        si « default » n'est pas 1 clé présente dans yes_or_no[langage].
+        Toutefois, nous sommes sûr que « default » n'est pas un booléen
+        [ retour attendu de ask_yes_or_no() ] mais plutôt de type STR.
+        Il faudrait donc avoir une valeur par défaut qui serait soit un
+        booléen, soit un STR : donc un objet dont on testerait le type
+        lors des tests sur la validité du paramètre « default ».
+
+        ==> C'est ce qui a finalement été choisi, « default » peut être
+        BOOL ou STR, mais le PB reste le MÊME s'il n'est ni l'un ni l'
+        autre, ou s'il est STR sans être une clef de yes_or_no[langage],
+        c-a-d il y aura plantage du script sur une EXCEPTION KeyError.       
+
+        :return: True ( YES ) or False ( NO ).
+        """
+
+        # On définit nos paramètres en fonction de notre mode de DEBUG personnel.
+        # ( cf ci-dessus « ATTENTION : PERSONNALISATION de notre mode DEBUG » )
+        #
+        if play_sound is None:
+            play_sound = self._debug_
+
+        # On sonne le réveil si désiré.
+        #
+        if play_sound:
+            self.on_sonne_le_reveil()
+
+        # On vérifie si nous connaissons la liste des façons de dire OUI ou NON
+        # dans le langage désiré de la réponse.
+        #
+        # Si le langage n'est pas référencé, nous présupposons l'anglais.
+        #
+        if langage not in yes_or_no.keys():
+
+            self.shw(f'Unknown language « {langage} »... Using english...')
+            self.shw('')
+            langage = 'eng'
+
+        our_yes_or_no = yes_or_no[langage]
+
+        # On vérifie la validité de la réponse par défaut.
+        #
+        # On affiche cette valeur par défaut en conséquence.
+        #
+        if default is None:
+
+            dflt_type = None
+            dflt_valid = False
+
+        else:
+
+            dflt_type = type(default)
+
+            assert dflt_type in (bool, str), (
+                "\n\t Invalid default value = Must be None, bool, or str."
+                f"\n\t Here type is = « {dflt_type} »."
+                )
+
+            if dflt_type == bool:
+
+                dflt_valid = True
+
+            elif dflt_type == str:
+
+                default = default.strip(whitespace)
+                dflt_valid = default != ''
+
+                if dflt_valid:
+
+                    assert default in our_yes_or_no.keys(), (
+                        f"\n\t Invalid default value = « {default} »"
+                        f" not in « {langage} » dictionary !"
+                        )
+
+        if dflt_valid:
+
+            prompt = f'{prompt} [« {default} » par défaut] '
+
+        # On initialise la liste des OUI & NON acceptés.
+        # ( en fonction du langage qui a été fixé ).
+        #
+        # Cette initialisation pourrait se réaliser via deux compréhensions de
+        # liste :
+        #
+        #   our_yes = [ key for key, value in our_yes_or_no.items() if value ]
+        #   our_no = [ key for key, value in our_yes_or_no.items() if not value ]
+        #
+        # ... mais on parcourt alors 2 fois la liste !
+        #
+        # Avec la solution ci-dessous ( boucle FOR ), la liste n'est parcourue
+        # qu'une seule fois.
+        #
+        # // TODO : Tester laquelle des 2 solutions est la plus rapide ???
+        #
+        # Cela dit, nous allons ensuite attendre une saisie humaine, donc la
+        # rapidité n'est pas ici un facteur discriminant !!!
+        #
+        # La solution avec une boucle FOR semble aussi la plus lisible.
+        #
+        our_yes = []
+        our_no = []
+
+        for key, value in our_yes_or_no.items():
+
+            if value:
+                our_yes.append(key)
+
+            else:
+                our_no.append(key)
+
+        # On attend & on traite la réponse de l'utilisateur.
+        #
+        while True:
+
+            answer = _input_(prompt).lower()
+            print()
+
+            if answer.strip(whitespace) == '':
+                answer = default
+
+            if answer in (True, False):
+                return answer
+
+            elif answer in our_yes_or_no.keys():
+                return our_yes_or_no[answer]
+
+            retries = retries - 1
+
+            if retries <= 0:
+
+                if raise_on_retry_error:
+
+                    raise ValueError('Too much retry...')
+
+                else:
+                    assert dflt_valid, (
+                        'Too much retry and no correct default value !'
+                        )
+
+                    self.shw('Too much retry... Using default !')
+                    self.shw('')
+
+                    return (
+                        default
+                        if dflt_type == bool 
+                        else our_yes_or_no[default]
+                        )
+
+            self.shw(reminder)
+            self.shw(f'OK = {our_yes}')
+            self.shw(f'NO = {our_no}')
+            self.shw('')
+
+
+    def choose_in_a_list(
+        self,
+        choices: list, 
+        default_choice: int = -1
+        ) -> int:
+        """ Prend en charge le choix par l'utilisateur d'une valeur dans une liste.
+    
+        Cette fonction va afficher la liste d'une manière qui permette à l'utilisateur
+        d'exprimer son choix.
+    
+        REMARQUE : Si la liste n'est constituée que d'un seul élément, alors le choix
+        est automatique & cette fonction renvoie aussitôt l'index de cet élément ( ie
+        0 donc ).
+    
+        :param choices: la liste dans laquelle une valeur doit être choisie.
+    
+        :param default_choice: index du choix par défaut. Cette valeur doit être fixée
+        à -1 si aucun choix par défaut n'est défini.
+    
+        :return: l'index dans la liste correspondant au choix ou, sinon, -1 si aucun
+        choix possible ( liste vide par exemple ).
+        """
+
+        log = self.logItem
+
+        list_length = len(choices)
+
+        # Si la liste est vide, le retour vaudra -1 car pas de choix possible.
+        # Si la liste n'a qu'1 élément, le retour vaudra 0 car 1 seul choix possible.
+        #
+        # Cela se résume en peu de mots... :
+        #
+        #       if list_length < 2:
+        #           the_choice_is = list_length - 1
+        #
+        # ... mais en fait le code s'est compliqué afin de pouvoir afficher à
+        # chaque fois la raison du choix ou du non choix.
+        #
+        if list_length == 0:
+            the_choice_is = - 1
+            log.info('Aucun choix disponible...')
+            log.info('')
+
+        elif list_length == 1:
+            the_choice_is = 0
+            log.info('Un seul choix disponible...')
+            log.info('')
+
+        # Plusieurs valeurs sont présents dans la liste donc on doit choisir.
+        #
+        # On présente pour ceci la liste à l'utilisateur afin qu'il fasse son
+        # choix.
+        #
+        else:
+            self.shw('Veuillez choisir parmi les réponses suivantes :')
+            self.shw('')
+
+            # // TODO : Il serait bon ici de limiter le nombre de réponses affichées
+            # et ceci au cas où la LISTE SERAIT TROP LONGUE. Reste à trouver comment...
+            #
+            for index, an_answer in enumerate(choices, start=0):
+                self.shw(f'{index:>3} - {an_answer}')
+            self.shw('')
+
+            # On demande son choix à l'utilisateur, i-e le n° de la réponse dans la
+            # liste affichée.
+            #
+            # Via les exceptions et des tests, on va vérifier que l'utilisateur
+            # fourni bien une réponse sous forme d'entier, et que cet entier soit
+            # compris dans les bornes des index de la liste...
+            #
+            msg = 'Veuillez indiquer le n° de la réponse choisie '
+
+            if 0 <= default_choice < list_length:
+                msg += f'( « {choices[default_choice]} » par défaut ) '
+
+            while True:
+
+                index_given = _input_(msg + ': ')
+                print()
+
+                if index_given == '' and 0 <= default_choice < list_length:
+                    the_choice_is = default_choice
+                    break
+
+                else:
+                    try:
+                        index = int(index_given)
+
+                    except ValueError:
+                        log.warning(
+                            "La donnée saisie n'est pas un entier : « %s » !!!",
+                            index_given
+                            )
+                        log.warning('')
+
+                    else:
+                        if 0 <= index < list_length:
+                            the_choice_is = index
+                            break
+
+                        else:
+                            log.warning(
+                                "Veuillez indiquer un nombre compris entre 0 et %s.",
+                                #str(list_length - 1)
+                                list_length - 1
+                                )
+                            log.warning('')
+
+            log.debug('Index choisi     : %s', the_choice_is)
+            log.debug('Valeur associée  : %s', choices[the_choice_is])
+            log.debug('')
+
+        return the_choice_is
+
+
+    def choose_in_a_dict(
+        self,
+        dict_of_choices: dict,
+        default_key: object = None,
+        restricted: bool = True
+        ) -> object:
+        """ Prend en charge le choix par l'utilisateur d'une valeur dans un dictionnaire.
+
+        Cette fonction va afficher le dictionnaire d'une manière qui permette à
+        l'utilisateur d'exprimer son choix.
+
+        REMARQUE : Si le dictionnaire n'est constitué que d'un seul élément, alors le
+        choix est automatique & cette fonction renvoie aussitôt la clé de cet élément.
+
+        :param dict_of_choices: le dictionnaire dans lequel une valeur doit être choisie.
+
+        :param default_key: clé du choix par défaut. Cette valeur doit être fixée à
+        None si aucun choix par défaut n'est défini.
+
+        :param restricted: faut-il restreindre le choix aux seules valeurs présentes
+        dans le dictionnaire, ou l'utilisateur peut-il saisir une clé inconnue ?
+        Si "restricted" vaut True, seules les valeurs du dictionnaire sont acceptées.
+
+        :return: la clé choisie ou, sinon, None si aucun choix possible ( dictionnaire
+        vide par exemple ).
+        """
+
+        log = self.logItem
+
+        dict_length = len(dict_of_choices)
+    
+        # Si le dictionnaire est vide, le retour vaudra None car pas de choix possible.
+        # Si la liste n'a qu'1 élément, le retour vaudra sa clé car 1 seul choix possible.
+        #
+        if dict_length == 0:
+            the_choice_is = None
+            log.info('Aucun choix disponible...')
+            log.info('')
+
+        elif dict_length == 1:
+            the_choice_is = list(dict_of_choices.keys())[0]
+            log.info('Un seul choix disponible...')
+            log.info('')
+
+        # Plusieurs valeurs sont présents dans le dictionnaire donc on doit choisir.
+        #
+        # On présente pour ceci le dictionnaire à l'utilisateur afin qu'il fasse son
+        # choix.
+        #
+        else:
+            self.shw('Veuillez choisir parmi les réponses suivantes :')
+            self.shw('')
+            self.shw('  N° -   CLEF   =   VALEUR')
+            self.shw(' ' + 33 * '-')
+
+            # // TODO : Il serait bon ici de limiter le nombre de réponses affichées
+            # et ceci au cas où la LISTE SERAIT TROP LONGUE. Reste à trouver comment...
+            #
+            for idx, item in enumerate(sorted(dict_of_choices.items()), start=0):
+                self.shw(f' {idx:>3} - {item[0]:>8} = {item[1]}')
+            self.shw('')
+
+            # On demande son choix à l'utilisateur, i-e le n° de la réponse dans la
+            # liste affichée.
+            #
+            # L'utilisateur peut aussi saisir directement l'une des clés ( on va
+            # considérer qu'il a saisi une clé si sa réponse n'est pas un entier
+            # compris dans la liste des index affichés ).
+            #
+            msg = 'Veuillez indiquer un n° de réponse ou une clef '
+
+            if not restricted or default_key in dict_of_choices:
+                msg += f'( « {default_key} » par défaut ) '
+ 
+            while True:
+
+                answer = _input_(msg + ': ')
+                print()
+
+                log.debug("La donnée saisie est : « %s ».", answer)
+                log.debug('')
+
+                if answer == '':
+                    # Si la réponse est vide et qu'il existe une
+                    # réponse par défaut digne de ce nom, on peut
+                    # enregistrer cette réponse.
+                    #
+                    if not restricted or default_key in dict_of_choices:
+                        the_choice_is = default_key
+                        break
+
+                else:
+                    # Par défaut, on considère que la réponse est une
+                    # clé & non un des index leur faisant face, mais
+                    # l'on va vérifier cela en analysant la réponse...
+                    #
+                    the_choice_is = answer
+
+                    try:
+                        index = int(the_choice_is)
+
+                    except ValueError:
+                        # La réponse n'est pas un entier, l'utilisateur a donc bien
+                        # voulu signifier une clé , qu'elle existe déjà ou qu'elle
+                        # soit nouvelle. On en prend bonne note...
+                        #
+                        log.debug("La réponse n'est pas un entier donc c'est une clef.")
+                        log.debug('')
+
+                    else:
+                        if 0 <= index < dict_length:
+                            # La réponse est un entier qui correspond aux index
+                            # affichés en face des clés, on retrouve donc la clé
+                            # associées.
+                            #
+                            # On pourrait pour ceci écrire :
+                            #
+                            #       list(sorted(dict_of_choices.keys()))[index]
+                            #
+                            # ... toutefois, comme c'est une autre formule qui a
+                            # été utilisée pour l'affichage, et comme on veut être
+                            # sûr que l'on retrouvera exactement la clé en face de
+                            # l'index donné, on réutilise exactement la formule qui
+                            # a servie à l'affichage pour retrouver cette clé.
+                            #
+                            the_choice_is = list(sorted(dict_of_choices.items()))[index][0]
+                            log.debug("La réponse est un index.")
+                            log.debug('')
+
+                        else:
+                            # La réponse est bien un entier, mais qui ne peut
+                            # représenter l'un des index affichés en face d'une
+                            # clé, nous allons donc supposer que l'utilisateur
+                            # a voulu signifier une clé, qu'elle existe ou qu'
+                            # elle soit nouvelle. On la retient donc.
+                            #
+                            log.debug("La réponse est un entier hors index donc une clef.")
+                            log.debug('')
+
+                    finally:
+                        # On a traduit la réponse sous forme de clé. Si cette
+                        # clé existe déjà, tout va bien ; sinon on demande
+                        # confirmation qu'il s'agit bien d'une nouvelle clé et
+                        # non d'une erreur de frappe.
+                        #
+                        # Si c'est une erreur, on reboucle...
+                        #
+                        # Si les réponses sont en fait restreintes au dictionnaire,
+                        # on reboucle aussi...
+                        #
+                        if the_choice_is in dict_of_choices:
+                            break
+
+                        else:
+                            log.warning(
+                                "« %s » n'est pas une clef connue...",
+                                #str(the_choice_is)
+                                the_choice_is
+                                )
+
+                            if restricted:
+                                # Si les clés inconnues ne sont pas autorisées, alors
+                                # on reboucle.
+                                #
+                                log.warning("... or les clefs inconnues sont interdites !")
+                                log.warning('')
+
+                            else:
+                                # Si cette nouvelle clé est confirmée par l'utilisateur,
+                                # on pourra quitter. Sinon on redemande une nouvelle
+                                # réponse...
+                                #
+                                log.warning('')
+                                prompt = 'Confirmez-vous cette réponse ?'
+
+                                if ask_yes_or_no(prompt, 'o'):
+                                    break
+
+            log.debug('Clef choisie    : %s', the_choice_is)
+            if the_choice_is in dict_of_choices:
+                log.debug(
+                    'Valeur associée : %s',
+                    dict_of_choices[the_choice_is]
+                    )
+            log.debug('')
+
+        return the_choice_is
+
+
+# ---------------------------------------------------------------------------
+#
+#   PARTIE :
+#   ~~~~~~~~
+#   Fonctions de GESTION de FICHIERS.
+#
+# ---------------------------------------------------------------------------
+
+
+    def file_system_mode(
+        self,
+        walking_mode: str = walking_via_listdir,
+        with_pathlib: str = pathlib_ignore,
+        with_fnmatch: bool = False,
+        with_glob: bool = False
+        ):
+        """
+        Cette méthode permet de modifier le fonctionnement interne
+        de ScriptSkeleton i-e notre gestion de fichiers va-t-elle
+        s'appuyer sur la librairie OS.PATH seule, ou plutôt sur les
+        modules PATHLIB, FNMATCH et GLOB ?
+
+        :param walking_mode: si ce « squelette » n'utilise que le
+        module OS.PATH, pour parcourir 1 répertoire utilisera-t-il
+        la fct os.listdir() ou os.scandir() ?
+
+            * walking_via_listdir : os.listdir() utilisée.
+
+            * walking_via_scandir : os.scandir() utilisée.
+
+            * walking_ignore : peu importe ( cas où un autre module
+            que OS.PATH est utilisé pour gérer les fichiers... ) et
+            si nous arrivons tout de même dans une partie de code
+            utilisant cette information, la méthode par défaut ( ie
+            os.listdir() sera utilisée ).
+
+            RQ = Si les modules GLOB ou FNMATCH sont importés, cela
+            n'impose pas le walking_mode et il faut le spécifier !
+
+            RQ = Cf FileSystemTree._FileSystemLeaf.iterdir()
+
+        :param with_pathlib: ce « squelette » va-t-il s'appuyer sur
+        le module PATHLIB, ou simplement se servir de la librairie
+        OS.PATH ? Valeurs possibles :
+
+            * pathlib_ignore ( None ) : pas de module PATHLIB.
+
+            * pathlib_direct_... : module PATHLIB sans filtre.
+
+            * pathlib_deeply : module PATHLIB incorporé.
+
+        :param with_fnmatch: ce « squelette » va-t-il s'appuyer sur
+        le module FNMATCH ?
+
+        :param with_glob: ce « squelette » va-t-il s'appuyer sur le
+        module GLOB ?
+        """
+
+        log = self.logItem
+        tree_old = self.files
+
+        # Si l'un des paramètres a changé, on recréé l'objet qui nous
+        # permet d'accéder à la gestion des répertoires et fichiers.
+        #
+        if (tree_old.walking_mode == walking_mode) \
+            and (tree_old.with_pathlib == with_pathlib) \
+            and (tree_old.with_fnmatch == with_fnmatch) \
+            and (tree_old.with_glob == with_glob):
+            #
+            # Rien n'a changé donc rien à faire !!!
+            #
+            log.debug("Configuration de la GESTION des FICHIERS :")
+            log.debug('==========================================')
+            log.debug("\tAUCUN des paramètres n'a été modifié.")
+            log.debug('\tDonc pas de changement dans la gestion')
+            log.debug('\t...... des répertoires et fichiers !!!')
+            log.debug('')
+
+        else:
+            # On créé un nouvel objet de gestion des noeuds de notre
+            # système de fichiers.
+            #
+            #node_type_old = type(tree_old.node())
+            node_type_old = type(tree_old.Path())
+
+            self.files = FileSystemTree(
+                walking_mode = walking_mode,
+                with_pathlib = with_pathlib,
+                with_fnmatch = with_fnmatch,
+                with_glob = with_glob,
+                log_file = log
+                )
+
+            if self.timing is not None:
+                _instrument_methods(self.files, self.timing)
+
+            tree_new = self.files
+
+            # On inspecte les références à l'espace mémoire occupé par
+            # la variable « tree_old » ( ie l'ancien FileSystemTree ).
+            #
+            # Et ceci :
+            #
+            #   AVANT libération des _FileSystemLeaf dont nous avons
+            #   la trace.
+            #
+            # RQ : FileSystemTree pourrait garder la liste des objets
+            # _FileSystemLeaf créé, mais cela créerait vers chacun d'
+            # eux une référence qui bloquerait toute action du ramasse
+            # -miettes de Python !!!
+            #
+            if ___debug___:
+
+                # On lance le Garbage Collector pour se débarrasser
+                # des parasites type l'instruction ci-dessus :
+                #
+                #   node_type_old = type(tree_old.Path())
+                #
+                # ... qui a créé un objet _FileSystemLeaf non nommé
+                # et inatteignable.
+                #
+                # ( sinon ce Garbage Collector ne sera probablement
+                #   pas lancé avant la fin de la méthode... )
+                #
+                gc_level = gc.get_debug()
+                gc.set_debug(gc.DEBUG_LEAK)
+                gc.collect()
+
+                #msg = pprint.pformat(gc.garbage, indent=33)
+                #log.debug(f"GC uncollectables objects : {msg}")
+                #log.debug('')
+
+                # Le décompte ci-dessous contient la référence faite
+                # par « tree_old » lui-même !!! Donc on soustrait 1
+                # au décompte trouvé afin que cette référence ne soit
+                # pas prise en compte...
+                #
+                memory_refs = _find_var_refcounts_(tree_old)[0] - 1
+
+                log.debug(f"Brand new FileSystemTree  : « tree_new » species   = {type(tree_new)}")
+                log.debug(f"Brand new FileSystemTree  : « tree_new » address   = {id(tree_new)}")
+		        #log.debug(f"Brand new FileSystemTree  : « tree_new » __repr__ = {repr(tree_new)}")
+                log.debug(f"Brand new FileSystemTree  : « tree_new » __str__   = {str(tree_new)}")
+                log.debug('')
+
+                log.debug(f"Deprecated FileSystemTree : « tree_old » species   = {type(tree_old)}")
+                log.debug(f"Deprecated FileSystemTree : « tree_old » address   = {id(tree_old)}")
+                #log.debug(f"Deprecated FileSystemTree : « tree_old » __repr__ = {repr(tree_old)}")
+                log.debug(f"Deprecated FileSystemTree : « tree_old » __str__   = {str(tree_old)}")
+                log.debug(f"Deprecated FileSystemTree : _find_var_refcounts_() = {memory_refs}")
+
+                # On retrouve ces références, s'il y en a, puis nous
+                # les affichons.
+                #
+                if memory_refs:
+
+                    referrers = gc.get_referrers(tree_old)
+
+                    #msg = pprint.pformat(referrers, indent=33)
+                    #log.debug(f"Deprecated FileSystemTree : gc.get_referrers       =\n{msg}")
+                    #log.debug('')
+
+                    # Nous souhaitons exclure « tree_old » lui-même de
+                    # cette liste avant un affichage plus précis.
+                    #
+                    # Comme nous n'arrivions pas à exclure « tree_old »
+                    # via les 2 compréhensions de liste ci-dessous :
+                    #
+                    #restricted = [r for r in referrers if not r is tree_old]
+                    #restricted = [r for r in referrers if id(r) != id(tree_old)]
+                    #
+                    # ... nous sommes passés à la suivante, plus large
+                    # dans son sens :
+                    #
+                    #restricted = [r for r in referrers if type(r) != FileSystemTree]
+                    #
+                    # ... et, alors, dans la liste de ces « referrers »,
+                    # l'étrange et non localisable item du type :
+                    #
+                    #   <cell at 0x00000249579B20B0: FileSystemTree object at 0x00000249579E4690>
+                    #
+                    # ... qui y apparaissait, a disparu de la liste :
+                    #
+                    #   « restricted »
+                    #
+                    # ... tout comme de la liste :
+                    #
+                    #   « referrers » !!!
+                    #
+                    # Nous avons alors remplacé la compréhension de
+                    # liste par:
+                    #
+                    #restricted = referrers
+                    #
+                    # ... et cette ligne perturbante <cell at xxx>
+                    # n'a toujours pas réapparu !!!
+                    #
+                    # Visiblement, en prévision d'1 des 2 premières
+                    # compréhensions de liste utilisant « tree_old »,
+                    # Python créait et conservait une variable locale
+                    # fantôme que gc.get_referrers() affichait !!!
+                    #
+                    # OU, PLUTÔT, comme indiqué dans la documentation
+                    # de « gc.get_referrers() » :
+                    #
+                    #   Warning
+                    #   Care must be taken when using objects returned by get_referrers()
+                    #   because some of them could still be under construction and hence
+                    #   in a temporarily invalid state. Avoid using get_referrers() for
+                    #   any purpose other than debugging. 
+                    #
+                    #   Cf https://docs.python.org/3/library/gc.html#gc.get_referrers
+                    #
+                    # Nous avons donc supprimé tout code visant à
+                    # enlever « tree_old » de la liste car, en fait :
+                    #
+                    #   « tree_old » EST PAR CONSTRUCTION ABSENT DE
+                    #   LA LISTE gc.get_referrers( « tree_old » ) !!!
+                    #
+                    #msg = pprint.pformat(restricted, indent=33)
+                    #log.debug(f"Restricted :\n{msg}")
+                    #log.debug('')
+
+                    log.debug(f"Deprecated FileSystemTree : get_referrers (detail) =")
+
+                    #for r in restricted:
+                    for r in referrers:
+
+                        # ICI aussi « gc.get_referrers » donne de
+                        # CURIEUSES INFORMATIONS suivant la ligne
+                        # ci-dessous décommentée...
+                        #
+                        # Ainsi, si locals() est envoyé à notre fct
+                        # _find_var_names_(), le prochain appel à
+                        # « gc.get_referrers », celui situé APRÈS la
+                        # libération des _FileSystemLeaf, donnera une
+                        # référence étrange pointant vers « tree_old »
+                        # i-e qq ch comme :
+                        #
+                        #   Var TYPE     = <class 'dict'>
+                        #   [..]
+                        #   Var __repr__ = {'self': <__main__.ScriptSkeleton object at 0x000001E1AE3847D0>,
+                        #
+                        # ... alors que ScriptSkeleton est loin d'être
+                        # un dictionnaire !!!
+                        #
+                        # En fait, cette étranganté n'en est PAS DU
+                        # TOUT !!!
+                        #
+                        # Il ne s'agit pas d'un objet ScriptSkeleton
+                        # mais de son dictionnaire qui est ici désigné.
+                        #
+                        # < instance ScriptSkeleton >.__dict__ possède
+                        # en effet les couples clef-valeur suivant :
+                        #
+                        #   - 'self': <__main__.ScriptSkeleton object at 0x000001E1AE3847D0>,
+                        #   - ...
+                        #   - 'files' : <__main__.FileSystemTree object at 0x000001859F9148D0>,
+                        #   - ...
+                        #
+                        # ... et cette valeur de la clef 'files' qui
+                        # peut pointer vers un objet FileSystemTree !!!
+                        #
+                        # Ce qui est étrange, c'est que skeleton.files
+                        # pointe encore vers l'ancien FileSystemTree
+                        # alors que qq lignes plus haut, le nouveau
+                        # FileSystemTree a été réaffecté à self.files !!!
+                        #
+                        # Il s'agit probablement des « invalid state »
+                        # indiqué dans le WARNING de gc.get_referrers.
+                        #
+                        # Cf ci-dessus :
+                        #
+                        #   « OU PLUTÔT, comme indiqué dans la documentation »
+                        #
+                        #
+                        # =================
+                        # !!! ATTENTION !!!
+                        # =================
+                        #
+                        # POUR AUTANT, même quand cette référence étrange
+                        # est indiquée, AU SORTIR DE file_system_mode(),
+                        # que soit lancé ou non « gc.collect() », on voit
+                        # apparaître des messages provenant de la méthode
+                        # __del__ de FileSystemTree !!!
+                        #
+                        # DONC, en sortie de file_system_mode(), après mise
+                        # à jour des _FileSystemLeaf, aucune référence vers
+                        # l'ancien FileSystemTree n'existe, et celui-ci est
+                        # éliminé par le Garbage Collector...
+                        #
+                        # Au final, nous avons supprimé la source de cette
+                        # référence étrange, en n'utilisant plus locals(),
+                        # même si cette étrangeté n'empêchait en rien la
+                        # disparition de l'ancien FileSystemTree...
+                        #
+                        #r_names = _find_var_names_(r, locals())
+                        r_names = _find_var_names_(r)
+
+                        log.debug('')
+                        log.debug(f"{margin}Var TYPE     = {type(r)}")
+                        log.debug(f"{margin}Var _NAMES_  = {r_names}")
+                        log.debug(f"{margin}Var address  = {id(r)}")
+                        #log.debug(f"{margin}Var __repr__ = {repr(r)}")
+                        log.debug(f"{margin}Var __str__  = {str(r)[0:222]}")
+
+                #_pause_()
+                log.debug('')
+
+            #node_type_new = type(tree_new.node())
+            node_type_new = type(tree_new.Path())
+            my_dict = self.paths_and_miscellaneous
+
+            if node_type_new != node_type_old:
+
+                # Si l'on a changé le type de stockage de la description
+                # des noeuds de notre système de fichier ( pathlib.Path
+                # vs _FileSystemLeaf ) alors nous convertissons dans le
+                # dictionnaire « paths_and_miscellaneous » les valeurs
+                # qui en auraient besoin !!!
+                #
+                #   Cf « ( ! ) ATTENTION ( ! ) : Choix a été fait de stocker »
+                #
+                #
+                # =================
+                # !!! ATTENTION !!!
+                # =================
+                #
+                # PAR AILLEURS, si nous sommes dans le cas d'1 conversion
+                # de _FileSystemLeaf en pathlib.Path, cette conversion va
+                # libérer les _FileSystemLeaf existantes, et ces dernières
+                # références vers l'ancien FileSystemTree disparaîtront...
+                #
+                # DONC cet ancien FileSystemTree sera libéré, dès la fin
+                # de « def file_system_mode », lorsque « tree_old » sera
+                # détruite ( puisqu'elle sera la dernière référence à ce
+                # vieux FileSystemTree ).
+                #
+                log.critical('')
+                log.critical("\t~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~")
+                log.critical("\tMODIFICATION DU TYPE DES NOEUDS !!!")
+                log.critical("\t~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~")
+                log.critical("\t... = ATTENTION AUX EFFETS DE BORDS")
+                log.critical('')
+
+                # Faudra-t-il annuler les références des _FileSystemLeaf vers leur
+                # FileSystemTree parent, afin de faciliter la Gaarbage Collection ?
+                #
+                #kill_references = ( node_type_old == FileSystemTree._FileSystemLeaf )
+
+                for key, value in my_dict.items():
+
+                    if type(value) == node_type_old:
+
+                        log.critical("\tConversion de « %s »...", key)
+
+                        # On stocke la zone mémoire éventuellement du type _FileSystemLeaf,
+                        # afin de pouvoir, sî elle est bien de ce type, annuler ensuite la
+                        # référence qu'elle fait pointer vers son FileSystemTree parent...,
+                        # facilitant ainsi le travail du Garbage Collector.
+                        #
+                        # Nous n'annulerons cette référence qu'après l'appel str(value), qui
+                        # exécute _FileSystemLeaf.__str__, qui a besoin de cette référence.
+                        #
+                        #leaf_old = my_dict[key]
+
+                        #my_dict[key] = tree_new.node(str(value))
+                        my_dict[key] = tree_new.Path(str(value))
+
+                        # Si applicable, on fait pointer la feuille dans le vide, afin de 
+                        # libérer une des références vers l'ancien FileSystemTree, et donc
+                        # de permettre le travail du GARBAGE COLLECTOR.
+                        #
+                        #
+                        # ATTENTION :
+                        # ===========
+                        #
+                        # Il n'est plus besoin d'annuler ces références : dorénavant, dans
+                        # FileSystemTree.__new__, nous annulons la référence de _tree_last
+                        # vers l'ancien FileSystemTree même lorsqu'est sélectionné le mode
+                        # « pathlib_direct_via_module_only ». Dans tous les cas, donc, il
+                        # n'y aura plus de références vers l'ancien FileSystemTree, autres
+                        # que les feuilles dont il est le parent. Or ces feuilles, via la
+                        # conversion ci-dessus ne seront plus utilisées, elles vont alors
+                        # disparaître grâce au Garbage Collector. Une fois disparues, elles
+                        # ne pointeront plus vers l'ancien FileSystemTree, et celui-ci sera
+                        # détruit.
+                        #
+                        #if kill_references:
+                        #    leaf_old.tree = None
+
+                        # Pour vérifier la conversion, on journalise le type de l'objet créé
+                        #
+                        #log.debug("\t\t... en un objet %s.", type(my_dict[key]))
+
+                log.critical("\t~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~")
+                log.critical('')
+                log.critical('')
+
+            elif node_type_new == FileSystemTree._FileSystemLeaf:
+
+                # Si le type de stockage est tjrs le même, et que ce sont
+                # des objets _FileSystemLeaf, alors nous mettons à jour
+                # leur pointeur vers le nouveau FileSystemTree dont elles
+                # dépendent.
+                #
+                #
+                # =================
+                # !!! ATTENTION !!!
+                # =================
+                #
+                # Cela aura pour effet de libérer toutes les références
+                # vers l'ancien FileSystemLeaf, et le Garbage Collector
+                # l'éliminera alors en sortie de cette méthode.
+                #
+                log.debug('')
+                log.debug("\t~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~")
+                log.debug("\tMODIFICATION DU PÈRE DES NOEUDS !!!")
+                log.debug("\t~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~")
+                log.debug("\t... = ATTENTION AUX EFFETS DE BORDS")
+                log.debug('')
+
+                for key, value in my_dict.items():
+
+                    if type(value) == node_type_new:
+
+                        log.debug("\tMise à jour de « %s »...", key)
+
+                        my_dict[key].tree = tree_new
+
+                log.debug("\t~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~")
+                log.debug('')
+                log.debug('')
+
+            # On inspecte les références à l'espace mémoire visé par
+            # la variable « tree_old » ( ie l'ancien FileSystemTree ).
+            #
+            # Et ceci :
+            #
+            #   APRÈS libération des _FileSystemLeaf dont nous avions
+            #   la trace.
+            #
+            if ___debug___:
+
+                # On lance le Garbage Collector pour se débarrasser
+                # des parasites qui auraient été créés ci-dessus.
+                #
+                # ( sinon ce Garbage Collector ne sera probablement
+                #   pas lancé avant la fin de la méthode... )
+                #
+                gc.collect()
+                gc.set_debug(gc_level)
+
+                memory_refs = _find_var_refcounts_(tree_old)[0] - 1
+
+                log.debug(f"Deprecated FileSystemTree : « tree_old » is {repr(tree_old)}")
+                log.debug(f"Deprecated FileSystemTree : « tree_old » address   = {id(tree_old)}")
+                log.debug(f"Deprecated FileSystemTree : _find_var_refcounts_() = {memory_refs}")
+
+                # On retrouve ces références, s'il y en a.
+                #
+                if memory_refs:
+
+                    referrers = gc.get_referrers(tree_old)
+
+                    #msg = pprint.pformat(referrers, indent=33)
+                    #log.debug(f"Deprecated FileSystemTree : gc.get_referrers       =\n{msg}")
+                    #log.debug('')
+
+                    log.debug(f"Deprecated FileSystemTree : get_referrers (detail) =")
+
+                    for r in referrers:
+
+                        r_names = _find_var_names_(r)
+
+                        log.debug('')
+                        log.debug(f"{margin}Var TYPE     = {type(r)}")
+                        log.debug(f"{margin}Var _NAMES_  = {r_names}")
+                        log.debug(f"{margin}Var address  = {id(r)}")
+                        log.debug(f"{margin}Var __repr__ = {repr(r)}")
+                        log.debug(f"{margin}Var __str__  = {r}")
+
+                #_pause_()
+                log.debug('')
+
+            # On libère notre ancien FileSystemTree qui est devenu
+            # inutile. Cela nous permettra, par ailleurs, que le bon
+            # décompte du nombre de FileSystemTree « en vie » soit
+            # tenu.
+            #
+            # Cf ci-dessus dans notre « FileSystemTree.__new__ », les
+            # rmqs à :
+            #
+            #   "Création d'un objet FileSystemTree dans les autres cas :"
+            #
+            #
+            # =================
+            # !!! ATTENTION !!!
+            # =================
+            #
+            # Le code ci-dessous est INUTILE i-e :
+            #
+            #   del tree_old
+            #
+            # ... sauf peut-être en mode DEBUG, au cas où l'on veuille
+            # faire des tests supplémentaires.
+            #
+            # En effet, « tree_old » est une variable locale, qui va
+            # disparaître en même temps que cette méthode va se clore.
+            #
+            # « tree_old » étant la dernière référence vers l'ancien
+            # FileSystemTree, le Garbage Collector va l'effacer de la
+            # mémoire sans autre action de notre part...
+            #
+            # Et ceci puisque, d'après les tests, le Garbage Collector
+            # se lance en sortie de cette fonction, quoi qu'il en soit.
+            #
+            # Ce qui est LOGIQUE, puisqu'il doit nettoyer la mémoire de
+            # toutes les variables locales à cette méthode.
+            #
+            #
+            # =================
+            # !!! ATTENTION !!!
+            # =================
+            #
+            # FINALEMENT, pour l'instant, nous avons choisi de ne pas 
+            # exécuter la portion de code ci-dessous ( cf « if False » )
+            # ni donc le Garbage Collector, afin de nous retrouver en des
+            # conditions les plus normales d'exécution.
+            #
+            if False:
+            #if ___debug___:
+                
+                log.debug("Running « del tree_old » + GARBAGE COLLECTION...")
+                log.debug('')
+
+                del tree_old
+                gc.collect()
+
+            else:
+
+                log.debug("Neither « del tree_old » nor GARBAGE COLLECTION !")
+                log.debug('')
+
+
+    def search_files_from_a_mask(
+        self,
+        #directory: os.PathLike = None,
+        directory: object = None,
+        mask: str = '*',
+        recursive: bool = False,
+        ordered: bool = True,
+        workers: int = None,
+        max_in_flight: int = None
+        ) -> list:
+    	# -> list( STR ) [ ou ] list( PATHLIB.PATH )
+    	# -> dict( STR : list ) si « mask » est une liste de masques
+        """ Cherche dans un répertoire tous les FICHIERS qui
+        correspondent à un certain masque.
+
+        :param directory: le répertoire à explorer, au format
+        STRING, PATHLIB.PATH, voire _FileSystemLeaf....
+
+        :param mask: le masque de recherche, qui peut contenir
+        des « wildcards ». Ces wildcards sont soit ceux compris
+        par pathlib.glob(), glob.glob() ou fnmatch.filter(), soit
+        ceux compris par la méthode _FileSystemLeaf._fake_iglob().
+        Dans ce dernier cas, les masques de recherche interprétés
+        sont :
+
+            - « * » : tous les fichiers.
+
+            - « *.xxx » : les fichiers d'un certain type.
+
+            - « title*.m* » : masque plus complexe.
+
+            - « title_t?[0-9].m[!o]* » : masque complexe avec « ? »,
+            « [seq] » ou « [!seq] ».
+
+        Dans les autres cas ( i-e lorsque nous avons importé les
+        modules GLOB ou FNMATCH ou PATHLIB ), cf :
+
+            Cf https://docs.python.org/3/library/glob.html#glob.glob
+            Cf https://docs.python.org/3/library/fnmatch.html#fnmatch.filter
+            Cf https://docs.python.org/3/library/pathlib.html#pathlib.Path.glob
+        
+            Ce paramètre peut aussi être une LISTE ( ou un t-uple )
+            de masques : le répertoire n'est alors parcouru qu'une
+            seule fois pour tous ces masques ( sauf si nous utilisons
+            GLOB ou PATHLIB, cf _FileSystemLeaf._multi_glob() ).
+
+        :return: la liste des chemins des fichiers trouvés, au
+        format STRING ou PATHLIB.PATH, et ces fichiers seront
+        exprimés via un PATH ABSOLU.
+
+        :param recursive: faut-il aussi chercher dans TOUTE l'arbo-
+        rescence sous « directory » ? Les sous-répertoires sont alors
+        parcourus EN PARALLÈLE ( cf _walk_files_in_parallel() ), ce qui
+        est surtout utile sur des partages réseau ou de gros disques
+        d'archives, où la latence de chaque lecture de répertoire
+        prédomine. Le masque s'applique alors aux noms des fichiers
+        de chaque niveau ( il ne doit donc pas contenir « / » ou « ** » ).
+
+        :param ordered: en mode « recursive », faut-il trier le résultat
+        ( ordre déterministe ) ou le laisser dans l'ordre où les fichiers
+        ont été trouvés par nos différents threads ?
+
+        :param workers: en mode « recursive », nombre maximal de threads
+        ( par défaut, celui de concurrent.futures.ThreadPoolExecutor ).
+
+        :param max_in_flight: en mode « recursive », nombre maximal de
+        répertoires en cours de lecture simultanément ( par défaut, le
+        double de « workers » ).
+
+            Si « mask » est une liste de masques, nous renvoyons un
+            DICTIONNAIRE dont les clés sont les masques, et dont les
+            valeurs sont les listes ci-dessus ( 1 par masque ).
+
+        ATTENTION : search_files_from_a_mask() ne renvoie QUE
+        des fichiers, tout répertoire est écarté du résultat !
+
+        ATTENTION : Si notre objet ScriptSkeleton est configuré
+        afin d'utiliser le module PATHLIB ( cf notre propriété
+        « with_pathlib » ) alors la liste en retour contiendra
+        des valeurs de type PATHLIB.PATH, sinon les valeurs de
+        la liste seront de type STRING !!!
+
+            Lorsqu'il s'agit de STRINGS, nous nous assurons que
+            les valeurs retournées soient des PATHS ABSOLUS.
+
+            Si les données retournées sont de type PATHLIB.PATH,
+            les valeurs retournées seront également de type PATH
+            ABSOLU ( obtenues via leur méthode « resolve » ).
+        """
+
+        #leaf = self.files.node
+        leaf = self.files.Path
+        log = self.logItem
+
+        if directory is None:
+
+            log.debug('Pas de répertoire de recherche indiqué.')
+            log.debug('Donc ce sera le répertoire de travail.')
+
+            # On n'appelle pas ici get_paths_and_miscellaneous()
+            # car on sait que 'working_PATH_FULL' est toujours
+            # défini à ce stade...
+            #
+            dir_n = self.paths_and_miscellaneous['NOD_working']
+
+        else:
+            dir_n = leaf(directory)
+
+        log.debug('Recherche de fichiers dans : %s.', dir_n)
+
+        # Plusieurs masques : nos _FileSystemLeaf savent les rechercher
+        # en 1 seul parcours du répertoire. Sinon ( modes « pathlib_direct_...» )
+        # nous n'avons d'autre choix que de faire 1 recherche par masque.
+        #
+        if not isinstance(mask, str):
+
+            if isinstance(dir_n, FileSystemTree._FileSystemLeaf) and not recursive:
+                return dir_n._multi_glob(mask, n_type = _glob_only_files)
+
+            return {
+                m: self.search_files_from_a_mask(
+                    dir_n, m,
+                    recursive = recursive,
+                    ordered = ordered,
+                    workers = workers,
+                    max_in_flight = max_in_flight
+                    )
+                for m in dict.fromkeys(mask)
+                }
+
+        # Recherche dans toute l'arborescence, en parallèle.
+        #
+        if recursive:
+
+            if not dir_n.is_dir():
+                return []
+
+            return list(self._walk_files_in_parallel(
+                dir_n,
+                mask,
+                ordered = ordered,
+                workers = workers,
+                max_in_flight = max_in_flight
+                ))
+
+        # Si nous n'utilisons que le module OS ( ni GLOB, ni FNMATCH,
+        # ni PATHLIB ), alors c'est _fake_iglob() qui fera la recherche
+        # et elle sait filtrer elle-même les FICHIERS ( « n_type » ).
+        #
+        # Nous lui confions donc ce filtrage, plutôt que de retester
+        # chaque résultat via « leaf(n).is_file() » ci-dessous : en mode
+        # « walking_via_scandir », les noeuds fournis par iterdir() ont
+        # en effet déjà en cache leur type ( cf os.DirEntry ), donc nous
+        # économisons ainsi 1 appel système par noeud.
+        #
+        tree = self.files
+
+        if isinstance(dir_n, FileSystemTree._FileSystemLeaf) \
+            and not (tree.with_glob or tree.with_fnmatch or tree.pathlib_import):
+
+            if not dir_n.is_dir():
+                return []
+
+            return list(dir_n._fake_iglob(
+                n_type = _glob_only_files,
+                **dir_n._parse_mask(mask)
+                ))
+
+        # Nous imposons que le retour de notre fonction soit
+        # une liste.
+        #
+        # En effet, par exemple, si :
+        #
+        #   self.with_pathlib == pathlib_direct_via_path_method
+        #
+        # ... alors :
+        #
+        #   self.files.node(directory).glob(mask)
+        #   [ ou plutôt self.files.Path(directory).glob(mask) ]
+        #   = < pathlib.Path >.glob(mask)
+        #   = un itérateur !!!
+        #
+        # En effet, sous Python IDLE :
+        #
+        #   import pathlib
+        #   lst = pathlib.Path('.').glob('*')
+        #   type(lst)
+        #
+        # -> result = <class 'generator'>
+        #
+        # ... Donc, si notre appelant s'attend à avoir 1 liste
+        # qu'il puisse réutiliser, alors il sera très surpris
+        # puisqu'une fois parcourue, cette liste deviendra vide
+        # ( propriété des itérateurs qui ne conservent pas leurs
+        # valeurs et ne peuvent donc les afficher qu'une fois et
+        # une seule ) !!! 
+        #
+        # Ainsi, sous IDLE :
+        #
+        #   for i in lst: print(i)
+    	#
+        # -> result =
+    	#	skeleton { SRC }.py
+    	#	skeleton.py
+    	#
+    	# ... puis :
+    	#
+        #	list(lst)
+    	#
+        # -> result = []
+    	#
+    	# Donc lorsque nous parcourons la liste, cela la vide !!!
+    	# Ce qui est bien le principe des itérateurs / générateurs.
+	    #
+        # D'où la syntaxe :
+        #
+        #   return list(self.files.node(directory).glob(mask))
+        #   [ ou plutôt list( self.files.Path(..).glob(..) ) ]
+        #
+        # RQ : Depuis qu'1 compréhension de liste est utilisée,
+        # la syntaxe ci-dessus a disparu puisqu'1 compréhension
+        # fournit 1 liste en retour ( que sa syntaxe soit basée
+        # sur une liste ou sur un itérateur !!! ).
+        #
+        # RQ : Depuis, < _FileSystemLeaf >.glob s'est mise aussi
+        # à renvoyer un itérateur ou générateur en retour ( et
+        # seulement cela ) et dans aucun cas une liste, ce qui
+        # justifie d'autant plus que nous transformions ceci
+        # en liste au regard de ce qu'attend notre appelant...
+        #
+        #
+        #   ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+        #   !!! EXEMPLE D'UTILISATION D'UNE COMPRÉHENSION DE LISTE !!!
+        #   ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+        #
+        #
+        only_files = [
+            #
+            # Nous utilisons une « compréhension de liste » pour
+            # écarter tout répertoire du résultat. En effet, nous
+            # ne souhaitons conserver que les fichiers.
+            #
+            # node(directory).glob(mask) renvoie en effet autant
+            # des fichiers que des répertoires, puisque c'est le
+            # cas de :
+            # [ ou plutôt Path(directory).glob(mask) dorénavant ]
+            #
+            #   . pathlib.glob()
+            #   . fnmatch.filter()
+            #   . glob.iglob()
+            #   . glob.glob()
+            #
+            # ... qui ne font pas le distingo entre les fichiers
+            # et les répertoires !!!
+            #
+            # Cf :
+            #
+            #   . https://docs.python.org/3/library/pathlib.html#pathlib.Path.glob
+            #   . https://docs.python.org/3/library/fnmatch.html#fnmatch.filter
+            #   . https://docs.python.org/3/library/glob.html#glob.iglob
+            #   . https://docs.python.org/3/library/glob.html#glob.glob
+            #
+            # Seule la fonction < _FileSystemLeaf >._fake_iglob()
+            # permet d'indiquer si l'on veut récupérer tous les
+            # noeuds, les répertoires seuls, ou seulement les
+            # fichiers.
+            #
+            # Par ailleurs, nous voulons être sûrs de ne fournir
+            # que des paths ABSOLUS, d'où l'utilisation de la fct
+            # os.path.abspath() qui accepte en entrée autant des
+            # STRING que des pathlib.PATH. Ainsi, sous IDLE :
+            #
+            #   os.path.abspath('.')
+            # > 'K:\\_Know\\Info\\Dvpt\\Réalisation\\Src\\_Python\\[ skeleton ]'
+            #
+            #   pathlib.Path('.')
+            # > WindowsPath('.')
+            #
+            #   os.path.abspath(pathlib.Path('.'))
+            # > 'K:\\_Know\\Info\\Dvpt\\Réalisation\\Src\\_Python\\[ skeleton ]'
+            #
+            # La formule est donc devenue :
+            #
+            #   [ os.path.abspath(n)
+            #       for n in node(directory).glob(mask) \
+            #       if node(n).is_file() ]
+            #
+            # RQ : < FileSystemTree >.node() fournit des STRINGS
+            # ou des objets de type PATHLIB.PATH.
+            #
+            # Par la suite, pour une formulation respectueuse
+            # des différents types possibles, nous avons choisi
+            # d'écrire :
+            #
+            #   [ os.path.abspath(n) if type(n) == str else n.resolve() \
+            #     for n in node(directory).glob(mask) if node(n).is_file() ]
+            #
+            # On peut en effet tester les expresions suivantes
+            # sous IDLE :
+            #
+            #   [ os.path.abspath(n) if type(n) == str else n.resolve() \
+            #     for n in pathlib.Path().glob('*') if n.is_file() ]
+            #
+            #   [ os.path.abspath(n) if type(n) == str else n.resolve() \
+            #     for n in glob.glob('*') if os.path.isfile(n) ]
+            #
+            # Cela a considérablement alourdi la syntaxe, mais
+            # c'est à visée didactique.
+            #
+            os.path.abspath(n) if type(n) == str else n.resolve()
+                for n in dir_n.glob(mask) \
+                if leaf(n).is_file()
+            ]
+        return only_files
+
+
+    def iter_files_from_a_mask(
+        self,
+        directory: object = None,
+        mask: str = '*',
+        recursive: bool = False,
+        ordered: bool = False,
+        workers: int = None,
+        max_in_flight: int = None
+        ) -> object:
+        # -> ( générateur ) STR [ ou ] PATHLIB.PATH
+        """ Version GÉNÉRATEUR de search_files_from_a_mask() : les paths
+        ABSOLUS des fichiers trouvés sont fournis au fur et à mesure de
+        leur découverte, et non une fois la liste complète construite.
+
+        Pour des répertoires contenant des millions de fichiers, notre
+        appelant peut ainsi commencer ses traitements dès le 1er fichier
+        trouvé, sans avoir à conserver en mémoire la liste entière.
+
+        Par ailleurs, nous n'encapsulons pas chaque résultat dans un objet
+        « leaf(n) » pour tester s'il s'agit d'un fichier : ce test est fait
+        avec ce que le parcours du répertoire nous a déjà appris ( cf les
+        os.DirEntry conservés par nos _FileSystemLeaf en mode « walking_via_
+        scandir » ), ou à défaut directement sur le path trouvé.
+
+        :param directory: cf search_files_from_a_mask().
+
+        :param mask: cf search_files_from_a_mask() ( 1 seul masque ).
+
+        :param recursive: cf search_files_from_a_mask().
+
+        :param ordered: cf search_files_from_a_mask(). ATTENTION : ici, la
+        valeur par défaut est False, car un résultat trié ne peut être
+        fourni qu'une fois toute l'arborescence parcourue.
+
+        :param workers: cf search_files_from_a_mask().
+
+        :param max_in_flight: cf search_files_from_a_mask().
+
+        :return: un générateur sur les paths ABSOLUS des fichiers trouvés,
+        au format STRING ou PATHLIB.PATH ( cf search_files_from_a_mask() ).
+        """
+
+        #leaf = self.files.node
+        leaf = self.files.Path
+        log = self.logItem
+        tree = self.files
+
+        if directory is None:
+            dir_n = self.paths_and_miscellaneous['NOD_working']
+        else:
+            dir_n = leaf(directory)
+
+        log.debug('Recherche ( au fil de l\'eau ) de fichiers dans : %s.', dir_n)
+
+        if not dir_n.is_dir():
+            return
+
+        if recursive:
+
+            yield from self._walk_files_in_parallel(
+                dir_n,
+                mask,
+                ordered = ordered,
+                workers = workers,
+                max_in_flight = max_in_flight
+                )
+
+        elif isinstance(dir_n, FileSystemTree._FileSystemLeaf) \
+            and not (tree.with_glob or tree.pathlib_import):
+
+            # _fake_iglob() est déjà un générateur, et filtre elle-même
+            # les FICHIERS avec les infos fournies par iterdir(). Si nous
+            # avons l'autorisation d'utiliser FNMATCH, nous lui demandons
+            # de tester les noms via ce module ( comme le ferait glob() ).
+            #
+            s_type = _search_fnmatch if tree.with_fnmatch else None
+
+            yield from dir_n._fake_iglob(
+                n_type = _glob_only_files,
+                **dir_n._parse_mask(mask, s_type)
+                )
+
+        else:
+
+            # GLOB ou PATHLIB : les noeuds trouvés sont des STRINGS ( qui
+            # ne nous apprennent rien sur leur type ) ou des pathlib.Path
+            # que nous interrogeons directement.
+            #
+            for n in dir_n.glob(mask):
+
+                if type(n) == str:
+                    if os.path.isfile(n):
+                        yield os.path.abspath(n)
+
+                elif n.is_file():
+                    yield n.resolve()
+
+
+    def _walk_files_in_parallel(
+        self,
+        root,               # _FileSystemLeaf, pathlib.Path
+        mask: str = '*',
+        ordered: bool = True,
+        workers: int = None,
+        max_in_flight: int = None
+        ) -> object:
+        # -> ( générateur ) STR [ ou ] PATHLIB.PATH
+        """ Cherche dans toute l'arborescence sous « root » les FICHIERS
+        dont le nom correspond à « mask », en confiant la lecture de chaque
+        sous-répertoire à un pool de threads.
+
+        La lecture d'un répertoire ( os.listdir, os.scandir, pathlib, glob,
+        ... ) est surtout une attente d'entrées / sorties, pendant laquelle
+        Python libère le GIL : plusieurs threads peuvent donc attendre en
+        même temps, ce qui masque la latence des partages réseau.
+
+        Chaque répertoire est lu via notre mode de parcours habituel ( cf
+        notre FileSystemTree ), donc toutes nos configurations profitent
+        de ce parallélisme :
+
+            - dans tous les cas, 1 seule lecture par répertoire via
+            iterdir(), dont les noms sont testés avec notre masque déjà
+            analysé ( _parse_mask ) ;
+
+            - en mode « pathlib_ignore » sans GLOB ni FNMATCH, ce masque
+            est le nôtre ; sinon, il est testé via FNMATCH, comme le font
+            glob.glob() et pathlib.Path.glob().
+
+        Les liens symboliques vers des répertoires ne sont pas suivis (
+        pour éviter de boucler ).
+
+        :param root: le répertoire de départ.
+
+        :param mask: le masque de recherche ( 1 seul niveau ).
+
+        :param ordered: True pour un résultat trié ( il n'est alors fourni
+        qu'une fois l'arborescence entièrement lue ), False pour que chaque
+        fichier soit fourni dès que son répertoire a été lu.
+
+        :param workers: cf search_files_from_a_mask().
+
+        :param max_in_flight: cf search_files_from_a_mask().
+
+        :return: un générateur sur les paths ABSOLUS des fichiers trouvés.
+        """
+
+        tree = self.files
+
+        if _mask_is_recursive(mask):
+            raise ValueError(
+                    f"Mask « {mask} » must not span directory levels in recursive mode."
+                    )
+
+        # Import à la demande, car seul ce mode en a besoin.
+        #
+        import concurrent.futures
+
+        if workers is None:
+            #
+            # Valeur par défaut de ThreadPoolExecutor ( Python >= 3.8 ).
+            #
+            workers = min(32, (os.cpu_count() or 1) + 4)
+
+        if max_in_flight is None:
+            max_in_flight = 2 * workers
+
+        native = isinstance(root, FileSystemTree._FileSystemLeaf) \
+            and not (tree.with_glob or tree.with_fnmatch or tree.pathlib_import)
+
+        # Le masque est analysé 1 seule fois, ici, et non dans chacun des
+        # threads : l'objet _CompiledMask est IMMUABLE et peut donc être
+        # partagé entre eux sans risque.
+        #
+        # Hors mode natif, il est testé via FNMATCH, comme le feraient
+        # glob() et pathlib.Path.glob() : chaque répertoire n'est ainsi lu
+        # qu'1 seule fois ( iterdir ), au lieu de 2 ( glob + iterdir ).
+        #
+        if native:
+            compiled = root._parse_mask(mask)
+        else:
+            compiled = FileSystemTree._FileSystemLeaf(tree, str(root))._parse_mask(
+                mask,
+                _search_fnmatch
+                )
+
+        # glob.glob() ignore les noms commençant par « . », sauf si le
+        # masque commence lui-même par « . ».
+        #
+        glob_hidden = mask.startswith('.')
+
+        # Les noeuds fournis par iterdir() sont ABSOLUS dès que « root »
+        # l'est : nous les renvoyons alors tels quels, sans resolve() (
+        # cf aussi _fake_iglob ).
+        #
+        as_is = os.path.isabs(str(root))
+
+        def _list_one_dir(directory) -> tuple:
+            # -> ( list( fichiers trouvés ), list( sous-répertoires ) )
+
+            found = []
+            subdirs = []
+
+            skip_hidden = not glob_hidden and tree.with_glob \
+                and isinstance(directory, FileSystemTree._FileSystemLeaf)
+
+            try:
+                for node in directory.iterdir():
+
+                    # En mode « walking_via_scandir », is_dir(), is_file()
+                    # et is_symlink() n'entraînent aucun appel système.
+                    #
+                    if node.is_dir():
+                        if not node.is_symlink():
+                            subdirs.append(node)
+
+                    elif skip_hidden and node.name.startswith('.'):
+                        pass
+
+                    elif compiled.match(node.name) and node.is_file():
+
+                        if not as_is:
+                            node = node.resolve()
+
+                        # Nos _FileSystemLeaf sont renvoyés sous forme de
+                        # STRINGS, les pathlib.Path tels quels.
+                        #
+                        found.append(
+                            str(node) if isinstance(node, FileSystemTree._FileSystemLeaf)
+                            else node
+                            )
+
+            except OSError as e:
+
+                # Répertoire disparu entretemps, droits insuffisants, ...
+                # Nous ignorons ce répertoire, comme le fait os.walk().
+                #
+                if log_each:
+                    log_each('Lecture impossible de « %s » : %s', directory, e)
+
+            return found, subdirs
+
+        log_each, log_summary = self._walk_loggers()
+        t_start = time.perf_counter() if log_summary else None
+
+        if log_each:
+            log_each('Recherche PARALLÈLE de « %s » sous « %s » :', mask, root)
+            log_each('\t%s threads, %s répertoires simultanés au maximum.',
+                workers,
+                max_in_flight
+                )
+
+        waiting = [root]    # répertoires à lire
+        in_flight = {}      # futures -> répertoires en cours de lecture
+        results = []
+        nb_dirs = 0
+        nb_found = 0
+
+        with concurrent.futures.ThreadPoolExecutor(max_workers = workers) as pool:
+
+            while waiting or in_flight:
+
+                # On soumet de nouveaux répertoires tant que notre limite
+                # n'est pas atteinte.
+                #
+                while waiting and len(in_flight) < max_in_flight:
+                    directory = waiting.pop()
+                    in_flight[pool.submit(_list_one_dir, directory)] = directory
+
+                done, _ = concurrent.futures.wait(
+                    in_flight,
+                    return_when = concurrent.futures.FIRST_COMPLETED
+                    )
+
+                for future in done:
+
+                    del in_flight[future]
+                    nb_dirs += 1
+
+                    found, subdirs = future.result()
+                    waiting.extend(subdirs)
+                    nb_found += len(found)
+
+                    if ordered:
+                        results.extend(found)
+                    else:
+                        yield from found
+
+        if log_each:
+            log_each('Répertoires parcourus = %s', nb_dirs)
+
+        if log_summary:
+            elapsed = time.perf_counter() - t_start
+            log_summary(
+                'Recherche PARALLÈLE de « %s » sous « %s » : %d répertoires parcourus,'
+                ' %d fichiers retenus, en %.4f s ( %s threads ).',
+                mask,
+                root,
+                nb_dirs,
+                nb_found,
+                elapsed,
+                workers,
+                extra = {
+                    'elapsed': elapsed,
+                    'counters': {'dirs': nb_dirs, 'found': nb_found, 'workers': workers}
+                    }
+                )
+
+        if ordered:
+            yield from sorted(results)
+
+
+    def convert_to_pdf_init(
+        self
+        ) -> bool:
+        """ Conversion de fichier(s) DOCX ( ou ODT, TXT, etc )
+        en fichier(s) PDF :
+
+                PHASE D'INITIALISATION
+
+        :return: opération réussie ou non.
+        """
+
+        log = self.logItem
+        no_error = True
+
+        # Pour convertir en PDF, on va faire appel à LibreOffice.
+        # En effet, le format PDF est complexe à gérer !!!
+        # Créer un PDF avec beaucoup de lignes TXT me semble
+        # compliqué !!!
+        #
+        # Cf :
+        #
+        #   _Know\Info\Dvpt\Réalisation\Langages\Python\- et - PDF.rar
+        #
+        # On lance donc dès que possible LibreOffice. Comme cela,
+        # lorsque nos traitements seront finis, ce logiciel aura
+        # certainement achevé son initialisation...
+        #
+        # Il nous suffira de communiquer avec lui pour lui demander
+        # la conversion.
+        #
+        log.debug('Initialisation de LibreOffice :')
+        log.debug('')
+
+        libre_office_exec = self.get_paths_and_miscellaneous(
+            'EXE_libre_office'
+            )
+
+        if libre_office_exec is None:
+            no_error = False
+
+        else:
+
+            log.debug('... i-e lancement de : « %s »', libre_office_exec)
+            log.debug('')
+
+            command_line = [
+                libre_office_exec,
+                #
+                # --headless permet de lancer LibreOffice sans son
+                # interface utilisateur. ( Starts in "headless mode"
+                # which allows using the application without user
+                # interface. This special mode can be used when the
+                # application is controlled by external clients via
+                # the API https://api.libreoffice.org/ )
+                #
+                '--headless',
+                '--nocrashreport',
+                '--nodefault',
+                '--nofirststartwizard',
+                '--nolockcheck',
+                '--nologo',
+                '--norestore'
+                ]
+
+            log.debug("Commande exécutée = %s", command_line)
+            log.debug('')
+
+            # On utilise Popen() car run() attend lui que Libre
+            # Office nous rende la main, ce qu'il ne fait que si
+            # on le ferme... puisqu'on ne lui demande rien de
+            # spécifique à faire et que donc Libre Office garde
+            # la main !!!
+            #
+            #   process = subprocess.run(command_line)
+            #
+            # Cela dit, il doit y avoir un paramètre de run() qui
+            # permet cela.
+            #
+            process = subprocess.Popen(command_line)
+
+            log.debug('Code Retour : « %s ».', process.returncode)
+            log.debug('')
+
+        return no_error
+
+
+    def convert_to_pdf_run(
+        self,
+        *args,
+        wait: bool = True
+        ) -> bool:
+        """ Conversion de fichier(s) DOCX ( ou ODT, TXT, etc )
+        en fichier(s) PDF :
+
+                PHASE DE CONVERSION
+
+        :param *args: tuple des fichiers à convertir, dont les
+        path seront du type STRING ou PATHLIB.PATH....
+
+        :param wait: attend-t-on la fin de la conversion pour
+        rendre la main à la fonction appelante ? ou pas...
+
+        :return: opération réussie ou non.
+        """
+
+        log = self.logItem
+        no_error = True
+
+        # On demande à LibreOffice de convertir nos fichiers
+        # en PDF.
+        #
+        # Pour ceci, j'ai choisi de simplement relancer Libre
+        # Office avec les paramètres adéquats. Comme il est
+        # déjà en tâche de fond ( grâce à l'initialisation via
+        # convert_to_pdf_init ), Libre Office va alors attraper
+        # cet appel et le réaliser...
+        #
+        # RQ : Si convert_to_pdf_init() n'a pas été déjà lancée,
+        # pas de souci... Ça marchera, quand même, mais ce sera
+        # certainement bien plus long car il faudra attendre le
+        # lancement de LibreOffice.
+        #
+        log.debug("Conversion de fichier(s) en PDF via LibreOffice :")
+        log.debug('')
+
+        libre_office_exec = self.get_paths_and_miscellaneous(
+            'EXE_libre_office'
+            )
+
+        if libre_office_exec is None:
+            no_error = False
+
+        else:
+
+            # Cf https://wiki.openoffice.org/wiki/API/Tutorials/PDF_export
+            # Cf https://www.libreofficehelp.com/batch-convert-writer-documents-pdf-libreoffice/
+            # Cf https://stackoverflow.com/questions/30349542/command-libreoffice-headless-convert-to-pdf-test-docx-outdir-pdf-is-not
+            #
+            #   --convert-to pdf:writer_pdf_Export:{"Magnification":{"type":"long","value":"2"}}
+            #   --convert-to pdf:writer_pdf_Export:{"Zoom":{"type":"long","value":"75"}}
+            #
+            format_cible = 'pdf:writer_pdf_Export'
+            #format_cible += ':{'
+            #format_cible += '"Magnification":{"type":"long","value":"4"}'
+            #format_cible += ','
+            #format_cible += '"Zoom":{"type":"long","value":"75"}'
+            #format_cible += '}'
+            #
+            # Je n'ai pas réussi à faire fonctionner les configurations PDF
+            # ci-dessus... Il faut probablement utiliser les UNO tools pour
+            # finement choisir nos paramètres.
+            #
+            # Cf - et - Communications ( pipe, socket ).rar\UNO tools = unotools-0.3.3\
+            # in _Know\Info\Dvpt\Réalisation\Langages\Python\
+            #
+            # L'utilisation des UNO tools PERMETTRAIT PAR EXEMPLE DE CHOISIR
+            # LA FONT POUR CONVERSION D'UN FICHIER .TXT vers PDF, ODT, ...
+            #
+
+            for file_in in args:
+
+                command_line = [
+                    libre_office_exec,
+                    #
+                    # --invisible :
+                    #
+                    #   Drapeau que j'utilisais dans mon ancien batch DOS
+                    #   "INVENTAIRE - #NotSynchronized.bat" ie je lançais :
+                    #
+                    #   SET LiO_DEFAULT="C:\Program Files\LibreOffice 5\program\soffice.exe"
+                    #   [..]
+                    #   SET LibreOffice=%LiO_DEFAULT%
+                    #   SET NOM_LENOVO_S340=BONZZZ-7
+                    #   SET LiO_LENOVO_S340="C:\Program Files\LibreOffice\program\soffice.exe"
+                    #   [..]
+                    #   IF '%PC_NAME%' == '%NOM_LENOVO_S340%' SET LibreOffice=%LiO_LENOVO_S340%
+                    #   [..]
+                    #   %LibreOffice% --invisible macro:///Standard.Convert.ConvertTXTtoPDF(%RESULT_FILE_TXT%)
+                    #
+                    # ... mais que j'ai finalement retiré car, après, si
+                    # je souhaitais lancer LibreOffice en interactif, je
+                    # n'y avais plus accès, à moins de tuer chaque process
+                    # LibreOffice avant de le lancer !
+                    #
+                    #'--invisible',
+                    '--convert-to', format_cible,
+                    '--outdir', '.',
+                    str(file_in)
+                    ]
+
+                log.debug("Fichier à traiter = %s", file_in)
+                log.debug("Commande exécutée = %s", command_line)
+
+                if wait:
+
+                    # Il est ici demandé que convert_to_pdf_run()
+                    # garde la main tant que la conversion n'est
+                    # achevée.
+                    #
+                    # J'utilise donc run() et non Popen(), car c'
+                    # est ainsi ce que LibreOffice va faire.
+                    #
+                    # C'est parfait puisque lorsque l'on va enfin
+                    # retrouver la main, on saura que la conversion
+                    # sera achevée ( et donc on sera sûr que le PDF
+                    # est bien présent... ).
+                    #
+                    log.debug('... exécution SYNCHRONE.')
+                    process = subprocess.run(command_line)
+
+                else:
+
+                    # On rend la main à l'appelant dès que l'on
+                    # a lancé la conversion, sans se soucier de
+                    # si elle est achevée ni comment...
+                    #
+                    log.debug('... exécution ASYNCHRONE.')
+                    process = subprocess.Popen(command_line)
+
+                log.debug('')
+                log.debug('Code Retour : « %s ».', process.returncode)
+                log.debug('')
+
+        return no_error
+
+
+    def edit_file_txt(
+        self,
+        *args,
+        wait: bool = True
+        ):
+        """ Édition d'un ou plusieurs fichiers au format TXT.
+
+        :param *args: tuple des fichiers à éditer, dont les
+        path seront du type STRING, PATHLIB.PATH, voire même
+        _FileSystemLeaf....
+
+        :param wait: attend-t-on la fin de l'édition pour
+        rendre la main à la fonction appelante ? ou pas...
+        """
+
+        self.shw_debug('Édition de fichier(s) TXT :')
+        self.shw_debug('')
+
+        # On retrouve l'éditeur de texte.
+        #
+        exe_txt_editor = self.get_paths_and_miscellaneous(
+            'EXE_txt_editor'
+            )
+
+        if exe_txt_editor is None:
+            pass
+        else:
+
+            for file_to_edit in args:
+
+                # On lance l'éditeur de texte avec notre fichier
+                # comme paramètre.
+                #
+                command_line = [exe_txt_editor, str(file_to_edit)]
+
+                self.shw_debug(
+                    f'Fichier à traiter = {file_to_edit}'
+                    )
+                self.shw_debug(
+                    f'Commande exécutée = {command_line}'
+                    )
+
+                if wait:
+
+                    # Il est demandé que edit_file_txt() garde la
+                    # main tant que la conversion n'est achevée.
+                    #
+                    # J'utilise donc run() et non Popen(), car c'
+                    # est ainsi ce que LibreOffice va faire.
+                    #
+                    # C'est parfait puisque lorsque l'on va enfin
+                    # retrouver la main, on saura que la conversion
+                    # sera achevée ( et donc on sera sûr que le PDF
+                    # est bien présent... ).
+                    #
+                    self.shw_debug('... exécution SYNCHRONE.')
+                    process = subprocess.run(command_line)
+
+                else:
+
+                    # On rend la main à l'appelant dès que l'on
+                    # a lancé la conversion, sans se soucier de
+                    # si elle est achevée ni comment...
+                    #
+                    self.shw_debug('... exécution ASYNCHRONE.')
+                    process = subprocess.Popen(command_line)
+
+                self.shw_debug('')
+                self.shw_debug(
+                    f'Code Retour : « {process.returncode} ».'
+                    )
+                self.shw_debug('')
+
+
+    def compare_files(
+        self,
+        *args,
+        action: str = 'difference',
+        txt_compare: bool = True
+        ) -> set:
+        """ Comparaison de 2 ou plusieurs fichiers.
+
+        :param *args: tuple des fichiers à comparer, dont les
+        path seront du type STRING ou PATHLIB.PATH....
+
+        :param action: comment veut-on comparer ?
+        ( le fichier figurant en 1er constitue la RÉFÉRENCE )
+            . intersection,
+            . difference ( par défaut ),
+            . difference symétrique
+            . union.
+
+        :param txt_compare: faut-il comparer au format texte
+        ( par défaut ) ou au format binaire...
+
+        :return: le résultat de la comparaison.
+        """
+
+        if txt_compare:
+            flag = 'rt'
+        else:
+            flag = 'rb'
+
+
+        # On ouvre les 2 fichiers, on les
+        # transforme en ensembles, puis on
+        # utilise les fonctions prédéfinies
+        # sur les ensembles pour obtenir le
+        # résultat cherché...
+        #
+        with open(str(args[0]), flag) as file1:
+
+            with open(str(args[1]), flag) as file2:
+
+                if action == 'intersection':
+                    # comparaison = set(file1).intersection(file2)
+                    comparaison = set(file1) & set(file2)
+                
+                elif action == 'difference':
+                    # comparaison = set(file1).difference(file2)
+                    comparaison = set(file1) - set(file2)
+
+                elif action == 'difference symétrique':
+                    # comparaison = set(file1)
+                    #                .symmetric_difference(file2)
+                    comparaison = set(file1) ^ set(file2)
+
+                elif action == 'union':
+                    # comparaison = set(file1).union(file2)
+                    comparaison = set(file1) | set(file2)
+
+                else:
+                    raise ValueError('Unknown compare action...')
+
+
+        # On supprime les lignes vides de
+        # l'ensemble résultat.
+        #
+        comparaison.discard('\n')
+
+        return comparaison
+
+
+    def get_unused_filename(
+        self,
+        #filename: str,
+        pattern: object,       # _FileSystemLeaf [ ou ] os.PathLike
+        file_ext: str = None,
+        idx_size: int = 3,
+        idx_start: int = 0,
+        idx_force: bool = True,
+        reserve: bool = False,
+        compressed: bool = False
+        ) -> str:
+        """ Permet de trouver un nom de fichier disponible, similaire
+        au « pattern » fourni, avec l'extension demandée.
+
+        ATTENTION : pattern contient un nom ( « basename » ) de fichier
+        AVEC OU SANS extension. L'extension cible ( « ext » ) sera, elle,
+        lue dans « file_ext ».
+
+        ATTENTION : si « file_ext » n'est pas fournie ( None ) alors nous
+        reprendrons l'extension de « pattern ». Par ailleurs, si nous est
+        fournie la chaîne vide ( « file_ext = '' » ) alors le fichier n'
+        aura aucune extension.
+
+        Quand « basename.ext » n'existe pas, nous renvoyons ce nom ( sauf
+        si idx_force = True ).
+
+        Sinon, nous renvoyons le 1er nom de fichier disponible du type :
+
+            « basename - 0###.ext » où ### est un entier.
+
+        Pour le trouver, nous listons 1 seule fois le répertoire ( plutôt
+        que de tester l'existence de chaque index, l'un après l'autre ).
+
+        RQ : Si nous réservons ce nom ( cf « reserve » ), nous gardons en
+        cache ( cf _unused_names_cache ) l'index réservé : tant que le
+        répertoire n'est pas modifié par ailleurs, les appels suivants n'
+        ont alors plus besoin de le lister.
+
+        :param pattern: le modèle de nom ( AVEC OU SANS EXTENSION ).
+
+        :param file_ext: l'extension cible ( cf ci-dessus ).
+
+        :param idx_size: le nombre minimum de caractères dont doit être
+        composé l'index ajouté ( s'il existe ). Par exemple, si idx_size
+        vaut 2, nous aurons possiblement à minima en sortie =
+
+            « basename - 00.ext »
+            ( si « basename.ext » existe ou « idx_force = True » ).
+
+        :param idx_start: faut-il commencer notre recherche de suffixe
+        à 0, à 1, ... ? C-a-d « basename - 0.ext » conviendrait-il ?
+        Ou faut-il « basename - 1.ext » à minima ? ...
+
+        :param idx_force: faut-il ou pas forcément ajouter un index
+        à « basename » ? Si non, on pourra renvoyer « basename.ext »
+        en sortie. Si oui, nous aurons à minima en sortie un nom du
+        type « basename - #.ext »
+
+        :param reserve: faut-il créer ( vide ) le fichier renvoyé afin
+        de le réserver ? Cette création est exclusive ( O_EXCL ) : si un
+        autre processus ( ou thread ) a pris ce nom entre-temps, nous
+        passons au suivant. Sans cela, 2 appels simultanés pourraient
+        renvoyer le même nom...
+
+        :param compressed: « pattern » est-il le nom d'un fichier que nous
+        compressons ( cf save_strings_to_file ) ? Son extension est alors
+        double ( cf _split_suffixes_ ), et les index s'insèrent avant elle :
+
+            « rapport.json.gz » => « rapport - 000.json.gz »
+
+        ... alors que sinon, seule la dernière extension est prise en compte :
+
+            « photos.2024.zip » => « photos.2024 - 000.zip »
+
+        :return: le nom de fichier désiré.
+        """
+
+        #leaf = self.files.node
+        leaf = self.files.Path
+
+        # Quel que soit le type en entrée ( STRING, pathlib.Path, ... )
+        # l'appel ci-dessous construit un objet fichier.
+        #
+        node = leaf(pattern)
+        # RQ : Un fichier que nous compressons garde son extension double
+        # ( cf « compressed » ).
+        #
+        if file_ext is None and compressed:
+            ( base, ext ) = _split_suffixes_(node.name)
+        elif file_ext is None:
+            ( base, ext ) = ( node.stem, node.suffix )
+        else:
+            ( base, ext ) = ( node.stem, file_ext )
+
+        alt_node = node.with_name(base + ext)
+
+        # Pour savoir si un nom est libre... et, si demandé, le
+        # réserver de façon exclusive.
+        #
+        def is_free(candidate) -> bool:
+
+            if not reserve:
+                return not candidate.exists()
+
+            try:
+                fd = os.open(str(candidate), os.O_WRONLY | os.O_CREAT | os.O_EXCL, 0o666)
+            except FileExistsError:
+                return False
+
+            os.close(fd)
+
+            return True
+
+        # Si le fichier existe, ou si l'on veut absolument qu'un nom
+        # de fichier avec index soit renvoyé, alors nous construisons
+        # ce nom...
+        #
+        # ( Sinon le nom qui nous a été fourni est celui recherché ! )
+        #
+        if idx_force or not is_free(alt_node):
+
+            # Nous sommes ici dans le cas où nous devons construire un
+            # nom de fichier alternatif ( ie le fichier existe déjà ou
+            # cela nous est demandé d'une façon impérative ).
+            #
+            # RQ : Nous sommes obligés de doubler les accolades ( {{ et
+            # }} ) ci-dessous dans la définition de format_mask afin de
+            # signifier à cette F-STRING que nous voulons le caractère
+            # spécial accolade en tant que tel ( et que ce n'est pas un
+            # nom de variable qui va être inclus entre accolades à cet
+            # endroit )... La F-STRING ne va donc interpréter que la
+            # partie {idx_size}.
+            #
+            format_mask = f' - {{:0{idx_size}d}}'
+
+            # Nous aurions pu écrire ci-dessous :
+            #
+            #   next = lambda x: alt_node.with_stem(base + x)
+            #
+            # mais PurePath.with_stem(stem) n'existe que depuis Python
+            # version 3.9... et ne connaît pas les extensions doubles.
+            #
+            # Cf https://docs.python.org/3/library/pathlib.html#pathlib.PurePath.with_stem
+            #
+            next = lambda x: node.with_name(base + x + ext)
+
+            directory = os.path.abspath(str(node.parent))
+            key = (directory, base, ext, idx_start)
+
+            # Date de modification du répertoire ( None s'il n'existe
+            # pas ) : elle nous dit si notre cache est toujours valable.
+            #
+            def dir_mtime():
+                try:
+                    return os.stat(directory).st_mtime_ns
+                except OSError:
+                    return None
+
+            with _unused_names_lock:
+
+                hint = _unused_names_cache.get(key) if reserve else None
+
+                if hint is not None and hint[0] == dir_mtime():
+
+                    # Le répertoire n'a pas bougé depuis notre dernière
+                    # réservation : tous les index jusqu'à celle-ci sont
+                    # donc toujours pris.
+                    #
+                    used = ()
+                    suffix_n = hint[1] + 1
+
+                else:
+
+                    # Nous listons une seule fois le répertoire pour y
+                    # trouver les index déjà utilisés, sous la forme
+                    # « basename - ###.ext ».
+                    #
+                    # RQ : Nous nous contentons de comparer début et fin
+                    # de chaque nom ( plutôt qu'utiliser une expression
+                    # régulière, cf module RE ), « basename » pouvant
+                    # contenir n'importe quel caractère.
+                    #
+                    used = set()
+                    prefix = base + ' - '
+
+                    try:
+                        with os.scandir(directory) as entries:
+
+                            for entry in entries:
+
+                                name = entry.name
+
+                                if not (name.startswith(prefix) and name.endswith(ext)):
+                                    continue
+
+                                index = name[len(prefix):len(name) - len(ext)]
+
+                                if index.isdigit():
+                                    used.add(int(index))
+
+                    except FileNotFoundError:
+                        pass
+
+                    suffix_n = idx_start
+
+                while True:
+
+                    # Nous sautons les index que notre listing nous a
+                    # déjà montrés comme pris.
+                    #
+                    while suffix_n in used:
+                        suffix_n += 1
+
+                    # Nous construisons d'abord le suffix sous format de
+                    # chaîne.
+                    #
+                    # Puis nous ajoutons ce suffixe au nom de fichier.
+                    #
+                    # Nous avons séparé cette opération en deux ( nous
+                    # aurions pu utiliser .format pour tout faire en une
+                    # seule fois ) car basename peut contenir « { » ou
+                    # « } » ( ce qui ferait planter .format !!! ).
+                    #
+                    # Il aurait probablement été possible de réaliser
+                    # cette concaténation en une fois via une F-STRING,
+                    # mais c'est beaucoup moins lisible...
+                    #
+                    # RQ : En temps normal, le 1er nom testé est le bon.
+                    # Nous n'en testons d'autres que si d'autres noms ont
+                    # été pris depuis notre listing ( ou si celui-ci ne
+                    # les a pas reconnus ).
+                    #
+                    suffix = format_mask.format(suffix_n)
+                    alt_node = next(suffix)
+
+                    if is_free(alt_node):
+                        break
+
+                    suffix_n += 1
+
+                # Seul un nom réservé ( donc réellement créé ) entre
+                # dans notre cache.
+                #
+                if reserve:
+                    _unused_names_cache[key] = ( dir_mtime(), suffix_n )
+
+        # Nous retournons le nom de fichier qui convient.
+        #
+        return str(alt_node)
+
+
+    def save_strings_to_file(
+        self,
+        *args,
+        #destination: os.PathLike,
+        destination: object,       # _FileSystemLeaf [ ou ] os.PathLike
+        ok_to_erase: bool = False,
+        ask_confirm: bool = True,
+        must_be_new: bool = False,
+        new_suffix: str = ' { new version }',
+        data_type: str = None,
+        data_fmt: str = coding_default,
+        buffer_size: int = 1024 * 1024,
+        atomic: bool = False,
+        sync: bool = False,
+        compression: str = None,
+        compression_level: int = None,
+        ) -> str:
+        """ Pour sauvegarder une ou des chaînes de
+        caractères dans un fichier.
+
+        :param *args: la suite de strings à stocker.
+        Chacune d'elles peut aussi être un itérable (
+        liste, générateur, ... ) de strings : elles
+        sont alors écrites au fur et à mesure de leur
+        production, sans jamais être toutes gardées
+        en mémoire ( sauf pour le JSON, cf ci-dessous ).
+
+        :param destination: nom du fichier à créer.
+        S'il existe déjà, un nouveau nom de fichier
+        sera bâti à partir de destination, sauf si
+        ok_to_erase ci-dessous est à True.
+
+        :param ok_to_erase: True si l'on veut que le
+        fichier soit écrasé s'il existe déjà.
+
+        :param ask_confirm: True si l'on veut qu'une
+        confirmation soit demandée avant d'écraser le
+        fichier.
+
+        :param must_be_new: si l'on veut forcément que
+        le nom de fichier soit « inspiré », dérivé, du
+        nom qui nous a été fourni, sans être le même...
+        i-e s'il faut forcément créé un nouveau nom.
+
+        :param new_suffix: le suffix qui doit être accolé
+        au nom de fichier qui nous a été fourni, si l'on
+        doit bâtir un nouveau nom.
+
+        :param data_type: quel est le type du contenu
+        que nous devons sauvegarder dans le fichier ?
+        ( HTML, JSON, ... ou None ). Pour du JSON ( ou
+        du JSON LINES, cf json_lines_types ), nos args
+        sont des objets Python à sérialiser : chaque
+        itérateur ( générateur, ... ), et en JSON LINES
+        chaque liste, y est parcouru enregistrement
+        par enregistrement, sans que
+        l'ensemble n'ait à tenir en mémoire ( cf
+        _iter_json_chunks_ ).
+
+        :param data_fmt: quel est le jeu de caractères
+        du fichier à créer ? Cela nous permet surtout
+        de savoir s'il faut créer un fichier « byte »
+        ou un fichier texte...
+
+        :param buffer_size: la taille ( en octets ) du
+        tampon d'écriture : nos strings n'y sont écrites
+        qu'une fois ce tampon plein, ce qui limite le
+        nombre d'appels système pour de nombreux petits
+        morceaux.
+
+        :param atomic: faut-il écrire de façon atomique
+        ( cf _AtomicFile ) ? Le contenu est alors écrit
+        dans un fichier temporaire qui ne remplace la
+        destination qu'une fois complet : un lecteur
+        ne voit jamais de fichier partiel et, en cas
+        d'erreur ( y compris UnicodeEncodeError ), la
+        version précédente est conservée. Combiné à
+        « ok_to_erase = True », cela permet d'écraser
+        sans risque la destination plutôt que de lui
+        bâtir un nouveau nom ( cf new_suffix ).
+
+        :param sync: en mode atomique, faut-il forcer
+        l'écriture sur disque ( os.fsync ) avant de
+        remplacer la destination ?
+
+        :param compression: faut-il compresser, au fil
+        de l'eau, le fichier créé ( cf compressions et
+        _CompressedFile ) ? Son extension ( « .gz », ...
+        ) est alors ajoutée à destination si besoin.
+        « compression_auto » choisit la compression d'
+        après l'extension de destination.
+
+        :param compression_level: le niveau de cette
+        compression ( None = celui par défaut ).
+
+        :return: le nom du fichier créé (au cas où nous
+        ayions dû bâtir un nouveau nom...).
+        """
+
+        log = self.logItem
+
+        # Quelle compression ? Et donc quelle extension ?
+        #
+        if compression == compression_auto:
+
+            compression = compression_by_suffix.get(
+                os.path.splitext(str(destination))[1].lower()
+                )
+
+        elif compression is not None:
+
+            if compression not in compressions:
+                raise ValueError(f'Unknown compression « {compression} »...')
+
+            suffix = compression_suffixes[compression]
+
+            if not str(destination).lower().endswith(suffix):
+                destination = str(destination) + suffix
+
+        #node = self.files.node(destination)
+        node = self.files.Path(destination)
+        new_name = node.exists()
+
+        if new_name:
+
+            new_name = not ok_to_erase
+            
+            if ok_to_erase and ask_confirm:
+
+                msg = (
+                    'ATTENTION : Nous allons écraser'
+                    f' « {destination} » !!!'
+                    )
+
+                new_name = not self.ask_yes_or_no(msg, 'n')
+
+        if new_name or must_be_new:
+
+            # On créé un nouveau nom de fichier si celui
+            # qui nous a été donné ne peut être utilisé.
+            #
+            # RQ : Pour un fichier que nous compressons, le suffixe
+            # se place avant son extension double ( cf _split_suffixes_ ).
+            #
+            if compression is None:
+                ( stem, ext ) = ( node.stem, node.suffix )
+            else:
+                ( stem, ext ) = _split_suffixes_(node.name)
+
+            tmp_dst = stem + new_suffix + ext
+
+            file_dst = self.get_unused_filename(
+                tmp_dst,
+                idx_force = True,
+                reserve = True,
+                compressed = compression is not None
+                )
+
+        else:
+
+            # On peut se servir tel quel du nom de fichier
+            # qui nous a été fourni.
+            #
+            file_dst = str(destination)
+
+        if (data_fmt is None) or (data_fmt == coding_bytes):
+
+            # Le jeu de caractères qui nous concerne est
+            # celui des « byte strings ». Donc on ouvre
+            # notre fichier au format « b(yte) ».
+            #
+            f_actual = 'BYTES'
+            f_other = 'TEXTE'
+            f_flag = 'wb'
+
+        else:
+
+            # On ouvre notre fichier au format « t(ext) ».
+            #
+            f_actual = 'TEXTE'
+            f_other = 'BYTES'
+            f_flag = 'wt'
+
+        log.debug('Type en entrée = « %s »', data_type)
+        log.debug('Format en entrée = « %s »', data_fmt)
+        log.debug('Format en sortie = « %s »', f_flag)
+        log.debug('')
+
+        self.shw(f'Destination = {file_dst}')
+        self.shw_debug(f'Format = « {f_flag} »')
+        self.shw('')
+
+        # On transforme « None » en STRING afin de convertir
+        # notre type de données en minuscules pour faciliter
+        # les tests par la suite.
+        #
+        # RQ : some_string OR '' = some_string
+        #         None     OR '' = ''
+        #
+        # Nous pourrons ensuite comparer bien plus simplement
+        # « data_type » avec les types attendus ( 'json', ... )
+        # sans avoir à nous soucier des majuscules.
+        #
+        data_type = (data_type or '').lower()
+
+        if 'json' in data_type:
+
+            json_lines = any(t in data_type for t in json_lines_types)
+
+            log.debug("Contenu à écrire format %s", 'JSON LINES' if json_lines else 'JSON')
+            log.debug("= Nous utilisons le module JSON.")
+            log.debug('')
+
+            # Nos données sont sérialisées au fur et à mesure
+            # ( cf _iter_json_chunks_ ), en texte comme en
+            # binaire ( f_flag == 'wb' ).
+            #
+            contents = _iter_json_chunks_(
+                args,
+                lines = json_lines,
+                as_bytes = f_flag == 'wb'
+                )
+
+        else:
+
+            # Chacun de nos arguments peut être une string,
+            # ou un itérable de strings ( générateur, ... ).
+            #
+            contents = _iter_chunks_(args)
+
+        # Si nous compressons, le fichier lui-même ne contient
+        # que des BYTES ( cf _CompressedFile ).
+        #
+        raw_flag = f_flag if compression is None else 'wb'
+
+        if atomic:
+            output = _AtomicFile(file_dst, raw_flag, buffer_size, sync)
+        else:
+            output = open(file_dst, raw_flag, buffering = buffer_size)
+
+        member = os.path.basename(file_dst)
+
+        if compression is not None:
+            member = member[:-len(compression_suffixes[compression])]
+
+        with output as raw_file, _CompressedFile(raw_file, compression, compression_level, f_flag, member) as new_file:
+
+            for content in contents:
+
+                try:
+                    new_file.write(content)
+
+                except UnicodeEncodeError as erreur:
+                    # Exception qui se rencontre par exemple si l'on essaye
+                    # d'écrire dans un fichier TXT ( « wt » ) le caractère
+                    # '\U0001f496' ( ou SPARKLING HEART c-a-d ❤️ ) qui est,
+                    # pourtant, Unicode !!!
+                    #
+                    # Il suffit d'exécuter sous IDLE le code suivant pour
+                    # s'en rendre compte :
+                    #
+                    #        with open('tmp.txt', 'wt') as f:
+                    #            c = '❤'     # ou « c = '\U0001f496' »
+                    #            try:
+                    #                f.write(c)
+                    #            except UnicodeEncodeError:
+                    #                print('Caractère NON UNICODE rencontré.')
+                    #            else:
+                    #                print('Tout va bien.')
+                    #            finally:
+                    #                print('FIN !!!')
+                    #
+                    # Cf aussi les remarques concernant :
+                    #
+                    #       'https://jsonplaceholder.typicode.com/'
+                    #
+                    # ... dans nos « AUTOTESTS de REQUÊTES HTTP ».
+                    #
+                    self.shw("\t\t~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~")
+                    self.shw("\t\tATTENTION = ERREUR À L'ENREGISTREMENT")
+                    self.shw("\t\t~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~")
+                    self.shw('')
+                    self.shw(f"\t« {erreur} »")
+                    self.shw('')
+                    self.shw("\tCaractère NON UNICODE rencontré à l'enregistrement.")
+                    self.shw("\tUne partie du contenu sera ignorée, non sauvegardée.")
+                    self.shw('')
+
+                    log.debug("\tNous ne prenons pas le risque de logger ce contenu")
+                    log.debug("\t... qui pourrait faire planter le module de LOG !!!")
+                    log.debug('')
+
+                    _show_stack_(log)
+
+                    self.shw(f"\tCodage actuel pour écriture dans le fichier = « {f_actual} ».")
+                    self.shw(f"\tNe faudrait-il pas plutôt utiliser le format « {f_other} » ?")
+                    self.shw('')
+
+                    # En mode atomique, un contenu incomplet ne doit
+                    # pas remplacer la version précédente : nous
+                    # abandonnons donc l'écriture.
+                    #
+                    if atomic:
+
+                        self.shw("\tÉcriture abandonnée : la destination reste inchangée.")
+                        self.shw('')
+
+                        raise
+
+        # Combien d'octets avons-nous finalement écrits ?
+        #
+        # RQ : En mode TEXTE, c'est la taille du fichier
+        # qui nous l'indique ( nos strings y ayant été
+        # encodées ).
+        #
+        nb_bytes = os.path.getsize(file_dst)
+
+        self.shw_debug(f'Octets écrits = {nb_bytes}')
+        self.shw_debug('')
+
+        return file_dst
+
+
+# ---------------------------------------------------------------------------
+#
+#   PARTIE :
+#   ~~~~~~~~
+#   Fonctions spécifiques au WEB ( browser, HTML, HTTP, etc ).
+#
+# ---------------------------------------------------------------------------
+
+
+    # Caractères interdits dans les URL, ainsi que leur transcription.
+    #
+    # Pour une liste des caractères qui devraient être présents dans
+    # ce dictionnaire, cf :
+    #
+    #   https://en.wikipedia.org/wiki/URL_encoding
+    #
+    _url_forbiddens = {
+        ' ': '%20',
+        #
+        # Sous Firefox, lorsque l'on écrit une URL avec un « ! », ce dernier n'est
+        # pas transformé par le browser. Ainsi :
+        #
+        #   https://www.google.com/search?q=( ! )
+        #
+        # ... devient :
+        #
+        #   https://www.google.com/search?q=(%20!%20)
+        #
+        # ... donc nous ne transformons pas non plus « ! ».
+        #
+        # ATTENTION : Après l'avoir saisie, lorsque l'on observe la première URL ci-
+        # dessus dans la barre d'adresses de Firefox, on lit « ( ! ) » mais si l'on
+        # copy / paste cette URL du browser vers un éditeur de texte, apparaît alors
+        # « (%20!%20) ». L'URL a donc bien été modifiée.
+        #
+#       '!': '%21',
+        '"': '%22',
+        #
+        # Le caractère suivant « # » permet de donner des indications dans certaines
+        # URL : il ne faut donc pas le traduire !!! Ainsi, cf :
+        #
+        #   https://mybox.airfrance.fr/MyBoxWeb/accueil.do#toRead
+        #
+#       '#': '%23',
+        #
+        # Le caractère suivant « $ » permet de donner des indications dans certaines
+        # URL : il ne faudrait donc pas le traduire ??? Ainsi, cf :
+        #
+        #   http://127.0.0.1/c$/Windows/win.ini
+        #
+        # Pour autant, la fonction « quote_from_bytes » du module urllib.parse traduit
+        # ce caractère en %24. Le module pathlib, comme il utilise cette fonction, fait
+        # de même. Donc nous aussi...
+        #
+        '$': '%24',
+        #
+        # Le caractère « % » permet de coder les caractères spéciaux dans les URL :
+        # il ne faut donc pas le traduire !!! Ainsi, cf :
+        #
+        #   https://fr.search.yahoo.com/search?p=dei%20cas
+        #
+#       '%': '%25',
+        #
+        # Le caractère suivant « & » est parfois utilisé dans les URL pour, par
+        # exemple, indiquer une recherche :
+        #
+        #   https://www.google.com/search?client=firefox-b-d&q=test
+        #
+#       '&': '%26',
+        "'": '%27',
+        #
+        # Pour « ( » et « ) », cf les remarques ci-dessus relatives à « ! ».
+        #
+#       '(': '%28',
+#       ')': '%29',
+        '*': '%2A',
+        '+': '%2B',
+        ',': '%2C',
+        #
+        # Certains caractères sont parties intégrantes d'une adresse web... !!!
+        # Donc mieux vaut ne pas les traiter, sinon l'URL sera incompréhensible
+        # lors de sa lecture. C'est le cas de « / » et « : » i.e « https:// ».
+        #
+#       '/': '%2F',
+#       ':': '%3A',
+        ';': '%3B',
+        #
+        # Tout comme « & » ci-dessus, les caractères suivants « = » et « ? » font
+        # partie du langage parfois utilisé dans les URL pour une recherche.
+        #
+#       '=': '%3D',
+#       '?': '%3F',
+        '@': '%40',
+        '[': '%5B',
+        ']': '%5D',
+        #
+        # Le caractère « \ » peut être utilisé dans des requêtes, cf :
+        #
+        #   https://www.google.com/search?q=\U0001f496
+        #   https://www.google.com/search?q=%5CU0001f496
+        #   = Emoji Unicode Character 'SPARKLING HEART' (U+1F496)
+        #
+        # ... donc nous l'avons ajouté au dictionnaire alors qu'il ne se trouve
+        # pas dans la table « Reserved characters after percent-encoding » de :
+        #
+        #   https://en.wikipedia.org/wiki/URL_encoding
+        #
+        # Il se trouve par contre dans la table :
+        #
+        #   « Common characters after percent-encoding (ASCII or UTF-8 based)  »
+        #
+        # ... de cette même page.
+        #
+        '\\': '%5C',        
+    }
+
+
+    def url_to_valid(
+        self,
+        url: str
+        ) -> str:
+        """ S'assure qu'une URL soit valide, i.e ne comporte pas de caractères
+        interdits, et renvoie si nécessaire l'URL adéquate, ou l'URL inchangée
+        si elle était déjà valide.
+
+        Cf par exemple le message d'erreur suivant si l'URL contient 1 espace :
+
+            InvalidURL = URL can't contain control characters. '/my Check-Lists.py' (found at least ' ')
+
+        :return: une URL valide.
+        """
+
+        valid_url = url
+
+        # Plutôt que de nous servir de notre tableau _url_forbiddens, nous
+        # pouvions utiliser les fonctions de parsing du module urllib.parse !
+        #
+        # Cf https://docs.python.org/3/library/urllib.parse.html#url-quoting
+        # Cf https://docs.python.org/3/library/urllib.parse.html#urllib.parse.quote
+        # Cf https://docs.python.org/3/library/urllib.parse.html#urllib.parse.quote_from_bytes
+        #
+        for key, value in self._url_forbiddens.items():
+
+            if key in url:
+
+                valid_url = valid_url.replace(key, value)
+
+        return valid_url
+
+
+    def send_request_url(
+        self,
+        url: str,
+        coding: str = coding_unknown
+        ) -> (str, str, str):
+        """ Pour envoyer une requête HTTP et en recevoir le résultat.
+
+        :param url: la requête à lancer.
+
+        :param coding: l'encodage attendu de la réponse.
+
+        :return: la réponse + son type de contenu + son format.
+        Le format correspondra au format souhaité, sauf si nous avons
+        eu à le modifier. Ce qui sera par exemple le cas si celui qui
+        nous a été transmis était « coding_unknown ».
+        """
+
+        log = self.logItem
+        url_string = ''
+        url_content = None
+
+        url_valid = self.url_to_valid(url)
+        self.shw(f'URL get  = {url}')
+        self.shw(f'URL ok   = {url_valid}')
+
+        # Nous encapsulons l'URL dans la structure urllib.request.Request
+        # du module, au cas où nous souhaitions plus tard utiliser cette
+        # classe afin de transmettre des paramètres à l'URL contactée...
+        #
+        # Si nous voulions ne pas utiliser cette structure et rester simple
+        # dans nos syntaxes, il suffirait alors de directement passer à l'
+        # appel urllib.request.urlopen() ci-dessous l'adresse url_valid.
+        #
+        request = urllib.request.Request(url=url_valid)
+
+        try:
+
+            # Pour économiser les ressources, on utilise WITH... ie
+            # l'objet réponse sera libéré dès la sortie du bloc.
+            #
+            # Cf https://realpython.com/urllib-request/
+            #
+            # « Using the context manager with, you make a request and
+            # receive a response with urlopen(). Then you read the body
+            # of the response and close the response object. »
+            #
+            # « If you've fully read the response, the subsequent attempt
+            # just returns an empty bytes object even though the response
+            # isn't closed. You'd have to make the request again.
+            #
+            # In this regard, the response is different from a file object,
+            # because with a file object, you can read it multiple times by
+            # using the .seek() method, which HTTPResponse doesn't support.
+            #
+            # Even after closing a response, you can still access the headers
+            # and other metadata, though. »
+            #
+            #with urllib.request.urlopen(url_valid, timeout=3) as data:
+            with urllib.request.urlopen(request, timeout=3) as data:
+
+                # Pour savoir ce qu'est et contient « data » :
+                #
+                #   cf https://docs.python.org/3/library/urllib.request.html#module-urllib.response
+                #   cf https://docs.python.org/3/library/http.client.html#httpresponse-objects
+                #   cf https://docs.python.org/3/library/email.message.html#email.message.EmailMessage
+                #   cf https://realpython.com/urllib-request/
+                #
+                #   « The main representation of an HTTP message that
+                # you'll be interacting with when using urllib.request
+                # is the HTTPResponse object. (..)
+                #
+                # You might think that HTTPMessage is a sort of base class,
+                # which HTTPResponse inherits from, but it's not. HTTPResponse
+                # inherits directly from io.BufferedIOBase, while the HTTPMessage
+                # class inherits from email.message.EmailMessage.
+                #
+                # The EmailMessage is defined in the source code as an object
+                # that contains a bunch of headers and a payload, so it doesn't
+                # necessarily have to be an email. HTTPResponse simply uses
+                # HTTPMessage as a container for its headers.
+                #
+                # However, if you're talking about HTTP itself and not its
+                # Python implementation, then you'd be right to think about
+                # an HTTP response as a kind of HTTP message.
+                #
+                # When you make a request with urllib.request.urlopen(), you
+                # get an HTTPResponse object in return. Spend some time exploring
+                # the HTTPResponse object with pprint() and dir() to see all the
+                # different methods and properties that belong to it:
+                #
+                #   >>> from urllib.request import urlopen
+                #   >>> from pprint import pprint
+                #   >>> with urlopen("https://www.example.com") as response:
+                #   ...     type(response)
+                #   ...     pprint(dir(response))
+                #
+                data_type = type(data)
+                url_bytes = data.read()
+
+                # data.url = URL of the resource retrieved, commonly used
+                # to determine if a redirect was followed.
+                #
+                url_address = data.url
+
+                # status = Status code returned by server.
+                # ( New in version 3.9 )
+                #
+                # code = Deprecated in favor of status.
+                # ( Deprecated since version 3.9 )
+                #
+                # getstatus() = Deprecated in favor of status.
+                # ( Deprecated since version 3.9 )
+                #
+                # Cf https://docs.python.org/3.9/library/urllib.request.html#module-urllib.response
+                #
+                if hasattr(data, 'status'):
+                    url_status = data.status
+                elif hasattr(data, 'code'):
+                    url_status = data.code
+                else:
+                    url_status = data.getstatus()
+
+                # Returns the headers of the response in the form of an
+                # EmailMessage instance.
+                #
+                # Cf https://docs.python.org/3/library/email.message.html#email.message.EmailMessage
+                #
+                # HTTPMessage class inherits from email.message.EmailMessage.
+                # HTTPResponse simply uses HTTPMessage as a container for its
+                # headers.
+                #
+                # Cf https://realpython.com/urllib-request/
+                #
+                url_header = data.headers
+
+                # headers.get_content_charset() sait lire les fichiers au
+                # format HTML.
+                #
+                # Le "character encoding" n'est normalement pas spécifié
+                # dans le fichier .py, pas en tout cas à la façon d'un
+                # fichier HTML normal !!!
+                #
+                # Donc get_content_charset() ne devrait pas le lire de
+                # façon correcte si c'est un fichier script Python, bash
+                # ou autres.
+                #
+                # Dans le cas où get_content_charset() ne peut donner de
+                # réponse, il renverra « None ».
+                #
+                url_charset = url_header.get_content_charset()
+                url_content = url_header.get_content_type()
+
+        except TimeoutError:
+            self.shw('')
+            self.shw('===>> Request timed out at the SYSTEM level...')
+            self.shw('')
+
+        except http.client.InvalidURL as error:
+            self.shw('')
+            self.shw(f'===>> InvalidURL ( http.client ) = {error}')
+            self.shw('')
+
+        except http.client.NotConnected as error:
+            self.shw('')
+            self.shw(f'===>> NotConnected ( http.client ) = {error}')
+            self.shw('')
+
+        # The except HTTPError must come first, otherwise except URLError
+        # will also catch an HTTPError.
+        #
+        # Cf https://docs.python.org/3/howto/urllib2.html#wrapping-it-up
+        #
+        # Though being an exception (a subclass of URLError), an HTTPError
+        # [..]
+        #
+        # Cf https://docs.python.org/3/library/urllib.error.html#urllib.error.HTTPError
+        #
+        # FINALEMENT : le traitement des erreurs HTTPError a été reporté
+        # dans celui des erreurs URLError ( puisque HTTPError est une ss-
+        # classe de URLError ). C'est plus propre.
+        #
+        # Cf https://docs.python.org/3/howto/urllib2.html#wrapping-it-up
+        # Cf https://docs.python.org/3/howto/urllib2.html#number-2
+        #
+        #except urllib.error.HTTPError as error:
+        #    self.shw('')
+        #    self.shw(
+        #        f'===>> HTTP {error.status} ERROR = {error.reason}'
+        #        )
+        #    self.shw('')
+        #
+        except urllib.error.URLError as error:
+            self.shw('')
+
+            # On gère ici aussi bien les HTTPError que les URLError.
+            #
+            # Cf https://docs.python.org/3/library/urllib.error.html#urllib.error.URLError
+            # Cf https://docs.python.org/3/library/urllib.error.html#urllib.error.HTTPError
+            # Cf https://docs.python.org/3/howto/urllib2.html#wrapping-it-up
+            # Cf https://docs.python.org/3/howto/urllib2.html#error-codes
+            # Cf https://docs.python.org/3/library/http.server.html#http.server.BaseHTTPRequestHandler.responses
+            #
+            if isinstance(error.reason, socket.timeout):
+                self.shw('===>> Socket timeout error...')
+
+            elif hasattr(error, 'code'):
+                self.shw(
+                    f'===>> HTTP {error.code} ERROR = {error.reason}'
                     )
+                self.shw("The server couldn't fulfill the request.")
 
-                if wait:
+                # On inscrit dans le LOG le maximum d'informations
+                # concernant cette erreur...
+                #
+                if error.code in http.server.BaseHTTPRequestHandler.responses:
 
-                    # Il est demandé que edit_file_txt() garde la
-                    # main tant que la conversion n'est achevée.
-                    #
-                    # J'utilise donc run() et non Popen(), car c'
-                    # est ainsi ce que LibreOffice va faire.
-                    #
-                    # C'est parfait puisque lorsque l'on va enfin
-                    # retrouver la main, on saura que la conversion
-                    # sera achevée ( et donc on sera sûr que le PDF
-                    # est bien présent... ).
-                    #
-                    self.shw_debug('... exécution SYNCHRONE.')
-                    process = subprocess.run(command_line)
+                    msgs = http.server.BaseHTTPRequestHandler.responses[
+                        error.code
+                        ]
 
-                else:
+                    log.debug(f'Short reason = {msgs[0]}')
+                    log.debug(f'Full reason = {msgs[1]}')
 
-                    # On rend la main à l'appelant dès que l'on
-                    # a lancé la conversion, sans se soucier de
-                    # si elle est achevée ni comment...
-                    #
-                    self.shw_debug('... exécution ASYNCHRONE.')
-                    process = subprocess.Popen(command_line)
+            else:
+                self.shw(f'===>> URLError = {error.reason}')
+                self.shw("We failed to reach a server.")
 
-                self.shw_debug('')
-                self.shw_debug(
-                    f'Code Retour : « {process.returncode} ».'
-                    )
-                self.shw_debug('')
+            self.shw('')
+            log.debug(f'Error TYPE = {type(error)}')
+            log.debug(f'Reason TYPE = {type(error.reason)}')
+            log.debug('')
 
+        else:
+            # EVERYTHING WENT FINE : la requête a donné un résultat.
 
-    def compare_files(
-        self,
-        *args,
-        action: str = 'difference',
-        txt_compare: bool = True
-        ) -> set:
-        """ Comparaison de 2 ou plusieurs fichiers.
+            # On informe si l'URL originale a été redirigée vers
+            # une autre adresse.
+            #
+            # ATTENTION : Ce test ne détecte pas si le préfix http
+            # change !! Ainsi, la requête 'http://www.google.com/'
+            # est toujours remplacée par 'https://www.google.com'
+            # mais le test « url_address != url_valid » ne saura
+            # voir que le préfixe HTTP est devenu HTTPS.
+            #
+            if url_address != url_valid:
+                self.shw(f'URL real = {url_address}')
+                self.shw( '[ i.e a redirect was followed... ]')
 
-        :param *args: tuple des fichiers à comparer, dont les
-        path seront du type STRING ou PATHLIB.PATH....
+            self.shw('')
 
-        :param action: comment veut-on comparer ?
-        ( le fichier figurant en 1er constitue la RÉFÉRENCE )
-            . intersection,
-            . difference ( par défaut ),
-            . difference symétrique
-            . union.
+            log.debug(f'Status code returned by server = {url_status}')
+            log.debug(f'Content type returned by server = {url_content}')
+            log.debug(f'Content charset returned by server = {url_charset}')
+            log.debug(f'Response message translation in Python = {data_type}')
+            log.debug(f'Response headers translation in Python = {type(url_header)}')
+            log.debug("Headers' keys = %s", url_header.keys())
 
-        :param txt_compare: faut-il comparer au format texte
-        ( par défaut ) ou au format binaire...
+            # En « http: », la clé est « Last-Modified ».
+            # En « file: », la clé est « Last-modified ».
+            #
+            last_modified = None
+            for key in ('Last-Modified', 'Last-modified'):
+                if key in url_header.keys():
+                    last_modified = url_header[key]
+                    break
 
-        :return: le résultat de la comparaison.
-        """
+            log.debug('Last-Modified = %s', last_modified)
+            log.debug('')
 
-        if txt_compare:
-            flag = 'rt'
-        else:
-            flag = 'rb'
+            log.debug('Début de « url_bytes » :')
+            log.debug(url_bytes[0:99])
+            log.debug('')
 
+            self.shw(f'Coding en entrée = « {coding} »')
 
-        # On ouvre les 2 fichiers, on les
-        # transforme en ensembles, puis on
-        # utilise les fonctions prédéfinies
-        # sur les ensembles pour obtenir le
-        # résultat cherché...
-        #
-        with open(str(args[0]), flag) as file1:
+            if coding == coding_unknown:
+                coding = url_charset
 
-            with open(str(args[1]), flag) as file2:
+            self.shw(f'Coding calculé = « {coding} »')
+            self.shw('')
 
-                if action == 'intersection':
-                    # comparaison = set(file1).intersection(file2)
-                    comparaison = set(file1) & set(file2)
-                
-                elif action == 'difference':
-                    # comparaison = set(file1).difference(file2)
-                    comparaison = set(file1) - set(file2)
+            if (coding is None) or (coding == coding_bytes):
 
-                elif action == 'difference symétrique':
-                    # comparaison = set(file1)
-                    #                .symmetric_difference(file2)
-                    comparaison = set(file1) ^ set(file2)
+                # Aucun décodage à faire car le jeu de caractères
+                # qui nous concerne est celui des « byte strings ».
+                #
+                url_string = url_bytes
 
-                elif action == 'union':
-                    # comparaison = set(file1).union(file2)
-                    comparaison = set(file1) | set(file2)
+            else:
+                url_string = url_bytes.decode(coding)
 
-                else:
-                    raise ValueError('Unknown compare action...')
+            log.debug('Début de « url_string » :')
+            log.debug(url_string[0:99])
+            log.debug('')
 
+        return (url_string, url_content, coding)
 
-        # On supprime les lignes vides de
-        # l'ensemble résultat.
-        #
-        comparaison.discard('\n')
 
-        return comparaison
+# ---------------------------------------------------------------------------
+#
+#   Programme PRINCIPAL de ce module s'il est lancé en mode autonome...
+#
+# ---------------------------------------------------------------------------
 
+if __name__ == "__main__":
 
-    def get_unused_filename(
-        self,
-        #filename: str,
-        pattern: object,       # _FileSystemLeaf [ ou ] os.PathLike
-        file_ext: str = None,
-        idx_size: int = 3,
-        idx_start: int = 0,
-        idx_force: bool = True
-	    ) -> str:
-        """ Permet de trouver un nom de fichier disponible, similaire
-        au « pattern » fourni, avec l'extension demandée.
+    skull = ScriptSkeleton(
+        arguments = sys.argv,
+        debug_mode = True
+        )
 
-        ATTENTION : pattern contient un nom ( « basename » ) de fichier
-        AVEC OU SANS extension. L'extension cible ( « ext » ) sera, elle,
-        lue dans « file_ext ».
+    log = skull.logItem
 
-        ATTENTION : si « file_ext » n'est pas fournie ( None ) alors nous
-        reprendrons l'extension de « pattern ». Par ailleurs, si nous est
-        fournie la chaîne vide ( « file_ext = '' » ) alors le fichier n'
-        aura aucune extension.
 
-        Quand « basename.ext » n'existe pas, nous renvoyons ce nom ( sauf
-        si idx_force = True ).
+    # Les fichiers d'auto-test auront
+    # un nom qui débute par :
+    #
+    it_begins_with = '#_TESTS_( skeleton )'
 
-        Sinon, nous renvoyons le 1er nom de fichier disponible du type :
 
-            « basename - 0###.ext » où ### est un entier.
+    # On affiche un peu de bla-bla.
+    #
+    log.info('')
+    log.info('AUTOTESTS de : %s', __file__)
+    log.info('==============')
+    log.info('')
 
-        :param pattern: le modèle de nom ( AVEC OU SANS EXTENSION ).
 
-        :param idx_size: le nombre minimum de caractères dont doit être
-        composé l'index ajouté ( s'il existe ). Par exemple, si idx_size
-        vaut 2, nous aurons possiblement à minima en sortie =
+    # #######################################################################
+    # -----------------------------------------------------------------------
+    # #######################################################################
+    # -----------------------------------------------------------------------
+    # #######################################################################
+    #
+    log.info('')
+    log.info('\t=================================')
+    log.info('\t>>> CHOIX DE LA CONFIGURATION <<<')
+    log.info('\t=================================')
+    log.info('')
+    log.info('')
 
-            « basename - 00.ext »
-            ( si « basename.ext » existe ou « idx_force = True » ).
+    config_choice = [
+        'Module OS seul + os.listdir',
+        'Module OS seul + os.scandir',
+        'Utilisation du module GLOB',
+        'Utilisation du module FNMATCH + os.listdir',
+        'Utilisation du module FNMATCH + os.scandir',
+        'Utilisation du module PATHLIB « enfoui »',
+        'Utilisation du module PATHLIB « direct » via la MÉTHODE Path()',
+        'Utilisation du module PATHLIB « direct » via la CLASSE Path()',
+        'Utilisation du module PATHLIB « direct » via le MODULE seul',
+        ]
+
+    # Les tuples ci-dessous correspondent à l'initialisation
+    # des différentes variables ( avec l'ordre = with_glob,
+    # with_fnmatch, with_pathlib, walking_mode ) de chacune
+    # des configurations ci-dessus.
+    #
+    config_init = [
+        #
+        # Module OS seul + os.listdir
+        (False, False, pathlib_ignore, walking_via_listdir),
+        #
+        # Module OS seul + os.scandir
+        (False, False, pathlib_ignore, walking_via_scandir),
+        #
+        # Utilisation du module GLOB
+        (True,  False, pathlib_ignore, walking_via_listdir),
+        #
+        # Utilisation du module FNMATCH + os.listdir
+        (False, True,  pathlib_ignore, walking_via_listdir),
+        #
+        # Utilisation du module FNMATCH + os.scandir
+        (False, True,  pathlib_ignore, walking_via_scandir),
+        #
+        # Utilisation du module PATHLIB « enfoui »
+        (False, False, pathlib_deeply, walking_ignore),
+        #
+        # Utilisation du module PATHLIB « direct » via FileSystemTree.Path()
+        (False, False, pathlib_direct_via_path_method, walking_ignore),
+        #
+        # Utilisation du module PATHLIB « direct » via pathlib.Path()
+        (False, False, pathlib_direct_via_path_class, walking_ignore),
+        #
+        # Utilisation du module PATHLIB « direct » sans aucun filtre
+        (False, False, pathlib_direct_via_module_only, walking_ignore),
+    ]
 
-        :param idx_start: faut-il commencer notre recherche de suffixe
-        à 0, à 1, ... ? C-a-d « basename - 0.ext » conviendrait-il ?
-        Ou faut-il « basename - 1.ext » à minima ? ...
+    idx = skull.choose_in_a_list(config_choice, 0)
 
-        :param idx_force: faut-il ou pas forcément ajouter un index
-        à « basename » ? Si non, on pourra renvoyer « basename.ext »
-        en sortie. Si oui, nous aurons à minima en sortie un nom du
-        type « basename - #.ext »
+    if idx < 0:
+        skull.shw("Aucun choix n'a été fait...")
+        skull.shw('-> « OS seul + os.listdir » imposé.')
+        idx = 0
 
-        :return: le nom de fichier désiré.
-        """
+    else:
+        skull.shw(f'Votre réponse = {config_choice[idx]}')
 
-        #leaf = self.files.node
-        leaf = self.files.Path
+    skull.shw('')
 
-        # Quel que soit le type en entrée ( STRING, pathlib.Path, ... )
-        # l'appel ci-dessous construit un objet fichier.
-        #
-        node = leaf(pattern)
-        ext = node.suffix if file_ext is None else file_ext
-        alt_node = node.with_suffix(ext)
+    w_glob, w_fnmatch, w_pathlib, walking_mode = config_init[idx]
 
-        # Si le fichier existe, ou si l'on veut absolument qu'un nom
-        # de fichier avec index soit renvoyé, alors nous construisons
-        # ce nom...
-        #
-        # ( Sinon le nom qui nous a été fourni est celui recherché ! )
-        #
-        if idx_force or alt_node.exists():
+    skull.file_system_mode(
+        walking_mode = walking_mode,
+        with_pathlib = w_pathlib,
+        with_fnmatch = w_fnmatch,
+        with_glob = w_glob
+        )
 
-            # Nous sommes ici dans le cas où nous devons construire un
-            # nom de fichier alternatif ( ie le fichier existe déjà ou
-            # cela nous est demandé d'une façon impérative ).
-            #
-            # RQ : Nous sommes obligés de doubler les accolades ( {{ et
-            # }} ) ci-dessous dans la définition de format_mask afin de
-            # signifier à cette F-STRING que nous voulons le caractère
-            # spécial accolade en tant que tel ( et que ce n'est pas un
-            # nom de variable qui va être inclus entre accolades à cet
-            # endroit )... La F-STRING ne va donc interpréter que la
-            # partie {idx_size}.
-            #
-            format_mask = f' - {{:0{idx_size}d}}'
+    #leaf = skull.files.node
+    leaf = skull.files.Path
 
-            # Nous aurions pu écrire ci-dessous :
-            #
-            #   next = lambda x: alt_node.with_stem(base + x)
-            #
-            # mais PurePath.with_stem(stem) n'existe que depuis Python
-            # version 3.9...
-            #
-            # Cf https://docs.python.org/3/library/pathlib.html#pathlib.PurePath.with_stem
-            #
-            base = node.stem
-            next = lambda x: node.with_name(base + x).with_suffix(ext)
+    if (w_pathlib in pathlib_direct):
 
-            suffix_n = idx_start
+        node_file = leaf(__file__ + '.test')
 
-            while True:
+        skull.shw('\t===>>> TOUTES les méthodes de pathlib.PATH() sont alors disponibles.')
+        skull.shw('')
+        skull.shw(f'\tpath          = {node_file}')
+        skull.shw(f'\tpath.SUFFIXES = {node_file.suffixes}')
+        skull.shw(f'\tpath.PARENTS  = {len(list(node_file.parents))}'
+                    ' [ c-a-d len(list(path.parents)) ]')
 
-                # Nous construisons d'abord le suffix sous format de
-                # chaîne.
-                #
-                # Puis nous ajoutons ce suffixe au nom de fichier.
-                #
-                # Nous avons séparé cette opération en deux ( nous
-                # aurions pu utiliser .format pour tout faire en une
-                # seule fois ) car basename peut contenir « { » ou
-                # « } » ( ce qui ferait planter .format !!! ).
-                #
-                # Il aurait probablement été possible de réaliser
-                # cette concaténation en une fois via une F-STRING,
-                # mais c'est beaucoup moins lisible...
-                #
-                suffix = format_mask.format(suffix_n)
-                alt_node = next(suffix)
+        log.debug('\tcar .PARENTS  = ')
+        for parent in list(node_file.parents):
+            log.debug('\t\t%s', parent)
 
-                if not alt_node.exists():
-                    break
+        skull.shw('')
+        skull.shw('')
 
-                suffix_n += 1
+        if w_pathlib == pathlib_direct_via_module_only:
 
-        # Nous retournons le nom de fichier qui convient.
-        #
-        return str(alt_node)
+            skull.shw('\t===>>> TOUTES les classes & fonctions de PATHLIB sont même ici disponibles.')
+            skull.shw('')
+            skull.shw(f'\tPurePath        = {type(skull.files.PurePath())}')
+            skull.shw(f'\t_WindowsFlavour = {type(skull.files._WindowsFlavour())}')
+            skull.shw('')
+            skull.shw('')
 
 
-    def save_strings_to_file(
-        self,
-        *args,
-        #destination: os.PathLike,
-        destination: object,       # _FileSystemLeaf [ ou ] os.PathLike
-        ok_to_erase: bool = False,
-        ask_confirm: bool = True,
-        must_be_new: bool = False,
-        new_suffix: str = ' { new version }',
-        data_type: str = None,
-        data_fmt: str = coding_default,
-        ) -> str:
-        """ Pour sauvegarder une ou des chaînes de
-        caractères dans un fichier.
+    # #######################################################################
+    # -----------------------------------------------------------------------
+    # #######################################################################
+    # -----------------------------------------------------------------------
+    # #######################################################################
+    #
+    user_answer = skull.ask_yes_or_no(
+        "Voulez-vous que je réalise le TEST des SYNTAXES FileSystemLeaf.Path.cwd() / .home() ?",
+        'non'
+        )
 
-        :param *args: la suite de strings à stocker.
+    if user_answer:
 
-        :param destination: nom du fichier à créer.
-        S'il existe déjà, un nouveau nom de fichier
-        sera bâti à partir de destination, sauf si
-        ok_to_erase ci-dessous est à True.
+        # On teste la syntaxe utilisant des ATTRIBUTS de
+        # MÉTHODE, syntaxe utilisée à cause de l'émulation
+        # de pathlib par FileSystemTree...
+        #
+        # Ces attributs de la méthode Path dans la classe
+        # FileSystemTree sont :
+        #
+        #   - Path.cwd
+        #   - Path.home
+        #
+        # En fonction de la valeur du mode d'exécution, ns
+        # aurons les retours suivants pour Path.cwd() :
+        #
+        #   pathlib_ignore : AttributeError
+        #   pathlib_deeply : AttributeError
+        #   pathlib_direct_via_path_method : AttributeError
+        #   pathlib_direct_via_path_class  : le cwd actuel
+        #   pathlib_direct_via_module_only : le cwd actuel
+        #
+        # Idem pour Path.home().
+        #
+        log.info('')
+        log.info('\t========================================')
+        log.info('\t>>> SYNTAXES FileSystemLeaf.Path.xxx <<<')
+        log.info('\t========================================')
+        log.info('')
+        log.info('')
 
-        :param ok_to_erase: True si l'on veut que le
-        fichier soit écrasé s'il existe déjà.
+        configs = [
+            ['un seul objet FileSystemTree', False],
+            ['deux instances FileSystemTree', True],
+        ]
 
-        :param ask_confirm: True si l'on veut qu'une
-        confirmation soit demandée avant d'écraser le
-        fichier.
+        tests = {
+            'cwd' : ( ['()', leaf().cwd ],  ['', leaf.cwd ] ),
+            #'home': ( ['()', leaf().home],  ['', leaf.home] ),
+        }
 
-        :param must_be_new: si l'on veut forcément que
-        le nom de fichier soit « inspiré », dérivé, du
-        nom qui nous a été fourni, sans être le même...
-        i-e s'il faut forcément créé un nouveau nom.
+        for c in configs:
 
-        :param new_suffix: le suffix qui doit être accolé
-        au nom de fichier qui nous a été fourni, si l'on
-        doit bâtir un nouveau nom.
+            msg = f'TESTS lorsque nous avons {c[0]} en mémoire :'
 
-        :param data_type: quel est le type du contenu
-        que nous devons sauvegarder dans le fichier ?
-        ( HTML, JSON, ... ou None )
+            skull.shw(msg)
+            skull.shw('°' * len(msg))
+            skull.shw('')
+            skull.shw('')
 
-        :param data_fmt: quel est le jeu de caractères
-        du fichier à créer ? Cela nous permet surtout
-        de savoir s'il faut créer un fichier « byte »
-        ou un fichier texte...
+            if c[1]:
+                fake_tree = FileSystemTree(log_file = log)
+                log.debug('')
 
-        :return: le nom du fichier créé (au cas où nous
-        ayions dû bâtir un nouveau nom...).
-        """
+            for key, syntaxes in tests.items():
 
-        log = self.logItem
+                for liste in syntaxes:
 
-        #node = self.files.node(destination)
-        node = self.files.Path(destination)
-        new_name = node.exists()
+                    msg = f'FileSystemLeaf.Path{liste[0]}.{key}() :'
+                    fct = liste[1]
 
-        if new_name:
+                    skull.shw('\t' + msg)
+                    skull.shw('\t' + '~' * len(msg))
+                    skull.shw('')
+                    skull.shw(f'=> {key} ( @MEMOIRE ) = {fct}')
+                    skull.shw(f'=> {key} (   TYPE   ) = {type(fct)}')
 
-            new_name = not ok_to_erase
-            
-            if ok_to_erase and ask_confirm:
+                    try:
+                        skull.shw(f'=> {key} (  VALEUR  ) = {fct()}')
 
-                msg = (
-                    'ATTENTION : Nous allons écraser'
-                    f' « {destination} » !!!'
-                    )
+                    except AttributeError as e:
+                        skull.shw(f'=> {key} (  VALEUR  ) = ERREUR {type(e)}')
+                        skull.shw(f'{e}')
 
-                new_name = not self.ask_yes_or_no(msg, 'n')
+                    skull.shw('')
+                    skull.shw('')
 
-        if new_name or must_be_new:
+                    _pause_("PAUSE avant la syntaxe suivante", after=2)
 
-            # On créé un nouveau nom de fichier si celui
-            # qui nous a été donné ne peut être utilisé.
-            #
-            tmp_dst = node.stem + new_suffix + node.suffix
 
-            file_dst = self.get_unused_filename(
-                tmp_dst,
-                idx_force = True
-                )
+        # Nous allons maintenant détruire l'instance fake_tree
+        # pour observer comment réagit notre script...
+        #
+        # Nous allons ainsi dérouler les étapes suivantes :
+        #
+        #   . Récupérer l'adresse mémoire de fake_tree.
+        #
+        #   . Vérifier le nombre de références vers l'objet
+        #     fake_tree.
+        #   > On doit trouver = 2
+        #   ( fake_tree & FileSystemTree._tree_last )
+        #
+        #   . Annuler la référence de fake_tree vers cette
+        #     adresse ( espace ) mémoire :
+        #       - soit « del fake_tree »,
+        #       - soit « fake_tree = None »
+        #
+        #   . Vérifier le nombre de référence vers l'adresse
+        #     mémoire.
+        #   > On doit trouver = 1 ( _tree_last seulement )
+        #
+        #   . Attribuer à FileSystemTree._tree_last une autre
+        #     valeur que l'objet fake_tree ( skull.files par
+        #     par exemple ).
+        #
+        #   . Vérifier le nombre de référence vers l'adresse
+        #     mémoire.
+        #   > On doit trouver = 0
+        #   > L'objet fake_tree doit avoir disparu !
+        #
+        skull.shw('DESTRUCTION du 2nd FileSystemTree utilisé :')
+        skull.shw('~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~')
+        skull.shw('')
+        skull.shw('STEP 0')
+        skull.shw('État INITIAL des références vers le 2nd FileSystemTree :')
+        skull.shw(f'_find_var_refcounts_(fake_tree) = {_find_var_refcounts_(fake_tree)}')
+        skull.shw('')
 
-        else:
+        fake_address = id(fake_tree)
 
-            # On peut se servir tel quel du nom de fichier
-            # qui nous a été fourni.
+        tests = {
             #
-            file_dst = str(destination)
-
-        if (data_fmt is None) or (data_fmt == coding_bytes):
-
-            # Le jeu de caractères qui nous concerne est
-            # celui des « byte strings ». Donc on ouvre
-            # notre fichier au format « b(yte) ».
+            # Step 1 : « del fake_tree » ou « fake_tree = None ».
+            # ========
             #
-            f_actual = 'BYTES'
-            f_other = 'TEXTE'
-            f_flag = 'wb'
+            'step 1' : 'fake_tree = None',
+            #
+            # Step 2 : Si l'on écrit :
+            # ========
+            #
+            #   skull.files._tree_last = skull.files
+            #
+            # ... alors _tree_last ne sera pas réellement modifié !!!
+            # ... et la référence ne disparaîtra donc pas.
+            #
+            # En effet, _tree_last est un attribut de classe et non
+            # d'instance.
+            #
+            'step 2' : 'skull.files._tree_last = skull.files',
+            #
+            # Step 3 : On annule la dernière référence à fake_tree.
+            # ========
+            #
+            # ... en modifiant _tree_last au niveau classe.
+            #
+            'step 3' : 'FileSystemTree._tree_last = skull.files',
+        }
 
-        else:
+        for key, action in tests.items():
 
-            # On ouvre notre fichier au format « t(ext) ».
-            #
-            f_actual = 'TEXTE'
-            f_other = 'BYTES'
-            f_flag = 'wt'
+            skull.shw(f'{key.upper()}')
+            skull.shw(f'Action exécutée : « {action} »')
+            skull.shw('')
 
-        log.debug('Type en entrée = « %s »', data_type)
-        log.debug('Format en entrée = « %s »', data_fmt)
-        log.debug('Format en sortie = « %s »', f_flag)
-        log.debug('')
+            exec(action)
 
-        self.shw(f'Destination = {file_dst}')
-        self.shw_debug(f'Format = « {f_flag} »')
-        self.shw('')
+            skull.shw('Évolution des références vers le 2nd FileSystemTree :')
+            skull.shw(f'_find_var_refcounts_(fake_address) = {_find_var_refcounts_(None, fake_address)}')
+            skull.shw('')
 
-        # On transforme « None » en STRING afin de convertir
-        # notre type de données en minuscules pour faciliter
-        # les tests par la suite.
-        #
-        # RQ : some_string OR '' = some_string
-        #         None     OR '' = ''
-        #
-        # Nous pourrons ensuite comparer bien plus simplement
-        # « data_type » avec les types attendus ( 'json', ... )
-        # sans avoir à nous soucier des majuscules.
-        #
-        data_type = (data_type or '').lower()
+        _pause_("PAUSE avant les prochains AUTOTESTS", before=1, after=2)
 
-        with open(file_dst, f_flag) as new_file:
 
-            for content in args:
+    # #######################################################################
+    # -----------------------------------------------------------------------
+    # #######################################################################
+    # -----------------------------------------------------------------------
+    # #######################################################################
+    #
+    user_answer = skull.ask_yes_or_no(
+        "Voulez-vous que je réalise les TESTS de COMPRÉHENSIONS de LISTE ?",
+        'non'
+        )
 
-                if f_flag == 'wt' and 'json' in data_type:
+    if user_answer:
 
-                    log.debug("Fichier destination format TEXTE")
-                    log.debug("+ Contenu à écrire format JSON")
-                    log.debug("= Nous utilisons le module JSON.")
-                    log.debug('')
+        # On affiche des résultats de compréhensions de
+        # liste à titre dicdactique.
+        #
+        # Ici, nous ne sommes donc pas vraiment dans de
+        # l'autotest... mais plus dans de la pédagogie.
+        #
+        log.info('')
+        log.info('\t===============================')
+        log.info('\t>>> COMPRÉHENSIONS de LISTE <<<')
+        log.info('\t===============================')
+        log.info('')
+        log.info('')
 
-                    # Nous utilisons le module JSON si le contenu à écrire est
-                    # de type JSON ( en espérant que le traitement soit ainsi
-                    # accéléré ).
-                    #
-                    # Par contre, json.dump() ne sait traiter que des datas au
-                    # format STRING en entrée et ne sait écrire que des datas
-                    # au format STRING en sortie. Or quand f_flag == 'wb', nos
-                    # données sont au format BYTES en entrée et, en sortie, le
-                    # fichier en ouvert en mode BYTES !!!
-                    #
-                    # Cf https://docs.python.org/fr/3/library/json.html#basic-usage :
-                    #
-                    #   json.dump(obj, fp, [..]
-                    #   Le module json produit toujours des objets str, et non
-                    #   des objets bytes. fp.write() doit ainsi prendre en charge
-                    #   un objet str en entrée.
-                    #
-                    # Pour écrire via le module JSON dans un fichier ouvert en
-                    # mode BYTES, il nous faudrait écrire un code type :
-                    #
-                    #   json_str = json.dumps(json.loads(content))
-                    #   new_file.write(json_str.encode(encoding='utf-8'))
-                    #
-                    # ... car json.loads() accepte du contenu au format BYTES,
-                    # et car, « according to RFC 4627, the default encoding of
-                    # UTF-8 is an absolute requirement of the application/json
-                    # specification. That's not to say that every single server
-                    # plays by the rules, but generally, you can assume that if
-                    # JSON is being transmitted, it'll almost always be encoded
-                    # using UTF-8. »
-                    #
-                    # BREF, nous arriverions alors à un code bien compliqué pour
-                    # simplement utiliser le module JSON !!!
-                    #
-                    # DONC nous ne l'utilisons si et seulement si le fichier de
-                    # destination est au format TXT !!!
-                    #
-                    json.dump(content, new_file)
+        mask = "*[[@]*"
 
-                else: 
-                    try:
-                        new_file.write(content)
+        log.info('Test et RÉSULTAT de :')
+        log.info('')
+        log.info(f'\t[ n for n in < current directory > if fnmatch.fnmatch( n.name, "{mask}" ) ]')
+        log.info('')
+        log.info('... où « n » est de type « FileSystelLeaf » ou « pathlib.Path » :')
+        log.info('')
 
-                    except UnicodeEncodeError as erreur:
-                        # Exception qui se rencontre par exemple si l'on essaye
-                        # d'écrire dans un fichier TXT ( « wt » ) le caractère
-                        # '\U0001f496' ( ou SPARKLING HEART c-a-d ❤️ ) qui est,
-                        # pourtant, Unicode !!!
-                        #
-                        # Il suffit d'exécuter sous IDLE le code suivant pour
-                        # s'en rendre compte :
-                        #
-                        #        with open('tmp.txt', 'wt') as f:
-                        #            c = '❤'     # ou « c = '\U0001f496' »
-                        #            try:
-                        #                f.write(c)
-                        #            except UnicodeEncodeError:
-                        #                print('Caractère NON UNICODE rencontré.')
-                        #            else:
-                        #                print('Tout va bien.')
-                        #            finally:
-                        #                print('FIN !!!')
-                        #
-                        # Cf aussi les remarques concernant :
-                        #
-                        #       'https://jsonplaceholder.typicode.com/'
-                        #
-                        # ... dans nos « AUTOTESTS de REQUÊTES HTTP ».
-                        #
-                        self.shw("\t\t~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~")
-                        self.shw("\t\tATTENTION = ERREUR À L'ENREGISTREMENT")
-                        self.shw("\t\t~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~")
-                        self.shw('')
-                        self.shw(f"\t« {erreur} »")
-                        self.shw('')
-                        self.shw("\tCaractère NON UNICODE rencontré à l'enregistrement.")
-                        self.shw("\tUne partie du contenu sera ignorée, non sauvegardée.")
-                        self.shw('')
+        try: fnmatch.translate('test_if*already_imported')
+        except AttributeError: import fnmatch
 
-                        log.debug("\tNous ne prenons pas le risque de logger ce contenu")
-                        log.debug("\t... qui pourrait faire planter le module de LOG !!!")
-                        log.debug('')
+        our_dir = leaf().iterdir
+        our_lst = [n for n in our_dir() if fnmatch.fnmatch(n.name, mask)]
 
-                        _show_stack_(log)
+        if len(our_lst) > 0:
 
-                        self.shw(f"\tCodage actuel pour écriture dans le fichier = « {f_actual} ».")
-                        self.shw(f"\tNe faudrait-il pas plutôt utiliser le format « {f_other} » ?")
-                        self.shw('')
+            for n in our_lst:
+                skull.shw(f'\t{n}')
 
-        return file_dst
+            skull.shw('')
+            skull.shw(f'\t=> DATATYPE for ALL objects = {type(our_lst[0])}')
 
+        else:
+            skull.shw('\tNO SUCH FILES OR DIRECTORIES')
 
-# ---------------------------------------------------------------------------
-#
-#   PARTIE :
-#   ~~~~~~~~
-#   Fonctions spécifiques au WEB ( browser, HTML, HTTP, etc ).
-#
-# ---------------------------------------------------------------------------
+        skull.shw('')
 
 
-    # Caractères interdits dans les URL, ainsi que leur transcription.
-    #
-    # Pour une liste des caractères qui devraient être présents dans
-    # ce dictionnaire, cf :
-    #
-    #   https://en.wikipedia.org/wiki/URL_encoding
+    # #######################################################################
+    # -----------------------------------------------------------------------
+    # #######################################################################
+    # -----------------------------------------------------------------------
+    # #######################################################################
     #
-    _url_forbiddens = {
-        ' ': '%20',
-        #
-        # Sous Firefox, lorsque l'on écrit une URL avec un « ! », ce dernier n'est
-        # pas transformé par le browser. Ainsi :
-        #
-        #   https://www.google.com/search?q=( ! )
-        #
-        # ... devient :
-        #
-        #   https://www.google.com/search?q=(%20!%20)
-        #
-        # ... donc nous ne transformons pas non plus « ! ».
-        #
-        # ATTENTION : Après l'avoir saisie, lorsque l'on observe la première URL ci-
-        # dessus dans la barre d'adresses de Firefox, on lit « ( ! ) » mais si l'on
-        # copy / paste cette URL du browser vers un éditeur de texte, apparaît alors
-        # « (%20!%20) ». L'URL a donc bien été modifiée.
-        #
-#       '!': '%21',
-        '"': '%22',
-        #
-        # Le caractère suivant « # » permet de donner des indications dans certaines
-        # URL : il ne faut donc pas le traduire !!! Ainsi, cf :
-        #
-        #   https://mybox.airfrance.fr/MyBoxWeb/accueil.do#toRead
-        #
-#       '#': '%23',
-        #
-        # Le caractère suivant « $ » permet de donner des indications dans certaines
-        # URL : il ne faudrait donc pas le traduire ??? Ainsi, cf :
-        #
-        #   http://127.0.0.1/c$/Windows/win.ini
-        #
-        # Pour autant, la fonction « quote_from_bytes » du module urllib.parse traduit
-        # ce caractère en %24. Le module pathlib, comme il utilise cette fonction, fait
-        # de même. Donc nous aussi...
-        #
-        '$': '%24',
-        #
-        # Le caractère « % » permet de coder les caractères spéciaux dans les URL :
-        # il ne faut donc pas le traduire !!! Ainsi, cf :
-        #
-        #   https://fr.search.yahoo.com/search?p=dei%20cas
-        #
-#       '%': '%25',
-        #
-        # Le caractère suivant « & » est parfois utilisé dans les URL pour, par
-        # exemple, indiquer une recherche :
-        #
-        #   https://www.google.com/search?client=firefox-b-d&q=test
-        #
-#       '&': '%26',
-        "'": '%27',
-        #
-        # Pour « ( » et « ) », cf les remarques ci-dessus relatives à « ! ».
-        #
-#       '(': '%28',
-#       ')': '%29',
-        '*': '%2A',
-        '+': '%2B',
-        ',': '%2C',
-        #
-        # Certains caractères sont parties intégrantes d'une adresse web... !!!
-        # Donc mieux vaut ne pas les traiter, sinon l'URL sera incompréhensible
-        # lors de sa lecture. C'est le cas de « / » et « : » i.e « https:// ».
-        #
-#       '/': '%2F',
-#       ':': '%3A',
-        ';': '%3B',
-        #
-        # Tout comme « & » ci-dessus, les caractères suivants « = » et « ? » font
-        # partie du langage parfois utilisé dans les URL pour une recherche.
-        #
-#       '=': '%3D',
-#       '?': '%3F',
-        '@': '%40',
-        '[': '%5B',
-        ']': '%5D',
-        #
-        # Le caractère « \ » peut être utilisé dans des requêtes, cf :
-        #
-        #   https://www.google.com/search?q=\U0001f496
-        #   https://www.google.com/search?q=%5CU0001f496
-        #   = Emoji Unicode Character 'SPARKLING HEART' (U+1F496)
-        #
-        # ... donc nous l'avons ajouté au dictionnaire alors qu'il ne se trouve
-        # pas dans la table « Reserved characters after percent-encoding » de :
-        #
-        #   https://en.wikipedia.org/wiki/URL_encoding
-        #
-        # Il se trouve par contre dans la table :
-        #
-        #   « Common characters after percent-encoding (ASCII or UTF-8 based)  »
+    user_answer = skull.ask_yes_or_no(
+        "Voulez-vous que je réalise mes AUTOTESTS de SAISIE ?",
+        'non'
+        )
+
+    if user_answer:
+
+        # On appelle choose_in_a_list() pour vérifier
+        # que Python ne plante pas en le parcourant.
         #
-        # ... de cette même page.
+        log.info('')
+        log.info('\t==================================')
+        log.info('\t>>> TEST de choose_in_a_list() <<<')
+        log.info('\t==================================')
+        log.info('')
+        log.info('')
+
+        fruits = ['apple', 'banana', 'cherry']
+        idx = skull.choose_in_a_list(fruits, 1)
+
+        if idx >= 0:
+            skull.shw(f'Votre réponse = {fruits[idx]}')
+
+        skull.shw('')
+
+        # On appelle choose_in_a_dict() pour vérifier
+        # que Python ne plante pas en le parcourant.
         #
-        '\\': '%5C',        
-    }
+        log.info('')
+        log.info('\t==================================')
+        log.info('\t>>> TEST de choose_in_a_dict() <<<')
+        log.info('\t==================================')
+        log.info('')
+        log.info('')
 
+        capitals = {
+            "USA":"Washington D.C.",
+            "France":"Paris",
+            "India":"New Delhi"
+            }
+        key = skull.choose_in_a_dict(capitals, 'India')
 
-    def url_to_valid(
-        self,
-        url: str
-        ) -> str:
-        """ S'assure qu'une URL soit valide, i.e ne comporte pas de caractères
-        interdits, et renvoie si nécessaire l'URL adéquate, ou l'URL inchangée
-        si elle était déjà valide.
+        if key is not None:
+            skull.shw(f'Votre réponse = {capitals[key]}')
 
-        Cf par exemple le message d'erreur suivant si l'URL contient 1 espace :
+        skull.shw('')
 
-            InvalidURL = URL can't contain control characters. '/my Check-Lists.py' (found at least ' ')
 
-        :return: une URL valide.
-        """
+    # #######################################################################
+    # -----------------------------------------------------------------------
+    # #######################################################################
+    # -----------------------------------------------------------------------
+    # #######################################################################
+    #
+    user_answer = skull.ask_yes_or_no(
+        "Voulez-vous que je réalise mes AUTOTESTS de CONCATÉNATIONS de PATH ?",
+        'non'
+        )
 
-        valid_url = url
+    if user_answer:
 
-        # Plutôt que de nous servir de notre tableau _url_forbiddens, nous
-        # pouvions utiliser les fonctions de parsing du module urllib.parse !
+        log.info('')
+        log.info('\t==============================')
+        log.info('\t>>> CONCATÉNATIONS de PATH <<<')
+        log.info('\t==============================')
+        log.info('')
+        log.info('')
+
+        skull.shw('EXEMPLE 1 : Opérateur « / » + Opérandes « FileSystelLeaf » et « STRING »')
+        skull.shw('')
+
+        # Nous écrivons nos PATH à la mode UNIX ( ie avec
+        # « / » comme séparateur ) car Python fournit des
+        # fonctions pour transformer cette notation UNIX
+        # vers celle Windows ( ie « \ » comme séparateur )
+        # mais pas pour l'inverse. Or nous lançons aussi,
+        # entre autres, ces tests sur iPad + iOS, où « \ »
+        # ne sera pas compris comme séparateur de PATH...
         #
-        # Cf https://docs.python.org/3/library/urllib.parse.html#url-quoting
-        # Cf https://docs.python.org/3/library/urllib.parse.html#urllib.parse.quote
-        # Cf https://docs.python.org/3/library/urllib.parse.html#urllib.parse.quote_from_bytes
+        # Cf ainsi :
         #
-        for key, value in self._url_forbiddens.items():
+        #   https://docs.python.org/3/library/os.path.html#os.path.normpath
+        #
+        #   (..) On Windows, it converts forward slashes
+        #   to backward slashes.
+        #
+        operande_1 = leaf(r"A:/blah/bleh/blih")
+        operande_2 = "ESSAI_n°1"
+        result = operande_1 / operande_2
 
-            if key in url:
+        skull.shw(f'\t« {str(operande_1)} »\tconcaténé avec\t« {str(operande_2)} »')
+        skull.shw(f'\t=> Résultat        = « {result} »')
+        skull.shw(f'\toù Type Opérande 1 = « {type(operande_1)} »')
+        skull.shw(f'\tet Type Opérande 2 = « {type(operande_2)} »')
+        skull.shw(f'\tet Type Résultat   = « {type(result)} »')
+        skull.shw('')
 
-                valid_url = valid_url.replace(key, value)
+        skull.shw('EXEMPLE 2 : Opérateur « / » + Opérandes « STRING » et « FileSystelLeaf » ( mais BUG car 2 disques indiqués !!! )')
+        skull.shw('')
 
-        return valid_url
+        operande_1 = r"B:/ESSAI_n°2"
+        operande_2 = leaf(r"C:/problème/car/deux/disques")
+        result = operande_1 / operande_2
 
+        skull.shw(f'\t« {str(operande_1)} »\tconcaténé avec\t« {str(operande_2)} »')
+        skull.shw(f'\t=> Résultat        = « {result} »')
+        skull.shw(f'\toù Type Opérande 1 = « {type(operande_1)} »')
+        skull.shw(f'\tet Type Opérande 2 = « {type(operande_2)} »')
+        skull.shw(f'\tet Type Résultat   = « {type(result)} »')
+        skull.shw('')
 
-    def send_request_url(
-        self,
-        url: str,
-        coding: str = coding_unknown
-        ) -> (str, str, str):
-        """ Pour envoyer une requête HTTP et en recevoir le résultat.
+        skull.shw(r"EXEMPLE 3 : Idem et 1er BUG réglé ( mais 2nd BUG car le « \ » de l'opérande 2 masque « problème\réglé » !!! )")
+        skull.shw('')
 
-        :param url: la requête à lancer.
+        operande_1 = r"D:/problème/réglé"
+        operande_2 = leaf(r"/ESSAI_n°3")
+        result = operande_1 / operande_2
 
-        :param coding: l'encodage attendu de la réponse.
+        skull.shw(f'\t« {str(operande_1)} »\tconcaténé avec\t« {str(operande_2)} »')
+        skull.shw(f'\t=> Résultat        = « {result} »')
+        skull.shw(f'\toù Type Opérande 1 = « {type(operande_1)} »')
+        skull.shw(f'\tet Type Opérande 2 = « {type(operande_2)} »')
+        skull.shw(f'\tet Type Résultat   = « {type(result)} »')
+        skull.shw('')
 
-        :return: la réponse + son type de contenu + son format.
-        Le format correspondra au format souhaité, sauf si nous avons
-        eu à le modifier. Ce qui sera par exemple le cas si celui qui
-        nous a été transmis était « coding_unknown ».
-        """
+        skull.shw('EXEMPLE 4 : Opérateur « /= »')
+        skull.shw('')
 
-        log = self.logItem
-        url_string = ''
-        url_content = None
+        operande_1 = leaf("Z://woah_wouh//")
+        operande_2 = "ESSAI_n°4"
+        result = operande_1
+        result /= operande_2
 
-        url_valid = self.url_to_valid(url)
-        self.shw(f'URL get  = {url}')
-        self.shw(f'URL ok   = {url_valid}')
+        skull.shw(f'\t« {str(operande_1)} »\tconcaténé avec\t« {str(operande_2)} »')
+        skull.shw(f'\t=> Résultat        = « {result} »')
+        skull.shw(f'\toù Type Opérande 1 = « {type(operande_1)} »')
+        skull.shw(f'\tet Type Opérande 2 = « {type(operande_2)} »')
+        skull.shw(f'\tet Type Résultat   = « {type(result)} »')
+        skull.shw('')
 
-        # Nous encapsulons l'URL dans la structure urllib.request.Request
-        # du module, au cas où nous souhaitions plus tard utiliser cette
-        # classe afin de transmettre des paramètres à l'URL contactée...
+
+    # #######################################################################
+    # -----------------------------------------------------------------------
+    # #######################################################################
+    # -----------------------------------------------------------------------
+    # #######################################################################
+    #
+    user_answer = skull.ask_yes_or_no(
+        "Voulez-vous que je réalise mes AUTOTESTS de RECHERCHE de fichiers & ÉDITION format texte ?",
+        'non'
+        )
+
+    if user_answer:
+
+        # Dans un 1er temps, nous limitions le test de notre
+        # méthode _fake_iglob() aux seuls cas où la gestion
+        # du système de fichiers ne dépendait que du module
+        # OS ( et de os.path ) :
         #
-        # Si nous voulions ne pas utiliser cette structure et rester simple
-        # dans nos syntaxes, il suffirait alors de directement passer à l'
-        # appel urllib.request.urlopen() ci-dessous l'adresse url_valid.
+        #   if not (w_glob or w_fnmatch) and w_pathlib == pathlib_ignore:
         #
-        request = urllib.request.Request(url=url_valid)
-
-        try:
+        # Nous avons depuis élargi le nombre des cas où nous
+        # testions _fake_iglob(). Pour autant, ns ne testons
+        # pas cette méthode en modes « pathlib_direct_... »
+        # puisque, dans ces modes, la gestion du système de
+        # fichiers est totalement déléguée au module PATHLIB
+        # et à ses objets pathlib.PATH qui ne disposent pas
+        # d'une méthode _fake_iglob()... !!!
+        # 
+        if not (w_pathlib in pathlib_direct):
 
-            # Pour économiser les ressources, on utilise WITH... ie
-            # l'objet réponse sera libéré dès la sortie du bloc.
-            #
-            # Cf https://realpython.com/urllib-request/
-            #
-            # « Using the context manager with, you make a request and
-            # receive a response with urlopen(). Then you read the body
-            # of the response and close the response object. »
-            #
-            # « If you've fully read the response, the subsequent attempt
-            # just returns an empty bytes object even though the response
-            # isn't closed. You'd have to make the request again.
-            #
-            # In this regard, the response is different from a file object,
-            # because with a file object, you can read it multiple times by
-            # using the .seek() method, which HTTPResponse doesn't support.
-            #
-            # Even after closing a response, you can still access the headers
-            # and other metadata, though. »
+            # On appelle _fake_iglob() pour vérifier que
+            # Python n'y plante pas.
             #
-            #with urllib.request.urlopen(url_valid, timeout=3) as data:
-            with urllib.request.urlopen(request, timeout=3) as data:
-
-                # Pour savoir ce qu'est et contient « data » :
-                #
-                #   cf https://docs.python.org/3/library/urllib.request.html#module-urllib.response
-                #   cf https://docs.python.org/3/library/http.client.html#httpresponse-objects
-                #   cf https://docs.python.org/3/library/email.message.html#email.message.EmailMessage
-                #   cf https://realpython.com/urllib-request/
-                #
-                #   « The main representation of an HTTP message that
-                # you'll be interacting with when using urllib.request
-                # is the HTTPResponse object. (..)
-                #
-                # You might think that HTTPMessage is a sort of base class,
-                # which HTTPResponse inherits from, but it's not. HTTPResponse
-                # inherits directly from io.BufferedIOBase, while the HTTPMessage
-                # class inherits from email.message.EmailMessage.
-                #
-                # The EmailMessage is defined in the source code as an object
-                # that contains a bunch of headers and a payload, so it doesn't
-                # necessarily have to be an email. HTTPResponse simply uses
-                # HTTPMessage as a container for its headers.
-                #
-                # However, if you're talking about HTTP itself and not its
-                # Python implementation, then you'd be right to think about
-                # an HTTP response as a kind of HTTP message.
-                #
-                # When you make a request with urllib.request.urlopen(), you
-                # get an HTTPResponse object in return. Spend some time exploring
-                # the HTTPResponse object with pprint() and dir() to see all the
-                # different methods and properties that belong to it:
-                #
-                #   >>> from urllib.request import urlopen
-                #   >>> from pprint import pprint
-                #   >>> with urlopen("https://www.example.com") as response:
-                #   ...     type(response)
-                #   ...     pprint(dir(response))
-                #
-                data_type = type(data)
-                url_bytes = data.read()
+            log.info('')
+            log.info('\t=============================')
+            log.info('\t>>> TEST de _fake_iglob() <<<')
+            log.info('\t=============================')
+            log.info('')
+            log.info('Version FRUSTRE :')
+            log.info('-----------------')
+            log.info('')
+            log.info('Nous testons cette méthode dans le cas de fichiers ou répertoires seuls.')
+            log.info('Le cas « indifférencié » est scanné via « search_files_from_a_mask() ».')
+            log.info('')
+            log.info('')
 
-                # data.url = URL of the resource retrieved, commonly used
-                # to determine if a redirect was followed.
-                #
-                url_address = data.url
+            t_name = {
+                _glob_only_dirs: 'SOUS-RÉPERTOIRES',
+                _glob_only_files: 'FICHIERS'
+            }
 
-                # status = Status code returned by server.
-                # ( New in version 3.9 )
-                #
-                # code = Deprecated in favor of status.
-                # ( Deprecated since version 3.9 )
-                #
-                # getstatus() = Deprecated in favor of status.
-                # ( Deprecated since version 3.9 )
-                #
-                # Cf https://docs.python.org/3.9/library/urllib.request.html#module-urllib.response
-                #
-                if hasattr(data, 'status'):
-                    url_status = data.status
-                elif hasattr(data, 'code'):
-                    url_status = data.code
-                else:
-                    url_status = data.getstatus()
+            our_dir = leaf()
 
-                # Returns the headers of the response in the form of an
-                # EmailMessage instance.
-                #
-                # Cf https://docs.python.org/3/library/email.message.html#email.message.EmailMessage
-                #
-                # HTTPMessage class inherits from email.message.EmailMessage.
-                # HTTPResponse simply uses HTTPMessage as a container for its
-                # headers.
-                #
-                # Cf https://realpython.com/urllib-request/
-                #
-                url_header = data.headers
+            for t in (_glob_only_dirs, _glob_only_files):
 
-                # headers.get_content_charset() sait lire les fichiers au
-                # format HTML.
-                #
-                # Le "character encoding" n'est normalement pas spécifié
-                # dans le fichier .py, pas en tout cas à la façon d'un
-                # fichier HTML normal !!!
-                #
-                # Donc get_content_charset() ne devrait pas le lire de
-                # façon correcte si c'est un fichier script Python, bash
-                # ou autres.
-                #
-                # Dans le cas où get_content_charset() ne peut donner de
-                # réponse, il renverra « None ».
-                #
-                url_charset = url_header.get_content_charset()
-                url_content = url_header.get_content_type()
+                msg = t_name[t] + ' du répertoire courant :'
 
-        except TimeoutError:
-            self.shw('')
-            self.shw('===>> Request timed out at the SYSTEM level...')
-            self.shw('')
+                log.info('\t' + msg)
+                log.info('\t' + '~' * len(msg))
 
-        except http.client.InvalidURL as error:
-            self.shw('')
-            self.shw(f'===>> InvalidURL ( http.client ) = {error}')
-            self.shw('')
+                for n in sorted(our_dir._fake_iglob(n_type = t)):
+                    skull.shw(f'\t{n}')
 
-        except http.client.NotConnected as error:
-            self.shw('')
-            self.shw(f'===>> NotConnected ( http.client ) = {error}')
-            self.shw('')
+                skull.shw('')
+                skull.shw('')
 
-        # The except HTTPError must come first, otherwise except URLError
-        # will also catch an HTTPError.
-        #
-        # Cf https://docs.python.org/3/howto/urllib2.html#wrapping-it-up
+            _pause_("PAUSE avant la syntaxe suivante")
+
+            log.info('')
+            log.info('Version FNMATCH :')
+            log.info('-----------------')
+            log.info('')
+
+            mask = '*[{(@]*'
+            mask_dct = our_dir._parse_mask(mask, _search_fnmatch)
+
+            log.info(f'Masque = {mask}')
+            log.info('')
+
+            for n in sorted(our_dir._fake_iglob(**mask_dct)):
+                skull.shw(f'\t{n}')
+
+            _pause_("PAUSE avant la syntaxe suivante",
+                    before=2, b_line=skull.shw)
+
+        # On appelle search_files_from_a_mask() pour
+        # vérifier que Python n'y plante pas.
         #
-        # Though being an exception (a subclass of URLError), an HTTPError
-        # [..]
+        log.info('')
+        log.info('\t==========================================')
+        log.info('\t>>> TEST de search_files_from_a_mask() <<<')
+        log.info('\t==========================================')
+        log.info('')
+        log.info('')
+
+        # On défini dans la liste ( de n-uplets nommés )
+        # suivante toutes les recherches que nous allons
+        # mener. Ainsi :
         #
-        # Cf https://docs.python.org/3/library/urllib.error.html#urllib.error.HTTPError
+        #   1 - On va chercher tout d'abord des fichiers
+        #       *.ISO dans un répertoire lointain...
         #
-        # FINALEMENT : le traitement des erreurs HTTPError a été reporté
-        # dans celui des erreurs URLError ( puisque HTTPError est une ss-
-        # classe de URLError ). C'est plus propre.
+        #   2 - Ensuite : tous les fichiers ( * ) dans un
+        #       répertoire proche...
         #
-        # Cf https://docs.python.org/3/howto/urllib2.html#wrapping-it-up
-        # Cf https://docs.python.org/3/howto/urllib2.html#number-2
+        #   3 - ...
         #
-        #except urllib.error.HTTPError as error:
-        #    self.shw('')
-        #    self.shw(
-        #        f'===>> HTTP {error.status} ERROR = {error.reason}'
-        #        )
-        #    self.shw('')
+        #   x - Enfin : les fichiers *.py du répertoire de
+        #       travail.
         #
-        except urllib.error.URLError as error:
-            self.shw('')
+        try: collections
+        except NameError: import collections
 
-            # On gère ici aussi bien les HTTPError que les URLError.
+        Search = collections.namedtuple(
+            "Search",
+            ['mask', 'dir']
+            )
+
+        # Nous écrivons nos PATH à la mode UNIX ( ie avec
+        # « / » comme séparateur ) car Python fournit des
+        # fonctions pour transformer cette notation UNIX
+        # vers celle Windows ( ie « \ » comme séparateur )
+        # mais pas pour l'inverse. Or nous lançons aussi,
+        # entre autres, ces tests sur iPad + iOS, où « \ »
+        # ne sera pas compris comme séparateur de PATH...
+        #
+        # Cf ainsi :
+        #
+        #   https://docs.python.org/3/library/os.path.html#os.path.normpath
+        #
+        #   (..) On Windows, it converts forward slashes
+        #   to backward slashes.
+        #
+        searches_todo = (
+            Search('*',     __file__),  # ERREUR = dans 1 fichier, non 1 répertoire
+            Search('*.iso', r"K:/_Backup.CDs/Comptabilité"),
+            Search('*.*',   r"../tmp"),
+            Search('(*',    r"../all files to one PDF"),
+            Search('r*',    r"../StoreKit"),            
             #
-            # Cf https://docs.python.org/3/library/urllib.error.html#urllib.error.URLError
-            # Cf https://docs.python.org/3/library/urllib.error.html#urllib.error.HTTPError
-            # Cf https://docs.python.org/3/howto/urllib2.html#wrapping-it-up
-            # Cf https://docs.python.org/3/howto/urllib2.html#error-codes
-            # Cf https://docs.python.org/3/library/http.server.html#http.server.BaseHTTPRequestHandler.responses
+            # Ajouter ci-dessus d'éventuelles nouvelles
+            # recherches. Laisser les 2 recherches qui
+            # suivent en dernière position.
             #
-            if isinstance(error.reason, socket.timeout):
-                self.shw('===>> Socket timeout error...')
-
-            elif hasattr(error, 'code'):
-                self.shw(
-                    f'===>> HTTP {error.code} ERROR = {error.reason}'
-                    )
-                self.shw("The server couldn't fulfill the request.")
-
-                # On inscrit dans le LOG le maximum d'informations
-                # concernant cette erreur...
-                #
-                if error.code in http.server.BaseHTTPRequestHandler.responses:
-
-                    msgs = http.server.BaseHTTPRequestHandler.responses[
-                        error.code
-                        ]
+            # En effet, la dernière ( sk*le*.py ) de la
+            # liste = son résultat nourrit le traitement
+            # qui la suit.
+            #
+            # Par ailleurs, l'avant-dernière recherche
+            # ( Sk*lE*.py ) permet, elle, de tester si l'
+            # OS est sensible à la casse en fonction des
+            # différentes options choisies ( avec glob
+            # ou pas, avec fnmatch ou pas, ... ). C'est
+            # par exple le cas sous iPadOS 16.3.1 ( ie
+            # Darwin Kernel Version 22.3.0 avec PYTHON
+            # version 3.11.0 ).
+            #
+            Search('Sk*lE*.py',  None),
+            Search('sk*le*.py',  None)
+            )
 
-                    log.debug(f'Short reason = {msgs[0]}')
-                    log.debug(f'Full reason = {msgs[1]}')
+        for idx, s in enumerate(searches_todo, start=0):
 
-            else:
-                self.shw(f'===>> URLError = {error.reason}')
-                self.shw("We failed to reach a server.")
+            if idx > 0:
+                _pause_("pause avant la recherche suivante",
+                        car="-", indent=3*margin,
+                        before=2, b_line=skull.shw,
+                        after=2, a_line=skull.shw)
 
-            self.shw('')
-            log.debug(f'Error TYPE = {type(error)}')
-            log.debug(f'Reason TYPE = {type(error.reason)}')
-            log.debug('')
+            files_found = skull.search_files_from_a_mask(
+                directory = s.dir,
+                mask = s.mask
+                )
 
-        else:
-            # EVERYTHING WENT FINE : la requête a donné un résultat.
+            msg_dir = f"« {s.mask} » in « {'.' if s.dir is None else s.dir} »"
+            msg_find = 9 * ' ' + f'---> Fichier(s) trouvé(s) :'
+            len_maxi = max(len(msg_dir), len(msg_find))
 
-            # On informe si l'URL originale a été redirigée vers
-            # une autre adresse.
-            #
-            # ATTENTION : Ce test ne détecte pas si le préfix http
-            # change !! Ainsi, la requête 'http://www.google.com/'
-            # est toujours remplacée par 'https://www.google.com'
-            # mais le test « url_address != url_valid » ne saura
-            # voir que le préfixe HTTP est devenu HTTPS.
-            #
-            if url_address != url_valid:
-                self.shw(f'URL real = {url_address}')
-                self.shw( '[ i.e a redirect was followed... ]')
+            skull.shw('~' * len_maxi)
+            skull.shw(msg_dir)
+            skull.shw(msg_find)
+            skull.shw('~' * len_maxi)
 
-            self.shw('')
+            if files_found is None or len(files_found) == 0:
+                skull.shw('\tNO SUCH FILES or DIRECTORIES...')
 
-            log.debug(f'Status code returned by server = {url_status}')
-            log.debug(f'Content type returned by server = {url_content}')
-            log.debug(f'Content charset returned by server = {url_charset}')
-            log.debug(f'Response message translation in Python = {data_type}')
-            log.debug(f'Response headers translation in Python = {type(url_header)}')
-            log.debug("Headers' keys = %s", url_header.keys())
+            else:
+                for file_name in sorted(files_found):
+                    skull.shw(f'\t{file_name}')
+                    skull.shw(f'\t\t=> DATATYPE = {type(file_name)}')
 
-            # En « http: », la clé est « Last-Modified ».
-            # En « file: », la clé est « Last-modified ».
-            #
-            last_modified = None
-            for key in ('Last-Modified', 'Last-modified'):
-                if key in url_header.keys():
-                    last_modified = url_header[key]
-                    break
+            skull.shw('')
+            skull.shw('')
+            skull.shw(77 * '-')
 
-            log.debug('Last-Modified = %s', last_modified)
-            log.debug('')
+        skull.shw('')
+        skull.shw('')
 
-            log.debug('Début de « url_bytes » :')
-            log.debug(url_bytes[0:99])
-            log.debug('')
+        # Même chose, mais avec PLUSIEURS masques recherchés en 1 seul
+        # parcours du répertoire de travail. On compare au passage le
+        # temps nécessaire à celui de recherches masque par masque.
+        #
+        _pause_("pause avant la recherche MULTI-MASQUES",
+                car="-", indent=3*margin,
+                before=2, b_line=skull.shw,
+                after=2, a_line=skull.shw)
 
-            self.shw(f'Coding en entrée = « {coding} »')
+        masks = ('*.py', '*.log', '*.[tb]a[tr]', '*.txt', 'sk*le*.*', '?*.*')
 
-            if coding == coding_unknown:
-                coding = url_charset
+        t_start = time.perf_counter()
+        found_by_mask = skull.search_files_from_a_mask(mask = masks)
+        t_multi = time.perf_counter() - t_start
 
-            self.shw(f'Coding calculé = « {coding} »')
-            self.shw('')
+        t_start = time.perf_counter()
+        for m in masks:
+            skull.search_files_from_a_mask(mask = m)
+        t_single = time.perf_counter() - t_start
 
-            if (coding is None) or (coding == coding_bytes):
+        for m, found in found_by_mask.items():
 
-                # Aucun décodage à faire car le jeu de caractères
-                # qui nous concerne est celui des « byte strings ».
-                #
-                url_string = url_bytes
+            skull.shw(f'« {m} » in « . » ---> {len(found)} fichier(s) :')
 
-            else:
-                url_string = url_bytes.decode(coding)
+            for file_name in sorted(found):
+                skull.shw(f'\t{file_name}')
 
-            log.debug('Début de « url_string » :')
-            log.debug(url_string[0:99])
-            log.debug('')
+            skull.shw('')
 
-        return (url_string, url_content, coding)
+        skull.shw(f'{len(masks)} masques en 1 seul parcours = {t_multi:.4f} s')
+        skull.shw(f'{len(masks)} masques en {len(masks)} parcours = {t_single:.4f} s')
+        skull.shw('')
+        skull.shw('')
 
+        # Recherche dans toute l'arborescence du répertoire parent, via
+        # notre parcours PARALLÈLE, avec 1 seul thread puis avec le nombre
+        # de threads par défaut ( résultats triés, puis non triés ).
+        #
+        _pause_("pause avant la recherche RÉCURSIVE ( parallèle )",
+                car="-", indent=3*margin,
+                before=2, b_line=skull.shw,
+                after=2, a_line=skull.shw)
+
+        for label, options in (
+                ('1 thread, trié',          { 'workers': 1 }),
+                ('N threads, trié',         { }),
+                ('N threads, non trié',     { 'ordered': False }),
+                ):
+
+            t_start = time.perf_counter()
+            found = skull.search_files_from_a_mask(
+                directory = '..',
+                mask = '*.py',
+                recursive = True,
+                **options
+                )
+            t_walk = time.perf_counter() - t_start
 
-# ---------------------------------------------------------------------------
-#
-#   Programme PRINCIPAL de ce module s'il est lancé en mode autonome...
-#
-# ---------------------------------------------------------------------------
+            skull.shw(f'« *.py » sous « .. » ( {label} ) = {len(found)} fichier(s) en {t_walk:.4f} s')
 
-if __name__ == "__main__":
+        # Même recherche, mais au fil de l'eau via iter_files_from_a_mask() :
+        # nous mesurons le délai d'obtention du 1er fichier.
+        #
+        t_start = time.perf_counter()
+        first = next(
+            skull.iter_files_from_a_mask(directory = '..', mask = '*.py', recursive = True),
+            None
+            )
+        t_first = time.perf_counter() - t_start
 
-    skull = ScriptSkeleton(
-        arguments = sys.argv,
-        debug_mode = True
-        )
+        skull.shw(f'« *.py » sous « .. » ( au fil de l\'eau ) = 1er fichier en {t_first:.4f} s')
+        skull.shw(f'\t{first}')
 
-    log = skull.logItem
+        skull.shw('')
+        skull.shw('')
 
+        user_answer = skull.ask_yes_or_no(
+            f"Édition des fichiers {s.mask} ( via l'éditeur de TXT ) ?",
+            'non'
+            )
 
-    # Les fichiers d'auto-test auront
-    # un nom qui débute par :
-    #
-    it_begins_with = '#_TESTS_( skeleton )'
+        if user_answer:
 
+            log.info('')
+            log.info('\t===============================')
+            log.info('\t>>> TEST de edit_file_txt() <<<')
+            log.info('\t===============================')
+            log.info('')
+            log.info('')
 
-    # On affiche un peu de bla-bla.
-    #
-    log.info('')
-    log.info('AUTOTESTS de : %s', __file__)
-    log.info('==============')
-    log.info('')
+            skull.edit_file_txt(
+                *files_found,
+                wait = False
+                )
 
 
     # #######################################################################
@@ -9386,110 +15448,102 @@ if __name__ == "__main__":
     # -----------------------------------------------------------------------
     # #######################################################################
     #
-    log.info('')
-    log.info('\t=================================')
-    log.info('\t>>> CHOIX DE LA CONFIGURATION <<<')
-    log.info('\t=================================')
-    log.info('')
-    log.info('')
+    user_answer = skull.ask_yes_or_no(
+        "Voulez-vous que je réalise mes AUTOTESTS de PDF ?",
+        'non'
+        )
 
-    config_choice = [
-        'Module OS seul + os.listdir',
-        'Module OS seul + os.scandir',
-        'Utilisation du module GLOB',
-        'Utilisation du module FNMATCH + os.listdir',
-        'Utilisation du module FNMATCH + os.scandir',
-        'Utilisation du module PATHLIB « enfoui »',
-        'Utilisation du module PATHLIB « direct » via la MÉTHODE Path()',
-        'Utilisation du module PATHLIB « direct » via la CLASSE Path()',
-        'Utilisation du module PATHLIB « direct » via le MODULE seul',
-        ]
+    if user_answer:
 
-    # Les tuples ci-dessous correspondent à l'initialisation
-    # des différentes variables ( avec l'ordre = with_glob,
-    # with_fnmatch, with_pathlib, walking_mode ) de chacune
-    # des configurations ci-dessus.
-    #
-    config_init = [
-        #
-        # Module OS seul + os.listdir
-        (False, False, pathlib_ignore, walking_via_listdir),
-        #
-        # Module OS seul + os.scandir
-        (False, False, pathlib_ignore, walking_via_scandir),
-        #
-        # Utilisation du module GLOB
-        (True,  False, pathlib_ignore, walking_via_listdir),
-        #
-        # Utilisation du module FNMATCH + os.listdir
-        (False, True,  pathlib_ignore, walking_via_listdir),
-        #
-        # Utilisation du module FNMATCH + os.scandir
-        (False, True,  pathlib_ignore, walking_via_scandir),
-        #
-        # Utilisation du module PATHLIB « enfoui »
-        (False, False, pathlib_deeply, walking_ignore),
-        #
-        # Utilisation du module PATHLIB « direct » via FileSystemTree.Path()
-        (False, False, pathlib_direct_via_path_method, walking_ignore),
-        #
-        # Utilisation du module PATHLIB « direct » via pathlib.Path()
-        (False, False, pathlib_direct_via_path_class, walking_ignore),
+        # On appelle les fonctions convert_to_pdf_*() pour
+        # vérifier que Python ne plante pas en leur sein.
         #
-        # Utilisation du module PATHLIB « direct » sans aucun filtre
-        (False, False, pathlib_direct_via_module_only, walking_ignore),
-    ]
-
-    idx = skull.choose_in_a_list(config_choice, 0)
-
-    if idx < 0:
-        skull.shw("Aucun choix n'a été fait...")
-        skull.shw('-> « OS seul + os.listdir » imposé.')
-        idx = 0
-
-    else:
-        skull.shw(f'Votre réponse = {config_choice[idx]}')
-
-    skull.shw('')
-
-    w_glob, w_fnmatch, w_pathlib, walking_mode = config_init[idx]
-
-    skull.file_system_mode(
-        walking_mode = walking_mode,
-        with_pathlib = w_pathlib,
-        with_fnmatch = w_fnmatch,
-        with_glob = w_glob
-        )
-
-    #leaf = skull.files.node
-    leaf = skull.files.Path
+        log.info('')
+        log.info('\t==================================')
+        log.info('\t>>> TEST de convert_to_pdf_*() <<<')
+        log.info('\t==================================')
+        log.info('')
+        log.info('')
 
-    if (w_pathlib in pathlib_direct):
+        if skull.convert_to_pdf_init():
 
-        node_file = leaf(__file__ + '.test')
+            f_name = '{} - {}.txt'.format(
+                it_begins_with,
+                skull.build_now_string()
+                )
 
-        skull.shw('\t===>>> TOUTES les méthodes de pathlib.PATH() sont alors disponibles.')
-        skull.shw('')
-        skull.shw(f'\tpath          = {node_file}')
-        skull.shw(f'\tpath.SUFFIXES = {node_file.suffixes}')
-        skull.shw(f'\tpath.PARENTS  = {len(list(node_file.parents))}'
-                    ' [ c-a-d len(list(path.parents)) ]')
+            with open(f_name, "wt") as f_test:
 
-        log.debug('\tcar .PARENTS  = ')
-        for parent in list(node_file.parents):
-            log.debug('\t\t%s', parent)
+                f_test.write(
+                    '#\n'
+                    '# =================\n'
+                    "# FICHIER DE TEST :\n"
+                    '# =================\n'
+                    '#\n'
+                    '# Bonjour, je suis un fichier totalement inutile.\n'
+                    "# J'ai vocation à être détruit après ma création.\n"
+                    '#\n'
+                    '\n'
+                    'Lorem ipsum (également appelé faux-texte, lipsum, ou bolo bolo)\n'
+                    'https://fr.wikipedia.org/wiki/Lorem_ipsum\n'
+                    '\n'
+                    "Lorem ipsum dolor sit amet, consectetur adipiscing elit. Sed non risus.\n"
+                    "Suspendisse lectus tortor, dignissim sit amet, adipiscing nec, ultricies\n"
+                    "sed, dolor. Cras elementum ultrices diam. Maecenas ligula massa, varius a,\n"
+                    "semper congue, euismod non, mi. Proin porttitor, orci nec nonummy molestie,\n"
+                    "enim est eleifend mi, non fermentum diam nisl sit amet erat. Duis semper.\n"
+                    "Duis arcu massa, scelerisque vitae, consequat in, pretium a, enim. Pellentesque\n"
+                    "congue. Ut in risus volutpat libero pharetra tempor. Cras vestibulum bibendum\n"
+                    "augue. Praesent egestas leo in pede. Praesent blandit odio eu enim. Pellentesque\n"
+                    "sed dui ut augue blandit sodales. Vestibulum ante ipsum primis in faucibus orci\n"
+                    "luctus et ultrices posuere cubilia Curae; Aliquam nibh. Mauris ac mauris sed\n"
+                    "pede pellentesque fermentum. Maecenas adipiscing ante non diam sodales hendrerit.\n"
+                    '\n'
+                    "Ut velit mauris, egestas sed, gravida nec, ornare ut, mi. Aenean ut orci vel\n"
+                    "massa suscipit pulvinar. Nulla sollicitudin. Fusce varius, ligula non tempus\n"
+                    "aliquam, nunc turpis ullamcorper nibh, in tempus sapien eros vitae ligula.\n"
+                    "Pellentesque rhoncus nunc et augue. Integer id felis. Curabitur aliquet\n"
+                    "pellentesque diam. Integer quis metus vitae elit lobortis egestas.\n"
+                    '\n'
+                    "Lorem ipsum dolor sit amet, consectetuer adipiscing elit. Morbi vel erat non\n"
+                    "mauris convallis vehicula. Nulla et sapien. Integer tortor tellus, aliquam\n"
+                    "faucibus, convallis id, congue eu, quam. Mauris ullamcorper felis vitae erat.\n"
+                    "Proin feugiat, augue non elementum posuere, metus purus iaculis lectus, et\n"
+                    "tristique ligula justo vitae magna.\n"
+                    '\n'
+                    "Aliquam convallis sollicitudin purus. Praesent aliquam, enim at fermentum\n"
+                    "mollis, ligula massa adipiscing nisl, ac euismod nibh nisl eu lectus. Fusce\n"
+                    "vulputate sem at sapien. Vivamus leo. Aliquam euismod libero eu enim. Nulla\n"
+                    "nec felis sed leo placerat imperdiet. Aenean suscipit nulla in justo. Suspendisse\n"
+                    "cursus rutrum augue. Nulla tincidunt tincidunt mi. Curabitur iaculis, lorem vel\n"
+                    "rhoncus faucibus, felis magna fermentum augue, et ultricies lacus lorem varius\n"
+                    "purus. Curabitur eu amet.\n"
+                    '\n')
 
-        skull.shw('')
-        skull.shw('')
+            # ATTENTION = On réalise dorénavant :
+            #
+            #       une exécution SYNCHRONE ( wait = True ) !!!
+            #
+            # ... En effet, si l'exécution est asynchrone, Libre Office ne
+            # va en général convertir qu'un seul des 2 fichiers ( soit le
+            # fichier temporaire f_name, soit __file__ ). Et on ne peut pas
+            # savoir lequel des 2 aura sa préférence...
+            #
+            # Il semble que cela soit dû au fait que Libre Office reçoit
+            # trop rapidement & trop consécutivement les deux demandes de
+            # conversion et que, dans la « précipitation », il perde ses
+            # billes, en oublie un ( le 1er ou le 2ème, il n'y a pas de
+            # règle à ce sujet ) : Libre Office ne convertit que l'autre.
+            #
+            skull.convert_to_pdf_run(f_name, __file__, wait = True)
 
-        if w_pathlib == pathlib_direct_via_module_only:
+            skull.shw(f'Fichier converti : {f_name}')
+            skull.shw(f'Fichier converti : {__file__}')
 
-            skull.shw('\t===>>> TOUTES les classes & fonctions de PATHLIB sont même ici disponibles.')
-            skull.shw('')
-            skull.shw(f'\tPurePath        = {type(skull.files.PurePath())}')
-            skull.shw(f'\t_WindowsFlavour = {type(skull.files._WindowsFlavour())}')
-            skull.shw('')
-            skull.shw('')
+        else:
+            skull.shw('Conversion PDF impossible sur ce terminal.')
+
+        skull.shw('')
 
 
     # #######################################################################
@@ -9499,170 +15553,176 @@ if __name__ == "__main__":
     # #######################################################################
     #
     user_answer = skull.ask_yes_or_no(
-        "Voulez-vous que je réalise le TEST des SYNTAXES FileSystemLeaf.Path.cwd() / .home() ?",
+        "Voulez-vous que je réalise mes AUTOTESTS de COMPARAISON de FICHIERS ?",
         'non'
         )
-
+    
     if user_answer:
 
-        # On teste la syntaxe utilisant des ATTRIBUTS de
-        # MÉTHODE, syntaxe utilisée à cause de l'émulation
-        # de pathlib par FileSystemTree...
-        #
-        # Ces attributs de la méthode Path dans la classe
-        # FileSystemTree sont :
-        #
-        #   - Path.cwd
-        #   - Path.home
-        #
-        # En fonction de la valeur du mode d'exécution, ns
-        # aurons les retours suivants pour Path.cwd() :
-        #
-        #   pathlib_ignore : AttributeError
-        #   pathlib_deeply : AttributeError
-        #   pathlib_direct_via_path_method : AttributeError
-        #   pathlib_direct_via_path_class  : le cwd actuel
-        #   pathlib_direct_via_module_only : le cwd actuel
-        #
-        # Idem pour Path.home().
+        # On appelle & teste la fonction compare_files().
         #
         log.info('')
-        log.info('\t========================================')
-        log.info('\t>>> SYNTAXES FileSystemLeaf.Path.xxx <<<')
-        log.info('\t========================================')
+        log.info('\t=======================================')
+        log.info('\t>>> TEST de COMPARAISON de FICHIERS <<<')
+        log.info('\t=======================================')
         log.info('')
         log.info('')
 
-        configs = [
-            ['un seul objet FileSystemTree', False],
-            ['deux instances FileSystemTree', True],
-        ]
-
-        tests = {
-            'cwd' : ( ['()', leaf().cwd ],  ['', leaf.cwd ] ),
-            #'home': ( ['()', leaf().home],  ['', leaf.home] ),
-        }
-
-        for c in configs:
+        reference = (
+            "Ve 29 feb AF 134 CDG (1,0) BOM    09h30 18h00 77W TVSV :  8h30 \n"
+            "\n"
+            "\tEquipage PNC\n"
+            "DEI CAS  LAURENT  36017312     B  EN SUPPLEM  P  IMPOS COMM.   UEKR  AMERIQUES  2EJ  \n"
+            "######### FIN #########"
+            )
 
-            msg = f'TESTS lorsque nous avons {c[0]} en mémoire :'
+        transformation = (
+            "Ve 29 feb AF 134 CDG (1,0) BOM    09h30 18h00 77W TVSV :  8h30 \n"
+            "\n"
+            "\tEquipage PNC\n"
+            "DEI CAS LAURENT                   36017312                      B EN SUPPLEM P IMPOS COMM.     UEKR AMERIQUES        2EJ\n"
+            "\n"
+            "\tEquipage PNC\n"
+            "DEI CAS LAURENT                   36017312   A350 359       C/C                                KDKR CAR/OCEAN INDIEN 3DD\n"
+            "######### FIN #########"
+            )
 
-            skull.shw(msg)
-            skull.shw('°' * len(msg))
-            skull.shw('')
-            skull.shw('')
 
-            if c[1]:
-                fake_tree = FileSystemTree(log_file = log)
-                log.debug('')
+        # On créé & on log le fichier de référence.
+        #
+        f_reference = '{} - ( 1 ) contenu de référence - {}.txt'.format(
+            it_begins_with,
+            skull.build_now_string()
+            )
 
-            for key, syntaxes in tests.items():
+        with open(f_reference, "wt") as new_file:
+            new_file.write(reference)
 
-                for liste in syntaxes:
+        log.debug('Fichier de référence :')
+        log.debug('~~~~~~~~~~~~~~~~~~~~~~')
+        log.debug('«')
+        log.debug('%s', reference)
+        log.debug('»')
+        log.debug('')
+        log.debug('')
 
-                    msg = f'FileSystemLeaf.Path{liste[0]}.{key}() :'
-                    fct = liste[1]
+        with open(f_reference, "rt") as new_file:
+            log.debug('Fichier de référence tel que converti en ENSEMBLE :')
+            log.debug('~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~')
+            log.debug('«')
+            for elt in set(new_file):
+                log.debug('%s', str(elt).rstrip('\r\n'))
+            log.debug('»')
+            log.debug('')
+            log.debug('')
 
-                    skull.shw('\t' + msg)
-                    skull.shw('\t' + '~' * len(msg))
-                    skull.shw('')
-                    skull.shw(f'=> {key} ( @MEMOIRE ) = {fct}')
-                    skull.shw(f'=> {key} (   TYPE   ) = {type(fct)}')
 
-                    try:
-                        skull.shw(f'=> {key} (  VALEUR  ) = {fct()}')
+        # On créé & on log le fichier à comparer.
+        #
+        f_transformation = '{} - ( 2 ) contenu transformé - {}.txt'.format(
+            it_begins_with,
+            skull.build_now_string()
+            )
 
-                    except AttributeError as e:
-                        skull.shw(f'=> {key} (  VALEUR  ) = ERREUR {type(e)}')
-                        skull.shw(f'{e}')
+        with open(f_transformation, "wt") as new_file:
+            new_file.write(transformation)
 
-                    skull.shw('')
-                    skull.shw('')
+        log.debug('Fichier transformé :')
+        log.debug('~~~~~~~~~~~~~~~~~~~~')
+        log.debug('«')
+        log.debug('%s', transformation)
+        log.debug('»')
+        log.debug('')
+        log.debug('')
 
-                    _pause_("PAUSE avant la syntaxe suivante", after=2)
+        with open(f_transformation, "rt") as new_file:
+            log.debug('Fichier transformé tel que converti en ENSEMBLE :')
+            log.debug('~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~')
+            log.debug('«')
+            for elt in set(new_file):
+                log.debug('%s', str(elt).rstrip('\r\n'))
+            log.debug('»')
+            log.debug('')
+            log.debug('')
 
 
-        # Nous allons maintenant détruire l'instance fake_tree
-        # pour observer comment réagit notre script...
-        #
-        # Nous allons ainsi dérouler les étapes suivantes :
-        #
-        #   . Récupérer l'adresse mémoire de fake_tree.
-        #
-        #   . Vérifier le nombre de références vers l'objet
-        #     fake_tree.
-        #   > On doit trouver = 2
-        #   ( fake_tree & FileSystemTree._tree_last )
-        #
-        #   . Annuler la référence de fake_tree vers cette
-        #     adresse ( espace ) mémoire :
-        #       - soit « del fake_tree »,
-        #       - soit « fake_tree = None »
-        #
-        #   . Vérifier le nombre de référence vers l'adresse
-        #     mémoire.
-        #   > On doit trouver = 1 ( _tree_last seulement )
-        #
-        #   . Attribuer à FileSystemTree._tree_last une autre
-        #     valeur que l'objet fake_tree ( skull.files par
-        #     par exemple ).
-        #
-        #   . Vérifier le nombre de référence vers l'adresse
-        #     mémoire.
-        #   > On doit trouver = 0
-        #   > L'objet fake_tree doit avoir disparu !
+        # On compare les 2 fichiers : INTERSECTION.
         #
-        skull.shw('DESTRUCTION du 2nd FileSystemTree utilisé :')
-        skull.shw('~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~')
+        skull.shw("RÉSULTAT de l'INTERSECTION des deux FICHIERS :")
+        skull.shw('~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~')
+        skull.shw('«')
+ 
+        intersection = skull.compare_files(
+            f_reference,
+            f_transformation,
+            action = 'intersection'
+            )
+
+        for elt in intersection:
+            skull.shw(str(elt).rstrip('\r\n'))
+        skull.shw('»')
         skull.shw('')
-        skull.shw('STEP 0')
-        skull.shw('État INITIAL des références vers le 2nd FileSystemTree :')
-        skull.shw(f'_find_var_refcounts_(fake_tree) = {_find_var_refcounts_(fake_tree)}')
         skull.shw('')
 
-        fake_address = id(fake_tree)
 
-        tests = {
-            #
-            # Step 1 : « del fake_tree » ou « fake_tree = None ».
-            # ========
-            #
-            'step 1' : 'fake_tree = None',
-            #
-            # Step 2 : Si l'on écrit :
-            # ========
-            #
-            #   skull.files._tree_last = skull.files
-            #
-            # ... alors _tree_last ne sera pas réellement modifié !!!
-            # ... et la référence ne disparaîtra donc pas.
-            #
-            # En effet, _tree_last est un attribut de classe et non
-            # d'instance.
-            #
-            'step 2' : 'skull.files._tree_last = skull.files',
-            #
-            # Step 3 : On annule la dernière référence à fake_tree.
-            # ========
-            #
-            # ... en modifiant _tree_last au niveau classe.
-            #
-            'step 3' : 'FileSystemTree._tree_last = skull.files',
-        }
+        # On compare les 2 fichiers : DIFFÉRENCE / au fichier référence.
+        #
+        skull.shw('LIGNES de la RÉFÉRENCE NON PRÉSENTES dans le fichier transformé :')
+        skull.shw('~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~')
+        skull.shw('«')
 
-        for key, action in tests.items():
+        difference = skull.compare_files(
+            f_reference,
+            f_transformation,
+            action = 'difference'
+            )
 
-            skull.shw(f'{key.upper()}')
-            skull.shw(f'Action exécutée : « {action} »')
-            skull.shw('')
+        for elt in difference:
+            skull.shw(str(elt).rstrip('\r\n'))
+        skull.shw('»')
+        skull.shw('')
+        skull.shw('')
+
+
+        # On compare les 2 fichiers : DIFFÉRENCE / au 2ème fichier.
+        #
+        # C-a-d que l'on va ici donner les lignes en plus dans le
+        # 2ème fichier...
+        #
+        skull.shw('LIGNES AJOUTÉES / MODIFIÉES dans le FICHIER TRANSFORMÉ :')
+        skull.shw('~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~')
+        skull.shw('«')
+ 
+        ajouts = skull.compare_files(
+            f_transformation,
+            f_reference,
+            action = 'difference'
+            )
 
-            exec(action)
+        for elt in ajouts:
+            skull.shw(str(elt).rstrip('\r\n'))
+        skull.shw('»')
+        skull.shw('')
+        skull.shw('')
 
-            skull.shw('Évolution des références vers le 2nd FileSystemTree :')
-            skull.shw(f'_find_var_refcounts_(fake_address) = {_find_var_refcounts_(None, fake_address)}')
-            skull.shw('')
 
-        _pause_("PAUSE avant les prochains AUTOTESTS", before=1, after=2)
+        # On compare les 2 fichiers : DIFFÉRENCE SYMÉTRIQUE.
+        #
+        skull.shw('RÉSULTAT de la DIFFÉRENCE SYMÉTRIQUE entre les deux FICHIERS :')
+        skull.shw('~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~')
+        skull.shw('«')
+ 
+        intersection = skull.compare_files(
+            f_reference,
+            f_transformation,
+            action = 'difference symétrique'
+            )
+
+        for elt in intersection:
+            skull.shw(str(elt).rstrip('\r\n'))
+        skull.shw('»')
+        skull.shw('')
+        skull.shw('')
 
 
     # #######################################################################
@@ -9672,51 +15732,78 @@ if __name__ == "__main__":
     # #######################################################################
     #
     user_answer = skull.ask_yes_or_no(
-        "Voulez-vous que je réalise les TESTS de COMPRÉHENSIONS de LISTE ?",
+        "Voulez-vous que je réalise les AUTOTESTS de get_unused_filename() ?",
         'non'
         )
 
     if user_answer:
 
-        # On affiche des résultats de compréhensions de
-        # liste à titre dicdactique.
-        #
-        # Ici, nous ne sommes donc pas vraiment dans de
-        # l'autotest... mais plus dans de la pédagogie.
+        # On appelle les fonctions convert_to_pdf_*() pour
+        # vérifier que Python ne plante pas en leur sein.
         #
         log.info('')
-        log.info('\t===============================')
-        log.info('\t>>> COMPRÉHENSIONS de LISTE <<<')
-        log.info('\t===============================')
+        log.info('\t=====================================')
+        log.info('\t>>> TEST de get_unused_filename() <<<')
+        log.info('\t=====================================')
         log.info('')
         log.info('')
 
-        mask = "*[[@]*"
+        f_name = f'{it_begins_with}.tmp'
 
-        log.info('Test et RÉSULTAT de :')
-        log.info('')
-        log.info(f'\t[ n for n in < current directory > if fnmatch.fnmatch( n.name, "{mask}" ) ]')
-        log.info('')
-        log.info('... où « n » est de type « FileSystelLeaf » ou « pathlib.Path » :')
-        log.info('')
+        skull.shw(f'Nom de référence = « {f_name} »')
+        skull.shw('')
 
-        try: fnmatch.translate('test_if*already_imported')
-        except AttributeError: import fnmatch
+        f_ext = '.blah-blah'
+        f_tmp = skull.get_unused_filename(f_name, f_ext, idx_force = False)
 
-        our_dir = leaf().iterdir
-        our_lst = [n for n in our_dir() if fnmatch.fnmatch(n.name, mask)]
+        skull.shw(f'Prochain nom disponible = « {f_tmp} »')
+        skull.shw(f"\t[ avec l'extension « {f_ext} » ]")
+        skull.shw('')
 
-        if len(our_lst) > 0:
+        skull.shw(f'Création de « {f_tmp} »')
+        skull.shw('')
 
-            for n in our_lst:
-                skull.shw(f'\t{n}')
+        leaf(f_tmp).touch()
+
+        skull.shw(f'Prochain nom après « {f_tmp} » ...')
+        skull.shw('')
+
+        skull.shw(
+            '\t* sur 18 chiffres, base 33 : « {} »'.format(
+                skull.get_unused_filename(f_name, '', 18, 33)
+                )
+            )
+        skull.shw(f"\t[ SANS extension ]")
+        skull.shw('')
+
+        f_tmp = skull.get_unused_filename(f_name)
 
+        skull.shw(f'\t* sur 3 chiffres, base 0 : « {f_tmp} »')
+        skull.shw(f"\t[ avec l'extension par DÉFAUT ]")
+        skull.shw('')
+
+        skull.shw(f'Création de « {f_tmp} »')
+        skull.shw('')
+
+        leaf(f_tmp).touch()
+
+        skull.shw(f'Re-Création de « {f_tmp} »')
+        skull.shw('')
+
+        try:
+            leaf(f_tmp).touch()
+
+        except FileExistsError:
+            skull.shw(f'\tINTERDITE CAR CE FICHIER EXISTE !!!')
             skull.shw('')
-            skull.shw(f'\t=> DATATYPE for ALL objects = {type(our_lst[0])}')
 
-        else:
-            skull.shw('\tNO SUCH FILES OR DIRECTORIES')
+        skull.shw(f'Prochain nom après « {f_tmp} » ...')
+        skull.shw('')
+
+        f_tmp = skull.get_unused_filename(f_name)
 
+        skull.shw(f'\t* sur 3 chiffres, base 0 : « {f_tmp} »')
+        skull.shw(f"\t[ avec l'extension par DÉFAUT ]")
         skull.shw('')
 
 
@@ -9727,51 +15814,145 @@ if __name__ == "__main__":
     # #######################################################################
     #
     user_answer = skull.ask_yes_or_no(
-        "Voulez-vous que je réalise mes AUTOTESTS de SAISIE ?",
+        "Voulez-vous que je réalise mes AUTOTESTS de DÉCOMPOSITIONS de PATH ?",
         'non'
         )
 
     if user_answer:
 
-        # On appelle choose_in_a_list() pour vérifier
-        # que Python ne plante pas en le parcourant.
+        # On appelle les fonctions convert_to_pdf_*() pour
+        # vérifier que Python ne plante pas en leur sein.
         #
         log.info('')
-        log.info('\t==================================')
-        log.info('\t>>> TEST de choose_in_a_list() <<<')
-        log.info('\t==================================')
+        log.info('\t======================================')
+        log.info('\t>>> TEST de DÉCOMPOSITIONS de PATH <<<')
+        log.info('\t======================================')
         log.info('')
         log.info('')
 
-        fruits = ['apple', 'banana', 'cherry']
-        idx = skull.choose_in_a_list(fruits, 1)
+        paths_with_slash = {
+            #
+            # Pour *ARGS :
+            # ~~~~~~~~~~~~
+            #
+            'DOS 1 part'      : ('C:/', ),
+            'DOS 2 parts'     : ('C:/', 'Voici' ),
+            'DOS 3 parts'     : ('C:/', 'Voici', 'un', 'path !' ),
+            'Unix 1 part'     : ('//server', ),
+            'Unix 2 parts'    : ('//server', 'Voici' ),
+            'Unix 3 parts'    : ('//server', 'Voici', 'un', 'path !' ),
+            #
+            # Pour WINDOWS : ( principalement )
+            # ~~~~~~~~~~~~~~
+            #
+            # Tests des paths classiques ( relatifs ou absolus ), mais
+            # aussi étendus ou UNC.
+            #
+            'relatif no dir'  : 'Lettres - de Papa à sa Mère.lnk',
+            'dir + relatif'   : 'Renato/Lettres - de Papa à sa Mère.lnk',
+            '/dir + relatif'  : '/Renato/Lettres - de Papa à sa Mère.lnk',
+            '.dir + relatif'  : './Renato/Lettres - de Papa à sa Mère.lnk',
+            '..dir + relatif' : '../Renato/Lettres - de Papa à sa Mère.lnk',
+            'absolu'          : 'K:/Renato/Lettres - de Papa à sa Mère.lnk',
+            'extend w disk'   : '//?/K:/Renato/Lettres - de Papa à sa Mère.lnk',
+            'extend w vol'    : '//./Volume{03b8d832-1552-45a5-827e-cfffa76aa867}/Renato/Lettres - de Papa à sa Mère.lnk',
+            'extend + UNC'    : '//?/UNC/Server/Share/Test/Foo.txt',
+            'UNC file'        : '//machine/mountpoint/directory/etc/Foo.txt',
+            'UNC dir + /'     : '//machine/mountpoint/directory/etc/',
+            'UNC dir - /'     : '//machine/mountpoint/directory/etc',
+            'UNC root + /'    : '//machine/mountpoint/',
+            'UNC root - /'    : '//machine/mountpoint',
+            #
+            # Pour WINDOWS : ( principalement )
+            # ~~~~~~~~~~~~~~
+            #
+            # les 2 paths suivants peuvent-ils être considérés comme
+            # ABSOLUS ? Ou ne sont-ils que INCOMPLETS ? En effet, un
+            # path UNC est normalement de la forme \\host\mountpoint,
+            # mais sur le web, de-ci de-là, on trouve des références
+            # à \\localhost ou \\127.0.0.1 dans des cas spécifiques.
+            #
+            # Nous considérons, dans la version « BRUT » de skeleton,
+            # i.e dans les versions qui ne s'appuient pas sur pathlib,
+            # que le 1ER de ces paths est ACCEPTABLE en tant que path
+            # ABSOLU. Le SECOND est, lui, RELATIF.
+            #
+            #   \\host\     => OK ie path ABSOLU
+            #   \\host      => NO ie path RELATIF
+            #
+            # Le module pathlib fait d'ailleurs de même...
+            #
+            'UNC host - /'    : '//host',
+            'UNC host + /'    : '//host/',
+            #
+            # Pour POSIX : ( principalement )
+            # ~~~~~~~~~~~~
+            #
+            # Les paths suivants sont-ils tous équivalents ?
+            #
+            # Normalement, oui...
+            #
+            'UNC unix 3 /'    : '///host/',
+            'UNC unix 4 /'    : '////host/',
+            'UNC unix 5 /'    : '/////host/',
+            'UNC unix 6 /'    : '//////host/',
+            #
+            # Pour WINDOWS : ( principalement )
+            # ~~~~~~~~~~~~~~
+            #
+            # Les paths suivants sont tirés de :
+            #
+            #   https://learn.microsoft.com/en-us/dotnet/standard/io/file-path-formats#example-ways-to-refer-to-the-same-file
+            #
+            'MS classic'      : "c:/temp/test-file.txt",
+            'MS 127.0.0.1'    : "//127.0.0.1/c$/temp/test-file.txt",
+            'MS localhost'    : "//LOCALHOST/c$/temp/test-file.txt",
+            'MS extend w .'   : "//./c:/temp/test-file.txt",
+            'MS extend w ?'   : "//?/c:/temp/test-file.txt",
+            'MS UNC lclhst'   : "//./UNC/LOCALHOST/c$/temp/test-file.txt",
+            #
+            # Les paths suivants sont tirés de :
+            #
+            #   https://learn.microsoft.com/en-us/dotnet/standard/io/file-path-formats#traditional-dos-paths
+            #
+            'MS trad abs'     : r"C:/Projects/apilibrary/apilibrary.sln",
+            'MS trad rel'     : r"C:Projects/apilibrary/apilibrary.sln",
+        }
 
-        if idx >= 0:
-            skull.shw(f'Votre réponse = {fruits[idx]}')
+        paths = paths_with_slash if os.name != 'nt' else {
+            k.replace('/', '\\')
+            : tuple(s.replace('/', '\\') for s in v)
+                if isinstance(v, tuple)
+                else v.replace('/', '\\')
+            for k, v in paths_with_slash.items()
+        }
 
-        skull.shw('')
+        for k, p in paths.items():
 
-        # On appelle choose_in_a_dict() pour vérifier
-        # que Python ne plante pas en le parcourant.
-        #
-        log.info('')
-        log.info('\t==================================')
-        log.info('\t>>> TEST de choose_in_a_dict() <<<')
-        log.info('\t==================================')
-        log.info('')
-        log.info('')
+            n = leaf(*p) if isinstance(p, tuple) else leaf(p)
 
-        capitals = {
-            "USA":"Washington D.C.",
-            "France":"Paris",
-            "India":"New Delhi"
-            }
-        key = skull.choose_in_a_dict(capitals, 'India')
+            log.info(f'Localisation : « {k:^16} » = {p}')
+            log.info('~~~~~~~~~~~~~~')
+            log.info('')
+            log.info(f'path construit\t-> {n}')
+            log.info('')
+            log.info(f'splitroot\t-> {n._flavour.splitroot(str(n))}')
+            log.info('')
 
-        if key is not None:
-            skull.shw(f'Votre réponse = {capitals[key]}')
+            try:
+                uri = n.as_uri()
+            except ValueError:
+                log.info('path.as_uri()\t-> « ValueError » car path RELATIF !!!')
+            else:
+                log.info(f'path.as_uri()\t-> {uri}')
 
-        skull.shw('')
+            _pause_("pause avant la recherche suivante",
+                    car="-", indent=3*margin,
+                    before=2, b_line=log.info,
+                    after=2, a_line=log.info)
+
+            log.info(77 * '-')
+            log.info('')
 
 
     # #######################################################################
@@ -9780,90 +15961,117 @@ if __name__ == "__main__":
     # -----------------------------------------------------------------------
     # #######################################################################
     #
-    user_answer = skull.ask_yes_or_no(
-        "Voulez-vous que je réalise mes AUTOTESTS de CONCATÉNATIONS de PATH ?",
+    user_answer = (w_pathlib not in pathlib_direct) and skull.ask_yes_or_no(
+        "Voulez-vous que je réalise le BENCHMARK des objets _FileSystemLeaf ?",
         'non'
         )
 
     if user_answer:
 
+        # On compare, en mémoire occupée et en temps d'accès aux
+        # parties d'un path ( name, stem, suffix, parent, drive ) :
+        #
+        #   . notre _FileSystemLeaf actuel ( __slots__ + cache ),
+        #   . son ancienne version ( __dict__ + recalcul à chaque
+        #   appel ), reproduite ci-dessous a minima,
+        #   . les objets pathlib.Path.
+        #
+        # RQ : Ce benchmark n'a pas de sens dans les modes de type
+        # « pathlib_direct_... » puisqu'alors _FileSystemLeaf n'est
+        # pas utilisé.
+        #
         log.info('')
-        log.info('\t==============================')
-        log.info('\t>>> CONCATÉNATIONS de PATH <<<')
-        log.info('\t==============================')
+        log.info('\t======================================')
+        log.info('\t>>> BENCHMARK de _FileSystemLeaf() <<<')
+        log.info('\t======================================')
         log.info('')
         log.info('')
 
-        skull.shw('EXEMPLE 1 : Opérateur « / » + Opérandes « FileSystelLeaf » et « STRING »')
-        skull.shw('')
+        try: tracemalloc
+        except NameError: import tracemalloc
 
-        # Nous écrivons nos PATH à la mode UNIX ( ie avec
-        # « / » comme séparateur ) car Python fournit des
-        # fonctions pour transformer cette notation UNIX
-        # vers celle Windows ( ie « \ » comme séparateur )
-        # mais pas pour l'inverse. Or nous lançons aussi,
-        # entre autres, ces tests sur iPad + iOS, où « \ »
-        # ne sera pas compris comme séparateur de PATH...
-        #
-        # Cf ainsi :
-        #
-        #   https://docs.python.org/3/library/os.path.html#os.path.normpath
-        #
-        #   (..) On Windows, it converts forward slashes
-        #   to backward slashes.
-        #
-        operande_1 = leaf(r"A:/blah/bleh/blih")
-        operande_2 = "ESSAI_n°1"
-        result = operande_1 / operande_2
+        try: pathlib.PurePath()
+        except AttributeError: import pathlib
 
-        skull.shw(f'\t« {str(operande_1)} »\tconcaténé avec\t« {str(operande_2)} »')
-        skull.shw(f'\t=> Résultat        = « {result} »')
-        skull.shw(f'\toù Type Opérande 1 = « {type(operande_1)} »')
-        skull.shw(f'\tet Type Opérande 2 = « {type(operande_2)} »')
-        skull.shw(f'\tet Type Résultat   = « {type(result)} »')
-        skull.shw('')
+        class _OldLeaf:
 
-        skull.shw('EXEMPLE 2 : Opérateur « / » + Opérandes « STRING » et « FileSystelLeaf » ( mais BUG car 2 disques indiqués !!! )')
-        skull.shw('')
+            # Reproduction de l'ancienne structure de _FileSystemLeaf
+            # ( avant __slots__ ) : 1 __dict__ par objet, et chaque
+            # propriété relance son calcul via os.path.
 
-        operande_1 = r"B:/ESSAI_n°2"
-        operande_2 = leaf(r"C:/problème/car/deux/disques")
-        result = operande_1 / operande_2
+            def __init__(self, tree, location):
+                self.tree = tree
+                self._flavour = _windows if os.name == 'nt' else _posix
+                self.walking_mode = tree.walking_mode
+                self.location_string = os.path.normpath(os.fspath(str(location)))
+                self.location_object = None
 
-        skull.shw(f'\t« {str(operande_1)} »\tconcaténé avec\t« {str(operande_2)} »')
-        skull.shw(f'\t=> Résultat        = « {result} »')
-        skull.shw(f'\toù Type Opérande 1 = « {type(operande_1)} »')
-        skull.shw(f'\tet Type Opérande 2 = « {type(operande_2)} »')
-        skull.shw(f'\tet Type Résultat   = « {type(result)} »')
-        skull.shw('')
+            @property
+            def drive(self):
+                return os.path.splitdrive(self.location_string)[0]
 
-        skull.shw(r"EXEMPLE 3 : Idem et 1er BUG réglé ( mais 2nd BUG car le « \ » de l'opérande 2 masque « problème\réglé » !!! )")
-        skull.shw('')
+            @property
+            def parent(self):
+                return _OldLeaf(self.tree, os.path.dirname(self.location_string))
 
-        operande_1 = r"D:/problème/réglé"
-        operande_2 = leaf(r"/ESSAI_n°3")
-        result = operande_1 / operande_2
+            @property
+            def name(self):
+                return os.path.basename(self.location_string)
 
-        skull.shw(f'\t« {str(operande_1)} »\tconcaténé avec\t« {str(operande_2)} »')
-        skull.shw(f'\t=> Résultat        = « {result} »')
-        skull.shw(f'\toù Type Opérande 1 = « {type(operande_1)} »')
-        skull.shw(f'\tet Type Opérande 2 = « {type(operande_2)} »')
-        skull.shw(f'\tet Type Résultat   = « {type(result)} »')
-        skull.shw('')
+            @property
+            def stem(self):
+                return os.path.splitext(self.name)[0]
 
-        skull.shw('EXEMPLE 4 : Opérateur « /= »')
+            @property
+            def suffix(self):
+                return os.path.splitext(self.location_string)[1]
+
+        nb_nodes = 100000
+        nb_loops = 5
+
+        root = os.getcwd()
+        names = [
+            os.path.join(root, f'fichier n°{i:06d}.txt')
+            for i in range(nb_nodes)
+            ]
+
+        candidates = {
+            '_FileSystemLeaf ( __slots__ )': lambda p: FileSystemTree._FileSystemLeaf(skull.files, p),
+            '_FileSystemLeaf ( ancien )'   : lambda p: _OldLeaf(skull.files, p),
+            'pathlib.Path'                 : pathlib.Path,
+        }
+
+        skull.shw(f'Nombre de noeuds = {nb_nodes}')
+        skull.shw(f'Nombre de lectures des parties de chaque path = {nb_loops}')
         skull.shw('')
 
-        operande_1 = leaf("Z://woah_wouh//")
-        operande_2 = "ESSAI_n°4"
-        result = operande_1
-        result /= operande_2
+        for label, builder in candidates.items():
+
+            tracemalloc.start()
+            t_start = time.perf_counter()
+
+            nodes = [builder(n) for n in names]
+
+            t_build = time.perf_counter() - t_start
+            mem_used, _ = tracemalloc.get_traced_memory()
+            tracemalloc.stop()
+
+            t_start = time.perf_counter()
+
+            for _ in range(nb_loops):
+                for n in nodes:
+                    n.name ; n.stem ; n.suffix ; n.drive
+
+            t_parts = time.perf_counter() - t_start
+
+            skull.shw(f'\t{label} :')
+            skull.shw(f'\t\t- mémoire      = {mem_used / nb_nodes:8.1f} octets / noeud')
+            skull.shw(f'\t\t- création     = {t_build:8.3f} s')
+            skull.shw(f'\t\t- name, stem.. = {t_parts:8.3f} s')
+            skull.shw('')
+
+            del nodes
 
-        skull.shw(f'\t« {str(operande_1)} »\tconcaténé avec\t« {str(operande_2)} »')
-        skull.shw(f'\t=> Résultat        = « {result} »')
-        skull.shw(f'\toù Type Opérande 1 = « {type(operande_1)} »')
-        skull.shw(f'\tet Type Opérande 2 = « {type(operande_2)} »')
-        skull.shw(f'\tet Type Résultat   = « {type(result)} »')
         skull.shw('')
 
 
@@ -9873,216 +16081,278 @@ if __name__ == "__main__":
     # -----------------------------------------------------------------------
     # #######################################################################
     #
-    user_answer = skull.ask_yes_or_no(
-        "Voulez-vous que je réalise mes AUTOTESTS de RECHERCHE de fichiers & ÉDITION format texte ?",
+    user_answer = (w_pathlib not in pathlib_direct) and skull.ask_yes_or_no(
+        "Voulez-vous que je réalise le BENCHMARK des masques « ? », « [seq] », « [!seq] » ?",
         'non'
         )
 
     if user_answer:
 
-        # Dans un 1er temps, nous limitions le test de notre
-        # méthode _fake_iglob() aux seuls cas où la gestion
-        # du système de fichiers ne dépendait que du module
-        # OS ( et de os.path ) :
+        # On compare, sur une longue liste de noms, notre fonction de
+        # test native ( expression régulière compilée une seule fois
+        # par _compile_mask ) à celle utilisée lorsque FNMATCH nous est
+        # imposé ( _search_fnmatch ), i-e 1 appel à fnmatch.fnmatch()
+        # par nom.
         #
-        #   if not (w_glob or w_fnmatch) and w_pathlib == pathlib_ignore:
+        # On vérifie également que les 2 donnent les mêmes résultats
+        # ( aux différences de casse près, puisque notre recherche est
+        # toujours insensible à la casse ).
         #
-        # Nous avons depuis élargi le nombre des cas où nous
-        # testions _fake_iglob(). Pour autant, ns ne testons
-        # pas cette méthode en modes « pathlib_direct_... »
-        # puisque, dans ces modes, la gestion du système de
-        # fichiers est totalement déléguée au module PATHLIB
-        # et à ses objets pathlib.PATH qui ne disposent pas
-        # d'une méthode _fake_iglob()... !!!
-        # 
-        if not (w_pathlib in pathlib_direct):
-
-            # On appelle _fake_iglob() pour vérifier que
-            # Python n'y plante pas.
-            #
-            log.info('')
-            log.info('\t=============================')
-            log.info('\t>>> TEST de _fake_iglob() <<<')
-            log.info('\t=============================')
-            log.info('')
-            log.info('Version FRUSTRE :')
-            log.info('-----------------')
-            log.info('')
-            log.info('Nous testons cette méthode dans le cas de fichiers ou répertoires seuls.')
-            log.info('Le cas « indifférencié » est scanné via « search_files_from_a_mask() ».')
-            log.info('')
-            log.info('')
+        log.info('')
+        log.info('\t=============================================')
+        log.info('\t>>> BENCHMARK des masques « ? », « [..] » <<<')
+        log.info('\t=============================================')
+        log.info('')
+        log.info('')
 
-            t_name = {
-                _glob_only_dirs: 'SOUS-RÉPERTOIRES',
-                _glob_only_files: 'FICHIERS'
-            }
+        bench_dir = FileSystemTree._FileSystemLeaf(skull.files, os.getcwd())
 
-            our_dir = leaf()
+        nb_names = 200000
 
-            for t in (_glob_only_dirs, _glob_only_files):
+        names = [
+            f'title_t{i % 100:02d}.{("mkv", "MKV", "mov", "txt", "cfg")[i % 5]}'
+            for i in range(nb_names)
+            ]
 
-                msg = t_name[t] + ' du répertoire courant :'
+        for mask in ('title_t?[0-9].m[!o]*', '*.[mc][kf]?', 'TITLE_T[!0]?.*'):
 
-                log.info('\t' + msg)
-                log.info('\t' + '~' * len(msg))
+            native = bench_dir._parse_mask(mask)
+            forced = bench_dir._parse_mask(mask, _search_fnmatch)
 
-                for n in sorted(our_dir._fake_iglob(n_type = t)):
-                    skull.shw(f'\t{n}')
+            t_start = time.perf_counter()
+            found_native = [n for n in names if native.match(n)]
+            t_native = time.perf_counter() - t_start
 
-                skull.shw('')
-                skull.shw('')
+            t_start = time.perf_counter()
+            found_fnmatch = [n for n in names if forced.match(n)]
+            t_fnmatch = time.perf_counter() - t_start
 
-            _pause_("PAUSE avant la syntaxe suivante")
+            same = found_native == [
+                n for n in names if fnmatch.fnmatchcase(n.lower(), mask.lower())
+                ]
 
-            log.info('')
-            log.info('Version FNMATCH :')
-            log.info('-----------------')
-            log.info('')
+            skull.shw(f'\tMasque « {mask} » ( {nb_names} noms ) :')
+            skull.shw(f'\t\t- natif   = {t_native:8.3f} s & {len(found_native)} noms retenus')
+            skull.shw(f'\t\t- fnmatch = {t_fnmatch:8.3f} s & {len(found_fnmatch)} noms retenus')
+            skull.shw(f'\t\t- gain    = x {t_fnmatch / t_native:.1f}')
+            skull.shw(f'\t\t- résultats identiques ( casse ignorée ) = {same}')
+            skull.shw('')
 
-            mask = '*[{(@]*'
-            mask_dct = our_dir._parse_mask(mask, _search_fnmatch)
+        skull.shw('')
 
-            log.info(f'Masque = {mask}')
-            log.info('')
 
-            for n in sorted(our_dir._fake_iglob(**mask_dct)):
-                skull.shw(f'\t{n}')
+    # #######################################################################
+    # -----------------------------------------------------------------------
+    # #######################################################################
+    # -----------------------------------------------------------------------
+    # #######################################################################
+    #
+    user_answer = isinstance(skull.files, FileSystemTree) \
+        and not skull.files.pathlib_import \
+        and skull.ask_yes_or_no(
+            "Voulez-vous que je réalise le BENCHMARK des INDEX de répertoires ?",
+            'non'
+            )
 
-            _pause_("PAUSE avant la syntaxe suivante",
-                    before=2, b_line=skull.shw)
+    if user_answer:
 
-        # On appelle search_files_from_a_mask() pour
-        # vérifier que Python n'y plante pas.
+        # Dans un répertoire temporaire rempli de fichiers, on compare
+        # le temps d'une recherche via masque :
+        #
+        #   . à FROID = sans index, le répertoire est relu ;
+        #
+        #   . à CHAUD ( disque ) = avec un index, lu depuis son fichier,
+        #   comme lors d'une nouvelle exécution de notre script ;
+        #
+        #   . à CHAUD ( mémoire ) = avec un index déjà lu.
+        #
+        # RQ : Sur un disque local, le gain est faible ( voire négatif )
+        # car l'OS a lui-même le répertoire en cache. C'est sur les partages
+        # réseau que le gain est réel.
         #
         log.info('')
         log.info('\t==========================================')
-        log.info('\t>>> TEST de search_files_from_a_mask() <<<')
+        log.info('\t>>> BENCHMARK des INDEX de répertoires <<<')
         log.info('\t==========================================')
         log.info('')
         log.info('')
 
-        # On défini dans la liste ( de n-uplets nommés )
-        # suivante toutes les recherches que nous allons
-        # mener. Ainsi :
-        #
-        #   1 - On va chercher tout d'abord des fichiers
-        #       *.ISO dans un répertoire lointain...
-        #
-        #   2 - Ensuite : tous les fichiers ( * ) dans un
-        #       répertoire proche...
-        #
-        #   3 - ...
-        #
-        #   x - Enfin : les fichiers *.py du répertoire de
-        #       travail.
-        #
-        try: collections
-        except NameError: import collections
+        nb_files = 20000
+        tree = skull.files
+        old_index = tree.index
 
-        Search = collections.namedtuple(
-            "Search",
-            ['mask', 'dir']
-            )
+        with tempfile.TemporaryDirectory() as bench_dir, \
+            tempfile.TemporaryDirectory() as index_dir:
 
-        # Nous écrivons nos PATH à la mode UNIX ( ie avec
-        # « / » comme séparateur ) car Python fournit des
-        # fonctions pour transformer cette notation UNIX
-        # vers celle Windows ( ie « \ » comme séparateur )
-        # mais pas pour l'inverse. Or nous lançons aussi,
-        # entre autres, ces tests sur iPad + iOS, où « \ »
-        # ne sera pas compris comme séparateur de PATH...
-        #
-        # Cf ainsi :
-        #
-        #   https://docs.python.org/3/library/os.path.html#os.path.normpath
+            for i in range(nb_files):
+                with open(os.path.join(bench_dir, f'f{i:05d}.{("txt", "py")[i % 2]}'), 'w'):
+                    pass
+
+            def _timed_search() -> tuple:
+                t_start = time.perf_counter()
+                found = skull.search_files_from_a_mask(bench_dir, 'f1*.py')
+                return time.perf_counter() - t_start, len(found)
+
+            tree.index = None
+            t_cold, n_cold = _timed_search()
+
+            tree.index = _DirectoryIndex(index_dir, tree.write_in_log)
+
+            t_start = time.perf_counter()
+            tree.index_build(bench_dir)
+            t_build = time.perf_counter() - t_start
+
+            tree.index = _DirectoryIndex(index_dir, tree.write_in_log)
+            t_disk, n_disk = _timed_search()
+            t_memory, n_memory = _timed_search()
+
+            tree.index_drop()
+            tree.index = old_index
+
+        skull.shw(f'Recherche de « f1*.py » parmi {nb_files} fichiers :')
+        skull.shw(f'\t- à froid ( sans index )   = {t_cold:8.4f} s & {n_cold} fichiers')
+        skull.shw(f'\t- construction de l\'index  = {t_build:8.4f} s')
+        skull.shw(f'\t- à chaud ( index disque ) = {t_disk:8.4f} s & {n_disk} fichiers')
+        skull.shw(f'\t- à chaud ( index mémoire )= {t_memory:8.4f} s & {n_memory} fichiers')
+        skull.shw('')
+        skull.shw('')
+
+
+    # #######################################################################
+    # -----------------------------------------------------------------------
+    # #######################################################################
+    # -----------------------------------------------------------------------
+    # #######################################################################
+    #
+    user_answer = skull.ask_yes_or_no(
+        "Voulez-vous que je réalise le BENCHMARK du CACHE des exécutables ?",
+        'non'
+        )
+
+    if user_answer:
+
+        # On compare la durée de set_paths_and_miscellaneous() lorsque
+        # toutes les recherches d'exécutables sont refaites ( comme lors
+        # d'1 1ère exécution ), puis lorsqu'elles sont relues dans notre
+        # cache ( comme lors des exécutions suivantes ).
         #
-        #   (..) On Windows, it converts forward slashes
-        #   to backward slashes.
+        # RQ : Ces recherches n'ont lieu que sous Windows. Ailleurs, les
+        # 2 durées doivent donc être identiques.
         #
-        searches_todo = (
-            Search('*',     __file__),  # ERREUR = dans 1 fichier, non 1 répertoire
-            Search('*.iso', r"K:/_Backup.CDs/Comptabilité"),
-            Search('*.*',   r"../tmp"),
-            Search('(*',    r"../all files to one PDF"),
-            Search('r*',    r"../StoreKit"),            
-            #
-            # Ajouter ci-dessus d'éventuelles nouvelles
-            # recherches. Laisser les 2 recherches qui
-            # suivent en dernière position.
-            #
-            # En effet, la dernière ( sk*le*.py ) de la
-            # liste = son résultat nourrit le traitement
-            # qui la suit.
-            #
-            # Par ailleurs, l'avant-dernière recherche
-            # ( Sk*lE*.py ) permet, elle, de tester si l'
-            # OS est sensible à la casse en fonction des
-            # différentes options choisies ( avec glob
-            # ou pas, avec fnmatch ou pas, ... ). C'est
-            # par exple le cas sous iPadOS 16.3.1 ( ie
-            # Darwin Kernel Version 22.3.0 avec PYTHON
-            # version 3.11.0 ).
-            #
-            Search('Sk*lE*.py',  None),
-            Search('sk*le*.py',  None)
-            )
-
-        for idx, s in enumerate(searches_todo, start=0):
+        log.info('')
+        log.info('\t===========================================')
+        log.info('\t>>> BENCHMARK du CACHE des exécutables <<<')
+        log.info('\t===========================================')
+        log.info('')
+        log.info('')
 
-            if idx > 0:
-                _pause_("pause avant la recherche suivante",
-                        car="-", indent=3*margin,
-                        before=2, b_line=skull.shw,
-                        after=2, a_line=skull.shw)
+        nb_loops = 10
+        durations = {}
 
-            files_found = skull.search_files_from_a_mask(
-                directory = s.dir,
-                mask = s.mask
-                )
+        for use_cache in ( False, True ):
 
-            msg_dir = f"« {s.mask} » in « {'.' if s.dir is None else s.dir} »"
-            msg_find = 9 * ' ' + f'---> Fichier(s) trouvé(s) :'
-            len_maxi = max(len(msg_dir), len(msg_find))
+            t_start = time.perf_counter()
 
-            skull.shw('~' * len_maxi)
-            skull.shw(msg_dir)
-            skull.shw(msg_find)
-            skull.shw('~' * len_maxi)
+            for _ in range(nb_loops):
+                skull.set_paths_and_miscellaneous(
+                    print_configuration = False,
+                    use_cache = use_cache
+                    )
 
-            if files_found is None or len(files_found) == 0:
-                skull.shw('\tNO SUCH FILES or DIRECTORIES...')
+            durations[use_cache] = ( time.perf_counter() - t_start ) / nb_loops
 
-            else:
-                for file_name in sorted(files_found):
-                    skull.shw(f'\t{file_name}')
-                    skull.shw(f'\t\t=> DATATYPE = {type(file_name)}')
+        skull.shw(f'Démarrage = set_paths_and_miscellaneous() ( moyenne sur {nb_loops} ) :')
+        skull.shw(f'\t- recherches complètes = {durations[False]:8.4f} s')
+        skull.shw(f'\t- via notre cache      = {durations[True]:8.4f} s')
+        skull.shw(f'\t- fichier cache        = {skull._discovery_cache_file()}')
+        skull.shw('')
 
-            skull.shw('')
-            skull.shw('')
-            skull.shw(77 * '-')
+        for key in ( 'EXE_libre_office', 'EXE_libre_writer', 'EXE_txt_editor' ):
+            skull.shw(f'\t{key:<18} = {skull.paths_and_miscellaneous[key]}')
 
         skull.shw('')
         skull.shw('')
 
-        user_answer = skull.ask_yes_or_no(
-            f"Édition des fichiers {s.mask} ( via l'éditeur de TXT ) ?",
-            'non'
-            )
 
-        if user_answer:
+    # #######################################################################
+    # -----------------------------------------------------------------------
+    # #######################################################################
+    # -----------------------------------------------------------------------
+    # #######################################################################
+    #
+    user_answer = skull.ask_yes_or_no(
+        "Voulez-vous que je réalise le BENCHMARK du LOG en tâche de fond ?",
+        'non'
+        )
 
-            log.info('')
-            log.info('\t===============================')
-            log.info('\t>>> TEST de edit_file_txt() <<<')
-            log.info('\t===============================')
-            log.info('')
-            log.info('')
+    if user_answer:
 
-            skull.edit_file_txt(
-                *files_found,
-                wait = False
-                )
+        # On mesure, du point de vue de l'appelant, le coût de N appels
+        # à log.debug() lorsque le fichier LOG est écrit directement, puis
+        # lorsqu'il l'est en tâche de fond ( cf _LogQueueHandler ), et ce
+        # pour chacune des politiques de débordement de la file.
+        #
+        # RQ : Un journal à part est utilisé, afin de ne pas remplir le
+        # nôtre de ces N messages...
+        #
+        log.info('')
+        log.info('\t=============================================')
+        log.info('\t>>> BENCHMARK du LOG en tâche de fond <<<')
+        log.info('\t=============================================')
+        log.info('')
+        log.info('')
+
+        nb_records = 50000
+        bench_log = logging.getLogger(f'{log.name}_benchmark')
+        bench_log.setLevel(logging.DEBUG)
+        bench_log.propagate = False
+
+        with tempfile.TemporaryDirectory() as bench_dir:
+
+            skull.shw(f'Durée de {nb_records} appels à log.debug() :')
+
+            for overflow in ( None, ) + log_overflows:
+
+                file_handler = logging.FileHandler(
+                    os.path.join(bench_dir, f'{overflow}.log'),
+                    encoding = 'utf-8'
+                    )
+                file_handler.setFormatter(logging.Formatter(
+                    fmt = '%(asctime)s - %(levelname)-9s %(message)s'
+                    ))
+
+                if overflow is None:
+                    handler = file_handler
+                else:
+                    handler = _LogQueueHandler(1000, overflow)
+                    handler.start(file_handler)
+
+                bench_log.addHandler(handler)
+
+                t_start = time.perf_counter()
+
+                for i in range(nb_records):
+                    bench_log.debug('Message n° %d de notre benchmark.', i)
+
+                t_caller = time.perf_counter() - t_start
+
+                if overflow is not None:
+                    handler.stop()
+
+                t_total = time.perf_counter() - t_start
+
+                bench_log.removeHandler(handler)
+                file_handler.close()
+
+                dropped = 0 if overflow is None else handler.dropped
+
+                skull.shw(
+                    f'\t- {str(overflow or "direct"):<12} : appelant = {t_caller:8.4f} s,'
+                    f' total = {t_total:8.4f} s, perdus = {dropped}'
+                    )
+
+        skull.shw('')
+        skull.shw('')
 
 
     # #######################################################################
@@ -10091,102 +16361,60 @@ if __name__ == "__main__":
     # -----------------------------------------------------------------------
     # #######################################################################
     #
-    user_answer = skull.ask_yes_or_no(
-        "Voulez-vous que je réalise mes AUTOTESTS de PDF ?",
+    user_answer = (w_pathlib not in pathlib_direct) and skull.ask_yes_or_no(
+        "Voulez-vous que je réalise le BENCHMARK du LOG dans « _fake_iglob » ?",
         'non'
         )
 
     if user_answer:
 
-        # On appelle les fonctions convert_to_pdf_*() pour
-        # vérifier que Python ne plante pas en leur sein.
+        # On mesure le parcours par _fake_iglob() d'1 répertoire de 100k
+        # fichiers, lorsque chaque fichier trouvé est journalisé, lorsque
+        # notre journal ignore les messages DEBUG ( aucun message n'est
+        # alors même construit ), puis en mode « quiet walk ».
         #
         log.info('')
-        log.info('\t==================================')
-        log.info('\t>>> TEST de convert_to_pdf_*() <<<')
-        log.info('\t==================================')
+        log.info('\t================================================')
+        log.info('\t>>> BENCHMARK du LOG dans « _fake_iglob » <<<')
+        log.info('\t================================================')
         log.info('')
         log.info('')
 
-        if skull.convert_to_pdf_init():
+        nb_files = 100000
+        old_level = log.level
 
-            f_name = '{} - {}.txt'.format(
-                it_begins_with,
-                skull.build_now_string()
-                )
+        with tempfile.TemporaryDirectory() as bench_dir:
 
-            with open(f_name, "wt") as f_test:
+            for i in range(nb_files):
+                with open(os.path.join(bench_dir, f'f{i:06d}.txt'), 'w'):
+                    pass
 
-                f_test.write(
-                    '#\n'
-                    '# =================\n'
-                    "# FICHIER DE TEST :\n"
-                    '# =================\n'
-                    '#\n'
-                    '# Bonjour, je suis un fichier totalement inutile.\n'
-                    "# J'ai vocation à être détruit après ma création.\n"
-                    '#\n'
-                    '\n'
-                    'Lorem ipsum (également appelé faux-texte, lipsum, ou bolo bolo)\n'
-                    'https://fr.wikipedia.org/wiki/Lorem_ipsum\n'
-                    '\n'
-                    "Lorem ipsum dolor sit amet, consectetur adipiscing elit. Sed non risus.\n"
-                    "Suspendisse lectus tortor, dignissim sit amet, adipiscing nec, ultricies\n"
-                    "sed, dolor. Cras elementum ultrices diam. Maecenas ligula massa, varius a,\n"
-                    "semper congue, euismod non, mi. Proin porttitor, orci nec nonummy molestie,\n"
-                    "enim est eleifend mi, non fermentum diam nisl sit amet erat. Duis semper.\n"
-                    "Duis arcu massa, scelerisque vitae, consequat in, pretium a, enim. Pellentesque\n"
-                    "congue. Ut in risus volutpat libero pharetra tempor. Cras vestibulum bibendum\n"
-                    "augue. Praesent egestas leo in pede. Praesent blandit odio eu enim. Pellentesque\n"
-                    "sed dui ut augue blandit sodales. Vestibulum ante ipsum primis in faucibus orci\n"
-                    "luctus et ultrices posuere cubilia Curae; Aliquam nibh. Mauris ac mauris sed\n"
-                    "pede pellentesque fermentum. Maecenas adipiscing ante non diam sodales hendrerit.\n"
-                    '\n'
-                    "Ut velit mauris, egestas sed, gravida nec, ornare ut, mi. Aenean ut orci vel\n"
-                    "massa suscipit pulvinar. Nulla sollicitudin. Fusce varius, ligula non tempus\n"
-                    "aliquam, nunc turpis ullamcorper nibh, in tempus sapien eros vitae ligula.\n"
-                    "Pellentesque rhoncus nunc et augue. Integer id felis. Curabitur aliquet\n"
-                    "pellentesque diam. Integer quis metus vitae elit lobortis egestas.\n"
-                    '\n'
-                    "Lorem ipsum dolor sit amet, consectetuer adipiscing elit. Morbi vel erat non\n"
-                    "mauris convallis vehicula. Nulla et sapien. Integer tortor tellus, aliquam\n"
-                    "faucibus, convallis id, congue eu, quam. Mauris ullamcorper felis vitae erat.\n"
-                    "Proin feugiat, augue non elementum posuere, metus purus iaculis lectus, et\n"
-                    "tristique ligula justo vitae magna.\n"
-                    '\n'
-                    "Aliquam convallis sollicitudin purus. Praesent aliquam, enim at fermentum\n"
-                    "mollis, ligula massa adipiscing nisl, ac euismod nibh nisl eu lectus. Fusce\n"
-                    "vulputate sem at sapien. Vivamus leo. Aliquam euismod libero eu enim. Nulla\n"
-                    "nec felis sed leo placerat imperdiet. Aenean suscipit nulla in justo. Suspendisse\n"
-                    "cursus rutrum augue. Nulla tincidunt tincidunt mi. Curabitur iaculis, lorem vel\n"
-                    "rhoncus faucibus, felis magna fermentum augue, et ultricies lacus lorem varius\n"
-                    "purus. Curabitur eu amet.\n"
-                    '\n')
+            bench_node = skull.files.Path(bench_dir)
+            durations = {}
 
-            # ATTENTION = On réalise dorénavant :
-            #
-            #       une exécution SYNCHRONE ( wait = True ) !!!
-            #
-            # ... En effet, si l'exécution est asynchrone, Libre Office ne
-            # va en général convertir qu'un seul des 2 fichiers ( soit le
-            # fichier temporaire f_name, soit __file__ ). Et on ne peut pas
-            # savoir lequel des 2 aura sa préférence...
-            #
-            # Il semble que cela soit dû au fait que Libre Office reçoit
-            # trop rapidement & trop consécutivement les deux demandes de
-            # conversion et que, dans la « précipitation », il perde ses
-            # billes, en oublie un ( le 1er ou le 2ème, il n'y a pas de
-            # règle à ce sujet ) : Libre Office ne convertit que l'autre.
-            #
-            skull.convert_to_pdf_run(f_name, __file__, wait = True)
+            for label, level, quiet in (
+                ( 'LOG DEBUG actif', logging.DEBUG, False ),
+                ( 'LOG DEBUG ignoré', logging.INFO, False ),
+                ( 'quiet walk', logging.DEBUG, True )
+                ):
 
-            skull.shw(f'Fichier converti : {f_name}')
-            skull.shw(f'Fichier converti : {__file__}')
+                log.setLevel(level)
+                skull.quiet_walk_mode(quiet)
 
-        else:
-            skull.shw('Conversion PDF impossible sur ce terminal.')
+                t_start = time.perf_counter()
+                nb_found = sum(1 for _ in bench_node._fake_iglob(mask = '*.txt'))
+                durations[label] = ( time.perf_counter() - t_start, nb_found )
+
+            skull.quiet_walk_mode(False)
+            log.setLevel(old_level)
+
+        skull.shw(f'_fake_iglob( « *.txt » ) sur {nb_files} fichiers :')
+
+        for label, ( duration, nb_found ) in durations.items():
+            skull.shw(f'\t- {label:<17} = {duration:8.4f} s & {nb_found} fichiers')
 
         skull.shw('')
+        skull.shw('')
 
 
     # #######################################################################
@@ -10196,174 +16424,131 @@ if __name__ == "__main__":
     # #######################################################################
     #
     user_answer = skull.ask_yes_or_no(
-        "Voulez-vous que je réalise mes AUTOTESTS de COMPARAISON de FICHIERS ?",
+        "Voulez-vous que je réalise le BENCHMARK de l'affichage en blocs ?",
         'non'
         )
-    
+
     if user_answer:
 
-        # On appelle & teste la fonction compare_files().
+        # On compare l'affichage de N lignes, 1 par 1 ( avec vidage après
+        # chaque ligne, comme sur un terminal ), puis via notre tampon (
+        # cf _ScreenBuffer ). Afin de ne pas inonder l'écran, ces lignes
+        # sont envoyées vers os.devnull : ce benchmark ne mesure donc que
+        # le nombre d'appels système économisés, le gain étant bien plus
+        # important sur un terminal lent.
         #
         log.info('')
-        log.info('\t=======================================')
-        log.info('\t>>> TEST de COMPARAISON de FICHIERS <<<')
-        log.info('\t=======================================')
+        log.info('\t==============================================')
+        log.info("\t>>> BENCHMARK de l'affichage en blocs <<<")
+        log.info('\t==============================================')
         log.info('')
         log.info('')
 
-        reference = (
-            "Ve 29 feb AF 134 CDG (1,0) BOM    09h30 18h00 77W TVSV :  8h30 \n"
-            "\n"
-            "\tEquipage PNC\n"
-            "DEI CAS  LAURENT  36017312     B  EN SUPPLEM  P  IMPOS COMM.   UEKR  AMERIQUES  2EJ  \n"
-            "######### FIN #########"
-            )
+        nb_lines = 100000
 
-        transformation = (
-            "Ve 29 feb AF 134 CDG (1,0) BOM    09h30 18h00 77W TVSV :  8h30 \n"
-            "\n"
-            "\tEquipage PNC\n"
-            "DEI CAS LAURENT                   36017312                      B EN SUPPLEM P IMPOS COMM.     UEKR AMERIQUES        2EJ\n"
-            "\n"
-            "\tEquipage PNC\n"
-            "DEI CAS LAURENT                   36017312   A350 359       C/C                                KDKR CAR/OCEAN INDIEN 3DD\n"
-            "######### FIN #########"
-            )
+        with open(os.devnull, 'w', encoding = 'utf-8') as null_screen:
 
+            t_start = time.perf_counter()
 
-        # On créé & on log le fichier de référence.
-        #
-        f_reference = '{} - ( 1 ) contenu de référence - {}.txt'.format(
-            it_begins_with,
-            skull.build_now_string()
-            )
+            for i in range(nb_lines):
+                print(f'Ligne n° {i} de notre benchmark.', file = null_screen, flush = True)
 
-        with open(f_reference, "wt") as new_file:
-            new_file.write(reference)
+            t_direct = time.perf_counter() - t_start
 
-        log.debug('Fichier de référence :')
-        log.debug('~~~~~~~~~~~~~~~~~~~~~~')
-        log.debug('«')
-        log.debug('%s', reference)
-        log.debug('»')
-        log.debug('')
-        log.debug('')
+            screen = _ScreenBuffer(null_screen)
+            t_start = time.perf_counter()
 
-        with open(f_reference, "rt") as new_file:
-            log.debug('Fichier de référence tel que converti en ENSEMBLE :')
-            log.debug('~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~')
-            log.debug('«')
-            for elt in set(new_file):
-                log.debug('%s', str(elt).rstrip('\r\n'))
-            log.debug('»')
-            log.debug('')
-            log.debug('')
+            for i in range(nb_lines):
+                _show_(f'Ligne n° {i} de notre benchmark.', screen = screen)
 
+            screen.drain()
+            t_buffered = time.perf_counter() - t_start
 
-        # On créé & on log le fichier à comparer.
-        #
-        f_transformation = '{} - ( 2 ) contenu transformé - {}.txt'.format(
-            it_begins_with,
-            skull.build_now_string()
-            )
+        skull.shw(f'Affichage de {nb_lines} lignes :')
+        skull.shw(f'\t- 1 par 1   = {t_direct:8.4f} s')
+        skull.shw(f'\t- en blocs  = {t_buffered:8.4f} s ( {screen.max_lines} lignes max par bloc )')
+        skull.shw('')
+        skull.shw('')
 
-        with open(f_transformation, "wt") as new_file:
-            new_file.write(transformation)
 
-        log.debug('Fichier transformé :')
-        log.debug('~~~~~~~~~~~~~~~~~~~~')
-        log.debug('«')
-        log.debug('%s', transformation)
-        log.debug('»')
-        log.debug('')
-        log.debug('')
+    # #######################################################################
+    # -----------------------------------------------------------------------
+    # #######################################################################
+    # -----------------------------------------------------------------------
+    # #######################################################################
+    #
+    user_answer = skull.ask_yes_or_no(
+        "Voulez-vous que je réalise le BENCHMARK des FORMATS de LOG ?",
+        'non'
+        )
 
-        with open(f_transformation, "rt") as new_file:
-            log.debug('Fichier transformé tel que converti en ENSEMBLE :')
-            log.debug('~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~')
-            log.debug('«')
-            for elt in set(new_file):
-                log.debug('%s', str(elt).rstrip('\r\n'))
-            log.debug('»')
-            log.debug('')
-            log.debug('')
+    if user_answer:
+
+        # On écrit N messages dans chacun de nos formats de LOG ( texte,
+        # JSON, binaire ), via un journal distinct du nôtre, puis on les
+        # relit via iter_log_records().
+        #
+        log.info('')
+        log.info('\t========================================')
+        log.info('\t>>> BENCHMARK des FORMATS de LOG <<<')
+        log.info('\t========================================')
+        log.info('')
+        log.info('')
+
+        nb_records = 50000
+
+        bench_log = logging.getLogger(f'{log.name}_formats')
+        bench_log.setLevel(logging.DEBUG)
+        bench_log.propagate = False
 
+        with tempfile.TemporaryDirectory() as bench_dir:
 
-        # On compare les 2 fichiers : INTERSECTION.
-        #
-        skull.shw("RÉSULTAT de l'INTERSECTION des deux FICHIERS :")
-        skull.shw('~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~')
-        skull.shw('«')
- 
-        intersection = skull.compare_files(
-            f_reference,
-            f_transformation,
-            action = 'intersection'
-            )
+            skull.shw(f'{nb_records} messages écrits puis relus :')
 
-        for elt in intersection:
-            skull.shw(str(elt).rstrip('\r\n'))
-        skull.shw('»')
-        skull.shw('')
-        skull.shw('')
+            for log_format in log_formats:
 
+                log_file = os.path.join(bench_dir, f'bench.{log_format}.log')
 
-        # On compare les 2 fichiers : DIFFÉRENCE / au fichier référence.
-        #
-        skull.shw('LIGNES de la RÉFÉRENCE NON PRÉSENTES dans le fichier transformé :')
-        skull.shw('~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~')
-        skull.shw('«')
+                if log_format == log_format_binary:
+                    file_handler = _BinaryRotatingFileHandler(log_file)
+                    file_handler.setFormatter(_BinaryLogFormatter())
 
-        difference = skull.compare_files(
-            f_reference,
-            f_transformation,
-            action = 'difference'
-            )
+                else:
+                    file_handler = logging.FileHandler(log_file, 'a', encoding = 'utf-8')
 
-        for elt in difference:
-            skull.shw(str(elt).rstrip('\r\n'))
-        skull.shw('»')
-        skull.shw('')
-        skull.shw('')
+                    if log_format == log_format_jsonl:
+                        file_handler.setFormatter(_JsonLinesFormatter())
+                    else:
+                        file_handler.setFormatter(logging.Formatter(
+                            fmt = '%(asctime)s - %(levelname)-9s %(message)s'
+                            ))
 
+                bench_log.addHandler(file_handler)
 
-        # On compare les 2 fichiers : DIFFÉRENCE / au 2ème fichier.
-        #
-        # C-a-d que l'on va ici donner les lignes en plus dans le
-        # 2ème fichier...
-        #
-        skull.shw('LIGNES AJOUTÉES / MODIFIÉES dans le FICHIER TRANSFORMÉ :')
-        skull.shw('~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~')
-        skull.shw('«')
- 
-        ajouts = skull.compare_files(
-            f_transformation,
-            f_reference,
-            action = 'difference'
-            )
+                t_start = time.perf_counter()
 
-        for elt in ajouts:
-            skull.shw(str(elt).rstrip('\r\n'))
-        skull.shw('»')
-        skull.shw('')
-        skull.shw('')
+                for i in range(nb_records):
+                    bench_log.debug(
+                        'Message n° %d de notre benchmark.',
+                        i,
+                        extra = {'elapsed': i / 1000, 'counters': {'i': i}}
+                        )
 
+                t_write = time.perf_counter() - t_start
 
-        # On compare les 2 fichiers : DIFFÉRENCE SYMÉTRIQUE.
-        #
-        skull.shw('RÉSULTAT de la DIFFÉRENCE SYMÉTRIQUE entre les deux FICHIERS :')
-        skull.shw('~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~')
-        skull.shw('«')
- 
-        intersection = skull.compare_files(
-            f_reference,
-            f_transformation,
-            action = 'difference symétrique'
-            )
+                bench_log.removeHandler(file_handler)
+                file_handler.close()
+
+                t_start = time.perf_counter()
+                nb_read = sum(1 for _ in iter_log_records(log_file))
+                t_read = time.perf_counter() - t_start
+
+                skull.shw(
+                    f'\t- {log_format:<7} : écriture = {t_write:8.4f} s,'
+                    f' lecture = {t_read:8.4f} s ( {nb_read} messages ),'
+                    f' taille = {os.path.getsize(log_file)} octets'
+                    )
 
-        for elt in intersection:
-            skull.shw(str(elt).rstrip('\r\n'))
-        skull.shw('»')
         skull.shw('')
         skull.shw('')
 
@@ -10375,78 +16560,89 @@ if __name__ == "__main__":
     # #######################################################################
     #
     user_answer = skull.ask_yes_or_no(
-        "Voulez-vous que je réalise les AUTOTESTS de get_unused_filename() ?",
+        "Voulez-vous que je réalise le BENCHMARK du temps d'IMPORT ?",
         'non'
         )
 
     if user_answer:
 
-        # On appelle les fonctions convert_to_pdf_*() pour
-        # vérifier que Python ne plante pas en leur sein.
+        # On importe notre module dans un nouvel interpréteur Python lancé
+        # avec l'option « -X importtime », qui détaille sur STDERR le temps
+        # d'import de chaque module ( en µs ) :
+        #
+        #   import time: self [us] | cumulative | imported package
+        #
+        # ... et ce, tel quel ( imports différés, cf _LazyModule ), puis en
+        # forçant l'import de tous nos modules différés, comme autrefois.
         #
         log.info('')
-        log.info('\t=====================================')
-        log.info('\t>>> TEST de get_unused_filename() <<<')
-        log.info('\t=====================================')
+        log.info('\t==========================================')
+        log.info("\t>>> BENCHMARK du temps d'IMPORT <<<")
+        log.info('\t==========================================')
         log.info('')
         log.info('')
 
-        f_name = f'{it_begins_with}.tmp'
+        module_dir = os.path.dirname(os.path.abspath(__file__))
+        module_name = os.path.splitext(os.path.basename(__file__))[0]
+        nb_runs = 5
+        nb_top = 10
 
-        skull.shw(f'Nom de référence = « {f_name} »')
-        skull.shw('')
+        eager_modules = (
+            'json, tempfile, subprocess, socket, http.client, http.server,'
+            ' urllib.request, urllib.error'
+            )
 
-        f_ext = '.blah-blah'
-        f_tmp = skull.get_unused_filename(f_name, f_ext, idx_force = False)
+        for label, code in (
+            ( 'imports différés', f'import {module_name}' ),
+            ( 'imports immédiats', f'import {module_name}, {eager_modules}' )
+            ):
 
-        skull.shw(f'Prochain nom disponible = « {f_tmp} »')
-        skull.shw(f"\t[ avec l'extension « {f_ext} » ]")
-        skull.shw('')
+            best = None
 
-        skull.shw(f'Création de « {f_tmp} »')
-        skull.shw('')
+            for _ in range(nb_runs):
 
-        leaf(f_tmp).touch()
+                process = subprocess.run(
+                    [sys.executable, '-X', 'importtime', '-c', code],
+                    cwd = module_dir,
+                    capture_output = True,
+                    text = True
+                    )
 
-        skull.shw(f'Prochain nom après « {f_tmp} » ...')
-        skull.shw('')
+                # L'indentation du nom d'1 module donne sa profondeur : 0
+                # pour les modules importés par le code lancé ( ou par
+                # Python lui-même à son démarrage ), 1 pour ceux qu'ils
+                # importent eux-mêmes, etc. Nous gardons ces 2 niveaux, et
+                # la durée cumulée du 1er pour total.
+                #
+                timings = []
+                total = 0
 
-        skull.shw(
-            '\t* sur 18 chiffres, base 33 : « {} »'.format(
-                skull.get_unused_filename(f_name, '', 18, 33)
-                )
-            )
-        skull.shw(f"\t[ SANS extension ]")
-        skull.shw('')
+                for line in process.stderr.splitlines():
 
-        f_tmp = skull.get_unused_filename(f_name)
+                    if not line.startswith('import time:') or 'cumulative' in line:
+                        continue
 
-        skull.shw(f'\t* sur 3 chiffres, base 0 : « {f_tmp} »')
-        skull.shw(f"\t[ avec l'extension par DÉFAUT ]")
-        skull.shw('')
+                    ( _, cumulative, package ) = line[len('import time:'):].split('|')
+                    depth = (len(package) - len(package.lstrip()) - 1) // 2
 
-        skull.shw(f'Création de « {f_tmp} »')
-        skull.shw('')
+                    if depth == 0:
+                        total += int(cumulative)
 
-        leaf(f_tmp).touch()
+                    if depth <= 1:
+                        timings.append(( int(cumulative), '  ' * depth + package.strip() ))
 
-        skull.shw(f'Re-Création de « {f_tmp} »')
-        skull.shw('')
+                if best is None or total < best[0]:
+                    best = ( total, timings )
 
-        try:
-            leaf(f_tmp).touch()
+            ( total, timings ) = best
 
-        except FileExistsError:
-            skull.shw(f'\tINTERDITE CAR CE FICHIER EXISTE !!!')
-            skull.shw('')
+            skull.shw(f'« {code} » ( meilleur de {nb_runs} essais ) = {total / 1000:8.2f} ms')
 
-        skull.shw(f'Prochain nom après « {f_tmp} » ...')
-        skull.shw('')
+            for cumulative, package in sorted(timings, reverse = True)[:nb_top]:
+                skull.shw(f'\t- {package:<24} = {cumulative / 1000:8.2f} ms')
 
-        f_tmp = skull.get_unused_filename(f_name)
+            skull.shw('')
 
-        skull.shw(f'\t* sur 3 chiffres, base 0 : « {f_tmp} »')
-        skull.shw(f"\t[ avec l'extension par DÉFAUT ]")
         skull.shw('')
 
 
@@ -10457,145 +16653,76 @@ if __name__ == "__main__":
     # #######################################################################
     #
     user_answer = skull.ask_yes_or_no(
-        "Voulez-vous que je réalise mes AUTOTESTS de DÉCOMPOSITIONS de PATH ?",
+        "Voulez-vous que je réalise le BENCHMARK des COMPRESSIONS de fichiers ?",
         'non'
         )
 
     if user_answer:
 
-        # On appelle les fonctions convert_to_pdf_*() pour
-        # vérifier que Python ne plante pas en leur sein.
+        # On sauvegarde un même ( gros ) rapport HTML, produit au fil de
+        # l'eau par un générateur, sans compression puis avec chacune de
+        # nos compressions, à différents niveaux : débit ( en Mo non
+        # compressés par seconde ) contre octets réellement écrits.
         #
         log.info('')
-        log.info('\t======================================')
-        log.info('\t>>> TEST de DÉCOMPOSITIONS de PATH <<<')
-        log.info('\t======================================')
+        log.info('\t================================================')
+        log.info('\t>>> BENCHMARK des COMPRESSIONS de fichiers <<<')
+        log.info('\t================================================')
         log.info('')
         log.info('')
 
-        paths_with_slash = {
-            #
-            # Pour *ARGS :
-            # ~~~~~~~~~~~~
-            #
-            'DOS 1 part'      : ('C:/', ),
-            'DOS 2 parts'     : ('C:/', 'Voici' ),
-            'DOS 3 parts'     : ('C:/', 'Voici', 'un', 'path !' ),
-            'Unix 1 part'     : ('//server', ),
-            'Unix 2 parts'    : ('//server', 'Voici' ),
-            'Unix 3 parts'    : ('//server', 'Voici', 'un', 'path !' ),
-            #
-            # Pour WINDOWS : ( principalement )
-            # ~~~~~~~~~~~~~~
-            #
-            # Tests des paths classiques ( relatifs ou absolus ), mais
-            # aussi étendus ou UNC.
-            #
-            'relatif no dir'  : 'Lettres - de Papa à sa Mère.lnk',
-            'dir + relatif'   : 'Renato/Lettres - de Papa à sa Mère.lnk',
-            '/dir + relatif'  : '/Renato/Lettres - de Papa à sa Mère.lnk',
-            '.dir + relatif'  : './Renato/Lettres - de Papa à sa Mère.lnk',
-            '..dir + relatif' : '../Renato/Lettres - de Papa à sa Mère.lnk',
-            'absolu'          : 'K:/Renato/Lettres - de Papa à sa Mère.lnk',
-            'extend w disk'   : '//?/K:/Renato/Lettres - de Papa à sa Mère.lnk',
-            'extend w vol'    : '//./Volume{03b8d832-1552-45a5-827e-cfffa76aa867}/Renato/Lettres - de Papa à sa Mère.lnk',
-            'extend + UNC'    : '//?/UNC/Server/Share/Test/Foo.txt',
-            'UNC file'        : '//machine/mountpoint/directory/etc/Foo.txt',
-            'UNC dir + /'     : '//machine/mountpoint/directory/etc/',
-            'UNC dir - /'     : '//machine/mountpoint/directory/etc',
-            'UNC root + /'    : '//machine/mountpoint/',
-            'UNC root - /'    : '//machine/mountpoint',
-            #
-            # Pour WINDOWS : ( principalement )
-            # ~~~~~~~~~~~~~~
-            #
-            # les 2 paths suivants peuvent-ils être considérés comme
-            # ABSOLUS ? Ou ne sont-ils que INCOMPLETS ? En effet, un
-            # path UNC est normalement de la forme \\host\mountpoint,
-            # mais sur le web, de-ci de-là, on trouve des références
-            # à \\localhost ou \\127.0.0.1 dans des cas spécifiques.
-            #
-            # Nous considérons, dans la version « BRUT » de skeleton,
-            # i.e dans les versions qui ne s'appuient pas sur pathlib,
-            # que le 1ER de ces paths est ACCEPTABLE en tant que path
-            # ABSOLU. Le SECOND est, lui, RELATIF.
-            #
-            #   \\host\     => OK ie path ABSOLU
-            #   \\host      => NO ie path RELATIF
-            #
-            # Le module pathlib fait d'ailleurs de même...
-            #
-            'UNC host - /'    : '//host',
-            'UNC host + /'    : '//host/',
-            #
-            # Pour POSIX : ( principalement )
-            # ~~~~~~~~~~~~
-            #
-            # Les paths suivants sont-ils tous équivalents ?
-            #
-            # Normalement, oui...
-            #
-            'UNC unix 3 /'    : '///host/',
-            'UNC unix 4 /'    : '////host/',
-            'UNC unix 5 /'    : '/////host/',
-            'UNC unix 6 /'    : '//////host/',
-            #
-            # Pour WINDOWS : ( principalement )
-            # ~~~~~~~~~~~~~~
-            #
-            # Les paths suivants sont tirés de :
-            #
-            #   https://learn.microsoft.com/en-us/dotnet/standard/io/file-path-formats#example-ways-to-refer-to-the-same-file
-            #
-            'MS classic'      : "c:/temp/test-file.txt",
-            'MS 127.0.0.1'    : "//127.0.0.1/c$/temp/test-file.txt",
-            'MS localhost'    : "//LOCALHOST/c$/temp/test-file.txt",
-            'MS extend w .'   : "//./c:/temp/test-file.txt",
-            'MS extend w ?'   : "//?/c:/temp/test-file.txt",
-            'MS UNC lclhst'   : "//./UNC/LOCALHOST/c$/temp/test-file.txt",
-            #
-            # Les paths suivants sont tirés de :
-            #
-            #   https://learn.microsoft.com/en-us/dotnet/standard/io/file-path-formats#traditional-dos-paths
-            #
-            'MS trad abs'     : r"C:/Projects/apilibrary/apilibrary.sln",
-            'MS trad rel'     : r"C:Projects/apilibrary/apilibrary.sln",
-        }
+        nb_lines = 200000
 
-        paths = paths_with_slash if os.name != 'nt' else {
-            k.replace('/', '\\')
-            : tuple(s.replace('/', '\\') for s in v)
-                if isinstance(v, tuple)
-                else v.replace('/', '\\')
-            for k, v in paths_with_slash.items()
-        }
+        def report():
+            yield b'<html><body><table>\n'
+            for i in range(nb_lines):
+                yield (
+                    f'<tr><td>{i}</td><td>Ligne n° {i} de notre rapport</td>'
+                    f'<td>{i * 3.14159:.3f}</td><td>{"OK" if i % 7 else "KO"}</td></tr>\n'
+                    ).encode('utf-8')
+            yield b'</table></body></html>\n'
 
-        for k, p in paths.items():
+        nb_bytes_in = sum(len(chunk) for chunk in report())
 
-            n = leaf(*p) if isinstance(p, tuple) else leaf(p)
+        skull.shw(f'Rapport de {nb_bytes_in / 1e6:.1f} Mo ( {nb_lines} lignes ) :')
 
-            log.info(f'Localisation : « {k:^16} » = {p}')
-            log.info('~~~~~~~~~~~~~~')
-            log.info('')
-            log.info(f'path construit\t-> {n}')
-            log.info('')
-            log.info(f'splitroot\t-> {n._flavour.splitroot(str(n))}')
-            log.info('')
+        with tempfile.TemporaryDirectory() as bench_dir:
 
-            try:
-                uri = n.as_uri()
-            except ValueError:
-                log.info('path.as_uri()\t-> « ValueError » car path RELATIF !!!')
-            else:
-                log.info(f'path.as_uri()\t-> {uri}')
+            for compression, level in (
+                ( None, None ),
+                ( compression_gzip, 1 ), ( compression_gzip, 6 ), ( compression_gzip, None ),
+                ( compression_bz2, 1 ), ( compression_bz2, None ),
+                ( compression_xz, 0 ), ( compression_xz, None ),
+                ( compression_zip, 1 ), ( compression_zip, None )
+                ):
 
-            _pause_("pause avant la recherche suivante",
-                    car="-", indent=3*margin,
-                    before=2, b_line=log.info,
-                    after=2, a_line=log.info)
+                t_start = time.perf_counter()
 
-            log.info(77 * '-')
-            log.info('')
+                out = skull.save_strings_to_file(
+                    report(),
+                    destination = os.path.join(bench_dir, 'bench.html'),
+                    ok_to_erase = True,
+                    ask_confirm = False,
+                    data_fmt = coding_bytes,
+                    compression = compression,
+                    compression_level = level
+                    )
+
+                t_write = time.perf_counter() - t_start
+                nb_bytes_out = os.path.getsize(out)
+
+                label = f'{compression or "aucune"} ( niveau {"défaut" if level is None else level} )'
+
+                skull.shw(
+                    f'\t- {label:<22} : {nb_bytes_in / 1e6 / t_write:8.1f} Mo/s,'
+                    f' {nb_bytes_out:>10} octets écrits'
+                    f' ( {100 * nb_bytes_out / nb_bytes_in:5.1f} % )'
+                    )
+
+                os.remove(out)
+
+        skull.shw('')
+        skull.shw('')
 
 
     # #######################################################################